@@ -0,0 +1,39 @@
+"""add trigram search indexes
+
+Revision ID: a1f3c7e9b2d4
+Revises: cb01d9ad81d9
+Create Date: 2026-10-16 10:12:41.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1f3c7e9b2d4'
+down_revision: Union[str, Sequence[str], None] = 'cb01d9ad81d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # 名称和别名的 trigram 索引，支持 ILIKE '%term%' 和 similarity 排序
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_entities_display_name_trgm "
+        "ON graph_entities USING gin (_display_name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_entities_aliases_trgm "
+        "ON graph_entities USING gin ((properties->>'__aliases__') gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS idx_entities_aliases_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_entities_display_name_trgm")
@@ -0,0 +1,28 @@
+"""add entity mapping export method
+
+Revision ID: a8c4e6f2b3d7
+Revises: f7b3d5e9a1c6
+Create Date: 2026-10-16 21:04:17.215638
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c4e6f2b3d7'
+down_revision: Union[str, Sequence[str], None] = 'f7b3d5e9a1c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('entity_mappings', sa.Column('export_method', sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('entity_mappings', 'export_method')
@@ -0,0 +1,54 @@
+"""add property filter indexes
+
+Revision ID: b7d2e4f6a8c1
+Revises: a1f3c7e9b2d4
+Create Date: 2026-10-16 14:37:05.582913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f6a8c1'
+down_revision: Union[str, Sequence[str], None] = 'a1f3c7e9b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 安全的数值转换函数，非数值返回 NULL；IMMUTABLE 以便用于表达式索引
+    op.execute(
+        r"""
+        CREATE OR REPLACE FUNCTION graph_try_numeric(value text) RETURNS numeric
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT CASE
+                WHEN value ~ '^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$'
+                THEN value::numeric
+            END
+        $$
+        """
+    )
+
+    # 属性等值过滤（@> 包含查询）使用的 GIN 索引
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_entities_properties_gin "
+        "ON graph_entities USING gin (properties jsonb_path_ops)"
+    )
+    # 数值属性的表达式索引由 PropertyIndexManager 按本体定义维护
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "DO $$ DECLARE idx record; BEGIN "
+        "FOR idx IN SELECT indexname FROM pg_indexes "
+        "WHERE tablename = 'graph_entities' AND indexname LIKE 'idx\\_prop\\_%' LOOP "
+        "EXECUTE 'DROP INDEX IF EXISTS ' || quote_ident(idx.indexname); "
+        "END LOOP; END $$"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_entities_properties_gin")
+    op.execute("DROP FUNCTION IF EXISTS graph_try_numeric(text)")
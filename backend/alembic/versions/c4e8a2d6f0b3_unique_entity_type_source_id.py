@@ -0,0 +1,131 @@
+"""unique entity type source id
+
+Revision ID: c4e8a2d6f0b3
+Revises: b7d2e4f6a8c1
+Create Date: 2026-10-16 16:05:41.218377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a2d6f0b3'
+down_revision: Union[str, Sequence[str], None] = 'b7d2e4f6a8c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 同一 (entity_type, source_id) 的重复实体合并到 ID 最小的一条：
+    # 属性按 ID 顺序合并（后同步的值覆盖），关系改指向保留的实体，
+    # 之后再删除重复实体，只有与已有关系重复的边随之级联删除
+    op.execute(
+        """
+        CREATE TEMP TABLE entity_dedup AS
+        SELECT e.id AS dup_id, k.keep_id
+        FROM graph_entities e
+        JOIN (
+            SELECT entity_type, source_id, min(id) AS keep_id
+            FROM graph_entities
+            WHERE source_id IS NOT NULL
+            GROUP BY entity_type, source_id
+            HAVING count(*) > 1
+        ) k ON e.entity_type = k.entity_type
+           AND e.source_id = k.source_id
+           AND e.id <> k.keep_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE graph_entities k
+        SET properties = m.properties
+        FROM (
+            SELECT g.keep_id, jsonb_object_agg(p.key, p.value ORDER BY e.id) AS properties
+            FROM (
+                SELECT DISTINCT keep_id, keep_id AS id FROM entity_dedup
+                UNION ALL
+                SELECT keep_id, dup_id FROM entity_dedup
+            ) g
+            JOIN graph_entities e ON e.id = g.id
+            CROSS JOIN LATERAL jsonb_each(coalesce(e.properties, '{}'::jsonb)) p
+            GROUP BY g.keep_id
+        ) m
+        WHERE k.id = m.keep_id
+        """
+    )
+    # 每个 (保留实体, 另一端, 关系类型) 只改指向一条边，且跳过已存在的边，
+    # 避免违反 uq_source_target_rel
+    op.execute(
+        """
+        UPDATE graph_relationships r
+        SET source_id = d.keep_id
+        FROM entity_dedup d
+        WHERE r.source_id = d.dup_id
+          AND NOT EXISTS (
+              SELECT 1 FROM graph_relationships x
+              WHERE x.source_id = d.keep_id
+                AND x.target_id = r.target_id
+                AND x.relationship_type = r.relationship_type
+          )
+          AND r.id = (
+              SELECT min(r2.id)
+              FROM graph_relationships r2
+              JOIN entity_dedup d2 ON r2.source_id = d2.dup_id
+              WHERE d2.keep_id = d.keep_id
+                AND r2.target_id = r.target_id
+                AND r2.relationship_type = r.relationship_type
+          )
+        """
+    )
+    op.execute(
+        """
+        UPDATE graph_relationships r
+        SET target_id = d.keep_id
+        FROM entity_dedup d
+        WHERE r.target_id = d.dup_id
+          AND NOT EXISTS (
+              SELECT 1 FROM graph_relationships x
+              WHERE x.target_id = d.keep_id
+                AND x.source_id = r.source_id
+                AND x.relationship_type = r.relationship_type
+          )
+          AND r.id = (
+              SELECT min(r2.id)
+              FROM graph_relationships r2
+              JOIN entity_dedup d2 ON r2.target_id = d2.dup_id
+              WHERE d2.keep_id = d.keep_id
+                AND r2.source_id = r.source_id
+                AND r2.relationship_type = r.relationship_type
+          )
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM graph_entities e
+        USING entity_dedup d
+        WHERE e.id = d.dup_id
+        """
+    )
+    op.execute("DROP TABLE entity_dedup")
+    op.drop_index('idx_entities_type_source', table_name='graph_entities')
+    op.create_index(
+        'uq_entities_type_source',
+        'graph_entities',
+        ['entity_type', 'source_id'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_entities_type_source', table_name='graph_entities')
+    op.create_index(
+        'idx_entities_type_source',
+        'graph_entities',
+        ['entity_type', 'source_id'],
+        unique=False,
+    )
@@ -0,0 +1,34 @@
+"""add sync paging settings
+
+Revision ID: d5f1b3c7e9a2
+Revises: c4e8a2d6f0b3
+Create Date: 2026-10-16 17:22:09.640153
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f1b3c7e9a2'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a2d6f0b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('data_products', sa.Column('sync_page_size', sa.Integer(), server_default='100', nullable=False))
+    op.add_column('data_products', sa.Column('sync_concurrency', sa.Integer(), server_default='4', nullable=False))
+    op.add_column('entity_mappings', sa.Column('sync_page_size', sa.Integer(), nullable=True))
+    op.add_column('entity_mappings', sa.Column('sync_concurrency', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('entity_mappings', 'sync_concurrency')
+    op.drop_column('entity_mappings', 'sync_page_size')
+    op.drop_column('data_products', 'sync_concurrency')
+    op.drop_column('data_products', 'sync_page_size')
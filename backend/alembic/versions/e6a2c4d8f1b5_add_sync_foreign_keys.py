@@ -0,0 +1,37 @@
+"""add sync foreign keys staging table
+
+Revision ID: e6a2c4d8f1b5
+Revises: d5f1b3c7e9a2
+Create Date: 2026-10-16 18:47:30.115964
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a2c4d8f1b5'
+down_revision: Union[str, Sequence[str], None] = 'd5f1b3c7e9a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sync_foreign_keys',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('relationship_mapping_id', sa.Integer(), nullable=False),
+    sa.Column('source_key', sa.String(length=500), nullable=False),
+    sa.Column('target_key', sa.String(length=500), nullable=False),
+    sa.ForeignKeyConstraint(['relationship_mapping_id'], ['relationship_mappings.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_sync_foreign_keys_mapping', 'sync_foreign_keys', ['relationship_mapping_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_sync_foreign_keys_mapping', table_name='sync_foreign_keys')
+    op.drop_table('sync_foreign_keys')
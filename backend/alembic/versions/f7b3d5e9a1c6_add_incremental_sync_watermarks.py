@@ -0,0 +1,45 @@
+"""add incremental sync watermarks
+
+Revision ID: f7b3d5e9a1c6
+Revises: e6a2c4d8f1b5
+Create Date: 2026-10-16 20:12:41.503817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b3d5e9a1c6'
+down_revision: Union[str, Sequence[str], None] = 'e6a2c4d8f1b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('entity_mappings', sa.Column('watermark_field', sa.String(length=255), nullable=True))
+    op.add_column('entity_mappings', sa.Column('watermark_filter_field', sa.String(length=255), nullable=True))
+    op.add_column('entity_mappings', sa.Column('full_sync_interval_hours', sa.Integer(), nullable=True))
+    op.add_column('entity_mappings', sa.Column('sync_watermark', sa.String(length=255), nullable=True))
+    op.add_column('entity_mappings', sa.Column('last_full_sync_at', sa.DateTime(), nullable=True))
+    op.add_column('sync_logs', sa.Column('records_deleted', sa.Integer(), server_default='0', nullable=True))
+
+    # 增量同步按 (relationship_mapping_id, source_key) 替换外键暂存行
+    op.drop_index('idx_sync_foreign_keys_mapping', table_name='sync_foreign_keys')
+    op.create_index('idx_sync_foreign_keys_mapping_source', 'sync_foreign_keys', ['relationship_mapping_id', 'source_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_sync_foreign_keys_mapping_source', table_name='sync_foreign_keys')
+    op.create_index('idx_sync_foreign_keys_mapping', 'sync_foreign_keys', ['relationship_mapping_id'], unique=False)
+
+    op.drop_column('sync_logs', 'records_deleted')
+    op.drop_column('entity_mappings', 'last_full_sync_at')
+    op.drop_column('entity_mappings', 'sync_watermark')
+    op.drop_column('entity_mappings', 'full_sync_interval_hours')
+    op.drop_column('entity_mappings', 'watermark_filter_field')
+    op.drop_column('entity_mappings', 'watermark_field')
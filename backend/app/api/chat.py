@@ -132,11 +132,15 @@ async def chat_stream_v2(
 
         return StreamingResponse(event_generator(), media_type="text/event-stream")
 
-    agent = EnhancedAgentService(
-        llm_config=llm_dict,
-        action_executor=action_executor,
-        action_registry=action_registry,
-    )
+    agent_runtime = getattr(request.app.state, "agent_runtime", None)
+    if agent_runtime is not None:
+        agent = await agent_runtime.get_agent(llm_dict)
+    else:
+        agent = EnhancedAgentService(
+            llm_config=llm_dict,
+            action_executor=action_executor,
+            action_registry=action_registry,
+        )
 
     async def event_generator():
         full_content = ""
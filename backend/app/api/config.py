@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.database import get_db
@@ -37,6 +37,7 @@ async def get_llm_config(
 @router.put("/llm")
 async def update_llm_config(
     req: LLMConfigRequest,
+    request: Request,
     current_user: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db)
 ):
@@ -61,6 +62,10 @@ async def update_llm_config(
         db.add(config)
 
     await db.commit()
+
+    agent_runtime = getattr(request.app.state, "agent_runtime", None)
+    if agent_runtime is not None:
+        agent_runtime.invalidate_llm()
     return {"message": "LLM config updated"}
 
 
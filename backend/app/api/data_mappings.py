@@ -89,10 +89,16 @@ async def create_entity_mapping(
         create_method=data.create_method,
         update_method=data.update_method,
         delete_method=data.delete_method,
+        export_method=data.export_method,
         sync_enabled=data.sync_enabled,
         sync_direction=SyncDirection(data.sync_direction.value),
         id_field_mapping=data.id_field_mapping,
         name_field_mapping=data.name_field_mapping,
+        sync_page_size=data.sync_page_size,
+        sync_concurrency=data.sync_concurrency,
+        watermark_field=data.watermark_field,
+        watermark_filter_field=data.watermark_filter_field,
+        full_sync_interval_hours=data.full_sync_interval_hours,
     )
 
     db.add(mapping)
@@ -113,10 +119,18 @@ async def create_entity_mapping(
         create_method=mapping.create_method,
         update_method=mapping.update_method,
         delete_method=mapping.delete_method,
+        export_method=mapping.export_method,
         sync_enabled=mapping.sync_enabled,
         sync_direction=data.sync_direction,
         id_field_mapping=mapping.id_field_mapping,
         name_field_mapping=mapping.name_field_mapping,
+        sync_page_size=mapping.sync_page_size,
+        sync_concurrency=mapping.sync_concurrency,
+        watermark_field=mapping.watermark_field,
+        watermark_filter_field=mapping.watermark_filter_field,
+        full_sync_interval_hours=mapping.full_sync_interval_hours,
+        sync_watermark=mapping.sync_watermark,
+        last_full_sync_at=mapping.last_full_sync_at,
         created_at=mapping.created_at,
         updated_at=mapping.updated_at,
         property_mapping_count=0,
@@ -164,10 +178,18 @@ async def list_entity_mappings(
             create_method=m.create_method,
             update_method=m.update_method,
             delete_method=m.delete_method,
+            export_method=m.export_method,
             sync_enabled=m.sync_enabled,
             sync_direction=m.sync_direction.value if m.sync_direction else "pull",
             id_field_mapping=m.id_field_mapping,
             name_field_mapping=m.name_field_mapping,
+            sync_page_size=m.sync_page_size,
+            sync_concurrency=m.sync_concurrency,
+            watermark_field=m.watermark_field,
+            watermark_filter_field=m.watermark_filter_field,
+            full_sync_interval_hours=m.full_sync_interval_hours,
+            sync_watermark=m.sync_watermark,
+            last_full_sync_at=m.last_full_sync_at,
             created_at=m.created_at,
             updated_at=m.updated_at,
             property_mapping_count=len(m.property_mappings),
@@ -216,12 +238,20 @@ async def get_entity_mapping(
         create_method=mapping.create_method,
         update_method=mapping.update_method,
         delete_method=mapping.delete_method,
+        export_method=mapping.export_method,
         sync_enabled=mapping.sync_enabled,
         sync_direction=(
             mapping.sync_direction.value if mapping.sync_direction else "pull"
         ),
         id_field_mapping=mapping.id_field_mapping,
         name_field_mapping=mapping.name_field_mapping,
+        sync_page_size=mapping.sync_page_size,
+        sync_concurrency=mapping.sync_concurrency,
+        watermark_field=mapping.watermark_field,
+        watermark_filter_field=mapping.watermark_filter_field,
+        full_sync_interval_hours=mapping.full_sync_interval_hours,
+        sync_watermark=mapping.sync_watermark,
+        last_full_sync_at=mapping.last_full_sync_at,
         created_at=mapping.created_at,
         updated_at=mapping.updated_at,
         property_mapping_count=len(mapping.property_mappings),
@@ -258,6 +288,13 @@ async def update_entity_mapping(
             update_data["sync_direction"].value
         )
 
+    # 高水位字段变化后原高水位失效，下次同步重新全量拉取
+    if update_data.get("watermark_field", mapping.watermark_field) != (
+        mapping.watermark_field
+    ):
+        mapping.sync_watermark = None
+        mapping.last_full_sync_at = None
+
     for key, value in update_data.items():
         setattr(mapping, key, value)
 
@@ -283,12 +320,20 @@ async def update_entity_mapping(
         create_method=mapping.create_method,
         update_method=mapping.update_method,
         delete_method=mapping.delete_method,
+        export_method=mapping.export_method,
         sync_enabled=mapping.sync_enabled,
         sync_direction=(
             mapping.sync_direction.value if mapping.sync_direction else "pull"
         ),
         id_field_mapping=mapping.id_field_mapping,
         name_field_mapping=mapping.name_field_mapping,
+        sync_page_size=mapping.sync_page_size,
+        sync_concurrency=mapping.sync_concurrency,
+        watermark_field=mapping.watermark_field,
+        watermark_filter_field=mapping.watermark_filter_field,
+        full_sync_interval_hours=mapping.full_sync_interval_hours,
+        sync_watermark=mapping.sync_watermark,
+        last_full_sync_at=mapping.last_full_sync_at,
         created_at=mapping.created_at,
         updated_at=mapping.updated_at,
         property_mapping_count=len(mapping.property_mappings),
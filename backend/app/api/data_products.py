@@ -41,8 +41,9 @@ from app.schemas.data_product import (
     GrpcServiceSchema,
     GrpcMethodInfo,
     SyncLogResponse,
+    SyncRequest,
 )
-from app.services.grpc_client import DynamicGrpcClient
+from app.services.grpc_client import DynamicGrpcClient, borrow_client, grpc_registry
 from app.services.sync_service import SyncService
 from app.models.scheduled_task import ScheduledTask, TaskExecution as TaskExecutionModel
 from app.schemas.scheduled_task import (
@@ -92,6 +93,8 @@ async def create_data_product(
         service_name=data.service_name,
         proto_content=data.proto_content,
         is_active=data.is_active,
+        sync_page_size=data.sync_page_size,
+        sync_concurrency=data.sync_concurrency,
         connection_status=ConnectionStatus.UNKNOWN,
     )
 
@@ -179,6 +182,9 @@ async def update_data_product(
                 detail=f"数据产品名称 '{data.name}' 已被使用",
             )
 
+    # 连接地址变化后，旧地址的共享连接和反射缓存失效
+    await grpc_registry.invalidate(product.grpc_host, product.grpc_port)
+
     # 更新字段
     update_data = data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
@@ -209,6 +215,7 @@ async def delete_data_product(
 
     await db.delete(product)
     await db.commit()
+    await grpc_registry.invalidate(product.grpc_host, product.grpc_port)
 
     logger.info(f"Deleted data product: {product.name}")
 
@@ -288,7 +295,7 @@ async def get_service_schema(
             detail=f"数据产品 ID={product_id} 不存在",
         )
 
-    async with DynamicGrpcClient(product.grpc_host, product.grpc_port) as client:
+    async with borrow_client(product.grpc_host, product.grpc_port) as client:
         try:
             info = await client.get_service_info(product.service_name)
 
@@ -348,7 +355,7 @@ async def list_available_methods(
             detail=f"数据产品 ID={product_id} 不存在",
         )
 
-    async with DynamicGrpcClient(product.grpc_host, product.grpc_port) as client:
+    async with borrow_client(product.grpc_host, product.grpc_port) as client:
         try:
             services = await client.list_services()
 
@@ -412,6 +419,7 @@ async def list_entity_mappings(
                 "create_method": mapping.create_method,
                 "update_method": mapping.update_method,
                 "delete_method": mapping.delete_method,
+                "export_method": mapping.export_method,
                 "sync_enabled": mapping.sync_enabled,
                 "sync_direction": (
                     mapping.sync_direction.value if mapping.sync_direction else "pull"
@@ -436,12 +444,21 @@ async def list_entity_mappings(
 # ============================================================================
 
 
-async def _run_sync_task_bg(product_id: int, sync_log_id: int):
+async def _run_sync_task_bg(
+    product_id: int,
+    sync_log_id: int,
+    incremental: bool = False,
+    reconcile: bool = False,
+):
     async with async_session() as session:
         sync_service = SyncService(session)
         try:
             await sync_service.sync_data_product(
-                product_id, sync_relationships=True, sync_log_id=sync_log_id
+                product_id,
+                sync_relationships=True,
+                sync_log_id=sync_log_id,
+                incremental=incremental,
+                reconcile=reconcile,
             )
         except Exception as e:
             logger.exception(f"Background sync failed for product {product_id}: {e}")
@@ -460,10 +477,15 @@ async def _run_sync_all_task_bg():
 async def trigger_sync(
     product_id: int,
     background_tasks: BackgroundTasks,
+    sync_request: Optional[SyncRequest] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """触发数据产品同步"""
+    """触发数据产品同步
+
+    默认全量拉取；sync_type="incremental" 时增量同步；
+    sync_type="reconcile" 时全量对账，并删除源端已不存在的实体。
+    """
     result = await db.execute(select(DataProduct).where(DataProduct.id == product_id))
     product = result.scalar_one_or_none()
     if not product:
@@ -472,9 +494,12 @@ async def trigger_sync(
             detail=f"数据产品 ID={product_id} 不存在",
         )
 
+    sync_type = sync_request.sync_type if sync_request is not None else "full"
+    incremental = sync_type == "incremental"
+    reconcile = sync_type == "reconcile"
     sync_log = SyncLog(
         data_product_id=product.id,
-        sync_type="manual",
+        sync_type=sync_type if incremental or reconcile else "manual",
         direction="pull",
         status="started",
         started_at=datetime.now(timezone.utc).replace(tzinfo=None),
@@ -483,7 +508,9 @@ async def trigger_sync(
     await db.commit()
     await db.refresh(sync_log)
 
-    background_tasks.add_task(_run_sync_task_bg, product_id, sync_log.id)
+    background_tasks.add_task(
+        _run_sync_task_bg, product_id, sync_log.id, incremental, reconcile
+    )
     return sync_log
 
 
@@ -8,12 +8,14 @@ from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import Optional
+from typing import List, Optional
 from app.core.database import get_db
 from app.api.deps import get_current_user, require_admin
 from app.models.user import User
 from app.services.pg_graph_storage import PGGraphStorage
 from app.services.pg_graph_importer import PGGraphImporter
+from app.services.property_index import PropertyIndexManager, schedule_index_sync
+from app.services.rdf_stream import STREAMING_FORMATS, iter_rdf_file
 from app.services.permission_service import PermissionService
 from app.rule_engine.event_emitter import GraphEventEmitter
 from fastapi.responses import Response
@@ -22,6 +24,8 @@ router = APIRouter(prefix="/graph", tags=["graph"])
 
 
 MAX_UPLOAD_SIZE = 50 * 1024 * 1024  # 50MB
+# 可流式解析的格式 (.ttl / .nt) 内存占用与文件大小无关，允许更大的上传
+MAX_STREAM_UPLOAD_SIZE = 500 * 1024 * 1024  # 500MB
 ALLOWED_EXTENSIONS = {".ttl", ".owl", ".rdf", ".xml", ".n3", ".nt"}
 
 
@@ -61,37 +65,60 @@ async def import_graph(
             detail=f"Unsupported file type '{ext}'. Allowed: {', '.join(ALLOWED_EXTENSIONS)}",
         )
 
-    # Validate file size
-    if file.size and file.size > MAX_UPLOAD_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size is {MAX_UPLOAD_SIZE // (1024*1024)}MB",
-        )
-
-    content = await file.read()
+    importer = PGGraphImporter(db)
 
-    # Double-check size after reading (file.size may not always be set)
-    if len(content) > MAX_UPLOAD_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size is {MAX_UPLOAD_SIZE // (1024*1024)}MB",
+    if ext in STREAMING_FORMATS:
+        # UploadFile 已落盘为临时文件，直接从文件流逐块解析
+        file.file.seek(0, os.SEEK_END)
+        size = file.file.tell()
+        file.file.seek(0)
+        if size > MAX_STREAM_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File too large. Maximum size is {MAX_STREAM_UPLOAD_SIZE // (1024*1024)}MB",
+            )
+        result = await importer.import_stream(
+            iter_rdf_file(file.file, STREAMING_FORMATS[ext])
+        )
+        schema_stats = result["schema"]
+        instance_stats = result["instances"]
+    else:
+        # Validate file size
+        if file.size and file.size > MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File too large. Maximum size is {MAX_UPLOAD_SIZE // (1024*1024)}MB",
+            )
+
+        content = await file.read()
+
+        # Double-check size after reading (file.size may not always be set)
+        if len(content) > MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File too large. Maximum size is {MAX_UPLOAD_SIZE // (1024*1024)}MB",
+            )
+
+        # 解析并导入
+        from app.services.owl_parser import OWLParser
+
+        parser = OWLParser()
+        parser.load_from_string(content.decode("utf-8"))
+        schema_triples, instance_triples = parser.classify_triples()
+
+        schema_stats = await importer.import_schema(parser)
+        instance_stats = await importer.import_instances(
+            schema_triples, instance_triples
         )
 
-    # 解析并导入
-    from app.services.owl_parser import OWLParser
-
-    parser = OWLParser()
-    parser.load_from_string(content.decode("utf-8"))
-    schema_triples, instance_triples = parser.classify_triples()
-
-    importer = PGGraphImporter(db)
-    schema_stats = await importer.import_schema(parser)
-    instance_stats = await importer.import_instances(schema_triples, instance_triples)
+    # 数据导入完成后在后台建立属性索引，避免逐行维护索引，也不让响应等待建索引
+    index_sync = schedule_index_sync(db)
 
     return {
         "message": "Graph imported successfully",
         "schema_stats": schema_stats,
         "instance_stats": instance_stats,
+        "property_indexes": "scheduled" if index_sync is not None else "skipped",
         "total": {
             "classes": schema_stats.get("classes", 0),
             "schema_properties": schema_stats.get("properties", 0),
@@ -101,6 +128,19 @@ async def import_graph(
     }
 
 
+@router.post("/property-indexes/sync")
+async def sync_property_indexes(
+    prune: bool = False,
+    current_user: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """根据本体数值属性和热点过滤属性同步 JSONB 属性索引
+
+    prune=true 时同时删除当前进程未观察到的热点属性索引。
+    """
+    return await PropertyIndexManager(db).sync(prune=prune)
+
+
 @router.post("/clear")
 async def clear_graph(
     clear_ontology: bool = True,
@@ -156,6 +196,7 @@ async def get_neighbors(
     name: str,
     hops: int = Query(default=1, ge=1, le=10),
     direction: str = "both",
+    relationship_types: Optional[List[str]] = Query(default=None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -176,6 +217,7 @@ async def get_neighbors(
             hops=hops,
             direction=direction,
             accessible_entity_types=accessible_entity_types,
+            relationship_types=relationship_types,
         )
     else:
         neighbors = await storage.get_instance_neighbors(
@@ -183,6 +225,7 @@ async def get_neighbors(
             hops=hops,
             direction=direction,
             accessible_entity_types=accessible_entity_types,
+            relationship_types=relationship_types,
         )
 
     return neighbors
@@ -193,6 +236,8 @@ async def find_path(
     start_uri: str,
     end_uri: str,
     max_depth: int = Query(default=5, ge=1, le=15),
+    k: int = Query(default=1, ge=1, le=10),
+    max_visited: int = Query(default=20000, ge=100, le=200000),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -210,6 +255,8 @@ async def find_path(
     kwargs = {
         "max_depth": max_depth,
         "accessible_entity_types": accessible_entity_types,
+        "k": k,
+        "max_visited": max_visited,
     }
     if start_uri.isdigit():
         kwargs["start_id"] = int(start_uri)
@@ -1,5 +1,5 @@
 # backend/app/api/mcp.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.database import get_db
@@ -7,11 +7,19 @@ from app.api.deps import get_current_user, require_admin
 from app.models.user import User
 from app.models.mcp_config import MCPConfig
 from app.schemas.mcp import MCPConfigCreate, MCPConfigUpdate, MCPConfigResponse
-from typing import List
+from app.services.mcp_client import mcp_pool
+from typing import Any, Dict, List
 
 router = APIRouter(prefix="/mcp", tags=["mcp"])
 
 
+def _refresh_agent_tools(request: Request) -> None:
+    """Reload the agent's MCP tools after a server configuration change."""
+    agent_runtime = getattr(request.app.state, "agent_runtime", None)
+    if agent_runtime is not None:
+        agent_runtime.invalidate_mcp()
+
+
 @router.get("", response_model=List[MCPConfigResponse])
 async def list_mcp_servers(
     current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
@@ -21,9 +29,23 @@ async def list_mcp_servers(
     return result.scalars().all()
 
 
+@router.get("/metrics")
+async def get_mcp_metrics(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """Get pooled session, call latency and error metrics per MCP server URL."""
+    metrics: Dict[str, Any] = {"servers": mcp_pool.metrics()}
+    agent_runtime = getattr(request.app.state, "agent_runtime", None)
+    if agent_runtime is not None:
+        metrics["agent"] = agent_runtime.metrics()
+    return metrics
+
+
 @router.post("", response_model=MCPConfigResponse, status_code=status.HTTP_201_CREATED)
 async def register_mcp_server(
     req: MCPConfigCreate,
+    request: Request,
     current_user: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
@@ -40,6 +62,7 @@ async def register_mcp_server(
     db.add(server)
     await db.commit()
     await db.refresh(server)
+    _refresh_agent_tools(request)
     return server
 
 
@@ -47,6 +70,7 @@ async def register_mcp_server(
 async def update_mcp_server(
     server_id: int,
     req: MCPConfigUpdate,
+    request: Request,
     current_user: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
@@ -57,18 +81,23 @@ async def update_mcp_server(
             status_code=status.HTTP_404_NOT_FOUND, detail="MCP server not found"
         )
 
+    old_url = server.url
     update_data = req.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(server, key, value)
 
     await db.commit()
     await db.refresh(server)
+    # Pooled sessions keep the old connection; reconnect on next use
+    await mcp_pool.invalidate(old_url)
+    _refresh_agent_tools(request)
     return server
 
 
 @router.delete("/{server_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_mcp_server(
     server_id: int,
+    request: Request,
     current_user: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
@@ -79,6 +108,9 @@ async def delete_mcp_server(
             status_code=status.HTTP_404_NOT_FOUND, detail="MCP server not found"
         )
 
+    url = server.url
     await db.delete(server)
     await db.commit()
+    await mcp_pool.invalidate(url)
+    _refresh_agent_tools(request)
     return None
@@ -180,6 +180,31 @@ async def list_execution_logs(
     }
 
 
+@router.get("/metrics")
+async def get_rule_engine_metrics(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+) -> dict[str, Any]:
+    """Get rule execution queue metrics.
+
+    Args:
+        request: FastAPI request (for app state access)
+        current_user: Current authenticated user
+
+    Returns:
+        Queue depth, lag, drop and throughput counters, plus execution
+        log writer counters
+    """
+    rule_engine = getattr(request.app.state, "rule_engine", None)
+    if rule_engine is None:
+        raise HTTPException(status_code=500, detail="Rule engine not initialized")
+    metrics = rule_engine.metrics()
+    log_writer = getattr(request.app.state, "log_writer", None)
+    if log_writer is not None:
+        metrics["execution_logs"] = log_writer.metrics()
+    return metrics
+
+
 @router.get("/{name}")
 async def get_rule(
     name: str,
@@ -57,6 +57,39 @@ class Settings(BaseSettings):
     SCHEDULER_MAX_CONCURRENT: int = 10
     SCHEDULER_DEFAULT_TIMEOUT: int = 300
 
+    # Rule engine settings
+    # 并发执行规则的 worker 数量（每个 worker 同时占用一个数据库连接）
+    RULE_ENGINE_WORKERS: int = 4
+    # 等待执行的事件队列上限
+    RULE_ENGINE_QUEUE_SIZE: int = 10000
+    # 队列满时的处理策略：wait 让产生事件的操作等待队列腾出空间，drop 丢弃新事件并计数
+    RULE_ENGINE_OVERFLOW: str = "wait"
+    # 关闭时等待队列排空的最长时间（秒）
+    RULE_ENGINE_SHUTDOWN_TIMEOUT: float = 30.0
+    # 同一实体的更新事件在该窗口内合并为一次规则执行（毫秒，0 表示不合并）
+    RULE_ENGINE_COALESCE_WINDOW_MS: int = 50
+
+    # Execution log settings
+    # 执行日志批量写入：单批最大条数与定时写入间隔（秒）
+    EXECUTION_LOG_BATCH_SIZE: int = 200
+    EXECUTION_LOG_FLUSH_INTERVAL: float = 1.0
+    # 内存缓冲上限，超出时丢弃最旧的日志
+    EXECUTION_LOG_MAX_BUFFER: int = 10000
+    # 成功执行日志的采样比例（失败日志总是记录）
+    EXECUTION_LOG_SUCCESS_SAMPLE_RATE: float = 1.0
+    # 关闭时无法写入数据库的日志转存文件，下次启动时补写
+    EXECUTION_LOG_SPOOL_PATH: str = "execution_logs.spool.jsonl"
+
+    # Agent runtime settings
+    # 后台刷新 MCP 工具列表的间隔（秒，0 表示只在启动和配置变更时刷新）
+    AGENT_MCP_REFRESH_INTERVAL: float = 300.0
+
+    # Property index settings
+    # 属性被过滤多少次后视为热点属性并建立表达式索引
+    PROPERTY_INDEX_HOT_THRESHOLD: int = 50
+    # 属性表达式索引的最大数量（限制写放大）
+    PROPERTY_INDEX_MAX_INDEXES: int = 64
+
     @property
     def effective_database_url(self) -> str:
         """获取有效的数据库 URL
@@ -1,9 +1,10 @@
 # backend/app/core/init_db.py
 import asyncio
 import logging
-from sqlalchemy import select
+from sqlalchemy import select, text
 from app.core.database import async_session, engine, Base
 from app.core.security import hash_password, generate_random_password
+from app.services.property_index import TRY_NUMERIC_FUNCTION_DDL
 
 # Import all models to register them with Base
 from app.models import User, LLMConfig, MCPConfig
@@ -15,6 +16,9 @@ async def init_db():
     """初始化数据库，创建表和默认用户"""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # 属性过滤依赖的 graph_try_numeric 函数（迁移中同样会创建）
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text(TRY_NUMERIC_FUNCTION_DDL))
 
     async with async_session() as session:
         # 检查是否已有用户
@@ -24,6 +24,8 @@ from app.api import (
     scheduled_tasks,
 )
 from app.services.scheduler_service import SchedulerService
+from app.services.grpc_client import grpc_registry
+from app.services.mcp_client import mcp_pool
 from app.core.database import engine, Base, async_session, get_db
 import app.models  # Implicitly registers models
 
@@ -35,6 +37,8 @@ from app.rule_engine.rule_engine import RuleEngine
 from app.rule_engine.event_emitter import GraphEventEmitter
 from app.rule_engine.parser import RuleParser
 from app.rule_engine.models import ActionDef
+from app.services.execution_log_writer import ExecutionLogWriter
+from app.services.agent.runtime import AgentRuntime
 from app.services.rule_storage import RuleStorage
 from app.services.permission_service import init_permission_service
 from app.core.init_db import init_db
@@ -58,8 +62,21 @@ async def lifespan(app: FastAPI):
     # Create event emitter early for dependency injection
     event_emitter = GraphEventEmitter()
 
+    # Execution logs of actions and rules are buffered and written in batches
+    log_writer = ExecutionLogWriter(
+        async_session,
+        batch_size=settings.EXECUTION_LOG_BATCH_SIZE,
+        flush_interval=settings.EXECUTION_LOG_FLUSH_INTERVAL,
+        max_buffer_size=settings.EXECUTION_LOG_MAX_BUFFER,
+        success_sample_rate=settings.EXECUTION_LOG_SUCCESS_SAMPLE_RATE,
+        spool_path=settings.EXECUTION_LOG_SPOOL_PATH,
+    )
+    await log_writer.start()
+
     action_registry = ActionRegistry()
-    action_executor = ActionExecutor(action_registry, event_emitter=event_emitter)
+    action_executor = ActionExecutor(
+        action_registry, event_emitter=event_emitter, log_writer=log_writer
+    )
     rule_registry = RuleRegistry()
 
     # Create RuleEngine with database session provider
@@ -69,10 +86,16 @@ async def lifespan(app: FastAPI):
         db_session=None,
         session_provider=async_session,
         action_executor=action_executor,
+        max_workers=settings.RULE_ENGINE_WORKERS,
+        max_queue_size=settings.RULE_ENGINE_QUEUE_SIZE,
+        coalesce_window=settings.RULE_ENGINE_COALESCE_WINDOW_MS / 1000,
+        log_writer=log_writer,
+        overflow=settings.RULE_ENGINE_OVERFLOW,
     )
 
     # Connect event emitter to rule engine
     event_emitter.subscribe(rule_engine.on_event)
+    event_emitter.add_backpressure(rule_engine.wait_for_capacity)
 
     # Initialize rule storage
     rules_dir = Path(__file__).parent.parent / "rules"
@@ -142,6 +165,15 @@ async def lifespan(app: FastAPI):
     )
     await scheduler_service.initialize()
 
+    # Agent graph and tool registries are built once and shared by chats
+    agent_runtime = AgentRuntime(
+        async_session,
+        action_executor=action_executor,
+        action_registry=action_registry,
+        mcp_refresh_interval=settings.AGENT_MCP_REFRESH_INTERVAL,
+    )
+    await agent_runtime.start()
+
     # Store in app state for access
     app.state.action_registry = action_registry
     app.state.action_executor = action_executor
@@ -149,12 +181,19 @@ async def lifespan(app: FastAPI):
     app.state.rule_engine = rule_engine
     app.state.rule_storage = rule_storage
     app.state.event_emitter = event_emitter
+    app.state.log_writer = log_writer
     app.state.scheduler_service = scheduler_service
+    app.state.agent_runtime = agent_runtime
 
     yield
 
     # === Shutdown ===
+    await agent_runtime.close()
     await scheduler_service.shutdown()
+    await rule_engine.shutdown(settings.RULE_ENGINE_SHUTDOWN_TIMEOUT)
+    await log_writer.close()
+    await grpc_registry.close_all()
+    await mcp_pool.close_all()
     await engine.dispose()
     logger.info("Database engine disposed")
 
@@ -60,9 +60,12 @@ async def get_instance_neighbors(
     direction: str = "both",
     type: str | None = None,
     property_filter: dict[str, Any] | None = None,
-) -> list[dict[str, Any]]:
+) -> dict[str, Any]:
     """Get neighbors of an instance.
 
+    Returns the neighbors and a ``truncated`` flag that is true when the
+    neighborhood was too large to traverse completely.
+
     Args:
         instance_name: Name or ID of the instance
         hops: Number of hops to traverse (default: 1)
@@ -83,7 +86,7 @@ async def get_instance_neighbors(
         else:
             kwargs["entity_name"] = instance_name
 
-        return await storage.get_instance_neighbors(**kwargs)
+        return await storage.get_instance_neighborhood(**kwargs)
 
 
 @mcp.tool()
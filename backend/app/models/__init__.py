@@ -14,6 +14,7 @@ from app.models.data_product import (
     EntityMapping,
     PropertyMapping,
     RelationshipMapping,
+    SyncForeignKey,
     SyncLog,
     ConnectionStatus,
     SyncDirection,
@@ -43,6 +44,7 @@ __all__ = [
     "EntityMapping",
     "PropertyMapping",
     "RelationshipMapping",
+    "SyncForeignKey",
     "SyncLog",
     "ConnectionStatus",
     "SyncDirection",
@@ -65,6 +65,10 @@ class DataProduct(Base):
     # Proto 定义（可选，用于离线解析）
     proto_content = Column(Text)
 
+    # 同步分页配置：每页条数和并发拉取的页数
+    sync_page_size = Column(Integer, nullable=False, default=100, server_default="100")
+    sync_concurrency = Column(Integer, nullable=False, default=4, server_default="4")
+
     # 连接状态
     connection_status = Column(
         SQLEnum(ConnectionStatus), default=ConnectionStatus.UNKNOWN
@@ -119,6 +123,9 @@ class EntityMapping(Base):
     create_method = Column(String(255))  # 创建方法，如 "CreateSupplier"
     update_method = Column(String(255))  # 更新方法，如 "UpdateSupplier"
     delete_method = Column(String(255))  # 删除方法，如 "DeleteSupplier"
+    export_method = Column(
+        String(255)
+    )  # 服务端流式导出方法，如 "ExportSuppliers"；配置后同步优先使用
 
     # 同步配置
     sync_enabled = Column(Boolean, default=True)
@@ -130,6 +137,21 @@ class EntityMapping(Base):
         String(255), default="name"
     )  # 用于生成图谱实体名称的字段
 
+    # 同步分页配置（为空时使用数据产品的配置）
+    sync_page_size = Column(Integer)
+    sync_concurrency = Column(Integer)
+
+    # 增量同步配置
+    watermark_field = Column(
+        String(255)
+    )  # 高水位字段，如 "updated_at" 或单调递增的游标字段；为空时只做全量同步
+    watermark_filter_field = Column(
+        String(255)
+    )  # 列表请求中的过滤字段，为空时使用 "<watermark_field>_from"
+    full_sync_interval_hours = Column(Integer)  # 全量对账间隔，为空时默认 24 小时
+    sync_watermark = Column(String(255))  # 已同步到的高水位
+    last_full_sync_at = Column(DateTime)  # 上次完整的全量同步时间
+
     # 元数据
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -282,6 +304,34 @@ class RelationshipMapping(Base):
         )
 
 
+class SyncForeignKey(Base):
+    """关系同步外键暂存表
+
+    实体同步拉取源数据时顺带记录关系映射所需的外键值，
+    关系同步直接基于该表做集合式连接，无需再次拉取源数据。
+    每次重新拉取源实体映射时，其关系映射对应的暂存行会被整体替换。
+    """
+
+    __tablename__ = "sync_foreign_keys"
+
+    id = Column(Integer, primary_key=True, autoincrement="auto")
+    relationship_mapping_id = Column(
+        Integer,
+        ForeignKey("relationship_mappings.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    source_key = Column(String(500), nullable=False)  # 源实体的外部 ID
+    target_key = Column(String(500), nullable=False)  # 外键值（目标实体的外部 ID）
+
+    __table_args__ = (
+        Index(
+            "idx_sync_foreign_keys_mapping_source",
+            "relationship_mapping_id",
+            "source_key",
+        ),
+    )
+
+
 class SyncLog(Base):
     """同步日志表
 
@@ -310,6 +360,7 @@ class SyncLog(Base):
     records_created = Column(Integer, default=0)
     records_updated = Column(Integer, default=0)
     records_failed = Column(Integer, default=0)
+    records_deleted = Column(Integer, default=0)
     error_message = Column(Text)
 
     # 时间
@@ -74,7 +74,8 @@ class GraphEntity(Base):
         Index("idx_entities_type", "entity_type"),
         Index("idx_entities_is_instance", "is_instance"),
         Index("idx_entities_type_instance", "entity_type", "is_instance"),
-        Index("idx_entities_type_source", "entity_type", "source_id"),
+        # 数据同步按 (entity_type, source_id) UPSERT；source_id 为 NULL 的行不参与唯一约束
+        Index("uq_entities_type_source", "entity_type", "source_id", unique=True),
     )
 
 
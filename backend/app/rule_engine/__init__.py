@@ -20,6 +20,7 @@ from app.rule_engine.action_executor import ActionExecutor, ExecutionResult
 # Rule registry and engine
 from app.rule_engine.rule_registry import RuleRegistry
 from app.rule_engine.rule_engine import RuleEngine
+from app.rule_engine.worker_pool import RuleWorkerPool
 
 # Evaluation context and expression evaluator
 from app.rule_engine.context import EvaluationContext
@@ -30,6 +31,7 @@ from app.rule_engine.pgq_translator import PGQTranslator
 
 # Event emitter
 from app.rule_engine.event_emitter import GraphEventEmitter
+from app.rule_engine.event_coalescer import EventCoalescer
 
 # Built-in functions
 from app.rule_engine.functions import BuiltinFunctions, evaluate_function
@@ -66,6 +68,7 @@ __all__ = [
     # Rule registry and engine
     "RuleRegistry",
     "RuleEngine",
+    "RuleWorkerPool",
     # Evaluation context and expression evaluator
     "EvaluationContext",
     "ExpressionEvaluator",
@@ -73,6 +76,7 @@ __all__ = [
     "PGQTranslator",
     # Event emitter
     "GraphEventEmitter",
+    "EventCoalescer",
     # Built-in functions
     "BuiltinFunctions",
     "evaluate_function",
@@ -1,5 +1,6 @@
 """Action executor for executing ACTION definitions."""
 
+import json
 from dataclasses import dataclass, field
 from typing import Any
 from app.rule_engine.action_registry import ActionRegistry
@@ -32,6 +33,21 @@ class ExecutionResult:
     return_value: Any | None = None
 
 
+@dataclass
+class BatchOutcome:
+    """Outcome of executing an action on a batch of entities.
+
+    Attributes:
+        results: One ExecutionResult per item, in order
+        events: Update events to emit once the batch is committed
+        logs: Execution log fields to record once the batch is committed
+    """
+
+    results: list[ExecutionResult]
+    events: list[UpdateEvent] = field(default_factory=list)
+    logs: list[dict[str, Any]] = field(default_factory=list)
+
+
 class ActionExecutor:
     """Executor for ACTION definitions.
 
@@ -41,16 +57,22 @@ class ActionExecutor:
     """
 
     def __init__(
-        self, registry: ActionRegistry, event_emitter: GraphEventEmitter | None = None
+        self,
+        registry: ActionRegistry,
+        event_emitter: GraphEventEmitter | None = None,
+        log_writer: Any = None,
     ):
         """Initialize the executor.
 
         Args:
             registry: ActionRegistry containing action definitions
             event_emitter: Optional GraphEventEmitter for triggering rules
+            log_writer: Optional batched ExecutionLogWriter; logs are written
+                inline through the context session when omitted
         """
         self.registry = registry
         self.event_emitter = event_emitter
+        self.log_writer = log_writer
 
     async def execute(
         self,
@@ -66,6 +88,11 @@ class ActionExecutor:
         1. Looks up the action definition
         2. Checks all preconditions in order
         3. If all preconditions pass, applies the effect
+        4. Commits the changes through the context session, then emits
+           update events and records the execution log
+
+        The executor owns the commit of a single execution; callers do not
+        commit afterwards.
 
         Args:
             entity_type: The entity type (e.g., "PurchaseOrder")
@@ -84,74 +111,233 @@ class ActionExecutor:
                 success=False, error=f"Action {entity_type}.{action_name} not found"
             )
 
-        # Create evaluator for this execution
-        evaluator = ExpressionEvaluator(context)
-
-        # Check all preconditions
-        for precondition in action.preconditions:
-            result = await evaluator.evaluate(precondition.condition)
-            if not result:
-                # Record failed execution log
-                if context.session:
-                    from app.repositories.rule_repository import ExecutionLogRepository
-
-                    repo = ExecutionLogRepository(context.session)
-                    await repo.create(
-                        type="ACTION",
-                        name=f"{entity_type}.{action_name}",
-                        entity_id=str(context.entity["id"]),
-                        actor_name=actor_name,
-                        actor_type=actor_type,
-                        success=False,
-                        detail={"error": precondition.on_failure},
-                    )
-                return ExecutionResult(success=False, error=precondition.on_failure)
-
-        # All preconditions passed - apply effect if present
-        changes = {}
-        return_value = None
-        if action.effect is not None:
-            changes, return_value = await self._apply_effect(
-                action.effect, evaluator, context
+        # Check preconditions and compute the effect
+        evaluation = await self.evaluate_action(action, context)
+        if not evaluation.success:
+            # Record failed execution log
+            await self._record_execution_log(
+                context,
+                type="ACTION",
+                name=f"{entity_type}.{action_name}",
+                entity_id=str(context.entity["id"]),
+                actor_name=actor_name,
+                actor_type=actor_type,
+                success=False,
+                detail={"error": evaluation.error},
             )
+            return evaluation
+
+        changes = evaluation.changes
+        return_value = evaluation.return_value
 
         # Persist changes to database if any
         if changes and context.session:
-            # Use PersistenceService to update properties safely via jsonb_set
-            success = await PersistenceService.update_properties(
+            # One UPDATE for all changes; it returns the previous values
+            patched = await PersistenceService.patch_properties(
                 context.session, entity_type, context.entity["id"], changes
             )
+            # Commit before emitting and logging, so that rules and logs only
+            # ever see changes that were persisted
+            await context.session.commit()
 
             # Emit events for rule engine if persistence succeeded
-            if success and self.event_emitter:
+            if patched is not None and self.event_emitter:
                 self._emit_update_events(
                     entity_type,
                     context.entity["id"],
                     changes,
-                    context_entity=context.entity,
+                    context_entity=patched.old_values,
                     actor_name=actor_name,
                     actor_type=actor_type,
                 )
+                await self.event_emitter.wait_for_capacity()
 
         # Record execution log
-        if context.session:
-            from app.repositories.rule_repository import ExecutionLogRepository
-
-            repo = ExecutionLogRepository(context.session)
-            await repo.create(
-                type="ACTION",
-                name=f"{entity_type}.{action_name}",
-                entity_id=str(context.entity["id"]),
-                actor_name=actor_name,
-                actor_type=actor_type,
-                success=True,
-                detail={"changes": changes, "return_value": return_value},
-            )
+        await self._record_execution_log(
+            context,
+            type="ACTION",
+            name=f"{entity_type}.{action_name}",
+            entity_id=str(context.entity["id"]),
+            actor_name=actor_name,
+            actor_type=actor_type,
+            success=True,
+            detail={"changes": changes, "return_value": return_value},
+        )
 
         return ExecutionResult(
             success=True, error=None, changes=changes, return_value=return_value
         )
 
+    async def evaluate_action(
+        self,
+        action: ActionDef,
+        context: EvaluationContext,
+        checks: dict[int, bool] | None = None,
+    ) -> ExecutionResult:
+        """Check the preconditions of an action and compute its effect.
+
+        Nothing is persisted; the returned changes still have to be written.
+
+        Args:
+            action: The action definition
+            context: Evaluation context containing entity data
+            checks: Precondition outcomes already computed elsewhere (e.g. in
+                SQL), keyed by precondition index; the remaining
+                preconditions are evaluated against the context
+
+        Returns:
+            ExecutionResult with the first failed precondition's message, or
+            the changes and return value of the effect
+        """
+        evaluator = ExpressionEvaluator(context)
+
+        for index, precondition in enumerate(action.preconditions):
+            if checks is not None and index in checks:
+                result = checks[index]
+            else:
+                result = await evaluator.evaluate(precondition.condition)
+            if not result:
+                return ExecutionResult(success=False, error=precondition.on_failure)
+
+        changes = {}
+        return_value = None
+        if action.effect is not None:
+            changes, return_value = await self._apply_effect(
+                action.effect, evaluator, context
+            )
+        return ExecutionResult(success=True, changes=changes, return_value=return_value)
+
+    async def execute_many(
+        self,
+        action: ActionDef,
+        items: list[tuple[EvaluationContext, dict[int, bool]]],
+        session: Any,
+        actor_name: str | None = None,
+        actor_type: str | None = None,
+    ) -> BatchOutcome:
+        """Execute an action on many preloaded entities in one session.
+
+        Preconditions and effects are evaluated per entity, and all changes
+        are written with one batched update without committing. Without a
+        log writer the execution logs are added to the session, so they
+        commit with the changes. Update events (and logs for the log writer)
+        are returned instead of published: the caller commits the batch and
+        then passes the outcome to ``publish``. Effects must not contain CALL
+        statements.
+
+        Args:
+            action: The action definition
+            items: (context, precomputed precondition outcomes) per entity
+            session: Session shared by the whole batch
+            actor_name: Name of the actor executing the action
+            actor_type: Type of the actor (AI/USER/MCP)
+
+        Returns:
+            BatchOutcome with one ExecutionResult per item, in order
+        """
+        name = f"{action.entity_type}.{action.action_name}"
+        results = []
+        logs = []
+        for context, checks in items:
+            try:
+                result = await self.evaluate_action(action, context, checks)
+            except Exception as e:
+                # Logged like a failed precondition
+                result = ExecutionResult(success=False, error=str(e))
+            results.append(result)
+            if result.success:
+                detail = {
+                    "changes": result.changes,
+                    "return_value": result.return_value,
+                }
+            else:
+                detail = {"error": result.error}
+            logs.append(
+                {
+                    "type": "ACTION",
+                    "name": name,
+                    "entity_id": str(context.entity["id"]),
+                    "actor_name": actor_name,
+                    "actor_type": actor_type,
+                    "success": result.success,
+                    "detail": detail,
+                }
+            )
+
+        updated = [
+            (context, result)
+            for (context, _), result in zip(items, results)
+            if result.success and result.changes
+        ]
+        if updated:
+            await PersistenceService.update_properties_batch(
+                session,
+                action.entity_type,
+                [(context.entity["id"], result.changes) for context, result in updated],
+            )
+
+        outcome = BatchOutcome(results=results)
+        if self.log_writer is not None:
+            outcome.logs = logs
+        elif logs:
+            from app.models.rule import ExecutionLog
+
+            session.add_all(
+                ExecutionLog(
+                    **{**fields, "detail": json.dumps(fields["detail"], default=str)}
+                )
+                for fields in logs
+            )
+
+        if self.event_emitter:
+            for context, result in updated:
+                outcome.events.extend(
+                    self._update_events(
+                        action.entity_type,
+                        context.entity["id"],
+                        result.changes,
+                        context_entity=context.entity,
+                        actor_name=actor_name,
+                        actor_type=actor_type,
+                    )
+                )
+        return outcome
+
+    async def publish(self, outcome: BatchOutcome) -> None:
+        """Record the logs and emit the events of a committed batch.
+
+        Args:
+            outcome: Outcome returned by execute_many, after its commit
+        """
+        if self.log_writer is not None:
+            for fields in outcome.logs:
+                self.log_writer.record(**fields)
+        if self.event_emitter and outcome.events:
+            for event in outcome.events:
+                self.event_emitter.emit(event)
+            await self.event_emitter.wait_for_capacity()
+
+    async def _record_execution_log(
+        self, context: EvaluationContext, **fields: Any
+    ) -> None:
+        """Record an execution log entry.
+
+        With a log writer the entry is buffered and written in a batch
+        outside the caller's transaction; otherwise it is inserted and
+        committed through the context session (if any).
+
+        Args:
+            context: Evaluation context of the action
+            **fields: ExecutionLog fields (type, name, entity_id, ...)
+        """
+        if self.log_writer is not None:
+            self.log_writer.record(**fields)
+        elif context.session:
+            from app.repositories.rule_repository import ExecutionLogRepository
+
+            repo = ExecutionLogRepository(context.session)
+            await repo.create(**fields)
+
     def _emit_update_events(
         self,
         entity_type: str,
@@ -174,6 +360,22 @@ class ActionExecutor:
         if not self.event_emitter:
             return
 
+        for event in self._update_events(
+            entity_type, entity_id, changes, context_entity, actor_name, actor_type
+        ):
+            self.event_emitter.emit(event)
+
+    @staticmethod
+    def _update_events(
+        entity_type: str,
+        entity_id: str,
+        changes: dict[str, Any],
+        context_entity: dict[str, Any] | None = None,
+        actor_name: str | None = None,
+        actor_type: str | None = None,
+    ) -> list[UpdateEvent]:
+        """Build an UpdateEvent for each property whose value changed."""
+        events = []
         for key, new_val in changes.items():
             old_val = context_entity.get(key) if context_entity else None
 
@@ -181,16 +383,18 @@ class ActionExecutor:
             if old_val == new_val:
                 continue
 
-            event = UpdateEvent(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                property=key,
-                old_value=old_val,
-                new_value=new_val,
-                actor_name=actor_name,
-                actor_type=actor_type,
+            events.append(
+                UpdateEvent(
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    property=key,
+                    old_value=old_val,
+                    new_value=new_val,
+                    actor_name=actor_name,
+                    actor_type=actor_type,
+                )
             )
-            self.event_emitter.emit(event)
+        return events
 
     async def _apply_effect(
         self, effect: Any, evaluator: ExpressionEvaluator, context: EvaluationContext
@@ -272,7 +476,7 @@ class ActionExecutor:
         import logging
         from sqlalchemy import select
         from app.models.data_product import DataProduct
-        from app.services.grpc_client import DynamicGrpcClient
+        from app.services.grpc_client import borrow_client
 
         logger = logging.getLogger(__name__)
 
@@ -324,8 +528,8 @@ class ActionExecutor:
             f"args={statement.arguments} request_data={request_data}"
         )
 
-        # 3. Call gRPC method
-        async with DynamicGrpcClient(product.grpc_host, product.grpc_port) as client:
+        # 3. Call gRPC method on the shared (pooled) client for this endpoint
+        async with borrow_client(product.grpc_host, product.grpc_port) as client:
             response = await client.call_method(
                 product.service_name,
                 statement.method_name,
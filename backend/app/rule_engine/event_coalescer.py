@@ -0,0 +1,172 @@
+"""Coalescing of bursts of update events per entity."""
+
+import asyncio
+import logging
+from typing import Any, Callable, Sequence
+
+from app.rule_engine.models import UpdateEvent
+
+logger = logging.getLogger(__name__)
+
+
+class EventCoalescer:
+    """Merges update events of the same entity within a time window.
+
+    The first event of an entity opens a window; every event of that
+    entity arriving before the window closes is folded into one event
+    that keeps the first old value and the last new value per property.
+    When the window closes the merged event is dispatched once, so rules
+    are evaluated once per entity instead of once per property change.
+
+    At most ``max_pending`` windows are open at a time; opening another one
+    dispatches the oldest window early, so a bulk update over many entities
+    reaches the worker pool (and its backpressure) instead of piling up here.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[UpdateEvent], Any],
+        window: float = 0.05,
+        matcher: Callable[[UpdateEvent], Sequence[Any]] | None = None,
+        max_pending: int = 10000,
+    ):
+        """Initialize the coalescer.
+
+        Args:
+            dispatch: Callable receiving merged events
+            window: Seconds to collect events of an entity; 0 disables merging
+            matcher: Returns the rules an event triggers, used to count
+                saved rule executions (events are counted when omitted)
+            max_pending: Maximum number of open windows
+        """
+        self.dispatch = dispatch
+        self.window = window
+        self.matcher = matcher
+        self.max_pending = max(1, max_pending)
+        self._pending: dict[tuple[str, str], UpdateEvent] = {}
+        self._timers: dict[tuple[str, str], asyncio.TimerHandle] = {}
+        self._pending_executions: dict[tuple[str, str], int] = {}
+        self._received = 0
+        self._dispatched = 0
+        self._executions_requested = 0
+        self._executions_dispatched = 0
+
+    def submit(self, event: UpdateEvent) -> None:
+        """Add an event to its entity's window, opening one if needed.
+
+        Args:
+            event: The update event to coalesce
+        """
+        self._received += 1
+        executions = self._count_executions(event)
+        if self.window <= 0:
+            self._executions_requested += executions
+            self._dispatch(event)
+            return
+
+        key = (event.entity_type, str(event.entity_id))
+        self._pending_executions[key] = (
+            self._pending_executions.get(key, 0) + executions
+        )
+
+        merged = self._pending.get(key)
+        if merged is None:
+            if len(self._pending) >= self.max_pending:
+                self._flush_oldest()
+            self._pending[key] = _merge(None, event)
+            loop = asyncio.get_running_loop()
+            self._timers[key] = loop.call_later(self.window, self._flush_key, key)
+        else:
+            _merge(merged, event)
+
+    def _count_executions(self, event: UpdateEvent) -> int:
+        """Number of rule executions an event would trigger on its own."""
+        if self.matcher is None:
+            return 1
+        return len(self.matcher(event))
+
+    def _flush_key(self, key: tuple[str, str]) -> None:
+        """Dispatch the merged event of one entity."""
+        self._timers.pop(key, None)
+        event = self._pending.pop(key, None)
+        if event is None:
+            return
+        self._executions_requested += self._pending_executions.pop(key, 0)
+        self._dispatch(event)
+
+    def _flush_oldest(self) -> None:
+        """Dispatch the window that was opened first, before it closes."""
+        key = next(iter(self._pending))
+        timer = self._timers.get(key)
+        if timer is not None:
+            timer.cancel()
+        self._flush_key(key)
+
+    def _dispatch(self, event: UpdateEvent) -> None:
+        """Hand an event to the dispatch callable."""
+        self._executions_dispatched += self._count_executions(event)
+        self._dispatched += 1
+        try:
+            self.dispatch(event)
+        except Exception:
+            logger.exception(
+                f"Failed to dispatch event for {event.entity_type} {event.entity_id}"
+            )
+
+    def flush(self) -> None:
+        """Dispatch all pending merged events immediately."""
+        for key in list(self._pending):
+            timer = self._timers.get(key)
+            if timer is not None:
+                timer.cancel()
+            self._flush_key(key)
+
+    @property
+    def pending(self) -> int:
+        """Number of entities with an open window."""
+        return len(self._pending)
+
+    def metrics(self) -> dict[str, Any]:
+        """Get a snapshot of the coalescing counters."""
+        return {
+            "coalesce_window_seconds": self.window,
+            "events_received": self._received,
+            "events_dispatched": self._dispatched,
+            "entities_pending": self.pending,
+            "rule_executions_saved": self._executions_requested
+            - self._executions_dispatched,
+        }
+
+
+def _merge(merged: UpdateEvent | None, event: UpdateEvent) -> UpdateEvent:
+    """Fold an event into a merged event (created from the event if None).
+
+    The merged event keeps the first old value and the last new value of
+    every property in ``changes``; its own property/old/new fields
+    describe the first property that changed.
+    """
+    if merged is None:
+        changes = dict(event.changes) or {
+            event.property: (event.old_value, event.new_value)
+        }
+        return UpdateEvent(
+            entity_type=event.entity_type,
+            entity_id=event.entity_id,
+            property=event.property,
+            old_value=event.old_value,
+            new_value=event.new_value,
+            actor_name=event.actor_name,
+            actor_type=event.actor_type,
+            changes=changes,
+        )
+
+    incoming = event.changes or {event.property: (event.old_value, event.new_value)}
+    for prop, (old_value, new_value) in incoming.items():
+        if prop in merged.changes:
+            old_value = merged.changes[prop][0]
+        merged.changes[prop] = (old_value, new_value)
+
+    merged.old_value, merged.new_value = merged.changes[merged.property]
+    merged.actor_name = event.actor_name
+    merged.actor_type = event.actor_type
+    return merged
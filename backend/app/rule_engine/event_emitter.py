@@ -1,6 +1,6 @@
 """Event emitter for graph update events."""
 
-from typing import TYPE_CHECKING, Callable, List
+from typing import TYPE_CHECKING, Awaitable, Callable, List
 
 if TYPE_CHECKING:
     from app.rule_engine.models import UpdateEvent, GraphViewEvent
@@ -18,6 +18,7 @@ class GraphEventEmitter:
     def __init__(self) -> None:
         """Initialize an empty list of listeners."""
         self._listeners: List[Callable[[EventT], None]] = []
+        self._backpressure: List[Callable[[], Awaitable[None]]] = []
 
     def subscribe(self, listener: Callable[[EventT], None]) -> None:
         """Subscribe a listener to graph events.
@@ -47,6 +48,22 @@ class GraphEventEmitter:
         except ValueError:
             raise ValueError("Listener is not subscribed") from None
 
+    def add_backpressure(self, waiter: Callable[[], Awaitable[None]]) -> None:
+        """Register a listener's wait for capacity.
+
+        Listeners that queue events for later processing register a waiter
+        here; async producers await ``wait_for_capacity`` after emitting.
+
+        Args:
+            waiter: Async callable returning once the listener has room.
+        """
+        self._backpressure.append(waiter)
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until every listener can accept more events."""
+        for waiter in self._backpressure:
+            await waiter()
+
     def emit(self, event: EventT) -> None:
         """Emit a graph event to all subscribed listeners.
 
@@ -43,6 +43,8 @@ class ActionDef:
     preconditions: list[Precondition]
     effect: Any | None  # AST EffectBlock node
     description: str | None = None
+    # Compiled batch entity load + precondition check query
+    check_plan: Any | None = field(default=None, compare=False, repr=False)
 
 
 @dataclass
@@ -78,6 +80,14 @@ class ForClause:
     entity_type: str
     condition: Any | None  # AST Expression node
     statements: list[Any]  # SetStatement, TriggerStatement, or ForClause
+    # Compiled query plans keyed by the set of bound outer variable names
+    plans: dict[frozenset[str], Any] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+    # Set-based UPDATE plans for SET-only bodies (None when not applicable)
+    set_plans: dict[frozenset[str], Any] = field(
+        default_factory=dict, compare=False, repr=False
+    )
 
 
 @dataclass
@@ -97,6 +107,8 @@ class UpdateEvent:
     new_value: Any
     actor_name: str | None = None
     actor_type: str | None = None
+    # Coalesced events: property -> (first old value, last new value)
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
 
 
 @dataclass
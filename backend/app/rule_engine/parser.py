@@ -1,6 +1,10 @@
 """DSL Parser using Lark."""
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from lark import Lark, Transformer, Token
 from pathlib import Path
 from app.rule_engine.models import (
@@ -509,21 +513,66 @@ class ASTTransformer(Transformer):
         return [i for i in items if i is not None]
 
 
+# Maximum number of distinct DSL texts whose parsed ASTs are kept
+AST_CACHE_SIZE = 512
+
+_ast_cache: "OrderedDict[str, tuple[Union[ActionDef, RuleDef], ...]]" = OrderedDict()
+_ast_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _shared_lark() -> Lark:
+    """Build the process-wide LALR parser.
+
+    The grammar analysis is cached on disk by Lark (keyed by the grammar
+    and options), so later processes load the parse tables instead of
+    rebuilding them. The transformer is stateless and safe to share.
+    """
+    grammar_path = Path(__file__).parent / "grammar.lark"
+    with open(grammar_path) as f:
+        grammar = f.read()
+
+    return Lark(
+        grammar,
+        parser="lalr",
+        transformer=ASTTransformer(),
+        start="start",
+        cache=True,
+    )
+
+
+def clear_ast_cache() -> None:
+    """Drop all cached ASTs."""
+    with _ast_cache_lock:
+        _ast_cache.clear()
+
+
 class RuleParser:
-    """Parser for ACTION and RULE DSL."""
+    """Parser for ACTION and RULE DSL.
 
-    def __init__(self):
-        grammar_path = Path(__file__).parent / "grammar.lark"
-        with open(grammar_path) as f:
-            grammar = f.read()
+    All instances share one compiled grammar, and parse results are
+    cached by a hash of the DSL text. Cached RuleDef/ActionDef objects
+    are shared between callers and must be treated as read-only.
+    """
 
-        self.lark = Lark(
-            grammar, parser="lalr", transformer=ASTTransformer(), start="start"
-        )
+    def __init__(self):
+        self.lark = _shared_lark()
 
     def parse(self, dsl_text: str) -> list[Union[ActionDef, RuleDef]]:
-        """Parse DSL text into AST."""
-        return self.lark.parse(dsl_text)
+        """Parse DSL text into AST, reusing the result for unchanged text."""
+        key = hashlib.sha256(dsl_text.encode("utf-8")).hexdigest()
+        with _ast_cache_lock:
+            cached = _ast_cache.get(key)
+            if cached is not None:
+                _ast_cache.move_to_end(key)
+                return list(cached)
+
+        parsed = tuple(self.lark.parse(dsl_text))
+        with _ast_cache_lock:
+            _ast_cache[key] = parsed
+            while len(_ast_cache) > AST_CACHE_SIZE:
+                _ast_cache.popitem(last=False)
+        return list(parsed)
 
     def parse_file(self, file_path: str) -> list[Union[ActionDef, RuleDef]]:
         """Parse DSL file into AST."""
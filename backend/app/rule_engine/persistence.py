@@ -2,6 +2,7 @@
 
 import json
 import logging
+from dataclasses import dataclass
 from typing import Any
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,6 +10,46 @@ from sqlalchemy.ext.asyncio import AsyncSession
 logger = logging.getLogger(__name__)
 
 
+class ConcurrentUpdateError(Exception):
+    """An entity changed after the version a compare-and-set update expected."""
+
+
+@dataclass
+class PatchResult:
+    """Outcome of a single-statement property patch.
+
+    Attributes:
+        old_values: Previous values of the patched properties (None when a
+            property did not exist)
+        updated_at: The entity's new updated_at, usable as the next
+            compare-and-set guard
+        old_display_name: Display name before the update
+        properties: All properties after the update, when requested
+    """
+
+    old_values: dict[str, Any]
+    updated_at: Any
+    old_display_name: str | None = None
+    properties: dict[str, Any] | None = None
+
+
+def _numeric_id(entity_id: Any) -> int | None:
+    """Coerce an entity ID to the integer graph_entities.id, None if invalid."""
+    if isinstance(entity_id, str) and entity_id.isdigit():
+        return int(entity_id)
+    if isinstance(entity_id, int):
+        return entity_id
+    logger.warning(f"PersistenceService: entity_id {entity_id} is not numeric.")
+    return None
+
+
+def _json_value(value: Any) -> Any:
+    """Decode a JSONB column returned as text by some drivers."""
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
 class PersistenceService:
     """Service for executing property updates on graph entities."""
 
@@ -20,7 +61,7 @@ class PersistenceService:
         prop_name: str,
         value: Any,
     ) -> bool:
-        """Update a single property using jsonb_set to avoid race conditions.
+        """Update a single property in one statement.
 
         Args:
             session: Active database session
@@ -32,57 +73,157 @@ class PersistenceService:
         Returns:
             True if successful
         """
-        try:
-            # Ensure entity_id is numeric to match graph_entities integer id column.
-            if isinstance(entity_id, str) and entity_id.isdigit():
-                numeric_id = int(entity_id)
-            elif isinstance(entity_id, int):
-                numeric_id = entity_id
-            else:
-                logger.warning(
-                    f"PersistenceService: entity_id {entity_id} is not numeric."
-                )
-                return False
-
-            # Use jsonb_set(target, path, new_value)
-            # path is an array of text
-            update_query = text(
-                """
-                UPDATE graph_entities
-                SET properties = jsonb_set(
-                    COALESCE(properties, '{}'::jsonb),
-                    ARRAY[:prop_name]::text[],
-                    CAST(:json_value AS jsonb)
-                )
+        return await PersistenceService.update_properties(
+            session, entity_type, entity_id, {prop_name: value}
+        )
+
+    @staticmethod
+    async def patch_properties(
+        session: AsyncSession,
+        entity_type: str,
+        entity_id: Any,
+        changes: dict[str, Any],
+        expected_updated_at: Any = None,
+        display_name: str | None = None,
+        return_properties: bool = False,
+    ) -> PatchResult | None:
+        """Apply all property changes to an entity with one UPDATE.
+
+        The changes are merged with ``properties || :patch`` and the previous
+        values come back through RETURNING, so no SELECT is needed to emit
+        update events. The row is locked while it is read, so concurrent
+        patches of the same entity are applied one after the other without
+        losing writes. The caller is responsible for committing.
+
+        Args:
+            session: Active database session
+            entity_type: Entity type
+            entity_id: Entity ID
+            changes: Dict of property changes
+            expected_updated_at: Compare-and-set guard; the update only
+                happens if the entity's updated_at still has this value
+            display_name: New display name (``_display_name`` column)
+            return_properties: Also return all properties after the update
+
+        Returns:
+            PatchResult, or None if the entity does not exist or the
+            compare-and-set guard did not match
+        """
+        numeric_id = _numeric_id(entity_id)
+        if numeric_id is None:
+            return None
+
+        params = {
+            "numeric_id": numeric_id,
+            "entity_type": entity_type,
+            "patch": json.dumps(changes),
+        }
+        guard = ""
+        if expected_updated_at is not None:
+            guard = "AND updated_at = :expected_updated_at"
+            params["expected_updated_at"] = expected_updated_at
+        set_display_name = ""
+        if display_name is not None:
+            set_display_name = "_display_name = :display_name,"
+            params["display_name"] = display_name
+        returning_properties = ", g.properties" if return_properties else ""
+
+        # The locking CTE reads the latest committed row, which is also the
+        # row the UPDATE modifies, so the returned old values are exact
+        query = text(
+            f"""
+            WITH old AS (
+                SELECT id, properties, _display_name
+                FROM graph_entities
                 WHERE id = :numeric_id
                 AND entity_type = :entity_type
-                """
+                {guard}
+                FOR UPDATE
             )
+            UPDATE graph_entities AS g
+            SET properties = COALESCE(g.properties, '{{}}'::jsonb) || CAST(:patch AS jsonb),
+                {set_display_name}
+                updated_at = now()
+            FROM old
+            WHERE g.id = old.id
+            RETURNING
+                (
+                    SELECT COALESCE(
+                        jsonb_object_agg(p.key, old.properties -> p.key),
+                        '{{}}'::jsonb
+                    )
+                    FROM jsonb_each(CAST(:patch AS jsonb)) AS p
+                ) AS old_values,
+                old._display_name AS old_display_name,
+                g.updated_at{returning_properties}
+            """
+        )
+
+        result = await session.execute(query, params)
+        row = result.mappings().first()
+        if row is None:
+            return None
+        return PatchResult(
+            old_values=_json_value(row["old_values"]) or {},
+            updated_at=row["updated_at"],
+            old_display_name=row["old_display_name"],
+            properties=(
+                _json_value(row["properties"]) or {} if return_properties else None
+            ),
+        )
+
+    @staticmethod
+    async def update_properties_batch(
+        session: AsyncSession,
+        entity_type: str,
+        changes: list[tuple[Any, dict[str, Any]]],
+    ) -> int:
+        """Merge property patches into many entities with a single executemany.
 
-            json_value = json.dumps(value)
+        Each patch is applied with the JSONB ``||`` operator, which for
+        top-level keys has the same effect as one jsonb_set per property.
+        The caller is responsible for committing.
+
+        Args:
+            session: Active database session
+            entity_type: Entity type shared by all entities
+            changes: (entity_id, {prop_name: value}) pairs
 
-            await session.execute(
-                update_query,
+        Returns:
+            Number of entities submitted for update
+        """
+        update_query = text(
+            """
+            UPDATE graph_entities
+            SET properties = COALESCE(properties, '{}'::jsonb) || CAST(:patch AS jsonb),
+                updated_at = now()
+            WHERE id = :numeric_id
+            AND entity_type = :entity_type
+            """
+        )
+
+        params = []
+        for entity_id, patch in changes:
+            numeric_id = _numeric_id(entity_id)
+            if numeric_id is None:
+                continue
+            params.append(
                 {
                     "numeric_id": numeric_id,
                     "entity_type": entity_type,
-                    "prop_name": prop_name,
-                    "json_value": json_value,
-                },
+                    "patch": json.dumps(patch),
+                }
             )
-            return True
-        except Exception as e:
-            logger.error(f"Error updating property {prop_name} on {entity_id}: {e}")
-            return False
+
+        if params:
+            await session.execute(update_query, params)
+        return len(params)
 
     @staticmethod
     async def update_properties(
         session: AsyncSession, entity_type: str, entity_id: Any, changes: dict[str, Any]
     ) -> bool:
-        """Update multiple properties.
-
-        Currently implemented as multiple jsonb_set calls for simplicity,
-        but could be optimized into a single jsonb_deep_merge if available.
+        """Update multiple properties with a single ``properties || :patch``.
 
         Args:
             session: Active database session
@@ -91,13 +232,15 @@ class PersistenceService:
             changes: Dict of property changes
 
         Returns:
-            True if all updates succeeded
+            True if the entity was updated
         """
-        success = True
-        for prop_name, value in changes.items():
-            res = await PersistenceService.update_property(
-                session, entity_type, entity_id, prop_name, value
+        try:
+            result = await PersistenceService.patch_properties(
+                session, entity_type, entity_id, changes
             )
-            if not res:
-                success = False
-        return success
+        except Exception as e:
+            logger.error(
+                f"Error updating properties {list(changes)} on {entity_id}: {e}"
+            )
+            return False
+        return result is not None
@@ -10,8 +10,118 @@ SQL/PGQ 参考：
 - PostgreSQL 18 GRAPH_TABLE 语法
 """
 
-from typing import Any, Optional, List, Tuple
-from app.rule_engine.models import ForClause
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, List, Tuple
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+from app.rule_engine.models import ActionDef, ForClause, RuleDef, SetStatement
+from app.services.property_index import json_equivalents
+
+# graph_entities 的基础列，其余路径视为 properties 中的属性
+_BASE_COLUMNS = {
+    "id",
+    "name",
+    "entity_type",
+    "is_instance",
+    "uri",
+    "properties",
+    "source_id",
+}
+
+# 与数值字面量比较时使用 graph_try_numeric()，以命中数值属性表达式索引
+_NUMERIC_COMPARISONS = {"==": "=", "<": "<", ">": ">", "<=": "<=", ">=": ">="}
+
+
+@dataclass(frozen=True)
+class _BoundParam:
+    """编译期外层绑定变量的占位：实体 ID 在执行时作为绑定参数传入"""
+
+    name: str
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """FOR 子句编译得到的参数化查询
+
+    SQL 文本只取决于规则本身，每次触发只替换绑定参数，
+    数据库可以复用同一个预编译语句（asyncpg 按 SQL 文本缓存 prepared statement）。
+    """
+
+    sql: str
+    statement: TextClause
+    params: dict[str, Any]  # 规则中的字面量参数
+    bound_params: tuple[tuple[str, str], ...]  # (参数名, 外层绑定变量名)
+    # 每次执行时求值的 SET 常量值：(参数名, 值表达式 AST)
+    value_params: tuple[tuple[str, Any], ...] = ()
+
+    def bind(self, bindings: dict[str, tuple[str, Any]]) -> dict[str, Any]:
+        """生成一次执行的参数：字面量参数加上本次绑定的实体 ID"""
+        params = dict(self.params)
+        for name, var in self.bound_params:
+            params[name] = _coerce_entity_id(bindings[var][1])
+        return params
+
+
+def _coerce_entity_id(entity_id: Any) -> Any:
+    """实体 ID 参数与 graph_entities.id 的整数类型对齐"""
+    if isinstance(entity_id, str) and entity_id.lstrip("-").isdigit():
+        return int(entity_id)
+    return entity_id
+
+
+def compile_for_clause(
+    for_clause: ForClause, bound_vars: Iterable[str] = ()
+) -> CompiledQuery:
+    """获取 FOR 子句的参数化查询，首次使用时编译并缓存在子句上
+
+    Args:
+        for_clause: FOR 子句 AST
+        bound_vars: 执行时已绑定的外层变量名
+    """
+    key = frozenset(bound_vars)
+    plan = for_clause.plans.get(key)
+    if plan is None:
+        plan = PGQTranslator().compile_for(for_clause, key)
+        for_clause.plans[key] = plan
+    return plan
+
+
+def compile_set_update(
+    for_clause: ForClause, bound_vars: Iterable[str] = ()
+) -> Optional[CompiledQuery]:
+    """获取 FOR 子句整体执行的 UPDATE 语句，首次使用时编译并缓存在子句上
+
+    仅适用于子句体全部是 SET 语句、且每个值都是常量或可翻译属性引用的情况，
+    否则返回 None（同样缓存），由调用方逐行求值。
+    """
+    key = frozenset(bound_vars)
+    if key not in for_clause.set_plans:
+        for_clause.set_plans[key] = PGQTranslator().compile_set_update(for_clause, key)
+    return for_clause.set_plans[key]
+
+
+def compile_precondition_checks(action: ActionDef) -> CompiledQuery:
+    """获取动作批量执行的实体加载与前置条件检查查询，首次使用时编译并缓存在动作上"""
+    if action.check_plan is None:
+        action.check_plan = PGQTranslator().compile_precondition_checks(action)
+    return action.check_plan
+
+
+def compile_rule(rule: RuleDef, bound_vars: Iterable[str] = ("this", "e")) -> None:
+    """预编译规则中所有 FOR 子句（含嵌套）的查询
+
+    默认绑定与事件触发执行一致：根 FOR 绑定 this/e，
+    嵌套 FOR 额外绑定外层 FOR 的变量。
+    """
+    pending = [(rule.body, frozenset(bound_vars))]
+    while pending:
+        for_clause, bound = pending.pop()
+        compile_for_clause(for_clause, bound)
+        for stmt in for_clause.statements:
+            if isinstance(stmt, ForClause):
+                pending.append((stmt, bound | {for_clause.variable}))
 
 
 class PGQTranslator:
@@ -32,6 +142,285 @@ class PGQTranslator:
         self._bound_vars: dict[str, tuple[str, str]] = {}
         self._param_counter = 0
         self._outer_aliases: set[str] = set()
+        # 编译参数化查询时收集的字面量参数；为 None 时字面量直接内联
+        self._params: Optional[dict[str, Any]] = None
+        self._inline_args = False
+
+    def compile_for(
+        self, for_clause: ForClause, bound_vars: Iterable[str] = ()
+    ) -> CompiledQuery:
+        """将 FOR 子句编译为参数化查询
+
+        字面量和外层绑定变量的实体 ID 都转换为绑定参数，
+        同一规则的每次触发生成相同的 SQL 文本。
+
+        Args:
+            for_clause: FOR 子句 AST
+            bound_vars: 执行时已绑定的外层变量名
+
+        Returns:
+            编译后的查询
+        """
+        saved = (
+            self._bound_vars,
+            self._outer_aliases,
+            self._params,
+            self._param_counter,
+        )
+        self._bound_vars = {}
+        self._outer_aliases = set()
+        self._params = {}
+        self._param_counter = 0
+        try:
+            bound_params = []
+            for index, var in enumerate(sorted(bound_vars)):
+                param = _BoundParam(f"bound{index}")
+                self._bound_vars[var] = (None, param)
+                bound_params.append((param.name, var))
+
+            sql = self.translate_for(for_clause)
+
+            # 只保留 SQL 中实际引用的参数（部分操作数会先翻译再被改写丢弃）
+            def referenced(name: str) -> bool:
+                return re.search(rf":{name}\b", sql) is not None
+
+            return CompiledQuery(
+                sql=sql,
+                statement=text(sql),
+                params={
+                    name: value
+                    for name, value in self._params.items()
+                    if referenced(name)
+                },
+                bound_params=tuple(
+                    (name, var) for name, var in bound_params if referenced(name)
+                ),
+            )
+        finally:
+            (
+                self._bound_vars,
+                self._outer_aliases,
+                self._params,
+                self._param_counter,
+            ) = saved
+
+    def compile_set_update(
+        self, for_clause: ForClause, bound_vars: Iterable[str] = ()
+    ) -> Optional[CompiledQuery]:
+        """将只包含 SET 语句的 FOR 子句编译为一条 UPDATE ... FROM (<FOR 查询>)
+
+        与逐行执行语义一致：所有 SET 都基于查询时的属性快照求值，
+        同一属性多次赋值时以最后一次为准。
+
+        Args:
+            for_clause: FOR 子句 AST
+            bound_vars: 执行时已绑定的外层变量名
+
+        Returns:
+            编译后的 UPDATE 语句；存在需要逐行求值的 SET 时返回 None
+        """
+        statements = for_clause.statements
+        if not statements or not all(
+            isinstance(stmt, SetStatement) for stmt in statements
+        ):
+            return None
+
+        var = for_clause.variable
+        select = compile_for_clause(for_clause, bound_vars)
+        params = dict(select.params)
+        value_params = []
+
+        properties = "COALESCE(_target.properties, '{}'::jsonb)"
+        for index, stmt in enumerate(statements):
+            parts = stmt.target.split(".")
+            if len(parts) != 2:
+                return None
+
+            if not self._references_row(stmt.value, var):
+                # 与当前行无关的值每次执行只求值一次
+                name = f"set{index}_value"
+                value_params.append((name, stmt.value))
+                value_sql = f"CAST(:{name} AS JSONB)"
+            else:
+                value_sql = self._row_value_sql(stmt.value, var, index, params)
+                if value_sql is None:
+                    return None
+
+            params[f"set{index}_key"] = parts[1]
+            properties = (
+                f"jsonb_set({properties}, ARRAY[:set{index}_key]::text[], {value_sql})"
+            )
+
+        sql = (
+            f"UPDATE graph_entities AS _target\n"
+            f"SET properties = {properties},\n"
+            f"    updated_at = now()\n"
+            f"FROM (\n{select.sql}) AS {var}\n"
+            f"WHERE _target.id = {var}.id\n"
+        )
+        return CompiledQuery(
+            sql=sql,
+            statement=text(sql),
+            params=params,
+            bound_params=select.bound_params,
+            value_params=tuple(value_params),
+        )
+
+    def _references_row(self, value: Any, var: str) -> bool:
+        """值表达式是否依赖当前行（引用循环变量 / this，或包含 EXISTS）"""
+        if isinstance(value, tuple) and value:
+            if value[0] == "id" and isinstance(value[1], str):
+                return value[1].split(".")[0] in (var, "this")
+            if value[0] == "exists":
+                return True
+            return any(self._references_row(item, var) for item in value[1:])
+        if isinstance(value, list):
+            return any(self._references_row(item, var) for item in value)
+        return False
+
+    def _row_value_sql(
+        self, value: Any, var: str, index: int, params: dict[str, Any]
+    ) -> Optional[str]:
+        """把引用当前行属性的值翻译为 JSONB 表达式，无法翻译时返回 None
+
+        只支持直接引用属性（如 po.amount），name/source_id 在逐行执行时
+        取自基础列，不能从 properties 读取。
+        """
+        if not (isinstance(value, tuple) and value[0] == "id"):
+            return None
+        parts = value[1].split(".")
+        if len(parts) < 2 or parts[1] in ("name", "source_id"):
+            return None
+
+        keys = []
+        for depth, key in enumerate(parts[1:]):
+            name = f"set{index}_path{depth}"
+            params[name] = key
+            keys.append(f":{name}")
+        # 属性缺失时与逐行执行一致写入 JSON null
+        return (
+            f"COALESCE({var}.properties #> ARRAY[{', '.join(keys)}]::text[], "
+            f"'null'::jsonb)"
+        )
+
+    def compile_precondition_checks(self, action: ActionDef) -> CompiledQuery:
+        """将动作的批量实体加载与前置条件检查编译为一条查询
+
+        查询按 ``this.id = ANY(:ids)`` 一次加载全部目标实体；
+        可翻译的前置条件（this 属性与字面量比较、IS NULL、EXISTS 及其组合）
+        作为 ``check{i}`` 布尔列随实体一起返回，i 为前置条件序号，
+        其余前置条件（如引用动作参数）由调用方逐个实体求值。
+        目标实体按 id 顺序加 FOR UPDATE 行锁，直到事务提交，
+        使前置条件与旧值在批量更新前不被并发修改。
+
+        Args:
+            action: 动作定义
+
+        Returns:
+            编译后的查询，执行时传入 ids 参数
+        """
+        saved = (
+            self._bound_vars,
+            self._outer_aliases,
+            self._params,
+            self._param_counter,
+        )
+        # this 绑定为外层行的 id 列，EXISTS 子查询与外层行关联
+        self._bound_vars = {"this": (action.entity_type, "this.id")}
+        self._outer_aliases = {"this"}
+        self._params = {}
+        self._param_counter = 0
+        try:
+            columns = ["this.id", "this._display_name AS name", "this.properties"]
+            for index, precondition in enumerate(action.preconditions):
+                if self._is_row_condition(precondition.condition):
+                    check_sql = self._translate_check(precondition.condition)
+                    columns.append(f"COALESCE({check_sql}, false) AS check{index}")
+
+            sql = (
+                f"SELECT {', '.join(columns)}\n"
+                f"FROM graph_entities this\n"
+                f"WHERE this.entity_type = {self._literal(action.entity_type)}\n"
+                f"AND this.is_instance = true\n"
+                f"AND this.id = ANY(:ids)\n"
+                f"ORDER BY this.id\n"
+                f"FOR UPDATE OF this\n"
+            )
+            return CompiledQuery(
+                sql=sql,
+                statement=text(sql),
+                params={
+                    name: value
+                    for name, value in self._params.items()
+                    if re.search(rf":{name}\b", sql)
+                },
+                bound_params=(),
+            )
+        finally:
+            (
+                self._bound_vars,
+                self._outer_aliases,
+                self._params,
+                self._param_counter,
+            ) = saved
+
+    def _is_row_condition(self, condition: Any) -> bool:
+        """前置条件能否在 SQL 中与逐个实体求值得到一致结果
+
+        只接受 this 的 properties 属性与同类型字面量的比较，避免文本与数值比较、
+        基础列（name/id 等在实体数据中取值不同）以及动作参数的引用。
+        """
+        if not isinstance(condition, tuple) or not condition:
+            return False
+        op = condition[0]
+        if op in ("and", "or"):
+            return self._is_row_condition(condition[1]) and self._is_row_condition(
+                condition[2]
+            )
+        if op == "not":
+            return self._is_row_condition(condition[1])
+        if op == "exists":
+            # 与逐个求值使用同一翻译，只是 this 改为关联外层行
+            return True
+        if op == "is_null":
+            return self._this_property(condition[1])
+        if op != "op":
+            return False
+
+        _, operator, left, right = condition
+        if not self._this_property(left):
+            return False
+        if operator == "IN":
+            return (
+                isinstance(right, list)
+                and bool(right)
+                and all(isinstance(item, str) for item in right)
+            )
+        if isinstance(right, bool) or not self._is_literal(right):
+            return False
+        if operator in ("<", ">", "<=", ">="):
+            return isinstance(right, (int, float))
+        if operator in ("==", "!="):
+            return isinstance(right, str)
+        return False
+
+    def _this_property(self, value: Any) -> bool:
+        """是否为 this 的单层 properties 属性引用（如 this.status）"""
+        prop = self._property_access(value)
+        return prop is not None and prop[0] == "this"
+
+    def _translate_check(self, condition: Any) -> str:
+        """翻译前置条件为布尔表达式，EXISTS 需要补上外层 EXISTS (...)"""
+        op = condition[0]
+        if op in ("and", "or"):
+            left = self._translate_check(condition[1])
+            right = self._translate_check(condition[2])
+            return f"({left} {op.upper()} {right})"
+        if op == "not":
+            return f"NOT {self._translate_check(condition[1])}"
+        if op == "exists":
+            return f"EXISTS ({self._translate_exists_pattern(condition[1])})"
+        return f"({self.translate_condition(condition)})"
 
     def translate_for(self, for_clause: ForClause) -> str:
         """将 FOR 子句转换为 SQL/PGQ 查询
@@ -58,7 +447,7 @@ class PGQTranslator:
 
         # 构建 SELECT 查询
         query = f"SELECT {alias}.*\nFROM graph_entities {alias}\n"
-        query += f"WHERE {alias}.entity_type = '{entity_type}'\n"
+        query += f"WHERE {alias}.entity_type = {self._literal(entity_type)}\n"
         query += f"AND {alias}.is_instance = true\n"
 
         if condition:
@@ -177,6 +566,19 @@ class PGQTranslator:
                 left_sql, rel_name, direction, right_sql
             )
 
+        # 单层属性与字面量比较：改写为可命中 JSONB 属性索引的形式
+        prop = self._property_access(left)
+        if prop and self._is_literal(right):
+            if (
+                isinstance(right, (int, float))
+                and not isinstance(right, bool)
+                and operator in _NUMERIC_COMPARISONS
+            ):
+                return f"graph_try_numeric({left_sql}) {_NUMERIC_COMPARISONS[operator]} {right_sql}"
+            if operator == "==" and isinstance(right, str):
+                alias, key = prop
+                return self._translate_containment(alias, key, right)
+
         if operator == "!=":
             return f"({left_sql} IS NULL OR {left_sql} <> {right_sql})"
 
@@ -191,6 +593,41 @@ class PGQTranslator:
         sql_op = op_map.get(str(operator), str(operator))
         return f"{left_sql} {sql_op} {right_sql}"
 
+    def _property_access(self, value: Any) -> Optional[Tuple[str, str]]:
+        """若 value 是单层属性路径（如 po.amount），返回 (别名, 属性键)"""
+        if isinstance(value, tuple) and len(value) > 1 and value[0] in ("path", "id"):
+            value = value[1]
+        if not isinstance(value, str) or "." not in value:
+            return None
+        parts = value.split(".")
+        if len(parts) != 2 or parts[1] in _BASE_COLUMNS:
+            return None
+        return parts[0], parts[1]
+
+    def _is_literal(self, value: Any) -> bool:
+        """判断是否为字面量（而不是路径或表达式）"""
+        if isinstance(value, bool) or value is None:
+            return False
+        if isinstance(value, (int, float)):
+            return True
+        if isinstance(value, str):
+            return "." not in value and value not in self._bound_vars
+        return False
+
+    def _translate_containment(self, alias: str, key: str, value: str) -> str:
+        """将 properties->>'key' = 'value' 改写为 @> 包含查询，可使用 GIN 索引"""
+        clauses = []
+        for candidate in json_equivalents(value):
+            doc = json.dumps({key: candidate}, ensure_ascii=False)
+            if self._params is not None:
+                clauses.append(
+                    f"{alias}.properties @> CAST({self._literal(doc)} AS JSONB)"
+                )
+            else:
+                doc = doc.replace("'", "''")
+                clauses.append(f"{alias}.properties @> '{doc}'::jsonb")
+        return "(" + " OR ".join(clauses) + ")"
+
     def _translate_relationship_pattern(
         self, left: str, rel_name: str, direction: str, right: str
     ) -> str:
@@ -240,7 +677,7 @@ class PGQTranslator:
                     right, right_id, rel_name, left
                 )
             else:
-                return f"EXISTS (SELECT 1 FROM graph_relationships r WHERE r.relationship_type = '{rel_name}')"
+                return f"EXISTS (SELECT 1 FROM graph_relationships r WHERE r.relationship_type = {self._literal(rel_name)})"
 
         elif direction == "<-":
             # 左 <- 右
@@ -250,11 +687,11 @@ class PGQTranslator:
                     right, right_id, rel_name, left
                 )
             else:
-                return f"EXISTS (SELECT 1 FROM graph_relationships r WHERE r.relationship_type = '{rel_name}')"
+                return f"EXISTS (SELECT 1 FROM graph_relationships r WHERE r.relationship_type = {self._literal(rel_name)})"
 
         else:
             # 无向
-            return f"EXISTS (SELECT 1 FROM graph_relationships r WHERE r.relationship_type = '{rel_name}')"
+            return f"EXISTS (SELECT 1 FROM graph_relationships r WHERE r.relationship_type = {self._literal(rel_name)})"
 
     def _exists_relationship_from_bound(
         self,
@@ -266,29 +703,27 @@ class PGQTranslator:
         condition: str = None,
     ) -> str:
         """生成从已绑定变量出发的关系 EXISTS 查询"""
-        sid = (
-            source_id
-            if isinstance(source_id, (int, str)) and "." in str(source_id)
-            else (source_id if isinstance(source_id, int) else f"'{source_id}'")
-        )
+        sid = self._id_sql(source_id)
 
         if target_var in self._outer_aliases:
             # Correlation with outer query (no JOIN needed)
             return f"""EXISTS (
                 SELECT 1 FROM graph_relationships r
                 WHERE r.source_id = {sid}
-                AND r.relationship_type = '{rel_type}'
+                AND r.relationship_type = {self._literal(rel_type)}
                 AND r.target_id = {target_var}.id
             )"""
         elif target_var not in self._bound_vars:
             # New variable, need JOIN
             where_parts = [
                 f"r.source_id = {sid}",
-                f"r.relationship_type = '{rel_type}'",
+                f"r.relationship_type = {self._literal(rel_type)}",
                 f"r.target_id = {target_var}.id",
             ]
             if target_type:
-                where_parts.append(f"{target_var}.entity_type = '{target_type}'")
+                where_parts.append(
+                    f"{target_var}.entity_type = {self._literal(target_type)}"
+                )
             if condition:
                 where_parts.append(condition)
 
@@ -301,7 +736,7 @@ class PGQTranslator:
             # Both are bound.
             where_parts = [
                 f"r.source_id = {sid}",
-                f"r.relationship_type = '{rel_type}'",
+                f"r.relationship_type = {self._literal(rel_type)}",
                 f"r.target_id = {target_var}.id",
             ]
             if condition:
@@ -322,29 +757,27 @@ class PGQTranslator:
         condition: str = None,
     ) -> str:
         """生成指向已绑定变量的关系 EXISTS 查询"""
-        tid = (
-            target_id
-            if isinstance(target_id, (int, str)) and "." in str(target_id)
-            else (target_id if isinstance(target_id, int) else f"'{target_id}'")
-        )
+        tid = self._id_sql(target_id)
 
         if source_var in self._outer_aliases:
             # Correlation with outer query
             return f"""EXISTS (
                 SELECT 1 FROM graph_relationships r
                 WHERE r.target_id = {tid}
-                AND r.relationship_type = '{rel_type}'
+                AND r.relationship_type = {self._literal(rel_type)}
                 AND r.source_id = {source_var}.id
             )"""
         elif source_var not in self._bound_vars:
             # New variable, need JOIN
             where_parts = [
                 f"r.target_id = {tid}",
-                f"r.relationship_type = '{rel_type}'",
+                f"r.relationship_type = {self._literal(rel_type)}",
                 f"r.source_id = {source_var}.id",
             ]
             if source_type:
-                where_parts.append(f"{source_var}.entity_type = '{source_type}'")
+                where_parts.append(
+                    f"{source_var}.entity_type = {self._literal(source_type)}"
+                )
             if condition:
                 where_parts.append(condition)
 
@@ -356,7 +789,7 @@ class PGQTranslator:
         else:
             where_parts = [
                 f"r.target_id = {tid}",
-                f"r.relationship_type = '{rel_type}'",
+                f"r.relationship_type = {self._literal(rel_type)}",
                 f"r.source_id = {source_var}.id",
             ]
             if condition:
@@ -371,13 +804,13 @@ class PGQTranslator:
         self, source_id: Any, rel_type: str, target_id: Any
     ) -> str:
         """生成两个已绑定变量之间的关系 EXISTS 查询"""
-        sid = source_id if isinstance(source_id, int) else f"{source_id}"
-        tid = target_id if isinstance(target_id, int) else f"{target_id}"
+        sid = self._id_sql(source_id)
+        tid = self._id_sql(target_id)
         return f"""EXISTS (
             SELECT 1 FROM graph_relationships r
             WHERE r.source_id = {sid}
             AND r.target_id = {tid}
-            AND r.relationship_type = '{rel_type}'
+            AND r.relationship_type = {self._literal(rel_type)}
         )"""
 
     def _translate_path(self, path: str) -> str:
@@ -410,19 +843,10 @@ class PGQTranslator:
         attr = parts[1]
 
         # 基础列名直接访问
-        base_cols = {
-            "id",
-            "name",
-            "entity_type",
-            "is_instance",
-            "uri",
-            "properties",
-            "source_id",
-        }
         if attr == "name":
             return f"{alias}._display_name"
 
-        if attr in base_cols and len(parts) == 2:
+        if attr in _BASE_COLUMNS and len(parts) == 2:
             return f"{alias}.{attr}"
 
         # 属性访问: properties->'key1'->>'key2'
@@ -524,11 +948,11 @@ class PGQTranslator:
                 )
             else:
                 # Neither bound, return a generic join
-                sql = f"EXISTS (SELECT 1 FROM graph_entities {left_var} JOIN graph_relationships r ON r.source_id = {left_var}.id JOIN graph_entities {right_var} ON r.target_id = {right_var}.id WHERE r.relationship_type = '{rel_name}'"
+                sql = f"EXISTS (SELECT 1 FROM graph_entities {left_var} JOIN graph_relationships r ON r.source_id = {left_var}.id JOIN graph_entities {right_var} ON r.target_id = {right_var}.id WHERE r.relationship_type = {self._literal(rel_name)}"
                 if left_type:
-                    sql += f" AND {left_var}.entity_type = '{left_type}'"
+                    sql += f" AND {left_var}.entity_type = {self._literal(left_type)}"
                 if right_type:
-                    sql += f" AND {right_var}.entity_type = '{right_type}'"
+                    sql += f" AND {right_var}.entity_type = {self._literal(right_type)}"
                 if condition_sql:
                     sql += f" AND {condition_sql}"
                 sql += ")"
@@ -544,11 +968,11 @@ class PGQTranslator:
                     left_var, left_id, rel_name, right_var, right_type, condition_sql
                 )
             else:
-                sql = f"EXISTS (SELECT 1 FROM graph_entities {right_var} JOIN graph_relationships r ON r.source_id = {right_var}.id JOIN graph_entities {left_var} ON r.target_id = {left_var}.id WHERE r.relationship_type = '{rel_name}'"
+                sql = f"EXISTS (SELECT 1 FROM graph_entities {right_var} JOIN graph_relationships r ON r.source_id = {right_var}.id JOIN graph_entities {left_var} ON r.target_id = {left_var}.id WHERE r.relationship_type = {self._literal(rel_name)}"
                 if right_type:
-                    sql += f" AND {right_var}.entity_type = '{right_type}'"
+                    sql += f" AND {right_var}.entity_type = {self._literal(right_type)}"
                 if left_type:
-                    sql += f" AND {left_var}.entity_type = '{left_type}'"
+                    sql += f" AND {left_var}.entity_type = {self._literal(left_type)}"
                 if condition_sql:
                     sql += f" AND {condition_sql}"
                 sql += ")"
@@ -574,7 +998,12 @@ class PGQTranslator:
         Returns:
             SQL 函数调用表达式
         """
-        arg_list = [self._translate_value(arg) for arg in args]
+        # 函数参数保持内联：参数化后部分重载函数无法推断参数类型
+        inline_args, self._inline_args = self._inline_args, True
+        try:
+            arg_list = [self._translate_value(arg) for arg in args]
+        finally:
+            self._inline_args = inline_args
         return f"{func_name}({', '.join(arg_list)})"
 
     def _translate_value(self, value: Any) -> str:
@@ -594,13 +1023,13 @@ class PGQTranslator:
             if "." in value or value in self._bound_vars:
                 return self._translate_path(value)
             # 否则是字符串字面量
-            return f"'{value}'"
+            return self._literal(value)
 
         if isinstance(value, bool):
             return "true" if value else "false"
 
         if isinstance(value, (int, float)):
-            return str(value)
+            return self._literal(value)
 
         if isinstance(value, list):
             items = [self._translate_value(item) for item in value]
@@ -619,6 +1048,31 @@ class PGQTranslator:
         # 回退：转换为字符串
         return str(value)
 
+    def _literal(self, value: Any) -> str:
+        """字面量：编译参数化查询时转换为绑定参数，否则内联"""
+        if self._params is not None and not self._inline_args:
+            name = self._get_next_param()
+            self._params[name] = value
+            return f":{name}"
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        sql = "'" + str(value).replace("'", "''") + "'"
+        if self._params is not None:
+            # text() 会把 ":name" 解析为绑定参数
+            sql = sql.replace(":", "\\:")
+        return sql
+
+    def _id_sql(self, entity_id: Any) -> str:
+        """已绑定变量的实体 ID"""
+        if isinstance(entity_id, _BoundParam):
+            return f":{entity_id.name}"
+        if isinstance(entity_id, int):
+            return str(entity_id)
+        if "." in str(entity_id):
+            # 路径引用
+            return str(entity_id)
+        return f"'{entity_id}'"
+
     # ==================== 变量绑定 ====================
 
     def bind_variable(self, var: str, entity_type: str, entity_id: str) -> None:
@@ -10,6 +10,7 @@ from app.rule_engine.models import (
     RuleDef,
     UpdateEvent,
     Trigger,
+    TriggerType,
     ForClause,
     SetStatement,
     TriggerStatement,
@@ -17,7 +18,14 @@ from app.rule_engine.models import (
 from app.rule_engine.context import EvaluationContext
 from app.rule_engine.evaluator import ExpressionEvaluator
 from app.rule_engine.persistence import PersistenceService
-from app.rule_engine.pgq_translator import PGQTranslator
+from app.rule_engine.worker_pool import RuleWorkerPool
+from app.rule_engine.event_coalescer import EventCoalescer
+from app.rule_engine.pgq_translator import (
+    PGQTranslator,
+    CompiledQuery,
+    compile_for_clause,
+    compile_set_update,
+)
 from sqlalchemy import text
 
 if TYPE_CHECKING:
@@ -41,6 +49,11 @@ class RuleEngine:
         db_session: "AsyncSession | None" = None,
         session_provider: Any = None,
         action_executor: Any = None,
+        max_workers: int = 4,
+        max_queue_size: int = 10000,
+        coalesce_window: float = 0.0,
+        log_writer: Any = None,
+        overflow: str = "wait",
     ):
         """Initialize the rule engine.
 
@@ -49,13 +62,35 @@ class RuleEngine:
             registry: The rule registry to use
             db_session: Initial database session (optional)
             session_provider: Async callable that returns a valid database session
+            max_workers: Number of events executed concurrently
+            max_queue_size: Number of events that may wait for a worker
+            coalesce_window: Seconds to merge events of the same entity
+                before executing rules (0 disables merging)
+            log_writer: Batched ExecutionLogWriter; logs are written inline
+                through the rule's session when omitted
+            overflow: What to do when max_queue_size events are waiting:
+                "wait" holds back producers awaiting wait_for_capacity,
+                "drop" discards new events
         """
         self.action_registry = action_registry
         self.registry = registry
         self.db_session = db_session
         self.session_provider = session_provider
         self.action_executor = action_executor
+        self.log_writer = log_writer
         self.translator = PGQTranslator()
+        self.worker_pool = RuleWorkerPool(
+            self._handle_event_async,
+            workers=max_workers,
+            max_queue_size=max_queue_size,
+            overflow=overflow,
+        )
+        self.coalescer = EventCoalescer(
+            self.worker_pool.submit,
+            window=coalesce_window,
+            matcher=self._match_rules,
+            max_pending=max_queue_size,
+        )
 
     @asynccontextmanager
     async def _session_scope(self):
@@ -82,7 +117,9 @@ class RuleEngine:
     def on_event(self, event: UpdateEvent) -> list[dict[str, Any]]:
         """Handle a graph update event synchronously.
 
-        This is called by the event emitter. It schedules async execution.
+        This is called by the event emitter. Events of the same entity are
+        merged within the coalescing window, then queued on the bounded
+        worker pool; events of the same entity run in order.
 
         Args:
             event: The update event to handle
@@ -90,16 +127,43 @@ class RuleEngine:
         Returns:
             Empty list (results are processed asynchronously)
         """
-        # Run async execution in background
         try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(self._handle_event_async(event))
+            asyncio.get_running_loop()
         except RuntimeError:
             # No running loop, try to run in new loop
             asyncio.run(self._handle_event_async(event))
+            return []
 
+        self.coalescer.submit(event)
         return []
 
+    async def wait_for_capacity(self) -> None:
+        """Wait until the rule queues have room (backpressure for producers).
+
+        Registered on the event emitter, so async producers such as actions,
+        batch actions and entity updates slow down to the pace of rule
+        execution instead of overflowing the queues.
+        """
+        await self.worker_pool.wait_for_capacity()
+
+    async def flush(self) -> None:
+        """Dispatch coalesced events and wait until all have been executed."""
+        self.coalescer.flush()
+        await self.worker_pool.flush()
+
+    async def shutdown(self, timeout: float | None = None) -> None:
+        """Drain queued events and stop the rule workers.
+
+        Args:
+            timeout: Maximum seconds to wait for queued events
+        """
+        self.coalescer.flush()
+        await self.worker_pool.close(timeout)
+
+    def metrics(self) -> dict[str, Any]:
+        """Get rule execution queue and event coalescing metrics."""
+        return {**self.worker_pool.metrics(), **self.coalescer.metrics()}
+
     async def _handle_event_async(self, event: UpdateEvent) -> list[dict[str, Any]]:
         """Handle a graph update event asynchronously.
 
@@ -209,26 +273,37 @@ class RuleEngine:
         # But our FOR clause handles searching.
 
         bindings = {}
-        result = await self._execute_for_clause_async(
-            rule_def.body, event, session, bindings
-        )
-
-        # Record execution log
         try:
-            from app.repositories.rule_repository import ExecutionLogRepository
-
-            repo = ExecutionLogRepository(session)
-            await repo.create(
+            result = await self._execute_for_clause_async(
+                rule_def.body, event, session, bindings
+            )
+        except Exception as e:
+            logger.exception(f"Error executing scheduled rule {db_rule.name}")
+            await session.rollback()
+            await self._record_execution_log(
+                session,
                 type="RULE_SCHEDULED",
                 name=db_rule.name,
                 entity_id=None,
                 actor_name="scheduler",
                 actor_type="SYSTEM",
-                success=True,
-                detail=result,
+                success=False,
+                detail={"error": str(e)},
             )
-        except Exception as log_err:
-            logger.error(f"Failed to record scheduled execution log: {log_err}")
+            return {"rule": db_rule.name, "error": str(e), "success": False}
+        await session.commit()
+
+        # Record execution log
+        await self._record_execution_log(
+            session,
+            type="RULE_SCHEDULED",
+            name=db_rule.name,
+            entity_id=None,
+            actor_name="scheduler",
+            actor_type="SYSTEM",
+            success=True,
+            detail=result,
+        )
 
         return {
             "rule": db_rule.name,
@@ -237,29 +312,31 @@ class RuleEngine:
             "statements_executed": result.get("statements_executed", 0),
         }
 
-    def _match_rules(self, event: UpdateEvent) -> list[RuleDef]:
+    def _match_rules(self, event: UpdateEvent) -> tuple[RuleDef, ...]:
         """Match rules to an event.
 
-        Finds all rules whose triggers match the event type,
-        entity type, and property.
+        Finds all rules whose triggers match the event type and entity
+        type, on either the changed property or any property. Coalesced
+        events match the rules of every changed property, each rule once.
 
         Args:
             event: The update event
 
         Returns:
-            List of matching rules ordered by priority
+            Matching rules ordered by priority (shared, do not modify)
         """
-        from app.rule_engine.models import Trigger, TriggerType
-
-        # Build a trigger from the event
-        trigger = Trigger(
-            type=TriggerType.UPDATE,
-            entity_type=event.entity_type,
-            property=event.property,
-        )
+        if len(event.changes) <= 1:
+            return self.registry.match(
+                TriggerType.UPDATE, event.entity_type, event.property
+            )
 
-        # Get matching rules from registry
-        return self.registry.get_by_trigger(trigger)
+        rules: dict[str, RuleDef] = {}
+        for prop in event.changes:
+            for rule in self.registry.match(
+                TriggerType.UPDATE, event.entity_type, prop
+            ):
+                rules.setdefault(rule.name, rule)
+        return tuple(sorted(rules.values(), key=lambda rule: -rule.priority))
 
     async def _execute_rule_async(
         self, rule: RuleDef, event: UpdateEvent, session: "AsyncSession"
@@ -291,28 +368,23 @@ class RuleEngine:
             result = await self._execute_for_clause_async(
                 for_clause, event, session, bindings
             )
+            # All writes of one rule firing are committed together
+            await session.commit()
 
             # Record execution log
-            try:
-                from app.repositories.rule_repository import ExecutionLogRepository
-
-                repo = ExecutionLogRepository(session)
-                await repo.create(
-                    type="RULE",
-                    name=rule.name,
-                    entity_id=(
-                        str(event.entity_id) if event.entity_id is not None else None
-                    ),
-                    actor_name=event.actor_name,
-                    actor_type=event.actor_type,
-                    success=True,
-                    detail={
-                        "entities_affected": result.get("entities_affected", 0),
-                        "statements_executed": result.get("statements_executed", 0),
-                    },
-                )
-            except Exception as log_err:
-                logger.error(f"Failed to record execution log: {log_err}")
+            await self._record_execution_log(
+                session,
+                type="RULE",
+                name=rule.name,
+                entity_id=event.entity_id,
+                actor_name=event.actor_name,
+                actor_type=event.actor_type,
+                success=True,
+                detail={
+                    "entities_affected": result.get("entities_affected", 0),
+                    "statements_executed": result.get("statements_executed", 0),
+                },
+            )
 
             return {
                 "rule": rule.name,
@@ -323,26 +395,43 @@ class RuleEngine:
 
         except Exception as e:
             logger.exception(f"Error executing rule {rule.name}")
+            # Discard the partial writes of this firing before logging the failure
+            await session.rollback()
             # Record failed execution log
-            try:
-                from app.repositories.rule_repository import ExecutionLogRepository
-
-                repo = ExecutionLogRepository(session)
-                await repo.create(
-                    type="RULE",
-                    name=rule.name,
-                    entity_id=(
-                        str(event.entity_id) if event.entity_id is not None else None
-                    ),
-                    actor_name=event.actor_name,
-                    actor_type=event.actor_type,
-                    success=False,
-                    detail={"error": str(e)},
-                )
-            except Exception as log_err:
-                logger.error(f"Failed to record execution log: {log_err}")
+            await self._record_execution_log(
+                session,
+                type="RULE",
+                name=rule.name,
+                entity_id=event.entity_id,
+                actor_name=event.actor_name,
+                actor_type=event.actor_type,
+                success=False,
+                detail={"error": str(e)},
+            )
             return {"rule": rule.name, "error": str(e), "success": False}
 
+    async def _record_execution_log(
+        self, session: "AsyncSession", **fields: Any
+    ) -> None:
+        """Record an execution log entry.
+
+        With a log writer the entry is buffered and written in a batch;
+        otherwise it is inserted and committed through the given session.
+
+        Args:
+            session: Session of the rule execution
+            **fields: ExecutionLog fields (type, name, entity_id, ...)
+        """
+        if self.log_writer is not None:
+            self.log_writer.record(**fields)
+            return
+        try:
+            from app.repositories.rule_repository import ExecutionLogRepository
+
+            await ExecutionLogRepository(session).create(**fields)
+        except Exception as log_err:
+            logger.error(f"Failed to record execution log: {log_err}")
+
     async def _execute_for_clause_async(
         self,
         for_clause: ForClause,
@@ -363,16 +452,12 @@ class RuleEngine:
         Returns:
             Execution result with counts
         """
-        # Set up translator with bindings
-        self.translator.clear_bound_vars()
-        if bindings:
-            for var, (vtype, vid) in bindings.items():
-                self.translator.bind_variable(var, vtype, vid)
+        # The query is compiled once per rule and set of bound variables;
+        # each firing only supplies the bound entity ids as parameters
+        bindings = bindings or {}
+        plan = compile_for_clause(for_clause, bindings)
 
-        # Use the PGQ translator to generate SQL query
-        sql_query = self.translator.translate_for(for_clause)
-
-        logger.debug(f"Executing SQL query: {sql_query}")
+        logger.debug(f"Executing SQL query: {plan.sql}")
 
         entities_affected = 0
         statements_executed = 0
@@ -384,10 +469,21 @@ class RuleEngine:
                 "statements_executed": 0,
             }
 
-        from sqlalchemy import text
+        # SET-only bodies whose values need no per-row Python evaluation
+        # run as one UPDATE over the whole result set
+        update = compile_set_update(for_clause, bindings)
+        if update is not None:
+            return await self._execute_set_update(
+                for_clause, update, session, bindings, scope
+            )
+
+        # Otherwise SET-only bodies are evaluated per row and written in one batch
+        set_only = all(isinstance(stmt, SetStatement) for stmt in for_clause.statements)
+        pending_changes: list[tuple[Any, dict[str, Any]]] = []
+        pending_statements = 0
 
         try:
-            result = await session.execute(text(sql_query))
+            result = await session.execute(plan.statement, plan.bind(bindings))
             records = result.mappings().all()
 
             logger.info(f"Found {len(records)} matching entities for rule")
@@ -437,6 +533,18 @@ class RuleEngine:
                 )
                 evaluator = ExpressionEvaluator(eval_ctx)
 
+                if set_only:
+                    patch = {}
+                    for stmt in for_clause.statements:
+                        change = await self._evaluate_set_statement(stmt, evaluator)
+                        if change:
+                            patch[change[0]] = change[1]
+                            pending_statements += 1
+                    if patch:
+                        pending_changes.append((entity_id, patch))
+                    entities_affected += 1
+                    continue
+
                 # Execute each statement in the FOR clause
                 for stmt in for_clause.statements:
                     # Update bindings for this iteration
@@ -463,14 +571,72 @@ class RuleEngine:
 
                 entities_affected += 1
 
+            if pending_changes:
+                await PersistenceService.update_properties_batch(
+                    session, for_clause.entity_type, pending_changes
+                )
+                statements_executed += pending_statements
+
         except Exception as e:
+            # A failed statement aborts the transaction; fail the whole firing
             logger.error(f"Error executing FOR clause: {e}")
+            raise
 
         return {
             "entities_affected": entities_affected,
             "statements_executed": statements_executed,
         }
 
+    async def _execute_set_update(
+        self,
+        for_clause: ForClause,
+        update: CompiledQuery,
+        session: "AsyncSession",
+        bindings: dict[str, tuple[str, str]],
+        scope: dict[str, dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Execute a SET-only FOR clause as a single set-based UPDATE.
+
+        Values that do not depend on the current row are evaluated once
+        against the outer scope and passed as parameters.
+
+        Args:
+            for_clause: The FOR clause to execute
+            update: Compiled UPDATE statement for the clause
+            session: Database session
+            bindings: Variable bindings from parent scopes
+            scope: Variable properties from parent scopes
+
+        Returns:
+            Execution result with counts
+        """
+        logger.debug(f"Executing set-based SQL update: {update.sql}")
+
+        try:
+            params = update.bind(bindings)
+            if update.value_params:
+                evaluator = ExpressionEvaluator(
+                    EvaluationContext(
+                        entity={},
+                        old_values={},
+                        session=session,
+                        variables=dict(scope or {}),
+                    )
+                )
+                for name, value in update.value_params:
+                    params[name] = json.dumps(await evaluator.evaluate(value))
+
+            result = await session.execute(update.statement, params)
+            updated = result.rowcount
+        except Exception as e:
+            # Errors propagate so the rule firing is rolled back and logged as failed
+            logger.error(f"Error executing set-based FOR clause: {e}")
+            raise
+
+        logger.info(f"Updated {updated} {for_clause.entity_type} entities for rule")
+        # All SET statements of the clause run as a single UPDATE
+        return {"entities_affected": updated, "statements_executed": 1}
+
     async def _execute_statement_async(
         self,
         session: Any,
@@ -553,22 +719,7 @@ class RuleEngine:
             True if successful
         """
         try:
-            # Extract target property from the statement
-            target = stmt.target  # e.g., "e.creditLevel"
-            value = stmt.value
-
-            # Parse the target to get property name
-            parts = target.split(".")
-            if len(parts) != 2:
-                logger.error(f"Invalid SET target: {target}")
-                return False
-
-            target_var, prop_name = parts
-
-            # Evaluate the value with full scope for cross-variable references
-            if evaluator:
-                evaluated_value = await evaluator.evaluate(value)
-            else:
+            if not evaluator:
                 # Fallback should not happen in rule engine rule execution
                 # but good for safety
                 eval_ctx = EvaluationContext(
@@ -578,23 +729,52 @@ class RuleEngine:
                     variables=scope or {},
                 )
                 evaluator = ExpressionEvaluator(eval_ctx)
-                evaluated_value = await evaluator.evaluate(value)
+
+            change = await self._evaluate_set_statement(stmt, evaluator)
+            if not change:
+                return False
+            prop_name, evaluated_value = change
 
             logger.info(f"Executing SET: {entity_id}.{prop_name} = {evaluated_value}")
 
-            # Use PersistenceService to update the property safely
-            success = await PersistenceService.update_property(
+            # Use PersistenceService to update the property safely; the rule
+            # firing commits once all its statements have run
+            return await PersistenceService.update_property(
                 session, entity_type, entity_id, prop_name, evaluated_value
             )
 
-            if success:
-                await session.commit()
-                return True
+        except Exception as e:
+            logger.error(f"Error executing SET statement: {e}")
             return False
 
+    async def _evaluate_set_statement(
+        self, stmt: SetStatement, evaluator: ExpressionEvaluator
+    ) -> tuple[str, Any] | None:
+        """Evaluate the property name and value of a SET statement.
+
+        Args:
+            stmt: SetStatement to evaluate
+            evaluator: Expression evaluator for the current row
+
+        Returns:
+            (property name, value), or None if the statement is invalid
+        """
+        try:
+            # Extract target property from the statement
+            target = stmt.target  # e.g., "e.creditLevel"
+
+            # Parse the target to get property name
+            parts = target.split(".")
+            if len(parts) != 2:
+                logger.error(f"Invalid SET target: {target}")
+                return None
+
+            # Evaluate the value with full scope for cross-variable references
+            return parts[1], await evaluator.evaluate(stmt.value)
+
         except Exception as e:
             logger.error(f"Error executing SET statement: {e}")
-            return False
+            return None
 
     async def _execute_trigger_statement(
         self, session: Any, stmt: TriggerStatement, entity_type: str, entity_id: str
@@ -626,7 +806,9 @@ class RuleEngine:
                 if not executor:
                     from app.rule_engine.action_executor import ActionExecutor
 
-                    executor = ActionExecutor(self.action_registry)
+                    executor = ActionExecutor(
+                        self.action_registry, log_writer=self.log_writer
+                    )
 
                 # Create evaluation context for the action
                 # Note: We use an empty entity dict for now, or we could pass current properties
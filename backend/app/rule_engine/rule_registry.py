@@ -1,6 +1,15 @@
 from typing import Any
 from app.rule_engine.base_registry import BaseRegistry
-from app.rule_engine.models import RuleDef, Trigger
+from app.rule_engine.models import RuleDef, Trigger, TriggerType
+from app.rule_engine.pgq_translator import compile_rule
+
+# property -> rules, highest priority first; the None key holds rules that
+# trigger on any property of the entity
+PropertyDispatch = dict[str | None, tuple[RuleDef, ...]]
+DispatchTable = dict[tuple[TriggerType, str], PropertyDispatch]
+
+_NO_RULES: tuple[RuleDef, ...] = ()
+_NO_PROPERTIES: PropertyDispatch = {}
 
 
 class RuleRegistry(BaseRegistry):
@@ -8,13 +17,19 @@ class RuleRegistry(BaseRegistry):
 
     The rule registry stores RuleDef objects and provides lookup
     functionality by rule name or trigger type.
+
+    Trigger lookups go through a dispatch table that is rebuilt whenever
+    the set of rules changes. Every entry is a pre-sorted tuple that
+    already includes the entity's property-less rules, and the table is
+    replaced with a single assignment, so matching an event never sorts,
+    copies or sees a half-updated table.
     """
 
     def __init__(self):
         """Initialize an empty registry."""
         super().__init__()
         self._rules: dict[str, RuleDef] = {}
-        self._trigger_index: dict[str, list[str]] = {}
+        self._dispatch: DispatchTable = {}
 
     def register(self, rule: RuleDef) -> None:
         """Register a rule definition.
@@ -28,13 +43,10 @@ class RuleRegistry(BaseRegistry):
         if rule.name in self._rules:
             raise ValueError(f"Rule '{rule.name}' is already registered")
 
+        # Compile the FOR clause queries once, not on every firing
+        compile_rule(rule)
         self._rules[rule.name] = rule
-
-        # Index by trigger for efficient lookup
-        trigger_key = self._make_trigger_key(rule.trigger)
-        if trigger_key not in self._trigger_index:
-            self._trigger_index[trigger_key] = []
-        self._trigger_index[trigger_key].append(rule.name)
+        self._rebuild_dispatch()
 
     def lookup(self, rule_name: str) -> RuleDef | None:
         """Look up a rule by name.
@@ -47,6 +59,29 @@ class RuleRegistry(BaseRegistry):
         """
         return self._rules.get(rule_name)
 
+    def match(
+        self, trigger_type: TriggerType, entity_type: str, property: str | None
+    ) -> tuple[RuleDef, ...]:
+        """Get rules triggered by a change, without building a Trigger.
+
+        Rules on the changed property and property-less rules on the
+        entity are both returned. The result is shared and must not be
+        modified.
+
+        Args:
+            trigger_type: The kind of change
+            entity_type: The entity type that changed
+            property: The changed property, or None for entity-level changes
+
+        Returns:
+            Matching rule definitions, ordered by priority (highest first)
+        """
+        by_property = self._dispatch.get((trigger_type, entity_type), _NO_PROPERTIES)
+        rules = by_property.get(property)
+        if rules is None:
+            rules = by_property.get(None, _NO_RULES)
+        return rules
+
     def get_by_trigger(self, trigger: Trigger) -> list[RuleDef]:
         """Get rules matching a trigger.
 
@@ -56,14 +91,7 @@ class RuleRegistry(BaseRegistry):
         Returns:
             List of matching rule definitions, ordered by priority (highest first)
         """
-        trigger_key = self._make_trigger_key(trigger)
-        rule_names = self._trigger_index.get(trigger_key, [])
-
-        # Get the rules and sort by priority (descending)
-        rules = [self._rules[name] for name in rule_names if name in self._rules]
-        rules.sort(key=lambda r: r.priority, reverse=True)
-
-        return rules
+        return list(self.match(trigger.type, trigger.entity_type, trigger.property))
 
     def get_all(self) -> list[RuleDef]:
         """Get all registered rules.
@@ -76,7 +104,7 @@ class RuleRegistry(BaseRegistry):
     def clear(self) -> None:
         """Clear all registered rules."""
         self._rules.clear()
-        self._trigger_index.clear()
+        self._dispatch = {}
 
     def unregister(self, rule_name: str) -> bool:
         """Unregister a rule by name.
@@ -90,14 +118,8 @@ class RuleRegistry(BaseRegistry):
         if rule_name not in self._rules:
             return False
 
-        rule = self._rules.pop(rule_name)
-
-        # Remove from trigger index
-        trigger_key = self._make_trigger_key(rule.trigger)
-        if trigger_key in self._trigger_index:
-            if rule_name in self._trigger_index[trigger_key]:
-                self._trigger_index[trigger_key].remove(rule_name)
-
+        del self._rules[rule_name]
+        self._rebuild_dispatch()
         return True
 
     def load_from_dsl(self, dsl_content: str) -> list[RuleDef]:
@@ -119,19 +141,27 @@ class RuleRegistry(BaseRegistry):
                     # Rule already registered, skip
                     pass
 
-    def _make_trigger_key(self, trigger: Trigger) -> str:
-        """Create a key for trigger indexing.
-
-        Args:
-            trigger: The trigger to create a key for
-
-        Returns:
-            A string key for indexing
-        """
-        parts = [trigger.type.value, trigger.entity_type]
-        if trigger.property:
-            parts.append(trigger.property)
-        return ":".join(parts)
+    def _rebuild_dispatch(self) -> None:
+        """Rebuild the trigger dispatch table and swap it in."""
+        by_entity: dict[tuple[TriggerType, str], list[RuleDef]] = {}
+        for rule in self._rules.values():
+            key = (rule.trigger.type, rule.trigger.entity_type)
+            by_entity.setdefault(key, []).append(rule)
+
+        dispatch: DispatchTable = {}
+        for key, rules in by_entity.items():
+            # sorted() is stable: equal priorities keep registration order
+            rules = sorted(rules, key=lambda r: r.priority, reverse=True)
+            properties = {rule.trigger.property or None for rule in rules}
+            dispatch[key] = {
+                prop: tuple(
+                    rule
+                    for rule in rules
+                    if (rule.trigger.property or None) in (prop, None)
+                )
+                for prop in properties | {None}
+            }
+        self._dispatch = dispatch
 
     def __len__(self) -> int:
         """Return the number of registered rules."""
@@ -0,0 +1,227 @@
+"""Bounded worker pool for asynchronous rule execution."""
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable
+
+from app.rule_engine.models import UpdateEvent
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("wait", "drop")
+
+# Set while a worker runs a handler; events emitted by rules must not wait
+# for queue space, since only the workers themselves can free it
+_in_worker: ContextVar[bool] = ContextVar("rule_worker", default=False)
+
+
+class RuleWorkerPool:
+    """Executes update events on a fixed number of workers.
+
+    Events are sharded by (entity_type, entity_id) so that all events of
+    one entity are handled by the same worker, in submission order.
+
+    What happens when ``max_queue_size`` events are waiting depends on the
+    overflow policy:
+
+    - ``"wait"`` (default): events are always queued, and producers that
+      await ``wait_for_capacity`` are held until the workers catch up
+    - ``"drop"``: each shard has a bounded queue; new events are dropped
+      and counted when it is full
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[UpdateEvent], Awaitable[Any]],
+        workers: int = 4,
+        max_queue_size: int = 10000,
+        overflow: str = "wait",
+    ):
+        """Initialize the worker pool.
+
+        Args:
+            handler: Async callable that processes a single event
+            workers: Number of concurrent workers (and database sessions)
+            max_queue_size: Total number of events that may wait in the queues
+            overflow: "wait" to hold producers back when the queues are full,
+                "drop" to discard new events
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        self.handler = handler
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self._queues: list[asyncio.Queue] = []
+        self._capacity: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight = 0
+        self._processed = 0
+        self._failed = 0
+        self._dropped = 0
+        self._waiting = 0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+
+    def _start(self) -> None:
+        """Create the queues and worker tasks on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        if self.overflow == "drop":
+            shard_size = max(1, self.max_queue_size // self.workers)
+        else:
+            # Unbounded; producers are held back by wait_for_capacity instead
+            shard_size = 0
+        self._loop = loop
+        self._queues = [asyncio.Queue(maxsize=shard_size) for _ in range(self.workers)]
+        self._capacity = asyncio.Event()
+        self._capacity.set()
+        self._tasks = [
+            loop.create_task(self._worker(queue), name=f"rule-worker-{index}")
+            for index, queue in enumerate(self._queues)
+        ]
+
+    def _shard(self, event: UpdateEvent) -> asyncio.Queue:
+        """Get the queue responsible for the event's entity."""
+        key = hash((event.entity_type, str(event.entity_id)))
+        return self._queues[key % self.workers]
+
+    def submit(self, event: UpdateEvent) -> bool:
+        """Enqueue an event without waiting.
+
+        Must be called from the event loop thread.
+
+        Args:
+            event: The update event to execute rules for
+
+        Returns:
+            True if queued, False if the queue was full and the event dropped
+            (only with the "drop" overflow policy)
+        """
+        self._start()
+        try:
+            self._shard(event).put_nowait((time.monotonic(), event))
+            if self.queue_depth >= self.max_queue_size:
+                self._capacity.clear()
+        except asyncio.QueueFull:
+            self._dropped += 1
+            logger.warning(
+                f"Rule queue full, dropping event "
+                f"{event.entity_type}.{event.property} on {event.entity_id}"
+            )
+            return False
+        return True
+
+    async def submit_wait(self, event: UpdateEvent) -> None:
+        """Enqueue an event, waiting for queue space (backpressure).
+
+        Args:
+            event: The update event to execute rules for
+        """
+        self._start()
+        if self.overflow == "wait":
+            await self.wait_for_capacity()
+            self.submit(event)
+            return
+        await self._shard(event).put((time.monotonic(), event))
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until fewer than max_queue_size events are queued.
+
+        Producers that emit events from async code await this after
+        emitting, so a bulk update runs at the pace of rule execution
+        instead of overflowing the queues. Returns immediately with the
+        "drop" policy and inside rule handlers.
+        """
+        if self.overflow != "wait" or _in_worker.get() or not self._tasks:
+            return
+        while self.queue_depth >= self.max_queue_size:
+            self._waiting += 1
+            try:
+                await self._capacity.wait()
+            finally:
+                self._waiting -= 1
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        """Process events of one shard sequentially."""
+        _in_worker.set(True)
+        while True:
+            enqueued_at, event = await queue.get()
+            if self.queue_depth < self.max_queue_size:
+                self._capacity.set()
+            lag = time.monotonic() - enqueued_at
+            self._last_lag = lag
+            self._max_lag = max(self._max_lag, lag)
+            self._in_flight += 1
+            try:
+                await self.handler(event)
+                self._processed += 1
+            except Exception:
+                self._failed += 1
+                logger.exception(
+                    f"Rule execution failed for {event.entity_type} {event.entity_id}"
+                )
+            finally:
+                self._in_flight -= 1
+                queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been processed."""
+        for queue in list(self._queues):
+            await queue.join()
+
+    async def close(self, timeout: float | None = None) -> None:
+        """Drain the queues and stop the workers.
+
+        Args:
+            timeout: Maximum seconds to wait for queued events; events still
+                pending afterwards are discarded
+        """
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Rule worker pool closed with {self.queue_depth} pending events"
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queues = []
+        self._loop = None
+        # Release producers still waiting for space
+        if self._capacity is not None:
+            self._capacity.set()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting to be processed."""
+        return sum(queue.qsize() for queue in self._queues)
+
+    def metrics(self) -> dict[str, Any]:
+        """Get a snapshot of the pool's counters.
+
+        Lag is the time an event waited in the queue before a worker
+        started executing it.
+        """
+        return {
+            "workers": self.workers,
+            "max_queue_size": self.max_queue_size,
+            "overflow": self.overflow,
+            "queue_depth": self.queue_depth,
+            "in_flight": self._in_flight,
+            "processed": self._processed,
+            "failed": self._failed,
+            "dropped": self._dropped,
+            "producers_waiting": self._waiting,
+            "last_lag_seconds": round(self._last_lag, 6),
+            "max_lag_seconds": round(self._max_lag, 6),
+        }
@@ -43,6 +43,8 @@ class DataProductCreate(BaseModel):
     service_name: str = Field(..., min_length=1, max_length=255)
     proto_content: Optional[str] = None
     is_active: bool = True
+    sync_page_size: int = Field(default=100, ge=1, le=10000)
+    sync_concurrency: int = Field(default=4, ge=1, le=32)
 
 
 class DataProductUpdate(BaseModel):
@@ -55,6 +57,8 @@ class DataProductUpdate(BaseModel):
     service_name: Optional[str] = Field(None, min_length=1, max_length=255)
     proto_content: Optional[str] = None
     is_active: Optional[bool] = None
+    sync_page_size: Optional[int] = Field(None, ge=1, le=10000)
+    sync_concurrency: Optional[int] = Field(None, ge=1, le=32)
 
 
 class DataProductResponse(BaseModel):
@@ -70,6 +74,8 @@ class DataProductResponse(BaseModel):
     last_health_check: Optional[datetime]
     last_error: Optional[str]
     is_active: bool
+    sync_page_size: int = 100
+    sync_concurrency: int = 4
     created_at: datetime
     updated_at: datetime
 
@@ -127,6 +133,7 @@ class EntityMappingCreate(BaseModel):
     create_method: Optional[str] = None
     update_method: Optional[str] = None
     delete_method: Optional[str] = None
+    export_method: Optional[str] = None  # 服务端流式导出方法，配置后同步优先使用
 
     # 同步配置
     sync_enabled: bool = True
@@ -136,6 +143,15 @@ class EntityMappingCreate(BaseModel):
     id_field_mapping: str = "id"
     name_field_mapping: str = "name"
 
+    # 同步分页配置（为空时使用数据产品的配置）
+    sync_page_size: Optional[int] = Field(None, ge=1, le=10000)
+    sync_concurrency: Optional[int] = Field(None, ge=1, le=32)
+
+    # 增量同步配置（为空时只做全量同步）
+    watermark_field: Optional[str] = None
+    watermark_filter_field: Optional[str] = None
+    full_sync_interval_hours: Optional[int] = Field(None, ge=0)
+
 
 class EntityMappingUpdate(BaseModel):
     """更新实体映射请求"""
@@ -146,10 +162,16 @@ class EntityMappingUpdate(BaseModel):
     create_method: Optional[str] = None
     update_method: Optional[str] = None
     delete_method: Optional[str] = None
+    export_method: Optional[str] = None
     sync_enabled: Optional[bool] = None
     sync_direction: Optional[SyncDirectionEnum] = None
     id_field_mapping: Optional[str] = None
     name_field_mapping: Optional[str] = None
+    sync_page_size: Optional[int] = Field(None, ge=1, le=10000)
+    sync_concurrency: Optional[int] = Field(None, ge=1, le=32)
+    watermark_field: Optional[str] = None
+    watermark_filter_field: Optional[str] = None
+    full_sync_interval_hours: Optional[int] = Field(None, ge=0)
 
 
 class EntityMappingResponse(BaseModel):
@@ -164,10 +186,18 @@ class EntityMappingResponse(BaseModel):
     create_method: Optional[str]
     update_method: Optional[str]
     delete_method: Optional[str]
+    export_method: Optional[str] = None
     sync_enabled: bool
     sync_direction: SyncDirectionEnum
     id_field_mapping: str
     name_field_mapping: str
+    sync_page_size: Optional[int] = None
+    sync_concurrency: Optional[int] = None
+    watermark_field: Optional[str] = None
+    watermark_filter_field: Optional[str] = None
+    full_sync_interval_hours: Optional[int] = None
+    sync_watermark: Optional[str] = None
+    last_full_sync_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
@@ -274,7 +304,7 @@ class RelationshipMappingResponse(BaseModel):
 class SyncRequest(BaseModel):
     """同步请求"""
 
-    sync_type: str = "full"  # "full" or "incremental"
+    sync_type: str = "full"  # "full", "incremental" or "reconcile"
 
 
 class SyncResult(BaseModel):
@@ -302,6 +332,7 @@ class SyncLogResponse(BaseModel):
     records_created: int
     records_updated: int
     records_failed: int
+    records_deleted: Optional[int] = 0
     error_message: Optional[str]
     started_at: datetime
     completed_at: Optional[datetime]
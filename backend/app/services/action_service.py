@@ -348,7 +348,7 @@ async def execute_single_action(
 
     Args:
         executor: ActionExecutor instance
-        session: Active database session (will be committed on success)
+        session: Active database session (committed by the executor on success)
         entity_type: Entity type
         action_name: Action name
         entity_id: Entity identifier
@@ -381,8 +381,6 @@ async def execute_single_action(
             actor_name=actor_name,
             actor_type=actor_type,
         )
-        if result.success:
-            await session.commit()
 
         return {
             "success": result.success,
@@ -6,6 +6,7 @@ It combines LangGraph orchestration with query and action tools.
 
 import logging
 import asyncio
+from contextvars import ContextVar
 from typing import Any, AsyncIterator, Callable, Optional
 from langchain_openai import ChatOpenAI
 
@@ -19,6 +20,11 @@ from langgraph.errors import GraphRecursionError
 
 logger = logging.getLogger(__name__)
 
+# Graph view events of the request whose tools are running in this context
+_request_graph_events: ContextVar[Optional[asyncio.Queue]] = ContextVar(
+    "request_graph_events", default=None
+)
+
 
 class EnhancedAgentService:
     """Enhanced QA Agent with query and action capabilities.
@@ -35,6 +41,7 @@ class EnhancedAgentService:
         llm_config: dict[str, Any],
         action_executor: Any = None,
         action_registry: Any = None,
+        mcp_registry: Optional[MCPToolRegistry] = None,
     ):
         """Initialize the enhanced agent service.
 
@@ -42,10 +49,13 @@ class EnhancedAgentService:
             llm_config: LLM configuration dict with api_key, base_url, model
             action_executor: Optional ActionExecutor instance for action execution
             action_registry: Optional ActionRegistry instance for looking up actions
+            mcp_registry: Optional already initialized MCPToolRegistry; when
+                omitted the MCP tools are loaded on first graph creation
         """
         self.llm_config = llm_config
         self.action_executor = action_executor
         self.action_registry = action_registry
+        self.mcp_registry = mcp_registry
 
         # Initialize LLM
         self.llm = ChatOpenAI(
@@ -59,9 +69,13 @@ class EnhancedAgentService:
         from app.rule_engine.event_emitter import GraphEventEmitter
 
         self.event_emitter = GraphEventEmitter()
+        # One listener routes events to the queue of the request that caused
+        # them, so concurrent chats sharing this service don't see each other's
+        self.event_emitter.subscribe(self._route_graph_event)
 
         # Initialize graph (lazy loading)
         self._graph = None
+        self._graph_lock = asyncio.Lock()
 
     def _get_session(self):
         """Get a database session context manager for query tools.
@@ -84,9 +98,28 @@ class EnhancedAgentService:
 
         return SessionContextManager()
 
+    @staticmethod
+    def _route_graph_event(event: Any) -> None:
+        """Put a graph view event into the queue of the current request."""
+        from app.rule_engine.models import GraphViewEvent
+
+        queue = _request_graph_events.get()
+        if queue is None or not isinstance(event, GraphViewEvent):
+            return
+        try:
+            queue.put_nowait(event)
+        except Exception as e:
+            logger.error(f"Error putting event in queue: {e}")
+
     async def _get_graph(self):
         """Get or create the LangGraph."""
-        if self._graph is None:
+        if self._graph is not None:
+            return self._graph
+
+        async with self._graph_lock:
+            if self._graph is not None:
+                return self._graph
+
             # Create query tools registry
             query_registry = QueryToolRegistry(self._get_session, self.event_emitter)
             query_tools = query_registry.tools
@@ -100,8 +133,10 @@ class EnhancedAgentService:
                 action_tools = action_registry_tools.tools
 
             # Create MCP tools
-            mcp_registry = MCPToolRegistry(self._get_session)
-            await mcp_registry.initialize()
+            mcp_registry = self.mcp_registry
+            if mcp_registry is None:
+                mcp_registry = MCPToolRegistry(self._get_session)
+                await mcp_registry.initialize()
             mcp_tools = mcp_registry.tools
 
             # Create the graph without memory (conversation history is managed in database)
@@ -130,7 +165,6 @@ class EnhancedAgentService:
             StreamEvent objects with type and content
         """
         from langchain_core.messages import HumanMessage, AIMessage
-        from app.rule_engine.models import GraphViewEvent
         import asyncio
 
         logger.info(f"=== Agent astream_chat started ===")
@@ -143,15 +177,8 @@ class EnhancedAgentService:
         # Track accumulated messages during graph execution for review
         accumulated_messages = []
 
-        def on_graph_event(event: Any):
-            if isinstance(event, GraphViewEvent):
-                try:
-                    graph_events_queue.put_nowait(event)
-                except Exception as e:
-                    logger.error(f"Error putting event in queue: {e}")
-
-        # Subscribe to graph events
-        self.event_emitter.subscribe(on_graph_event)
+        # Tools run in tasks copied from this context and find the queue here
+        queue_token = _request_graph_events.set(graph_events_queue)
 
         # Initial thinking event
         yield {
@@ -328,9 +355,10 @@ class EnhancedAgentService:
             }
         finally:
             try:
-                self.event_emitter.unsubscribe(on_graph_event)
-            except Exception as e:
-                logger.debug("Failed to unsubscribe event handler: %s", e)
+                _request_graph_events.reset(queue_token)
+            except ValueError:
+                # Generator finalized from another context
+                _request_graph_events.set(None)
             # Always emit done so the frontend stream terminates
             yield {"type": "done"}
 
@@ -0,0 +1,213 @@
+"""App-scoped runtime for the enhanced agent.
+
+Building an ``EnhancedAgentService`` creates an LLM client, the query and
+action tool registries and a compiled LangGraph, and loading MCP tools opens
+a session to every configured MCP server. The runtime does that work once per
+process and shares the result across chat requests; only the per-request
+state (history and graph event queue) lives in ``astream_chat``.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Optional
+
+from app.services.agent.agent_service import EnhancedAgentService
+from app.services.agent_tools.mcp_tools import MCPToolRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class AgentRuntime:
+    """Keeps one warm agent service and its MCP tools for the application.
+
+    The agent is rebuilt only when the LLM configuration or the MCP tool set
+    changes. MCP tool lists are refreshed in the background, periodically and
+    whenever an MCP server configuration changes, so chat requests never wait
+    on MCP servers to list their tools.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        action_executor: Any = None,
+        action_registry: Any = None,
+        mcp_refresh_interval: float = 300.0,
+    ):
+        """Initialize the runtime.
+
+        Args:
+            session_factory: Returns an AsyncSession context manager
+            action_executor: Optional ActionExecutor for action tools
+            action_registry: Optional ActionRegistry for action tools
+            mcp_refresh_interval: Seconds between background MCP tool
+                refreshes; 0 disables the periodic refresh
+        """
+        self.session_factory = session_factory
+        self.action_executor = action_executor
+        self.action_registry = action_registry
+        self.mcp_refresh_interval = mcp_refresh_interval
+
+        self.mcp_registry = MCPToolRegistry(session_factory)
+        self._mcp_loaded = False
+        self._mcp_version = 0
+        self._mcp_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._pending_refreshes: set[asyncio.Task] = set()
+
+        self._agent: Optional[EnhancedAgentService] = None
+        self._agent_key: Optional[tuple] = None
+        self._agent_lock = asyncio.Lock()
+        self._agents_built = 0
+
+    # ==================== Agent ====================
+
+    async def get_agent(self, llm_config: dict[str, Any]) -> EnhancedAgentService:
+        """Get the shared agent service for an LLM configuration.
+
+        The service and its compiled graph are reused as long as the LLM
+        configuration and the MCP tool set stay the same.
+
+        Args:
+            llm_config: LLM configuration dict with api_key, base_url, model
+
+        Returns:
+            An agent service whose graph is already compiled
+        """
+        if not self._mcp_loaded:
+            async with self._mcp_lock:
+                # A background load may have finished while waiting
+                if not self._mcp_loaded:
+                    await self._load_mcp_tools()
+
+        key = self._key(llm_config)
+        agent = self._agent
+        if agent is not None and self._agent_key == key:
+            return agent
+
+        async with self._agent_lock:
+            key = self._key(llm_config)
+            if self._agent is None or self._agent_key != key:
+                agent = EnhancedAgentService(
+                    llm_config=dict(llm_config),
+                    action_executor=self.action_executor,
+                    action_registry=self.action_registry,
+                    mcp_registry=self.mcp_registry,
+                )
+                await agent._get_graph()
+                self._agent = agent
+                self._agent_key = key
+                self._agents_built += 1
+                logger.info(f"Agent graph compiled (model: {llm_config['model']})")
+            return self._agent
+
+    def _key(self, llm_config: dict[str, Any]) -> tuple:
+        """Identity of the agent built for a configuration."""
+        return (
+            llm_config["api_key"],
+            llm_config["base_url"],
+            llm_config["model"],
+            self._mcp_version,
+        )
+
+    def invalidate_llm(self) -> None:
+        """Drop the shared agent after the LLM configuration changed."""
+        self._agent = None
+        self._agent_key = None
+
+    # ==================== MCP tools ====================
+
+    async def refresh_mcp_tools(self) -> bool:
+        """Reload the tools of all active MCP servers.
+
+        A new registry is loaded and swapped in only when complete, so
+        running chats keep the tools they started with. The agent is rebuilt
+        on its next use only if the tool set changed.
+
+        Returns:
+            Whether the MCP tool set changed
+        """
+        async with self._mcp_lock:
+            return await self._load_mcp_tools()
+
+    async def _load_mcp_tools(self) -> bool:
+        """Load MCP tools into a new registry (caller holds the MCP lock)."""
+        registry = MCPToolRegistry(self.session_factory)
+        try:
+            await registry.initialize()
+        except Exception as e:
+            logger.error(f"Failed to refresh MCP tools: {e}")
+            return False
+
+        first_load = not self._mcp_loaded
+        self._mcp_loaded = True
+        if not first_load and _signature(registry) == _signature(self.mcp_registry):
+            return False
+
+        self.mcp_registry = registry
+        self._mcp_version += 1
+        logger.info(f"Loaded {len(registry.tools)} MCP tools")
+        return True
+
+    def invalidate_mcp(self) -> None:
+        """Schedule a background MCP tool refresh after a configuration change."""
+        try:
+            task = asyncio.get_running_loop().create_task(
+                self.refresh_mcp_tools(), name="agent-mcp-refresh"
+            )
+        except RuntimeError:
+            # No running loop: the next chat request loads the tools
+            self._mcp_loaded = False
+            return
+        self._pending_refreshes.add(task)
+        task.add_done_callback(self._pending_refreshes.discard)
+
+    # ==================== Lifecycle ====================
+
+    async def start(self) -> None:
+        """Start loading MCP tools and the periodic refresh in the background."""
+        if self._refresh_task is not None:
+            return
+        self._refresh_task = asyncio.create_task(self._run(), name="agent-runtime")
+
+    async def close(self) -> None:
+        """Stop the background refresh tasks."""
+        tasks = list(self._pending_refreshes)
+        if self._refresh_task is not None:
+            tasks.append(self._refresh_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refresh_task = None
+        self._pending_refreshes.clear()
+
+    async def _run(self) -> None:
+        """Load MCP tools now and then every mcp_refresh_interval seconds."""
+        while True:
+            await self.refresh_mcp_tools()
+            if self.mcp_refresh_interval <= 0:
+                return
+            await asyncio.sleep(self.mcp_refresh_interval)
+
+    def metrics(self) -> dict[str, Any]:
+        """Get a snapshot of the runtime state."""
+        return {
+            "agent_ready": self._agent is not None,
+            "agents_built": self._agents_built,
+            "mcp_tools": len(self.mcp_registry.tools),
+            "mcp_version": self._mcp_version,
+        }
+
+
+def _signature(registry: MCPToolRegistry) -> tuple:
+    """Comparable description of the servers and tools of an MCP registry.
+
+    Server ids and URLs are part of the signature: tool coroutines are bound
+    to a client for the URL they were loaded from, so a moved server needs a
+    new registry even when it serves the same tools.
+    """
+    tools = []
+    for tool in registry.tools:
+        schema = tool.args_schema
+        fields = sorted(schema.model_fields) if isinstance(schema, type) else []
+        tools.append((tool.name, tool.description, tuple(fields)))
+    return sorted(registry.servers), sorted(tools)
@@ -275,7 +275,6 @@ def create_action_tools(
                 actor_type="AI",
             )
             if result.success:
-                await session.commit()
                 parts = [
                     f"Action {entity_type}.{action_name} executed successfully on {entity_id}"
                 ]
@@ -328,7 +327,10 @@ def create_action_tools(
         ]
 
         # Import batch executor
-        from app.services.batch_executor import BatchActionExecutor
+        from app.services.batch_executor import (
+            BatchActionExecutor,
+            BatchExecutionConfig,
+        )
 
         executor = BatchActionExecutor(
             action_executor=action_executor,
@@ -348,7 +350,11 @@ def create_action_tools(
 
         # Execute batch
         results = await executor.execute_batch(
-            executions, actor_name="AI Assistant", actor_type="AI"
+            executions,
+            # Only the first 10 successes/failures are shown below
+            config=BatchExecutionConfig(batch_native=True, max_results_in_memory=10),
+            actor_name="AI Assistant",
+            actor_type="AI",
         )
 
         # Format results
@@ -364,16 +370,20 @@ def create_action_tools(
                     [f"{k}={v}" for k, v in success["changes"].items()]
                 )
                 output.append(f"  - {success['entity_id']}: {changes_str}")
-            if len(results.successes) > 10:
-                output.append(f"  ... and {len(results.successes) - 10} more")
+            if results.succeeded > len(results.successes):
+                output.append(
+                    f"  ... and {results.succeeded - len(results.successes)} more"
+                )
             output.append("")
 
         if results.failures:
             output.append("Failed entities:")
             for failure in results.failures[:10]:  # Show first 10
                 output.append(f"  - {failure['entity_id']}: {failure['error']}")
-            if len(results.failures) > 10:
-                output.append(f"  ... and {len(results.failures) - 10} more")
+            if results.failed > len(results.failures):
+                output.append(
+                    f"  ... and {results.failed - len(results.failures)} more"
+                )
 
         return "\n".join(output)
 
@@ -129,9 +129,11 @@ class MCPToolRegistry:
     def __init__(self, session_provider):
         self.session_provider = session_provider
         self._tools = []
+        self._servers = []
 
     async def initialize(self):
         self._tools = []
+        self._servers = []
         async with self.session_provider() as db:
             result = await db.execute(
                 select(MCPConfig).where(MCPConfig.is_active == True)
@@ -139,6 +141,7 @@ class MCPToolRegistry:
             configs = result.scalars().all()
 
             for config in configs:
+                self._servers.append((config.id, config.name, config.url))
                 try:
                     client = MCPClient(config.url)
                     mcp_tools = await client.get_tools()
@@ -179,3 +182,8 @@ class MCPToolRegistry:
     @property
     def tools(self) -> List[StructuredTool]:
         return self._tools
+
+    @property
+    def servers(self) -> List[tuple]:
+        """(id, name, url) of the MCP servers the tools were loaded from."""
+        return self._servers
@@ -189,9 +189,17 @@ def create_query_tools(
             else:
                 kwargs["entity_name"] = instance_name
 
-            results = await tools.get_instance_neighbors(**kwargs)
+            neighborhood = await tools.get_instance_neighborhood(**kwargs)
+            results = neighborhood["neighbors"]
+            truncated_note = (
+                "Note: the neighborhood is too large and the result was truncated. "
+                "Narrow the query with a type or property filter, or fewer hops."
+            )
             if not results:
-                return f"No neighbor nodes found for '{instance_name}'"
+                message = f"No neighbor nodes found for '{instance_name}'"
+                if neighborhood["truncated"]:
+                    message += f"\n{truncated_note}"
+                return message
 
             # Group by distance
             by_distance = {}
@@ -228,6 +236,9 @@ def create_query_tools(
                     output.append(f"  ... and {len(by_distance[dist]) - 10} more")
                 output.append("")
 
+            if neighborhood["truncated"]:
+                output.append(truncated_note)
+
             return "\n".join(output)
 
         return await _execute_with_session(get_session_func, _execute, event_emitter)
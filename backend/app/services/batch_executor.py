@@ -6,13 +6,18 @@ parallelism and progress tracking.
 """
 
 import asyncio
+import json
 import logging
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Sized
 from dataclasses import dataclass, field
 from typing import Any, Callable, Awaitable
 from datetime import datetime
 
 from app.rule_engine.action_executor import ActionExecutor, ExecutionResult
 from app.rule_engine.context import EvaluationContext
+from app.rule_engine.models import ActionDef, CallStatement
+from app.rule_engine.pgq_translator import compile_precondition_checks
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +31,32 @@ class BatchExecutionConfig:
         timeout_per_action: Timeout in seconds for each action
         retry_on_failure: Whether to retry failed actions
         max_retries: Maximum number of retry attempts
+        batch_native: Execute actions on chunks of entities with one entity
+            query, bulk precondition checks, one batched update and one
+            commit per chunk (actions with CALL statements, non-numeric
+            entity IDs and custom entity loaders use the per-entity path)
+        chunk_size: Number of entities per chunk in batch-native mode; the
+            timeout applies to a whole chunk
+        progress_every: Send one aggregated progress update every N
+            completions; 1 sends a detailed update per completion unless
+            progress_interval is set
+        progress_interval: Send an aggregated progress update at most every
+            N seconds (0 disables time-based updates)
+        max_results_in_memory: Maximum number of successes and of failures
+            kept in the result (None keeps all); counts are always exact
+        results_path: Optional NDJSON file receiving every per-item result
     """
 
     max_concurrent: int = 10
     timeout_per_action: int = 30
     retry_on_failure: bool = False
     max_retries: int = 1
+    batch_native: bool = False
+    chunk_size: int = 500
+    progress_every: int = 1
+    progress_interval: float = 0.0
+    max_results_in_memory: int | None = None
+    results_path: str | None = None
 
 
 @dataclass
@@ -45,6 +70,7 @@ class BatchExecutionResult:
         successes: List of successful results with entity_id and changes
         failures: List of failed results with entity_id and error
         duration_seconds: Total execution time in seconds
+        results_path: NDJSON file with all per-item results, if configured
     """
 
     total: int
@@ -53,6 +79,132 @@ class BatchExecutionResult:
     successes: list[dict] = field(default_factory=list)
     failures: list[dict] = field(default_factory=list)
     duration_seconds: float = 0.0
+    results_path: str | None = None
+
+
+class _ResultCollector:
+    """Counts batch results, keeps a bounded sample and reports progress.
+
+    Per-item results are written to the NDJSON file when configured;
+    the execution log already receives one entry per action execution.
+    """
+
+    def __init__(
+        self,
+        config: BatchExecutionConfig,
+        total: int | None,
+        progress_callback: Callable[[dict], Awaitable] | None,
+    ):
+        self.config = config
+        self.total = total
+        self.progress_callback = progress_callback
+        self.completed = 0
+        self.successes: list[dict] = []
+        self.failures: list[dict] = []
+        self.succeeded = 0
+        self.failed = 0
+        self.aggregate = config.progress_every > 1 or config.progress_interval > 0
+        self._pending_updates: list[dict] = []
+        self._reported = 0
+        self._reported_at = time.monotonic()
+        self._file = (
+            open(config.results_path, "w", encoding="utf-8")
+            if config.results_path
+            else None
+        )
+
+    def record(self, execution: dict, result_or_error: Any) -> None:
+        """Record the outcome of one execution."""
+        self.completed += 1
+        label = f"{execution['entity_type']}.{execution['action_name']}"
+        entity_id = execution["entity_id"]
+
+        if isinstance(result_or_error, Exception):
+            item = {"entity_id": entity_id, "error": str(result_or_error)}
+        elif result_or_error.success:
+            item = {"entity_id": entity_id, "changes": result_or_error.changes}
+        else:
+            item = {
+                "entity_id": entity_id,
+                "error": result_or_error.error or "Unknown error",
+            }
+
+        success = "error" not in item
+        if success:
+            self.succeeded += 1
+            self._keep(self.successes, item)
+            logger.info(f"Action {label} on {entity_id} succeeded")
+        else:
+            self.failed += 1
+            self._keep(self.failures, item)
+            logger.warning(f"Action {label} on {entity_id} failed: {item['error']}")
+
+        if self._file is not None:
+            self._file.write(
+                json.dumps({**item, "success": success}, default=str) + "\n"
+            )
+
+        if self.progress_callback and not self.aggregate:
+            update = {
+                "type": "action_progress",
+                "completed": self.completed,
+                "total": self.total,
+                "entity_id": entity_id,
+                "success": success,
+            }
+            if success:
+                update["changes"] = item["changes"]
+            else:
+                # Keep the original error (possibly None) of failed results
+                update["error"] = (
+                    str(result_or_error)
+                    if isinstance(result_or_error, Exception)
+                    else result_or_error.error
+                )
+            self._pending_updates.append(update)
+
+    def _keep(self, items: list[dict], item: dict) -> None:
+        limit = self.config.max_results_in_memory
+        if limit is None or len(items) < limit:
+            items.append(item)
+
+    async def report(self, final: bool = False) -> None:
+        """Send the progress updates that are due."""
+        if not self.progress_callback:
+            return
+        if not self.aggregate:
+            updates, self._pending_updates = self._pending_updates, []
+            for update in updates:
+                await self.progress_callback(update)
+            return
+
+        if self.completed == self._reported:
+            return
+        now = time.monotonic()
+        due = final or (
+            self.config.progress_every > 1
+            and self.completed - self._reported >= self.config.progress_every
+        )
+        if self.config.progress_interval > 0:
+            due = due or now - self._reported_at >= self.config.progress_interval
+        if not due:
+            return
+
+        self._reported = self.completed
+        self._reported_at = now
+        await self.progress_callback(
+            {
+                "type": "batch_progress",
+                "completed": self.completed,
+                "total": self.total,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+            }
+        )
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
 
 
 class StreamingBatchExecutor:
@@ -81,7 +233,7 @@ class StreamingBatchExecutor:
 
     async def execute_batch(
         self,
-        executions: list[dict],
+        executions: Iterable[dict] | AsyncIterable[dict],
         config: BatchExecutionConfig | None = None,
         progress_callback: Callable[[dict], Awaitable] | None = None,
         actor_name: str | None = None,
@@ -89,8 +241,12 @@ class StreamingBatchExecutor:
     ) -> BatchExecutionResult:
         """Execute actions concurrently with controlled parallelism.
 
+        Executions are pulled lazily, so at most ``max_concurrent`` tasks
+        exist at any time regardless of the batch size.
+
         Args:
-            executions: List of execution specs with entity_type, action_name, entity_id, params
+            executions: Execution specs with entity_type, action_name,
+                entity_id, params; a list or any (async) iterable
             config: Optional batch execution configuration
             progress_callback: Optional async callback for progress updates
             actor_name: Optional actor name
@@ -102,133 +258,99 @@ class StreamingBatchExecutor:
         config = config or BatchExecutionConfig()
         start_time = datetime.now()
 
-        total = len(executions)
-        completed = 0
-        successes = []
-        failures = []
-
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(config.max_concurrent)
-
-        # Define a wrapper function that creates closures correctly
-        async def process_one(execution: dict) -> tuple[dict, Any]:
-            """Process a single execution with semaphore control."""
-
-            async def _execute():
-                return await self._execute_single_action(
-                    execution, actor_name=actor_name, actor_type=actor_type
+        total = len(executions) if isinstance(executions, Sized) else None
+        collector = _ResultCollector(config, total, progress_callback)
+        units = self._iter_units(executions, config)
+        in_flight: set[asyncio.Task] = set()
+        exhausted = False
+
+        try:
+            while True:
+                # Top up the window from the input
+                while not exhausted and len(in_flight) < config.max_concurrent:
+                    unit = await anext(units, None)
+                    if unit is None:
+                        exhausted = True
+                    else:
+                        in_flight.add(
+                            asyncio.create_task(
+                                self._run_unit(unit, config, actor_name, actor_type)
+                            )
+                        )
+                if not in_flight:
+                    break
+
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
                 )
+                for task in done:
+                    for execution, result_or_error in task.result():
+                        collector.record(execution, result_or_error)
+                await collector.report()
+
+            await collector.report(final=True)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await units.aclose()
+            collector.close()
 
-            async with semaphore:
-                try:
-                    result = await asyncio.wait_for(
-                        _execute(), timeout=config.timeout_per_action
-                    )
-                    return execution, result
-                except asyncio.TimeoutError:
-                    result = ExecutionResult(
-                        success=False,
-                        error=f"Timeout after {config.timeout_per_action}s",
-                    )
-                    return execution, result
-                except Exception as e:
-                    return execution, e
-
-        # Create all tasks by explicitly calling the wrapper for each execution
-        tasks = [process_one(exec) for exec in executions]
-
-        # Process tasks as they complete
-        for task in asyncio.as_completed(tasks):
-            execution, result_or_error = await task
-
-            completed += 1
-
-            if isinstance(result_or_error, Exception):
-                # Handle exception
-                error_msg = str(result_or_error)
-                failures.append(
-                    {"entity_id": execution["entity_id"], "error": error_msg}
-                )
-
-                logger.warning(
-                    f"Action {execution['entity_type']}.{execution['action_name']} "
-                    f"on {execution['entity_id']} failed: {error_msg}"
-                )
-
-                # Send progress update
-                if progress_callback:
-                    await progress_callback(
-                        {
-                            "type": "action_progress",
-                            "completed": completed,
-                            "total": total,
-                            "entity_id": execution["entity_id"],
-                            "success": False,
-                            "error": error_msg,
-                        }
-                    )
-            elif result_or_error.success:
-                successes.append(
-                    {
-                        "entity_id": execution["entity_id"],
-                        "changes": result_or_error.changes,
-                    }
-                )
+        duration = (datetime.now() - start_time).total_seconds()
 
-                logger.info(
-                    f"Action {execution['entity_type']}.{execution['action_name']} "
-                    f"on {execution['entity_id']} succeeded"
-                )
+        return BatchExecutionResult(
+            total=collector.completed,
+            succeeded=collector.succeeded,
+            failed=collector.failed,
+            successes=collector.successes,
+            failures=collector.failures,
+            duration_seconds=duration,
+            results_path=config.results_path,
+        )
 
-                # Send progress update
-                if progress_callback:
-                    await progress_callback(
-                        {
-                            "type": "action_progress",
-                            "completed": completed,
-                            "total": total,
-                            "entity_id": execution["entity_id"],
-                            "success": True,
-                            "changes": result_or_error.changes,
-                        }
-                    )
-            else:
-                # Execution failed but not due to exception
-                failures.append(
-                    {
-                        "entity_id": execution["entity_id"],
-                        "error": result_or_error.error or "Unknown error",
-                    }
-                )
+    async def _run_unit(
+        self,
+        unit: tuple[ActionDef | None, list[dict]],
+        config: BatchExecutionConfig,
+        actor_name: str | None,
+        actor_type: str | None,
+    ) -> list[tuple[dict, Any]]:
+        """Run one scheduling unit: a single execution or a batch-native chunk.
 
-                logger.warning(
-                    f"Action {execution['entity_type']}.{execution['action_name']} "
-                    f"on {execution['entity_id']} failed: {result_or_error.error}"
-                )
+        Args:
+            unit: (action, executions); action is None for a single
+                per-entity execution
+            config: Batch execution configuration
+            actor_name: Optional actor name
+            actor_type: Optional actor type
 
-                # Send progress update
-                if progress_callback:
-                    await progress_callback(
-                        {
-                            "type": "action_progress",
-                            "completed": completed,
-                            "total": total,
-                            "entity_id": execution["entity_id"],
-                            "success": False,
-                            "error": result_or_error.error,
-                        }
-                    )
+        Returns:
+            (execution, ExecutionResult or exception) pairs
+        """
+        action, executions = unit
+        if action is None:
+            work = self._execute_single_action(
+                executions[0], actor_name=actor_name, actor_type=actor_type
+            )
+        else:
+            work = self._execute_chunk(
+                action, executions, actor_name=actor_name, actor_type=actor_type
+            )
 
-        duration = (datetime.now() - start_time).total_seconds()
+        try:
+            results = await asyncio.wait_for(work, timeout=config.timeout_per_action)
+        except asyncio.TimeoutError:
+            result = ExecutionResult(
+                success=False,
+                error=f"Timeout after {config.timeout_per_action}s",
+            )
+            return [(execution, result) for execution in executions]
+        except Exception as e:
+            # A failed chunk's transaction is not committed
+            return [(execution, e) for execution in executions]
 
-        return BatchExecutionResult(
-            total=total,
-            succeeded=len(successes),
-            failed=len(failures),
-            successes=successes,
-            failures=failures,
-            duration_seconds=duration,
-        )
+        if action is None:
+            return [(executions[0], results)]
+        return results
 
     async def _execute_single_action(
         self,
@@ -270,17 +392,144 @@ class StreamingBatchExecutor:
                 variables=params,
             )
 
-            # Execute the action
-            result = await self.action_executor.execute(
+            # Execute the action; the executor commits its changes
+            return await self.action_executor.execute(
                 entity_type,
                 action_name,
                 context,
                 actor_name=actor_name,
                 actor_type=actor_type,
             )
-            if result.success:
-                await session.commit()
-            return result
+
+    async def _iter_units(
+        self,
+        executions: Iterable[dict] | AsyncIterable[dict],
+        config: BatchExecutionConfig,
+    ) -> AsyncIterator[tuple[ActionDef | None, list[dict]]]:
+        """Lazily turn executions into scheduling units.
+
+        Per-entity executions are yielded as soon as they are read; in
+        batch-native mode executions of the same action are buffered until
+        a chunk is full, and partial chunks are yielded at the end.
+
+        Args:
+            executions: Execution specs (list or async iterable)
+            config: Batch execution configuration
+
+        Yields:
+            (None, [execution]) for per-entity executions and
+            (action, executions) for batch-native chunks
+        """
+        native = config.batch_native and not self.get_entity_data_func
+        actions: dict[tuple[str, str], ActionDef | None] = {}
+        buffers: dict[tuple[str, str], list[dict]] = {}
+
+        async for execution in _aiter(executions):
+            key = (execution["entity_type"], execution["action_name"])
+            if native and key not in actions:
+                action = self.action_executor.registry.lookup(*key)
+                # Unknown actions report their error per entity; CALL
+                # statements talk to external services and stay per entity
+                if not isinstance(action, ActionDef) or _has_call(action):
+                    action = None
+                actions[key] = action
+
+            # Custom entity loaders can only be called per entity
+            if not native or not actions[key]:
+                yield None, [execution]
+            elif not str(execution["entity_id"]).isdigit():
+                yield None, [execution]
+            else:
+                buffer = buffers.setdefault(key, [])
+                buffer.append(execution)
+                if len(buffer) >= config.chunk_size:
+                    del buffers[key]
+                    yield actions[key], buffer
+
+        for key, buffer in buffers.items():
+            yield actions[key], buffer
+
+    async def _execute_chunk(
+        self,
+        action: ActionDef,
+        chunk: list[dict],
+        actor_name: str | None = None,
+        actor_type: str | None = None,
+    ) -> list[tuple[dict, ExecutionResult]]:
+        """Execute an action on a chunk of entities in one transaction.
+
+        All entities are loaded and locked with one ``id = ANY(:ids) FOR
+        UPDATE`` query that also evaluates the preconditions translatable to
+        SQL, so checks and old values hold until the commit; the remaining
+        preconditions and the effects are evaluated in memory, changes are
+        written with one batched update and the chunk is committed once.
+        Update events and buffered logs are published after the commit.
+
+        Args:
+            action: Action definition without CALL statements
+            chunk: Execution specs with numeric entity IDs
+            actor_name: Optional actor name
+            actor_type: Optional actor type
+
+        Returns:
+            (execution, result) pairs in chunk order
+        """
+        plan = compile_precondition_checks(action)
+        ids = sorted({int(execution["entity_id"]) for execution in chunk})
+
+        async with self.get_session_func() as session:
+            result = await session.execute(plan.statement, {**plan.params, "ids": ids})
+            rows = {row["id"]: row for row in result.mappings().all()}
+
+            items = []
+            results: list[ExecutionResult | None] = []
+            for execution in chunk:
+                row = rows.get(int(execution["entity_id"]))
+                if row is None:
+                    results.append(
+                        ExecutionResult(
+                            success=False,
+                            error=(
+                                f"Entity '{execution['entity_id']}' not found "
+                                f"(type: {execution['entity_type']})"
+                            ),
+                        )
+                    )
+                    continue
+                properties = {
+                    k: v
+                    for k, v in (row["properties"] or {}).items()
+                    if not k.startswith("__")
+                }
+                context = EvaluationContext(
+                    entity={**properties, "id": execution["entity_id"]},
+                    old_values={},
+                    session=session,
+                    variables=dict(execution.get("params") or {}),
+                )
+                # Preconditions translated to SQL come back as check{i} columns
+                checks = {
+                    index: bool(row[f"check{index}"])
+                    for index in range(len(action.preconditions))
+                    if f"check{index}" in row
+                }
+                items.append((context, checks))
+                results.append(None)
+
+            outcome = await self.action_executor.execute_many(
+                action,
+                items,
+                session,
+                actor_name=actor_name,
+                actor_type=actor_type,
+            )
+            await session.commit()
+
+        # Only committed changes trigger rules and success logs
+        await self.action_executor.publish(outcome)
+        executed = iter(outcome.results)
+        results = [next(executed) if r is None else r for r in results]
+        return list(zip(chunk, results))
 
     async def _get_entity_data(
         self, entity_type: str, entity_id: str
@@ -310,6 +559,22 @@ class StreamingBatchExecutor:
         return {}
 
 
+async def _aiter(items: Iterable[dict] | AsyncIterable[dict]) -> AsyncIterator[dict]:
+    """Iterate a sync or async iterable asynchronously."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _has_call(action: ActionDef) -> bool:
+    """Whether an action's effect contains a CALL statement."""
+    statements = getattr(action.effect, "statements", None) or []
+    return any(isinstance(statement, CallStatement) for statement in statements)
+
+
 class BatchActionExecutor(StreamingBatchExecutor):
     """Batch action executor (alias for StreamingBatchExecutor).
 
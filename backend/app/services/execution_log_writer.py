@@ -0,0 +1,250 @@
+# backend/app/services/execution_log_writer.py
+"""
+执行日志批量写入
+
+规则与动作的每次执行原本都在调用方的会话里同步插入一条 execution_logs 并提交，
+写入延迟和锁竞争都落在执行热路径上。ExecutionLogWriter 把日志记录先放入内存缓冲，
+由后台任务按条数或时间间隔批量写入（executemany，asyncpg 下为多行 INSERT）：
+
+- record() 同步、不阻塞，不占用调用方的会话和事务
+- 缓冲达到 batch_size 立即触发写入，否则每 flush_interval 秒写入一次
+- 写入失败的记录保留在缓冲中重试；缓冲超过上限时丢弃最旧的记录并计数
+- 成功执行可按比例采样（失败记录总是保留）
+- 关闭时写入剩余记录；数据库不可用时转存到本地 spool 文件，下次启动时补写
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+
+from app.models.rule import ExecutionLog
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionLogWriter:
+    """执行日志的异步批量写入器"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        max_buffer_size: int = 10000,
+        success_sample_rate: float = 1.0,
+        spool_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            session_factory: 返回 AsyncSession 上下文管理器的工厂（如 async_session）
+            batch_size: 触发立即写入的缓冲条数，也是单次 INSERT 的最大行数
+            flush_interval: 定时写入间隔（秒）
+            max_buffer_size: 缓冲上限，超出时丢弃最旧的记录
+            success_sample_rate: 成功执行的采样比例，1 表示全部记录，0 表示不记录
+            spool_path: 关闭时无法写入数据库的记录转存文件（JSON Lines）
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self.success_sample_rate = success_sample_rate
+        self.spool_path = spool_path
+
+        self._buffer: deque = deque()
+        self._success_counts: Dict[Tuple[str, str], int] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._written = 0
+        self._sampled_out = 0
+        self._dropped = 0
+        self._failed_flushes = 0
+
+    # ==================== 记录 ====================
+
+    def record(
+        self,
+        type: str,
+        name: str,
+        entity_id: Any = None,
+        actor_name: Optional[str] = None,
+        actor_type: Optional[str] = None,
+        success: bool = True,
+        detail: Optional[dict] = None,
+    ) -> bool:
+        """加入一条执行日志，字段与 ExecutionLogRepository.create 一致
+
+        Returns:
+            是否被记录（被采样丢弃时返回 False）
+        """
+        if success and not self._sample(type, name):
+            self._sampled_out += 1
+            return False
+
+        self._buffer.append(
+            {
+                "timestamp": datetime.now(timezone.utc).replace(tzinfo=None),
+                "type": type,
+                "name": name,
+                "entity_id": str(entity_id) if entity_id is not None else None,
+                "actor_name": actor_name,
+                "actor_type": actor_type,
+                "success": success,
+                "detail": json.dumps(detail, default=str) if detail else None,
+            }
+        )
+        while len(self._buffer) > self.max_buffer_size:
+            self._buffer.popleft()
+            self._dropped += 1
+
+        if len(self._buffer) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    def _sample(self, type: str, name: str) -> bool:
+        """成功执行的采样：同一 (type, name) 每 N 条保留 1 条，结果可复现"""
+        if self.success_sample_rate >= 1:
+            return True
+        if self.success_sample_rate <= 0:
+            return False
+        every = max(1, round(1 / self.success_sample_rate))
+        key = (type, name)
+        count = self._success_counts.get(key, 0)
+        self._success_counts[key] = count + 1
+        return count % every == 0
+
+    # ==================== 生命周期 ====================
+
+    async def start(self) -> None:
+        """启动后台写入任务，并补写上次遗留的 spool 文件"""
+        if self._task is not None:
+            return
+        self._load_spool()
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run(), name="execution-log-writer")
+
+    async def close(self) -> None:
+        """停止后台任务并写入全部剩余记录，写入失败时转存到 spool 文件"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        await self.flush_all()
+        if self._buffer:
+            self._write_spool()
+
+    async def _run(self) -> None:
+        """按间隔或缓冲条数触发写入"""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            while self._buffer:
+                if not await self.flush():
+                    break
+                if len(self._buffer) < self.batch_size:
+                    break
+
+    # ==================== 写入 ====================
+
+    async def flush(self) -> bool:
+        """写入一批缓冲记录（最多 batch_size 条）
+
+        Returns:
+            是否写入成功（缓冲为空时也返回 True）
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            count = min(len(self._buffer), self.batch_size)
+            if count == 0:
+                return True
+            rows = [self._buffer.popleft() for _ in range(count)]
+            try:
+                async with self.session_factory() as session:
+                    await session.execute(insert(ExecutionLog), rows)
+                    await session.commit()
+            except BaseException as e:
+                # 放回缓冲头部，保持顺序，下次重试（任务被取消时同样不丢记录）
+                self._buffer.extendleft(reversed(rows))
+                if not isinstance(e, Exception):
+                    raise
+                self._failed_flushes += 1
+                logger.warning(f"Failed to write {count} execution logs: {e}")
+                return False
+
+            self._written += count
+            return True
+
+    async def flush_all(self) -> None:
+        """写入当前缓冲中的全部记录（测试与关闭前使用）"""
+        while self._buffer:
+            if not await self.flush():
+                return
+
+    # ==================== spool 文件 ====================
+
+    def _write_spool(self) -> None:
+        """将剩余记录追加写入 spool 文件"""
+        if not self.spool_path:
+            logger.error(f"Discarding {len(self._buffer)} unwritten execution logs")
+            return
+        try:
+            with open(self.spool_path, "a", encoding="utf-8") as f:
+                for row in self._buffer:
+                    f.write(
+                        json.dumps(
+                            {**row, "timestamp": row["timestamp"].isoformat()},
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                    )
+            logger.warning(
+                f"Spooled {len(self._buffer)} execution logs to {self.spool_path}"
+            )
+            self._buffer.clear()
+        except OSError as e:
+            logger.error(f"Failed to spool execution logs: {e}")
+
+    def _load_spool(self) -> None:
+        """读取 spool 文件中的记录放入缓冲，随后删除文件"""
+        if not self.spool_path or not os.path.exists(self.spool_path):
+            return
+        rows: List[dict] = []
+        try:
+            with open(self.spool_path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    row = json.loads(line)
+                    row["timestamp"] = datetime.fromisoformat(row["timestamp"])
+                    rows.append(row)
+            os.remove(self.spool_path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load spooled execution logs: {e}")
+            return
+        self._buffer.extendleft(reversed(rows))
+        logger.info(f"Loaded {len(rows)} spooled execution logs")
+
+    # ==================== 指标 ====================
+
+    def metrics(self) -> Dict[str, Any]:
+        """写入器计数快照"""
+        return {
+            "buffered": len(self._buffer),
+            "written": self._written,
+            "sampled_out": self._sampled_out,
+            "dropped": self._dropped,
+            "failed_flushes": self._failed_flushes,
+        }
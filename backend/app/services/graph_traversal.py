@@ -0,0 +1,499 @@
+# backend/app/services/graph_traversal.py
+"""
+图遍历引擎
+
+基于前沿 (frontier) 的逐层扩展实现图遍历，替代递归 CTE 的路径枚举。
+
+递归 CTE 会为每一条不同的路径生成一行（并携带路径数组），在存在枢纽节点的
+图上随深度呈组合爆炸。这里改为每层只发起一次邻接查询，并用全局 visited 集合
+保证每个节点只被访问一次：
+
+1. 双向 BFS 最短路径：从起点和终点同时扩展，每次扩展较小的一侧前沿，
+   两侧相遇即停止
+2. k 条最短路径：基于 Yen 算法，复用双向 BFS 作为子过程
+3. 多跳邻居：按层同步扩展，每层设置扇出上限，关系类型和方向下推到每一跳
+4. 访问节点上限：单次查询访问的节点数超过上限时提前终止
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import select, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.graph import GraphEntity, GraphRelationship
+
+logger = logging.getLogger(__name__)
+
+# 单次查询默认最多访问的节点数
+DEFAULT_MAX_VISITED = 20000
+
+# 每条邻接查询中 IN 列表的最大长度（避免超出驱动的参数个数限制）
+FRONTIER_CHUNK_SIZE = 5000
+
+# 多跳邻居查询：每层最多纳入的新节点数，以及总节点数上限
+DEFAULT_MAX_PER_LEVEL = 200
+DEFAULT_MAX_NODES = 500
+
+_REVERSE_DIRECTION = {"outgoing": "incoming", "incoming": "outgoing", "both": "both"}
+
+
+@dataclass(frozen=True)
+class TraversalEdge:
+    """一条被遍历到的关系边"""
+
+    id: int
+    source_id: int
+    target_id: int
+    relationship_type: str
+
+
+@dataclass
+class GraphPath:
+    """一条路径：节点 ID 序列与相邻节点之间的边"""
+
+    node_ids: List[int]
+    edges: List[TraversalEdge]
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+
+@dataclass
+class TraversalStats:
+    """单次遍历的统计信息，访问上限在多次子搜索之间共享"""
+
+    max_visited: int = DEFAULT_MAX_VISITED
+    visited: int = 0
+    queries: int = 0
+    truncated: bool = False
+
+    def charge(self, count: int) -> bool:
+        """记录新访问的节点数，超出上限时返回 False"""
+        self.visited += count
+        if self.visited > self.max_visited:
+            self.truncated = True
+            return False
+        return True
+
+
+@dataclass
+class VisitedNode:
+    """邻居扩展中访问到的节点，parent/edge 为首次到达时经过的节点和边"""
+
+    id: int
+    distance: int
+    parent_id: Optional[int] = None
+    edge: Optional[TraversalEdge] = None
+
+
+@dataclass
+class Neighborhood:
+    """多跳邻居扩展结果"""
+
+    start_id: int
+    nodes: Dict[int, VisitedNode] = field(default_factory=dict)
+    edges: List[TraversalEdge] = field(default_factory=list)
+    truncated: bool = False
+
+
+@dataclass
+class _SearchSide:
+    """双向搜索中的一侧"""
+
+    direction: str
+    frontier: Set[int]
+    parents: Dict[int, Optional[Tuple[int, TraversalEdge]]]
+    distance: Dict[int, int] = field(default_factory=dict)
+    depth: int = 0
+
+
+class GraphTraversal:
+    """基于前沿扩展的图遍历引擎"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ==================== 邻接查询 ====================
+
+    async def expand(
+        self,
+        frontier: Iterable[int],
+        direction: str = "both",
+        relationship_types: Optional[List[str]] = None,
+        stats: Optional[TraversalStats] = None,
+    ) -> List[Tuple[int, int, TraversalEdge]]:
+        """一次性获取整层前沿的所有邻接边
+
+        Args:
+            frontier: 当前层的节点 ID
+            direction: outgoing / incoming / both
+            relationship_types: 可选，仅沿这些关系类型扩展
+            stats: 可选，用于记录查询次数
+
+        Returns:
+            (前沿节点, 邻居节点, 边) 列表
+        """
+        frontier_ids = list(frontier)
+        adjacency: List[Tuple[int, int, TraversalEdge]] = []
+        frontier_set = set(frontier_ids)
+
+        for i in range(0, len(frontier_ids), FRONTIER_CHUNK_SIZE):
+            chunk = frontier_ids[i : i + FRONTIER_CHUNK_SIZE]
+
+            if direction == "outgoing":
+                condition = GraphRelationship.source_id.in_(chunk)
+            elif direction == "incoming":
+                condition = GraphRelationship.target_id.in_(chunk)
+            else:
+                condition = or_(
+                    GraphRelationship.source_id.in_(chunk),
+                    GraphRelationship.target_id.in_(chunk),
+                )
+
+            query = select(
+                GraphRelationship.id,
+                GraphRelationship.source_id,
+                GraphRelationship.target_id,
+                GraphRelationship.relationship_type,
+            ).where(condition)
+
+            if relationship_types:
+                query = query.where(
+                    GraphRelationship.relationship_type.in_(relationship_types)
+                )
+
+            result = await self.db.execute(query)
+            if stats is not None:
+                stats.queries += 1
+
+            for rel_id, source_id, target_id, rel_type in result.all():
+                edge = TraversalEdge(rel_id, source_id, target_id, rel_type)
+                if direction != "incoming" and source_id in frontier_set:
+                    adjacency.append((source_id, target_id, edge))
+                if direction != "outgoing" and target_id in frontier_set:
+                    adjacency.append((target_id, source_id, edge))
+
+        return adjacency
+
+    async def filter_accessible(
+        self, node_ids: Iterable[int], accessible_entity_types: Optional[List[str]]
+    ) -> Set[int]:
+        """过滤出实体类型可访问的节点"""
+        ids = list(node_ids)
+        if not ids or not accessible_entity_types:
+            return set(ids)
+
+        allowed: Set[int] = set()
+        for i in range(0, len(ids), FRONTIER_CHUNK_SIZE):
+            chunk = ids[i : i + FRONTIER_CHUNK_SIZE]
+            result = await self.db.execute(
+                select(GraphEntity.id).where(
+                    GraphEntity.id.in_(chunk),
+                    GraphEntity.entity_type.in_(accessible_entity_types),
+                )
+            )
+            allowed.update(row[0] for row in result.all())
+        return allowed
+
+    # ==================== 多跳邻居 ====================
+
+    async def expand_neighborhood(
+        self,
+        start_id: int,
+        hops: int,
+        direction: str = "both",
+        relationship_types: Optional[List[str]] = None,
+        accessible_entity_types: Optional[List[str]] = None,
+        max_per_level: int = DEFAULT_MAX_PER_LEVEL,
+        max_nodes: int = DEFAULT_MAX_NODES,
+    ) -> Neighborhood:
+        """按层同步扩展邻居，每个节点全局只访问一次
+
+        Args:
+            start_id: 起始节点 ID
+            hops: 扩展跳数
+            direction: outgoing / incoming / both，作用于每一跳
+            relationship_types: 可选，仅沿这些关系类型扩展
+            accessible_entity_types: 可选，不可访问的节点既不返回也不继续扩展
+            max_per_level: 每层最多纳入的新节点数
+            max_nodes: 总节点数上限（不含起始节点）
+
+        Returns:
+            Neighborhood，任一上限生效时 truncated 为 True
+        """
+        neighborhood = Neighborhood(start_id=start_id)
+        neighborhood.nodes[start_id] = VisitedNode(id=start_id, distance=0)
+        seen_edges: Set[int] = set()
+        frontier = {start_id}
+
+        for distance in range(1, hops + 1):
+            if not frontier:
+                break
+
+            adjacency = await self.expand(frontier, direction, relationship_types)
+
+            # 首次到达的父节点：按 (父节点, 边) 排序保证结果稳定
+            first_reach: Dict[int, Tuple[int, TraversalEdge]] = {}
+            for node, neighbor, edge in sorted(
+                adjacency, key=lambda item: (item[0], item[2].id)
+            ):
+                if neighbor not in neighborhood.nodes and neighbor not in first_reach:
+                    first_reach[neighbor] = (node, edge)
+
+            candidates = set(first_reach)
+            if accessible_entity_types:
+                candidates = await self.filter_accessible(
+                    candidates, accessible_entity_types
+                )
+
+            admitted = sorted(candidates)
+            budget = min(max_per_level, max_nodes - (len(neighborhood.nodes) - 1))
+            if len(admitted) > budget:
+                admitted = admitted[: max(budget, 0)]
+                neighborhood.truncated = True
+
+            for node_id in admitted:
+                parent_id, edge = first_reach[node_id]
+                neighborhood.nodes[node_id] = VisitedNode(
+                    id=node_id, distance=distance, parent_id=parent_id, edge=edge
+                )
+
+            # 记录两端均已纳入的边（含非树边），用于可视化
+            for node, neighbor, edge in adjacency:
+                if (
+                    edge.id not in seen_edges
+                    and node in neighborhood.nodes
+                    and neighbor in neighborhood.nodes
+                ):
+                    seen_edges.add(edge.id)
+                    neighborhood.edges.append(edge)
+
+            frontier = set(admitted)
+            if len(neighborhood.nodes) - 1 >= max_nodes:
+                if frontier and distance < hops:
+                    neighborhood.truncated = True
+                break
+
+        return neighborhood
+
+    # ==================== 最短路径 ====================
+
+    async def shortest_path(
+        self,
+        start_id: int,
+        end_id: int,
+        max_depth: int = 5,
+        direction: str = "both",
+        accessible_entity_types: Optional[List[str]] = None,
+        stats: Optional[TraversalStats] = None,
+        excluded_nodes: Optional[Set[int]] = None,
+        excluded_edges: Optional[Set[int]] = None,
+    ) -> Optional[GraphPath]:
+        """双向 BFS 查找最短路径
+
+        每轮扩展前沿较小的一侧；一侧扩展出的新节点已被另一侧访问过时即相遇。
+        同一轮内可能有多个相遇点，取两侧距离之和最小者。
+
+        Args:
+            start_id: 起点 ID
+            end_id: 终点 ID
+            max_depth: 路径最大边数
+            direction: 路径方向，both 表示忽略边的方向
+            accessible_entity_types: 可选，路径经过的节点类型必须在此列表中
+            stats: 可选，遍历统计（含访问上限）
+            excluded_nodes: 不允许经过的节点（Yen 算法使用）
+            excluded_edges: 不允许经过的边（Yen 算法使用）
+
+        Returns:
+            GraphPath，未找到（或超出访问上限）时返回 None
+        """
+        stats = stats or TraversalStats()
+        excluded_nodes = excluded_nodes or set()
+        excluded_edges = excluded_edges or set()
+
+        if start_id == end_id:
+            return GraphPath(node_ids=[start_id], edges=[])
+
+        forward = _SearchSide(
+            direction=direction,
+            frontier={start_id},
+            parents={start_id: None},
+            distance={start_id: 0},
+        )
+        backward = _SearchSide(
+            direction=_REVERSE_DIRECTION.get(direction, "both"),
+            frontier={end_id},
+            parents={end_id: None},
+            distance={end_id: 0},
+        )
+        if not stats.charge(2):
+            return None
+
+        while (
+            forward.frontier
+            and backward.frontier
+            and forward.depth + backward.depth < max_depth
+        ):
+            if len(forward.frontier) <= len(backward.frontier):
+                side, other = forward, backward
+            else:
+                side, other = backward, forward
+
+            adjacency = await self.expand(side.frontier, side.direction, stats=stats)
+
+            candidates = {
+                neighbor
+                for _, neighbor, edge in adjacency
+                if neighbor not in side.parents
+                and neighbor not in excluded_nodes
+                and edge.id not in excluded_edges
+            }
+            if accessible_entity_types:
+                candidates = await self.filter_accessible(
+                    candidates, accessible_entity_types
+                )
+
+            next_frontier: Set[int] = set()
+            meeting: Optional[int] = None
+            meeting_length: Optional[int] = None
+
+            for node, neighbor, edge in adjacency:
+                if (
+                    neighbor not in candidates
+                    or neighbor in side.parents
+                    or edge.id in excluded_edges
+                ):
+                    continue
+                side.parents[neighbor] = (node, edge)
+                side.distance[neighbor] = side.depth + 1
+                next_frontier.add(neighbor)
+
+                if neighbor in other.parents:
+                    length = side.distance[neighbor] + other.distance[neighbor]
+                    if meeting_length is None or length < meeting_length:
+                        meeting, meeting_length = neighbor, length
+
+            side.depth += 1
+            side.frontier = next_frontier
+
+            if meeting is not None:
+                return self._join_paths(forward, backward, meeting)
+
+            if not stats.charge(len(next_frontier)):
+                logger.warning(
+                    f"Path search {start_id} -> {end_id} stopped after visiting "
+                    f"{stats.visited} nodes (limit {stats.max_visited})"
+                )
+                return None
+
+        return None
+
+    async def k_shortest_paths(
+        self,
+        start_id: int,
+        end_id: int,
+        k: int = 1,
+        max_depth: int = 5,
+        direction: str = "both",
+        accessible_entity_types: Optional[List[str]] = None,
+        stats: Optional[TraversalStats] = None,
+    ) -> List[GraphPath]:
+        """Yen 算法查找 k 条最短的简单路径
+
+        以上一条路径的每个节点作为分叉点 (spur node)，屏蔽根路径上的节点以及
+        已知路径在该处使用过的边后，用双向 BFS 求分叉路径。
+
+        Returns:
+            按长度升序排列的路径列表（最多 k 条）
+        """
+        stats = stats or TraversalStats()
+        first = await self.shortest_path(
+            start_id,
+            end_id,
+            max_depth=max_depth,
+            direction=direction,
+            accessible_entity_types=accessible_entity_types,
+            stats=stats,
+        )
+        if first is None:
+            return []
+
+        paths: List[GraphPath] = [first]
+        candidates: List[GraphPath] = []
+        seen = {self._path_key(first)}
+
+        while len(paths) < k:
+            previous = paths[-1]
+            for i in range(len(previous.node_ids) - 1):
+                spur_node = previous.node_ids[i]
+                root_nodes = previous.node_ids[: i + 1]
+                root_edges = previous.edges[:i]
+
+                excluded_edges = {
+                    p.edges[i].id
+                    for p in paths
+                    if len(p.edges) > i and p.node_ids[: i + 1] == root_nodes
+                }
+                excluded_nodes = set(root_nodes[:-1])
+
+                spur = await self.shortest_path(
+                    spur_node,
+                    end_id,
+                    max_depth=max_depth - i,
+                    direction=direction,
+                    accessible_entity_types=accessible_entity_types,
+                    stats=stats,
+                    excluded_nodes=excluded_nodes,
+                    excluded_edges=excluded_edges,
+                )
+                if stats.truncated:
+                    break
+                if spur is None:
+                    continue
+
+                candidate = GraphPath(
+                    node_ids=root_nodes[:-1] + spur.node_ids,
+                    edges=root_edges + spur.edges,
+                )
+                key = self._path_key(candidate)
+                if key not in seen:
+                    seen.add(key)
+                    candidates.append(candidate)
+
+            if not candidates or stats.truncated:
+                break
+
+            candidates.sort(key=len)
+            paths.append(candidates.pop(0))
+
+        return paths
+
+    # ==================== 内部工具 ====================
+
+    @staticmethod
+    def _join_paths(
+        forward: _SearchSide, backward: _SearchSide, meeting: int
+    ) -> GraphPath:
+        """从相遇点回溯两侧的父指针，拼接完整路径"""
+        node_ids = [meeting]
+        edges: List[TraversalEdge] = []
+
+        node = meeting
+        while forward.parents[node] is not None:
+            parent, edge = forward.parents[node]
+            node_ids.insert(0, parent)
+            edges.insert(0, edge)
+            node = parent
+
+        node = meeting
+        while backward.parents[node] is not None:
+            parent, edge = backward.parents[node]
+            node_ids.append(parent)
+            edges.append(edge)
+            node = parent
+
+        return GraphPath(node_ids=node_ids, edges=edges)
+
+    @staticmethod
+    def _path_key(path: GraphPath) -> Tuple[int, ...]:
+        return tuple(edge.id for edge in path.edges)
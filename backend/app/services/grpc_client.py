@@ -4,33 +4,59 @@
 
 使用 Server Reflection 发现服务定义，并支持动态方法调用。
 不需要预编译 .proto 文件。
+
+GrpcClientRegistry 按 (host, port) 在进程内复用长连接和已反射的服务描述符，
+调用方通过 borrow_client 借用共享客户端，避免每次调用都建立连接和重新反射。
 """
 
 import grpc
 import grpc.aio
 import logging
-import json
 import asyncio
 import time
-from typing import Dict, Any, List, Optional, Tuple
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Any, Iterable, List, Optional, Tuple
 from google.protobuf import descriptor_pb2
 from google.protobuf import descriptor_pool
 from google.protobuf import message_factory
-from google.protobuf.json_format import MessageToDict, ParseDict
+from google.protobuf.json_format import ParseDict
 from grpc_reflection.v1alpha import reflection_pb2, reflection_pb2_grpc
 
+from app.services.grpc_codec import MethodCodec
+
 logger = logging.getLogger(__name__)
 
+# 共享长连接的 keepalive 配置：只在有调用时发送 ping，避免触发服务端 too_many_pings
+SHARED_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 60_000),
+    ("grpc.keepalive_timeout_ms", 20_000),
+    ("grpc.keepalive_permit_without_calls", 0),
+]
+DEFAULT_DESCRIPTOR_TTL = 600  # 反射描述符的缓存时间（秒）
+DEFAULT_HEALTH_CHECK_INTERVAL = 30  # 借出共享连接时检查连接状态的最小间隔（秒）
+
 
 class DynamicGrpcClient:
-    def __init__(self, host: str, port: int):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        options: Optional[List[Tuple[str, Any]]] = None,
+    ):
         self.target = f"{host}:{port}"
+        self.options = options
         self.channel = None
         self.reflection_stub = None
         self.pool = descriptor_pool.DescriptorPool()
         self.factory = message_factory.MessageFactory(self.pool)
         self._loaded_files = set()
         self._services = {}  # service_name -> service_desc
+        self._codecs: Dict[Tuple[str, str], MethodCodec] = {}
+        self._unary_calls: Dict[str, Any] = {}  # method path -> 当前通道上的调用对象
+        self._stream_calls: Dict[str, Any] = {}  # 服务端流式方法的调用对象
+        self._reflection_lock = asyncio.Lock()
+        self.descriptors_loaded_at: Optional[float] = None
 
     async def __aenter__(self):
         await self.connect()
@@ -45,7 +71,7 @@ class DynamicGrpcClient:
             return
 
         try:
-            self.channel = grpc.aio.insecure_channel(self.target)
+            self.channel = grpc.aio.insecure_channel(self.target, options=self.options)
             # 等待连接就绪
             await asyncio.wait_for(self.channel.channel_ready(), timeout=timeout)
             self.reflection_stub = reflection_pb2_grpc.ServerReflectionStub(
@@ -73,6 +99,27 @@ class DynamicGrpcClient:
             await self.channel.close()
             self.channel = None
             self.reflection_stub = None
+            self._unary_calls = {}
+            self._stream_calls = {}
+
+    def reset_descriptors(self):
+        """清空已反射的服务描述符，下次调用时重新反射"""
+        self.pool = descriptor_pool.DescriptorPool()
+        self.factory = message_factory.MessageFactory(self.pool)
+        self._loaded_files = set()
+        self._services = {}
+        self._codecs = {}
+        # 调用对象绑定了旧描述符的序列化函数，需随描述符一起重建
+        self._unary_calls = {}
+        self._stream_calls = {}
+        self.descriptors_loaded_at = None
+
+    async def _get_service(self, service_name: str):
+        """获取服务描述符，并发调用时只反射一次"""
+        if service_name in self._services:
+            return self._services[service_name]
+        async with self._reflection_lock:
+            return await self._load_service_reflection(service_name)
 
     async def _load_service_reflection(self, service_name: str):
         """通过反射加载服务定义到 DescriptorPool"""
@@ -153,6 +200,8 @@ class DynamicGrpcClient:
                 )
 
             self._services[service_name] = service_desc
+            if self.descriptors_loaded_at is None:
+                self.descriptors_loaded_at = time.monotonic()
             return service_desc
 
         except Exception as e:
@@ -161,7 +210,7 @@ class DynamicGrpcClient:
 
     async def get_service_info(self, service_name: str) -> Dict[str, Any]:
         """获取服务的详细描述"""
-        service_desc = await self._load_service_reflection(service_name)
+        service_desc = await self._get_service(service_name)
 
         methods = []
         message_types = {}
@@ -171,18 +220,20 @@ class DynamicGrpcClient:
                 return
 
             fields = []
-            for field in msg_desc.fields:
+            for field_desc in msg_desc.fields:
                 field_info = {
-                    "name": field.name,
-                    "type": field.type,
+                    "name": field_desc.name,
+                    "type": field_desc.type,
                     "type_name": (
-                        field.message_type.full_name if field.message_type else None
+                        field_desc.message_type.full_name
+                        if field_desc.message_type
+                        else None
                     ),
-                    "label": field.label,
+                    "label": field_desc.label,
                 }
                 fields.append(field_info)
-                if field.message_type:
-                    extract_msg(field.message_type)
+                if field_desc.message_type:
+                    extract_msg(field_desc.message_type)
 
             message_types[msg_desc.full_name] = {
                 "name": msg_desc.name,
@@ -208,51 +259,115 @@ class DynamicGrpcClient:
             "message_types": list(message_types.values()),
         }
 
+    async def get_codec(self, service_name: str, method_name: str) -> MethodCodec:
+        """获取方法的预编译编解码信息（首次调用时构建并缓存）"""
+        codec = self._codecs.get((service_name, method_name))
+        if codec is not None:
+            return codec
+
+        service_desc = await self._get_service(service_name)
+        method_desc = service_desc.methods_by_name.get(method_name)
+        if not method_desc:
+            raise ValueError(
+                f"Method {method_name} not found in service {service_name}"
+            )
+
+        codec = MethodCodec(
+            path=f"/{service_desc.full_name}/{method_name}",
+            input_class=message_factory.GetMessageClass(method_desc.input_type),
+            output_class=message_factory.GetMessageClass(method_desc.output_type),
+            client_streaming=method_desc.client_streaming,
+            server_streaming=method_desc.server_streaming,
+        )
+        self._codecs[(service_name, method_name)] = codec
+        return codec
+
     async def call_method(
         self,
         service_name: str,
         method_name: str,
         request_data: Dict[str, Any],
         timeout: Optional[int] = 300,
+        item_fields: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
-        """动态调用 gRPC 方法"""
-        service_desc = await self._load_service_reflection(service_name)
-        method_desc = next(
-            (m for m in service_desc.methods if m.name == method_name), None
-        )
-
-        if not method_desc:
-            raise ValueError(
-                f"Method {method_name} not found in service {service_name}"
+        """动态调用 gRPC 方法
+
+        Args:
+            item_fields: 列表响应中每个条目只转换这些字段；为 None 时转换全部字段
+        """
+        codec = await self.get_codec(service_name, method_name)
+        if codec.client_streaming or codec.server_streaming:
+            raise NotImplementedError(
+                "Streaming methods not supported, use stream_method for "
+                "server-streaming methods"
             )
 
-        InputMessageClass = message_factory.GetMessageClass(method_desc.input_type)
-        request_msg = InputMessageClass()
+        request_msg = codec.input_class()
         ParseDict(request_data, request_msg)
 
-        method_path = f"/{service_desc.full_name}/{method_name}"
+        if not self.channel:
+            await self.connect()
+        unary_call = self._unary_calls.get(codec.path)
+        if unary_call is None:
+            unary_call = self.channel.unary_unary(
+                codec.path,
+                request_serializer=codec.input_class.SerializeToString,
+                response_deserializer=codec.output_class.FromString,
+            )
+            self._unary_calls[codec.path] = unary_call
 
-        if method_desc.client_streaming or method_desc.server_streaming:
-            raise NotImplementedError("Streaming methods not supported")
+        try:
+            response_msg = await unary_call(request_msg, timeout=timeout)
+            return codec.converter(item_fields)(response_msg)
+        except Exception as e:
+            logger.error(f"Error calling {codec.path}: {e}")
+            raise
 
-        request_bytes = request_msg.SerializeToString()
-        OutputMessageClass = message_factory.GetMessageClass(method_desc.output_type)
+    async def stream_method(
+        self,
+        service_name: str,
+        method_name: str,
+        request_data: Dict[str, Any],
+        timeout: Optional[int] = None,
+        item_fields: Optional[Iterable[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """调用服务端流式方法，逐条产出转换后的响应消息
+
+        消费方停止迭代时不再读取流，由 HTTP/2 流控对服务端形成背压；
+        提前退出（aclose）时取消调用。
+
+        Args:
+            timeout: 整个流的超时时间（秒），为 None 时不限制
+            item_fields: 每条消息只转换这些字段；为 None 时转换全部字段
+        """
+        codec = await self.get_codec(service_name, method_name)
+        if codec.client_streaming or not codec.server_streaming:
+            raise ValueError(f"{codec.path} is not a server-streaming method")
+
+        request_msg = codec.input_class()
+        ParseDict(request_data, request_msg)
 
-        try:
-            unary_call = self.channel.unary_unary(
-                method_path,
-                request_serializer=lambda x: x,
-                response_deserializer=lambda x: x,
+        if not self.channel:
+            await self.connect()
+        stream_call = self._stream_calls.get(codec.path)
+        if stream_call is None:
+            stream_call = self.channel.unary_stream(
+                codec.path,
+                request_serializer=codec.input_class.SerializeToString,
+                response_deserializer=codec.output_class.FromString,
             )
-            response_bytes = await unary_call(request_bytes, timeout=timeout)
+            self._stream_calls[codec.path] = stream_call
 
-            response_msg = OutputMessageClass()
-            response_msg.ParseFromString(response_bytes)
-
-            return MessageToDict(response_msg, preserving_proto_field_name=True)
+        convert = codec.converter(item_fields)
+        call = stream_call(request_msg, timeout=timeout)
+        try:
+            async for response_msg in call:
+                yield convert(response_msg)
         except Exception as e:
-            logger.error(f"Error calling {method_path}: {e}")
+            logger.error(f"Error streaming {codec.path}: {e}")
             raise
+        finally:
+            call.cancel()
 
     async def list_services(self) -> List[str]:
         """列出服务器上的服务"""
@@ -284,3 +399,151 @@ class DynamicGrpcClient:
             return True, "连接成功", round(latency_ms, 2)
         except Exception as e:
             return False, str(e), None
+
+
+@dataclass
+class _SharedClientSlot:
+    """注册表中一个 (host, port) 的共享客户端"""
+
+    key: Tuple[str, int]
+    loop: asyncio.AbstractEventLoop
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    client: Optional[DynamicGrpcClient] = None
+    checked_at: float = 0.0
+    # 进行中的借用数；invalidate 后的槽位由最后一个借用方关闭
+    borrows: int = 0
+    retired: bool = False
+
+
+class GrpcClientRegistry:
+    """进程级 gRPC 客户端注册表
+
+    按 (host, port) 复用带 keepalive 的长连接和已反射的服务描述符：
+    - 借出时按间隔检查连接状态，连接失败或已关闭时重建连接
+    - 描述符超过 TTL 后重新反射；数据产品地址等配置变更时调用 invalidate
+    - grpc.aio 通道绑定事件循环，事件循环变化时重建客户端
+    - invalidate 立即移除客户端，旧连接在所有借用归还后才关闭
+    """
+
+    def __init__(
+        self,
+        descriptor_ttl: float = DEFAULT_DESCRIPTOR_TTL,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+    ):
+        self.descriptor_ttl = descriptor_ttl
+        self.health_check_interval = health_check_interval
+        self._slots: Dict[Tuple[str, int], _SharedClientSlot] = {}
+
+    def _slot(self, key: Tuple[str, int]) -> _SharedClientSlot:
+        loop = asyncio.get_running_loop()
+        slot = self._slots.get(key)
+        if slot is None or slot.loop is not loop:
+            slot = _SharedClientSlot(key=key, loop=loop)
+            self._slots[key] = slot
+        return slot
+
+    async def get(self, host: str, port: int) -> DynamicGrpcClient:
+        """获取 (host, port) 的共享客户端，必要时建立连接
+
+        不计入借用，invalidate 时连接可能立即关闭；调用 RPC 请使用 borrow。
+        """
+        return await self._get(self._slot((host, int(port))))
+
+    async def _get(self, slot: _SharedClientSlot) -> DynamicGrpcClient:
+        host, port = slot.key
+        async with slot.lock:
+            now = time.monotonic()
+            client = slot.client
+            if client is None:
+                client = DynamicGrpcClient(host, port, options=SHARED_CHANNEL_OPTIONS)
+                await client.connect()
+                slot.client, slot.checked_at = client, now
+                return client
+
+            if (
+                client.descriptors_loaded_at is not None
+                and now - client.descriptors_loaded_at > self.descriptor_ttl
+            ):
+                client.reset_descriptors()
+
+            if (
+                client.channel is None
+                or now - slot.checked_at >= self.health_check_interval
+            ):
+                state = (
+                    client.channel.get_state(try_to_connect=True)
+                    if client.channel
+                    else None
+                )
+                if state in (
+                    None,
+                    grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+                    grpc.ChannelConnectivity.SHUTDOWN,
+                ):
+                    logger.warning(
+                        f"Shared channel to {client.target} is {state}, reconnecting"
+                    )
+                    await client.close()
+                    await client.connect()
+                slot.checked_at = now
+            return client
+
+    @asynccontextmanager
+    async def borrow(self, host: str, port: int) -> AsyncIterator[DynamicGrpcClient]:
+        """借用共享客户端；退出时不关闭连接"""
+        slot = self._slot((host, int(port)))
+        slot.borrows += 1
+        try:
+            client = await self._get(slot)
+            try:
+                yield client
+            except grpc.aio.AioRpcError as e:
+                if e.code() == grpc.StatusCode.UNAVAILABLE:
+                    # 下次借出时立即检查连接状态
+                    slot.checked_at = 0.0
+                raise
+        finally:
+            slot.borrows -= 1
+            if slot.retired and slot.borrows == 0:
+                await self._close(slot)
+
+    async def invalidate(self, host: str, port: int) -> None:
+        """丢弃 (host, port) 的共享客户端（连接和描述符），下次借用时重建
+
+        仍有借用方调用中的旧连接延后到最后一个借用归还时关闭。
+        """
+        slot = self._slots.pop((host, int(port)), None)
+        if slot is None:
+            return
+        slot.retired = True
+        if slot.borrows:
+            logger.info(
+                f"Invalidated shared gRPC client for {host}:{port}, "
+                f"closing after {slot.borrows} borrow(s) are released"
+            )
+            return
+        await self._close(slot)
+        logger.info(f"Invalidated shared gRPC client for {host}:{port}")
+
+    async def _close(self, slot: _SharedClientSlot) -> None:
+        client, slot.client = slot.client, None
+        if client is not None and slot.loop is asyncio.get_running_loop():
+            await client.close()
+
+    async def close_all(self) -> None:
+        """关闭所有共享连接（应用关闭时调用，不等待借用归还）"""
+        slots, self._slots = list(self._slots.values()), {}
+        for slot in slots:
+            slot.retired = True
+            await self._close(slot)
+
+
+grpc_registry = GrpcClientRegistry()
+
+
+def borrow_client(host: str, port: int):
+    """从进程级注册表借用 (host, port) 的共享客户端
+
+    用法与 DynamicGrpcClient 相同：``async with borrow_client(host, port) as client``
+    """
+    return grpc_registry.borrow(host, port)
@@ -0,0 +1,238 @@
+# backend/app/services/grpc_codec.py
+"""
+gRPC 消息编解码
+
+为动态调用的每个方法预编译转换函数，替代逐条调用 MessageToDict：
+- 字段转换器按描述符一次性生成，调用时只遍历已设置的字段；
+  嵌套消息（含递归类型）同样使用预编译的转换函数
+- 可指定列表条目的字段投影，只转换映射中用到的字段，
+  未用到的嵌套消息不会被转换为 dict
+
+投影只作用于一层：列表响应的条目（顶层 repeated 消息字段）或服务端流式的每条消息。
+被投影选中的嵌套消息字段整体转换，不支持按嵌套路径（如 ``address.city``）投影。
+
+输出与 MessageToDict(preserving_proto_field_name=True) 保持一致：
+省略未设置的字段，64 位整数转为字符串，枚举转为名称，bytes 转为 base64。
+"""
+
+import base64
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional
+
+from google.protobuf import descriptor
+from google.protobuf.internal import type_checkers
+from google.protobuf.json_format import MessageToDict
+
+FieldDescriptor = descriptor.FieldDescriptor
+Converter = Callable[[Any], Any]
+# 一次编译中已生成的消息转换函数，按消息全名索引，供嵌套和递归类型复用
+ConverterCache = Dict[str, Callable[[Any], Dict[str, Any]]]
+
+_INT64_TYPES = (
+    FieldDescriptor.CPPTYPE_INT64,
+    FieldDescriptor.CPPTYPE_UINT64,
+)
+
+
+def _is_repeated(field_desc: FieldDescriptor) -> bool:
+    is_repeated = getattr(field_desc, "is_repeated", None)
+    if is_repeated is not None:
+        return is_repeated
+    return field_desc.label == FieldDescriptor.LABEL_REPEATED
+
+
+def _is_map(field_desc: FieldDescriptor) -> bool:
+    message_type = field_desc.message_type
+    return message_type is not None and message_type.GetOptions().map_entry
+
+
+def _message_to_dict(message: Any) -> Dict[str, Any]:
+    return MessageToDict(message, preserving_proto_field_name=True)
+
+
+def _float_converter(single_precision: bool) -> Converter:
+    def convert(value: float) -> Any:
+        if math.isinf(value):
+            return "-Infinity" if value < 0.0 else "Infinity"
+        if math.isnan(value):
+            return "NaN"
+        if single_precision:
+            return type_checkers.ToShortestFloat(value)
+        return value
+
+    return convert
+
+
+def _enum_converter(field_desc: FieldDescriptor) -> Converter:
+    enum_type = field_desc.enum_type
+    if enum_type.full_name == "google.protobuf.NullValue":
+        return lambda value: None
+    names = {number: value.name for number, value in enum_type.values_by_number.items()}
+    return lambda value: names.get(value, value)
+
+
+def _value_converter(
+    field_desc: FieldDescriptor, cache: ConverterCache
+) -> Optional[Converter]:
+    """单个值的转换函数；返回 None 表示原样输出"""
+    cpp_type = field_desc.cpp_type
+    if cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
+        return _nested_converter(field_desc.message_type, cache)
+    if cpp_type == FieldDescriptor.CPPTYPE_ENUM:
+        return _enum_converter(field_desc)
+    if field_desc.type == FieldDescriptor.TYPE_BYTES:
+        return lambda value: base64.b64encode(value).decode("utf-8")
+    if cpp_type in _INT64_TYPES:
+        return str
+    if cpp_type == FieldDescriptor.CPPTYPE_FLOAT:
+        return _float_converter(single_precision=True)
+    if cpp_type == FieldDescriptor.CPPTYPE_DOUBLE:
+        return _float_converter(single_precision=False)
+    return None
+
+
+def _field_converter(field_desc: FieldDescriptor, cache: ConverterCache) -> Converter:
+    """字段值（含 repeated 和 map）的转换函数"""
+    if _is_map(field_desc):
+        value_desc = field_desc.message_type.fields_by_name["value"]
+        convert_value = _value_converter(value_desc, cache) or (lambda value: value)
+
+        def convert_map(value: Any) -> Dict[str, Any]:
+            result = {}
+            for key in value:
+                if isinstance(key, bool):
+                    name = "true" if key else "false"
+                else:
+                    name = str(key)
+                result[name] = convert_value(value[key])
+            return result
+
+        return convert_map
+
+    convert = _value_converter(field_desc, cache)
+    if _is_repeated(field_desc):
+        if convert is None:
+            return list
+        return lambda values: [convert(value) for value in values]
+    return convert or (lambda value: value)
+
+
+def _fields_converter(
+    converters: Dict[str, Converter],
+) -> Callable[[Any], Dict[str, Any]]:
+    """只遍历已设置的字段，跳过没有转换函数（未投影）的字段"""
+
+    def convert(message: Any) -> Dict[str, Any]:
+        result = {}
+        for field_desc, value in message.ListFields():
+            converter = converters.get(field_desc.name)
+            if converter is not None and not field_desc.is_extension:
+                result[field_desc.name] = converter(value)
+        return result
+
+    return convert
+
+
+def _nested_converter(
+    message_desc: descriptor.Descriptor, cache: ConverterCache
+) -> Callable[[Any], Dict[str, Any]]:
+    """嵌套消息的完整转换函数；先登记再填充字段，递归类型引用同一函数"""
+    if message_desc.full_name.startswith("google.protobuf."):
+        return _message_to_dict
+    convert = cache.get(message_desc.full_name)
+    if convert is None:
+        converters: Dict[str, Converter] = {}
+        convert = cache[message_desc.full_name] = _fields_converter(converters)
+        for field_desc in message_desc.fields:
+            converters[field_desc.name] = _field_converter(field_desc, cache)
+    return convert
+
+
+def compile_message_converter(
+    message_desc: descriptor.Descriptor,
+    fields: Optional[Iterable[str]] = None,
+) -> Callable[[Any], Dict[str, Any]]:
+    """生成消息到 dict 的转换函数
+
+    Args:
+        message_desc: 消息描述符
+        fields: 只输出这些字段；为 None 时输出全部字段
+    """
+    if message_desc.full_name.startswith("google.protobuf."):
+        # 知名类型（Timestamp、Struct 等）有特殊的 JSON 表示
+        return _message_to_dict
+
+    cache: ConverterCache = {}
+    if fields is None:
+        return _nested_converter(message_desc, cache)
+    wanted = set(fields)
+    return _fields_converter(
+        {
+            field_desc.name: _field_converter(field_desc, cache)
+            for field_desc in message_desc.fields
+            if field_desc.name in wanted
+        }
+    )
+
+
+def compile_response_converter(
+    message_desc: descriptor.Descriptor,
+    item_fields: Optional[Iterable[str]] = None,
+) -> Callable[[Any], Dict[str, Any]]:
+    """生成响应消息的转换函数
+
+    item_fields 只作用于响应顶层的 repeated 消息字段（列表方法的条目），
+    分页等其他字段完整输出。
+    """
+    if item_fields is None or message_desc.full_name.startswith("google.protobuf."):
+        return compile_message_converter(message_desc)
+
+    cache: ConverterCache = {}
+    converters: Dict[str, Converter] = {}
+    for field_desc in message_desc.fields:
+        if (
+            field_desc.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE
+            and _is_repeated(field_desc)
+            and not _is_map(field_desc)
+        ):
+            convert_item = compile_message_converter(
+                field_desc.message_type, item_fields
+            )
+            converters[field_desc.name] = lambda items, c=convert_item: [
+                c(item) for item in items
+            ]
+        else:
+            converters[field_desc.name] = _field_converter(field_desc, cache)
+    return _fields_converter(converters)
+
+
+@dataclass
+class MethodCodec:
+    """一个 gRPC 方法的预编译编解码信息"""
+
+    path: str
+    input_class: Any
+    output_class: Any
+    client_streaming: bool
+    server_streaming: bool
+    _converters: Dict[Optional[FrozenSet[str]], Callable] = field(
+        default_factory=dict, repr=False
+    )
+
+    def converter(
+        self, item_fields: Optional[Iterable[str]] = None
+    ) -> Callable[[Any], Dict[str, Any]]:
+        """按字段投影缓存的响应转换函数
+
+        服务端流式方法的每条响应即一个条目，字段投影直接作用于响应消息。
+        """
+        key = frozenset(item_fields) if item_fields is not None else None
+        convert = self._converters.get(key)
+        if convert is None:
+            if self.server_streaming:
+                convert = compile_message_converter(self.output_class.DESCRIPTOR, key)
+            else:
+                convert = compile_response_converter(self.output_class.DESCRIPTOR, key)
+            self._converters[key] = convert
+        return convert
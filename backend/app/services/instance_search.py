@@ -0,0 +1,124 @@
+# backend/app/services/instance_search.py
+"""
+实例搜索服务
+
+按名称、ID 或别名搜索实例节点。
+
+PostgreSQL 下依赖 pg_trgm 的 GIN 索引（见迁移 a1f3c7e9b2d4）：
+- idx_entities_display_name_trgm: _display_name gin_trgm_ops
+- idx_entities_aliases_trgm: (properties->>'__aliases__') gin_trgm_ops
+
+ILIKE '%term%' 可以直接使用 trigram 索引，结果按 similarity 排序，
+因此搜索耗时与命中数量相关，而不是与图的规模相关。
+纯数字关键字（且不超过 int32 主键范围）先走主键精确查找。
+
+其他数据库（如测试使用的 SQLite）退化为普通 LIKE 查询，并按名称精确匹配和长度排序。
+"""
+
+import logging
+from typing import List, Optional
+from sqlalchemy import select, or_, func, case, literal_column, Text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.graph import GraphEntity
+
+logger = logging.getLogger(__name__)
+
+# 别名在 properties 中的键
+ALIASES_KEY = "__aliases__"
+
+# graph_entities.id 为 int32，超出范围的数字（如手机号、订单号）只按文本搜索
+MAX_ENTITY_ID = 2**31 - 1
+
+
+def escape_like(term: str) -> str:
+    """转义 LIKE 通配符"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class InstanceSearch:
+    """实例搜索"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @property
+    def _is_postgres(self) -> bool:
+        bind = self.db.bind
+        return bind is not None and getattr(bind.dialect, "name", None) == "postgresql"
+
+    def _aliases_text(self):
+        """别名数组的文本形式
+
+        PostgreSQL 下使用字面量键，使表达式与 idx_entities_aliases_trgm 的索引表达式一致
+        （绑定参数形式的键无法匹配表达式索引）。
+        """
+        if self._is_postgres:
+            return GraphEntity.properties.op("->>", return_type=Text)(
+                literal_column(f"'{ALIASES_KEY}'")
+            )
+        return GraphEntity.properties[ALIASES_KEY].astext
+
+    async def search(
+        self,
+        keyword: str,
+        entity_type: Optional[str] = None,
+        limit: int = 10,
+        accessible_entity_types: Optional[List[str]] = None,
+    ) -> List[GraphEntity]:
+        """搜索实例节点
+
+        Returns:
+            按相关度排序的实体列表，ID 精确匹配的实体排在最前
+        """
+        keyword = keyword.strip()
+        if not keyword or limit <= 0:
+            return []
+
+        filters = [GraphEntity.is_instance == True]
+        if entity_type:
+            filters.append(GraphEntity.entity_type == entity_type)
+        if accessible_entity_types:
+            filters.append(GraphEntity.entity_type.in_(accessible_entity_types))
+
+        entities: List[GraphEntity] = []
+
+        # ID 精确查找走主键
+        if keyword.isascii() and keyword.isdigit() and int(keyword) <= MAX_ENTITY_ID:
+            result = await self.db.execute(
+                select(GraphEntity).where(GraphEntity.id == int(keyword), *filters)
+            )
+            entity = result.scalar_one_or_none()
+            if entity is not None:
+                entities.append(entity)
+                filters.append(GraphEntity.id != entity.id)
+                limit -= 1
+                if limit <= 0:
+                    return entities
+
+        pattern = f"%{escape_like(keyword)}%"
+        aliases = self._aliases_text()
+        query = select(GraphEntity).where(
+            or_(
+                GraphEntity._display_name.ilike(pattern, escape="\\"),
+                aliases.ilike(pattern, escape="\\"),
+            ),
+            *filters,
+        )
+
+        if self._is_postgres:
+            rank = func.greatest(
+                func.similarity(GraphEntity._display_name, keyword),
+                func.similarity(func.coalesce(aliases, ""), keyword),
+            )
+            query = query.order_by(rank.desc(), GraphEntity.id)
+        else:
+            exact = case(
+                (func.lower(GraphEntity._display_name) == keyword.lower(), 0), else_=1
+            )
+            query = query.order_by(
+                exact, func.length(GraphEntity._display_name), GraphEntity.id
+            )
+
+        result = await self.db.execute(query.limit(limit))
+        entities.extend(result.scalars().all())
+        return entities
@@ -1,5 +1,9 @@
 # backend/app/services/mcp_client.py
+import asyncio
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
 import httpx
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.sse import sse_client
@@ -7,32 +11,319 @@ from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_POOL_SIZE = 1  # Initialized sessions kept per server
+DEFAULT_CONNECT_TIMEOUT = 10.0  # Seconds to open and initialize a session
+DEFAULT_CALL_TIMEOUT = 120.0  # Seconds before a tool call is abandoned
+DEFAULT_BACKOFF_BASE = 0.5  # First reconnect delay after a failed connect
+DEFAULT_BACKOFF_MAX = 30.0  # Upper bound of the reconnect delay
+LATENCY_SAMPLES = 200  # Recent call latencies kept for percentiles
 
-class MCPClient:
-    """Client for interacting with MCP servers via SSE."""
+
+class _PooledSession:
+    """One initialized MCP session kept open by its own task.
+
+    The SSE transport and ClientSession are anyio context managers that must
+    be entered and exited by the same task, so a dedicated task owns them and
+    callers only send requests on the session. ClientSession matches
+    responses to request ids, so concurrent calls share one connection.
+    """
 
     def __init__(self, url: str):
         self.url = url
-        self._session: Optional[ClientSession] = None
-        self._exit_stack = None
-        self._client = None
+        self.session: Optional[ClientSession] = None
+        self.in_flight = 0
+        self._ready = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
 
-    async def get_tools(self) -> List[Dict[str, Any]]:
-        """Fetch available tools from the MCP server."""
+    async def open(self, timeout: float) -> None:
+        """Connect and initialize; raises if the session cannot be opened."""
+        self._task = asyncio.create_task(self._run(), name=f"mcp-session {self.url}")
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            await self.close()
+            raise ConnectionError(f"Timed out connecting to MCP server {self.url}")
+        if self.session is None:
+            raise ConnectionError(
+                f"Could not connect to MCP server {self.url}: {self._error}"
+            )
+
+    async def _run(self) -> None:
         try:
             async with sse_client(self.url) as (read, write):
                 async with ClientSession(read, write) as session:
                     await session.initialize()
-                    tools_result = await session.list_tools()
-                    # tools_result.tools is a list of Tool objects
-                    return [
-                        {
-                            "name": tool.name,
-                            "description": tool.description,
-                            "input_schema": tool.inputSchema,
-                        }
-                        for tool in tools_result.tools
-                    ]
+                    self.session = session
+                    self._ready.set()
+                    await self._stop.wait()
+        except Exception as e:
+            self._error = e
+            if self.session is not None:
+                logger.warning(f"MCP session to {self.url} closed: {e}")
+        finally:
+            self.session = None
+            self._ready.set()
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self.session is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def close(self) -> None:
+        """Close the session and wait for its task to exit."""
+        self._stop.set()
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), 5.0)
+        except (asyncio.TimeoutError, Exception):
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+@dataclass
+class _ServerStats:
+    """Counters of one MCP server."""
+
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    connects: int = 0
+    connect_failures: int = 0
+    last_error: Optional[str] = None
+    latencies: deque = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+
+class MCPServerPool:
+    """Initialized sessions to one MCP server, shared by all callers.
+
+    - Up to ``size`` sessions are opened on demand; a call goes to the open
+      session with the fewest requests in flight
+    - Dead sessions are dropped and replaced on the next call
+    - After a failed connect, new connects wait an exponential backoff; calls
+      arriving meanwhile fail fast instead of piling up on a down server
+    - One connect runs at a time, outside the pool lock: calls with an open
+      session keep being served, calls without one wait for the connect
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        call_timeout: float = DEFAULT_CALL_TIMEOUT,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ):
+        self.url = url
+        self.size = max(1, size)
+        self.connect_timeout = connect_timeout
+        self.call_timeout = call_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.loop = asyncio.get_running_loop()
+        self.stats = _ServerStats()
+        self._sessions: List[_PooledSession] = []
+        self._changed = asyncio.Condition()
+        self._connecting = False
+        self._closed = False
+        self._failures = 0
+        self._retry_at = 0.0
+
+    async def _acquire(self) -> _PooledSession:
+        """Pick an open session, connecting a new one when needed."""
+        async with self._changed:
+            while True:
+                self._sessions = [s for s in self._sessions if s.alive]
+                idle = [s for s in self._sessions if s.in_flight == 0]
+                if self._sessions and (
+                    idle or self._connecting or len(self._sessions) >= self.size
+                ):
+                    return min(self._sessions, key=lambda s: s.in_flight)
+
+                now = time.monotonic()
+                if now < self._retry_at:
+                    if self._sessions:
+                        return min(self._sessions, key=lambda s: s.in_flight)
+                    raise ConnectionError(
+                        f"MCP server {self.url} is unavailable, "
+                        f"reconnecting in {self._retry_at - now:.1f}s"
+                    )
+                if not self._connecting:
+                    # Reserve the connect, then open it without the lock
+                    self._connecting = True
+                    break
+                await self._changed.wait()
+
+        pooled = _PooledSession(self.url)
+        try:
+            await pooled.open(self.connect_timeout)
+        except Exception as e:
+            async with self._changed:
+                self._connecting = False
+                self._failures += 1
+                delay = min(
+                    self.backoff_max, self.backoff_base * 2 ** (self._failures - 1)
+                )
+                self._retry_at = time.monotonic() + delay
+                self.stats.connect_failures += 1
+                self.stats.last_error = str(e)
+                self._changed.notify_all()
+            raise
+        except BaseException:
+            # Cancelled while connecting: release the reservation
+            async with self._changed:
+                self._connecting = False
+                self._changed.notify_all()
+            await pooled.close()
+            raise
+
+        async with self._changed:
+            self._connecting = False
+            self._changed.notify_all()
+            if self._closed:
+                await pooled.close()
+                raise ConnectionError(f"MCP pool for {self.url} was closed")
+            self._failures = 0
+            self._retry_at = 0.0
+            self.stats.connects += 1
+            self._sessions.append(pooled)
+            return pooled
+
+    async def _request(self, send) -> Any:
+        """Run one request on a pooled session and record its outcome."""
+        self.stats.calls += 1
+        try:
+            pooled = await self._acquire()
+        except Exception:
+            self.stats.errors += 1
+            raise
+
+        pooled.in_flight += 1
+        start = time.monotonic()
+        try:
+            return await asyncio.wait_for(send(pooled.session), self.call_timeout)
+        except asyncio.TimeoutError:
+            self.stats.errors += 1
+            self.stats.timeouts += 1
+            self.stats.last_error = f"Timed out after {self.call_timeout}s"
+            raise
+        except Exception as e:
+            self.stats.errors += 1
+            self.stats.last_error = str(e)
+            raise
+        finally:
+            pooled.in_flight -= 1
+            self.stats.latencies.append(time.monotonic() - start)
+
+    async def list_tools(self) -> Any:
+        return await self._request(lambda session: session.list_tools())
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        return await self._request(lambda session: session.call_tool(name, arguments))
+
+    async def close(self) -> None:
+        self._closed = True
+        sessions, self._sessions = self._sessions, []
+        await asyncio.gather(*(s.close() for s in sessions))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of the server's counters and latencies."""
+        stats = self.stats
+        latencies = sorted(stats.latencies)
+
+        def percentile(q: float) -> Optional[float]:
+            if not latencies:
+                return None
+            index = min(len(latencies) - 1, int(q * len(latencies)))
+            return round(latencies[index] * 1000, 2)
+
+        return {
+            "sessions": sum(1 for s in self._sessions if s.alive),
+            "in_flight": sum(s.in_flight for s in self._sessions),
+            "calls": stats.calls,
+            "errors": stats.errors,
+            "timeouts": stats.timeouts,
+            "connects": stats.connects,
+            "connect_failures": stats.connect_failures,
+            "latency_ms_p50": percentile(0.5),
+            "latency_ms_p95": percentile(0.95),
+            "last_error": stats.last_error,
+        }
+
+
+class MCPClientPool:
+    """Process-wide MCP session pools keyed by server URL.
+
+    Sessions are bound to the event loop that opened them; a pool created on
+    another loop is replaced. Call invalidate when a server's URL or
+    settings change.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, **pool_options: Any):
+        self.size = size
+        self.pool_options = pool_options
+        self._pools: Dict[str, MCPServerPool] = {}
+
+    def get(self, url: str) -> MCPServerPool:
+        """Get the pool of a server URL, creating it if needed."""
+        pool = self._pools.get(url)
+        if pool is None or pool.loop is not asyncio.get_running_loop():
+            pool = MCPServerPool(url, size=self.size, **self.pool_options)
+            self._pools[url] = pool
+        return pool
+
+    async def invalidate(self, url: str) -> None:
+        """Close the sessions of a server; the next call reconnects."""
+        pool = self._pools.pop(url, None)
+        if pool is None:
+            return
+        if pool.loop is asyncio.get_running_loop():
+            await pool.close()
+        logger.info(f"Invalidated MCP sessions for {url}")
+
+    async def close_all(self) -> None:
+        """Close all sessions (on application shutdown)."""
+        for url in list(self._pools):
+            await self.invalidate(url)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-server metrics keyed by URL."""
+        return {url: pool.metrics() for url, pool in self._pools.items()}
+
+
+mcp_pool = MCPClientPool()
+
+
+class MCPClient:
+    """Client for interacting with MCP servers via SSE.
+
+    Requests go through pooled, already initialized sessions instead of a
+    new SSE connection and MCP handshake per call.
+    """
+
+    def __init__(self, url: str, pool: Optional[MCPClientPool] = None):
+        self.url = url
+        self.pool = pool or mcp_pool
+
+    async def get_tools(self) -> List[Dict[str, Any]]:
+        """Fetch available tools from the MCP server."""
+        try:
+            tools_result = await self.pool.get(self.url).list_tools()
+            # tools_result.tools is a list of Tool objects
+            return [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "input_schema": tool.inputSchema,
+                }
+                for tool in tools_result.tools
+            ]
         except Exception as e:
             logger.error(f"Failed to fetch tools from MCP server at {self.url}: {e}")
             return []
@@ -40,11 +331,8 @@ class MCPClient:
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
         """Call a tool on the MCP server."""
         try:
-            async with sse_client(self.url) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    result = await session.call_tool(name, arguments)
-                    return result.content
+            result = await self.pool.get(self.url).call_tool(name, arguments)
+            return result.content
         except Exception as e:
             logger.error(f"Error calling MCP tool '{name}' at {self.url}: {e}")
             raise
@@ -0,0 +1,221 @@
+# backend/app/services/page_fetcher.py
+"""
+gRPC 列表方法分页拉取
+
+同步时的两级流水线：
+1. 拉取：首页返回 total_pages 后，以有限并发预取后续页面
+2. 处理：调用方逐页转换并写库，同时后续页面仍在网络上传输
+
+预取窗口（同时在途或已完成但未被消费的页面数）等于并发数，
+消费方处理变慢时不会再发起新的请求，内存占用有上界。
+页面按页码顺序交付，保证同一记录在多页中出现时后出现的值生效。
+
+配置了服务端流式导出方法时，iter_stream_batches 以一次调用读取全部记录，
+按页大小分批交付，缓冲的批次数同样以并发数为上界。
+
+传入 FetchProgress 时记录是否确认拉取了源端的全部记录（删除检测的前提）：
+分页响应必须声明 total_pages 且全部页面都已收到，流式导出必须正常结束。
+"""
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass
+class FetchProgress:
+    """拉取进度"""
+
+    total_pages: Optional[int] = None  # 源端声明的总页数，未声明时为 None
+    received_pages: int = 0
+    # 确认已收到源端全部记录：收齐声明的全部页面，或流式导出正常结束
+    complete: bool = False
+
+
+class PageFetchError(Exception):
+    """拉取某一页失败"""
+
+    def __init__(self, page: int, error: Exception):
+        super().__init__(f"Failed to fetch page {page}: {error}")
+        self.page = page
+        self.error = error
+
+
+def resolve_paging(product: Any, mapping: Any = None) -> Tuple[int, int]:
+    """分页大小和并发数：EntityMapping 上的配置优先于 DataProduct"""
+    page_size = getattr(mapping, "sync_page_size", None) or getattr(
+        product, "sync_page_size", None
+    )
+    concurrency = getattr(mapping, "sync_concurrency", None) or getattr(
+        product, "sync_concurrency", None
+    )
+    return page_size or DEFAULT_PAGE_SIZE, max(1, concurrency or DEFAULT_CONCURRENCY)
+
+
+def extract_page(response: Any, total_pages: int) -> Tuple[List[Dict], int]:
+    """从列表方法响应中取出条目和总页数
+
+    直接返回列表的响应视为不分页（总页数为 0）。
+    """
+    items: List[Dict] = []
+    if isinstance(response, dict):
+        if "items" in response and isinstance(response["items"], list):
+            items = response["items"]
+        else:
+            for val in response.values():
+                if isinstance(val, list):
+                    items = val
+                    break
+
+        if "pagination" in response and isinstance(response["pagination"], dict):
+            total_pages = response["pagination"].get("total_pages", total_pages)
+
+    elif isinstance(response, list):
+        items = response
+        total_pages = 0
+
+    return items, total_pages
+
+
+async def iter_pages(
+    client: Any,
+    service_name: str,
+    method_name: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    request: Optional[Dict[str, Any]] = None,
+    item_fields: Optional[Iterable[str]] = None,
+    progress: Optional[FetchProgress] = None,
+) -> AsyncIterator[Tuple[int, List[Dict]]]:
+    """按页码顺序产出 (page, items)，遇到空页结束
+
+    应配合 contextlib.aclosing 使用，提前退出时会取消尚未完成的预取请求。
+    item_fields 不为空时，条目只包含这些字段（由客户端按字段投影转换响应）。
+
+    Raises:
+        PageFetchError: 某一页拉取失败
+    """
+
+    options = {"item_fields": item_fields} if item_fields is not None else {}
+
+    async def fetch(page: int) -> Any:
+        payload = dict(request or {})
+        payload["pagination"] = {"page": page, "page_size": page_size}
+        logger.info(f"Calling gRPC method {method_name} for page {page}...")
+        try:
+            return await client.call_method(
+                service_name, method_name, payload, **options
+            )
+        except Exception as e:
+            raise PageFetchError(page, e) from e
+
+    progress = progress if progress is not None else FetchProgress()
+
+    # 首页串行拉取，获得总页数（同时完成服务反射加载）
+    response = await fetch(1)
+    items, total_pages = extract_page(response, 1)
+    if isinstance(response, dict) and "total_pages" in (
+        response.get("pagination") or {}
+    ):
+        progress.total_pages = total_pages
+    if not items:
+        return
+    progress.received_pages = 1
+    progress.complete = progress.total_pages == 1
+    yield 1, items
+
+    pending: Deque[Tuple[int, asyncio.Task]] = deque()
+    next_page = 2
+
+    def fill() -> None:
+        nonlocal next_page
+        while next_page <= total_pages and len(pending) < concurrency:
+            pending.append((next_page, asyncio.create_task(fetch(next_page))))
+            next_page += 1
+
+    try:
+        fill()
+        while pending:
+            page, task = pending.popleft()
+            items, _ = extract_page(await task, total_pages)
+            if not items:
+                break
+            progress.received_pages = page
+            progress.complete = page == progress.total_pages
+            # 先补充预取窗口，再交给调用方处理
+            fill()
+            yield page, items
+    finally:
+        for _, task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+
+async def iter_stream_batches(
+    client: Any,
+    service_name: str,
+    method_name: str,
+    batch_size: int = DEFAULT_PAGE_SIZE,
+    buffer_batches: int = DEFAULT_CONCURRENCY,
+    request: Optional[Dict[str, Any]] = None,
+    item_fields: Optional[Iterable[str]] = None,
+    progress: Optional[FetchProgress] = None,
+) -> AsyncIterator[Tuple[int, List[Dict]]]:
+    """消费服务端流式方法，按 batch_size 分批产出 (batch, items)
+
+    后台任务读取流并分批放入容量为 buffer_batches 的队列；队列满时暂停读取，
+    由 gRPC 流控对服务端形成背压。
+    应配合 contextlib.aclosing 使用，提前退出时会取消流。
+
+    Raises:
+        PageFetchError: 流中断，page 为未能完整交付的批次号
+    """
+
+    options = {"item_fields": item_fields} if item_fields is not None else {}
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, buffer_batches))
+    done = object()
+
+    async def read_stream() -> None:
+        batch_no = 1
+        batch: List[Dict] = []
+        logger.info(f"Streaming gRPC method {method_name}...")
+        try:
+            async for item in client.stream_method(
+                service_name, method_name, dict(request or {}), **options
+            ):
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    await queue.put((batch_no, batch))
+                    batch_no += 1
+                    batch = []
+            if batch:
+                await queue.put((batch_no, batch))
+        except Exception as e:
+            await queue.put(PageFetchError(batch_no, e))
+            return
+        await queue.put(done)
+
+    reader = asyncio.create_task(read_stream())
+    try:
+        while True:
+            entry = await queue.get()
+            if entry is done:
+                if progress is not None:
+                    progress.complete = True
+                break
+            if isinstance(entry, PageFetchError):
+                raise entry
+            if progress is not None:
+                progress.received_pages = entry[0]
+            yield entry
+    finally:
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
@@ -3,12 +3,20 @@
 PostgreSQL 图导入器
 
 将 OWL/TTL 解析结果导入 PostgreSQL 图存储。
+支持一次性导入已解析的三元组列表，也支持按批次流式导入（import_stream）。
 """
 
+import asyncio
+import itertools
+import json
 import logging
-from typing import List, Set, Dict, Any
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import IO, Iterable, Iterator, List, Set, Dict, Any, Optional, Tuple
+from rdflib import Graph
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, text
 from app.models.graph import (
     GraphEntity,
     GraphRelationship,
@@ -16,9 +24,96 @@ from app.models.graph import (
     SchemaRelationship,
 )
 from app.services.owl_parser import OWLParser, Triple
+from app.services.rdf_stream import RDFTriple, TripleClassifier
 
 logger = logging.getLogger(__name__)
 
+# 批量导入使用的临时暂存表
+BULK_NODE_TABLE = "tmp_import_nodes"
+BULK_EDGE_TABLE = "tmp_import_edges"
+
+# 按名称批量查询 / 非 PostgreSQL 暂存写入的分块大小
+BULK_LOOKUP_CHUNK_SIZE = 1000
+
+# 流式导入时每批实例三元组的数量（按主体边界切分，实际批次可能略大）
+STREAM_BATCH_SIZE = 5000
+
+# 流式导入时每次在工作线程中解析的三元组数量
+STREAM_PARSE_CHUNK_SIZE = 5000
+
+# 流式导入时内存中最多保留的待合并属性片段 / 待重试关系数量，超出部分写入临时文件
+STREAM_PENDING_LIMIT = 50000
+
+
+def _merge_properties(base: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
+    """合并属性字典，别名列表追加而不是覆盖"""
+    merged = dict(base)
+    for key, value in extra.items():
+        if key == "__aliases__":
+            aliases = list(merged.get("__aliases__", []))
+            aliases.extend(a for a in value if a not in aliases)
+            merged["__aliases__"] = aliases
+        else:
+            merged[key] = value
+    return merged
+
+
+@dataclass
+class _StreamState:
+    """流式导入过程中跨批次保留的状态
+
+    待合并的属性片段和待重试的关系在内存中各自最多保留 STREAM_PENDING_LIMIT 条，
+    超出时先重试一次，仍无法处理的部分按 JSON 行写入临时文件，流结束后分块处理。
+    """
+
+    # 主体尚未导入的属性片段：{instance_name: {prop: value}}
+    pending_fragments: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # 端点尚未导入的关系，流结束后重试
+    deferred_relationships: List[Dict[str, str]] = field(default_factory=list)
+    fragment_spill: Optional[IO[str]] = None
+    relationship_spill: Optional[IO[str]] = None
+
+    def spill_fragments(self) -> None:
+        self.fragment_spill = _spill(
+            self.fragment_spill, self.pending_fragments.items()
+        )
+        self.pending_fragments.clear()
+
+    def spill_relationships(self) -> None:
+        self.relationship_spill = _spill(
+            self.relationship_spill, self.deferred_relationships
+        )
+        self.deferred_relationships.clear()
+
+    def close(self) -> None:
+        for spill in (self.fragment_spill, self.relationship_spill):
+            if spill is not None:
+                spill.close()
+        self.fragment_spill = self.relationship_spill = None
+
+
+def _spill(spill: Optional[IO[str]], records: Iterable[Any]) -> IO[str]:
+    """将记录以 JSON 行追加到临时文件（首次调用时创建）"""
+    if spill is None:
+        spill = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+    for record in records:
+        spill.write(json.dumps(record))
+        spill.write("\n")
+    return spill
+
+
+def _read_spill(spill: Optional[IO[str]], chunk_size: int) -> Iterator[List[Any]]:
+    """分块读回临时文件中的记录"""
+    if spill is None:
+        return
+    spill.seek(0)
+    records = (json.loads(line) for line in spill)
+    while True:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
 
 class PGGraphImporter:
     """将 OWL/TTL 解析结果导入 PostgreSQL"""
@@ -146,7 +241,10 @@ class PGGraphImporter:
         return stats
 
     async def import_instances(
-        self, schema_triples: List[Triple], instance_triples: List[Triple]
+        self,
+        schema_triples: List[Triple],
+        instance_triples: List[Triple],
+        bulk: Optional[bool] = None,
     ) -> Dict:
         """导入 Instance 层
 
@@ -157,15 +255,272 @@ class PGGraphImporter:
         Args:
             schema_triples: Schema 层的三元组（未使用）
             instance_triples: 实例层的三元组
+            bulk: 是否使用批量导入（暂存表 + 集合式 INSERT），
+                默认在 PostgreSQL 下启用
 
         Returns:
-            统计信息字典
+            统计信息字典（含 duration_seconds 和 rows_per_second）
         """
+        started = time.perf_counter()
         stats = {"nodes": 0, "relationships": 0, "properties": 0}
 
         # 清除缓存
         await self.clear_cache()
 
+        nodes, relationships = self._collect_instances(instance_triples)
+        stats["properties"] = sum(len(node["props"]) for node in nodes)
+
+        if bulk is None:
+            bulk = self._is_postgres
+
+        if bulk:
+            await self._import_instances_bulk(nodes, relationships, stats)
+        else:
+            await self._import_instances_orm(nodes, relationships, stats)
+
+        elapsed = time.perf_counter() - started
+        rows = len(nodes) + len(relationships)
+        stats["mode"] = "bulk" if bulk else "orm"
+        stats["duration_seconds"] = round(elapsed, 3)
+        stats["rows_per_second"] = round(rows / elapsed, 1) if elapsed > 0 else 0.0
+        logger.info(
+            f"Imported {stats['nodes']} nodes and {stats['relationships']} relationships "
+            f"({rows} rows staged) in {elapsed:.2f}s [{stats['mode']}, "
+            f"{stats['rows_per_second']} rows/s]"
+        )
+        return stats
+
+    # ==================== 流式导入 ====================
+
+    async def import_stream(
+        self,
+        triples: Iterable[RDFTriple],
+        batch_size: int = STREAM_BATCH_SIZE,
+        bulk: Optional[bool] = None,
+    ) -> Dict:
+        """流式导入（Schema + Instance）
+
+        单遍读取三元组：Schema 三元组收集到一个小 Graph 中，
+        实例三元组按固定大小分批导入，内存占用与文件大小无关。
+
+        - 首个实例批次导入前先导入已收集的 Schema，结束时如有新增 Schema 再补充导入
+        - 批次只在主体切换处截断，同一主体连续出现的三元组落在同一批次
+        - 主体尚未出现类型声明的属性片段在其类型声明导入后合并
+        - 端点尚未导入的关系在流结束后重试一次
+        - 名称 -> ID 缓存只在单个批次内有效；待处理的片段和关系超出
+          STREAM_PENDING_LIMIT 时写入临时文件
+        - rdflib 解析在工作线程中分块进行，不阻塞事件循环
+
+        Args:
+            triples: (s, p, o) rdflib 三元组迭代器，见 app.services.rdf_stream
+            batch_size: 每批实例三元组数量
+            bulk: 是否使用批量导入，默认在 PostgreSQL 下启用
+
+        Returns:
+            {"schema": Schema 统计, "instances": 实例统计}
+        """
+        started = time.perf_counter()
+        if bulk is None:
+            bulk = self._is_postgres
+
+        await self.clear_cache()
+
+        classifier = TripleClassifier()
+        schema_graph = Graph()
+        schema_stats: Dict = {"classes": 0, "properties": 0}
+        imported_schema_size: Optional[int] = None
+        stats = {
+            "nodes": 0,
+            "relationships": 0,
+            "properties": 0,
+            "triples": 0,
+            "schema_triples": 0,
+            "batches": 0,
+        }
+        state = _StreamState()
+        batch: List[Triple] = []
+        iterator = iter(triples)
+
+        try:
+            while True:
+                # 解析（rdflib）是 CPU 密集的同步代码，分块放到工作线程中执行
+                chunk = await asyncio.to_thread(
+                    list, itertools.islice(iterator, STREAM_PARSE_CHUNK_SIZE)
+                )
+                if not chunk:
+                    break
+                for s, p, o in chunk:
+                    stats["triples"] += 1
+                    if classifier.is_schema(s, p, o):
+                        schema_graph.add((s, p, o))
+                        stats["schema_triples"] += 1
+                        continue
+
+                    subject = str(s)
+                    if len(batch) >= batch_size and batch[-1].subject != subject:
+                        if imported_schema_size is None:
+                            schema_stats = await self.import_schema(
+                                OWLParser(schema_graph)
+                            )
+                            imported_schema_size = len(schema_graph)
+                        await self._import_stream_batch(batch, bulk, stats, state)
+                        batch = []
+                    batch.append(Triple(subject, str(p), str(o)))
+
+            if imported_schema_size != len(schema_graph):
+                schema_stats = await self.import_schema(OWLParser(schema_graph))
+            if batch:
+                await self._import_stream_batch(batch, bulk, stats, state)
+            await self._finish_stream(bulk, stats, state, batch_size)
+        finally:
+            state.close()
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await asyncio.to_thread(close)
+
+        elapsed = time.perf_counter() - started
+        stats["mode"] = "stream"
+        stats["duration_seconds"] = round(elapsed, 3)
+        stats["triples_per_second"] = (
+            round(stats["triples"] / elapsed, 1) if elapsed > 0 else 0.0
+        )
+        logger.info(
+            f"Stream-imported {stats['triples']} triples in {stats['batches']} batches: "
+            f"{stats['nodes']} nodes, {stats['relationships']} relationships "
+            f"in {elapsed:.2f}s [{stats['triples_per_second']} triples/s]"
+        )
+        return {"schema": schema_stats, "instances": stats}
+
+    async def _import_stream_batch(
+        self, batch: List[Triple], bulk: bool, stats: Dict, state: _StreamState
+    ) -> None:
+        """导入一个实例批次"""
+        type_map, node_properties, relationships = self._group_instance_triples(batch)
+        nodes = self._build_nodes(type_map, node_properties)
+        typed = {node["name"] for node in nodes}
+        stats["properties"] += sum(len(props) for props in node_properties.values())
+        stats["batches"] += 1
+
+        if bulk:
+            await self._import_instances_bulk(nodes, relationships, stats)
+        else:
+            await self._import_instances_orm(nodes, relationships, stats)
+        state.deferred_relationships.extend(self._unresolved(relationships))
+        # 缓存只服务于当前批次，后续批次的端点按名称从数据库解析
+        self._entity_cache.clear()
+
+        fragments = {
+            name: props for name, props in node_properties.items() if name not in typed
+        }
+        merged = await self._merge_property_fragments(fragments)
+        for name, props in fragments.items():
+            if name not in merged:
+                state.pending_fragments[name] = _merge_properties(
+                    state.pending_fragments.get(name, {}), props
+                )
+
+        if len(state.pending_fragments) > STREAM_PENDING_LIMIT:
+            merged = await self._merge_property_fragments(state.pending_fragments)
+            for name in merged:
+                del state.pending_fragments[name]
+            state.spill_fragments()
+        if len(state.deferred_relationships) > STREAM_PENDING_LIMIT:
+            retry = state.deferred_relationships
+            state.deferred_relationships = await self._import_relationships(
+                retry, bulk, stats
+            )
+            state.spill_relationships()
+
+    async def _finish_stream(
+        self, bulk: bool, stats: Dict, state: _StreamState, chunk_size: int
+    ) -> None:
+        """合并剩余属性片段并重试端点缺失的关系
+
+        先处理写入临时文件的（较早的）记录，再处理内存中的记录。
+        """
+        for chunk in _read_spill(state.fragment_spill, chunk_size):
+            fragments: Dict[str, Dict[str, Any]] = {}
+            for name, props in chunk:
+                fragments[name] = _merge_properties(fragments.get(name, {}), props)
+            await self._merge_property_fragments(fragments)
+        await self._merge_property_fragments(state.pending_fragments)
+        state.pending_fragments.clear()
+
+        for chunk in _read_spill(state.relationship_spill, chunk_size):
+            await self._import_relationships(chunk, bulk, stats)
+        if state.deferred_relationships:
+            await self._import_relationships(state.deferred_relationships, bulk, stats)
+            state.deferred_relationships.clear()
+
+    async def _import_relationships(
+        self, relationships: List[Dict[str, str]], bulk: bool, stats: Dict
+    ) -> List[Dict[str, str]]:
+        """导入端点已存在的关系，返回端点仍缺失的关系"""
+        if bulk:
+            await self._import_instances_bulk([], relationships, stats)
+        else:
+            await self._import_instances_orm([], relationships, stats)
+        unresolved = self._unresolved(relationships)
+        self._entity_cache.clear()
+        return unresolved
+
+    def _unresolved(self, relationships: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """端点未能解析为实体 ID 的关系"""
+        return [
+            rel
+            for rel in relationships
+            if self._local_name(rel["subject"]) not in self._entity_cache
+            or self._local_name(rel["object"]) not in self._entity_cache
+        ]
+
+    async def _merge_property_fragments(
+        self, fragments: Dict[str, Dict[str, Any]]
+    ) -> Set[str]:
+        """将属性片段合并到已导入的实例中
+
+        Returns:
+            已合并的实例名称（其余名称尚无对应实例）
+        """
+        merged: Set[str] = set()
+        if not fragments:
+            return merged
+        names = list(fragments)
+        for i in range(0, len(names), BULK_LOOKUP_CHUNK_SIZE):
+            result = await self.db.execute(
+                select(GraphEntity).where(
+                    GraphEntity.is_instance == True,
+                    GraphEntity._display_name.in_(
+                        names[i : i + BULK_LOOKUP_CHUNK_SIZE]
+                    ),
+                )
+            )
+            for entity in result.scalars().all():
+                entity.properties = _merge_properties(
+                    entity.properties or {}, fragments[entity._display_name]
+                )
+                merged.add(entity._display_name)
+        await self.db.commit()
+        return merged
+
+    def _collect_instances(
+        self, instance_triples: List[Triple]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+        """将实例三元组整理为节点列表和关系列表
+
+        Returns:
+            (nodes, relationships)
+            nodes: [{name, entity_type, props, uri}]
+            relationships: [{subject, predicate, object}]
+        """
+        type_map, node_properties, relationships = self._group_instance_triples(
+            instance_triples
+        )
+        return self._build_nodes(type_map, node_properties), relationships
+
+    def _group_instance_triples(
+        self, instance_triples: List[Triple]
+    ) -> Tuple[Dict[str, str], Dict[str, Dict[str, Any]], List[Dict[str, str]]]:
+        """按谓词将实例三元组分组为类型声明、节点属性和关系"""
         # 收集数据
         type_map: Dict[str, str] = {}  # {instance_uri: class_name}
         node_properties: Dict[str, Dict[str, Any]] = (
@@ -227,53 +582,66 @@ class PGGraphImporter:
                     prop_name = pred.split("#")[-1].split("/")[-1]
                     node_properties[subject_name][prop_name] = triple.obj
 
-        # 按类分组创建节点
-        nodes_by_class: Dict[str, List[Dict]] = {}
+        return type_map, node_properties, relationships
+
+    @staticmethod
+    def _build_nodes(
+        type_map: Dict[str, str], node_properties: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        nodes = []
         for subject_uri, class_name in type_map.items():
             node_name = subject_uri.split("#")[-1].split("/")[-1]
-            props = node_properties.get(node_name, {})
-
-            if class_name not in nodes_by_class:
-                nodes_by_class[class_name] = []
-            nodes_by_class[class_name].append(
-                {"name": node_name, "props": props, "uri": subject_uri}
+            nodes.append(
+                {
+                    "name": node_name,
+                    "entity_type": class_name,
+                    "props": node_properties.get(node_name, {}),
+                    "uri": subject_uri,
+                }
             )
-            stats["properties"] += len(props)
+        return nodes
 
-        # 批量创建节点
-        for class_name, nodes in nodes_by_class.items():
-            for node in nodes:
-                # 检查是否已存在
-                existing = await self.db.execute(
-                    select(GraphEntity).where(
-                        GraphEntity._display_name == node["name"],
-                        GraphEntity.entity_type == class_name,
-                    )
+    @staticmethod
+    def _local_name(uri: str) -> str:
+        return uri.split("#")[-1].split("/")[-1]
+
+    # ==================== ORM 逐行导入 ====================
+
+    async def _import_instances_orm(
+        self,
+        nodes: List[Dict[str, Any]],
+        relationships: List[Dict[str, str]],
+        stats: Dict,
+    ) -> None:
+        """逐行检查并通过 ORM 写入（适用于小数据量和非 PostgreSQL 数据库）"""
+        for node in nodes:
+            # 检查是否已存在
+            existing = await self.db.execute(
+                select(GraphEntity).where(
+                    GraphEntity._display_name == node["name"],
+                    GraphEntity.entity_type == node["entity_type"],
                 )
-                if not existing.scalar_one_or_none():
-                    new_entity = GraphEntity(
-                        _display_name=node["name"],
-                        entity_type=class_name,
-                        is_instance=True,
-                        properties=node["props"],
-                        uri=node.get("uri"),
-                    )
-                    self.db.add(new_entity)
-                    stats["nodes"] += 1
+            )
+            if not existing.scalar_one_or_none():
+                new_entity = GraphEntity(
+                    _display_name=node["name"],
+                    entity_type=node["entity_type"],
+                    is_instance=True,
+                    properties=node["props"],
+                    uri=node.get("uri"),
+                )
+                self.db.add(new_entity)
+                stats["nodes"] += 1
 
         await self.db.commit()
 
-        # 重建缓存用于关系创建
-        await self._build_entity_cache()
+        # 按名称解析关系端点（本批新建节点及图中已有实体）
+        await self._cache_entity_ids(relationships)
 
-        # 批量创建关系
         for rel in relationships:
-            rel_name = rel["predicate"].split("#")[-1].split("/")[-1]
-            source_name = rel["subject"].split("#")[-1].split("/")[-1]
-            target_name = rel["object"].split("#")[-1].split("/")[-1]
-
-            source_id = self._entity_cache.get(source_name)
-            target_id = self._entity_cache.get(target_name)
+            rel_name = self._local_name(rel["predicate"])
+            source_id = self._entity_cache.get(self._local_name(rel["subject"]))
+            target_id = self._entity_cache.get(self._local_name(rel["object"]))
 
             if source_id and target_id:
                 # 检查关系是否已存在
@@ -294,17 +662,192 @@ class PGGraphImporter:
                     stats["relationships"] += 1
 
         await self.db.commit()
-        return stats
 
-    async def _build_entity_cache(self):
-        """构建实体名称到 ID 的缓存"""
+    # ==================== 批量导入 ====================
+
+    @property
+    def _is_postgres(self) -> bool:
+        bind = self.db.bind
+        return bind is not None and getattr(bind.dialect, "name", None) == "postgresql"
+
+    async def _import_instances_bulk(
+        self,
+        nodes: List[Dict[str, Any]],
+        relationships: List[Dict[str, str]],
+        stats: Dict,
+    ) -> None:
+        """批量导入
+
+        1. 节点写入暂存表（PostgreSQL 下使用 COPY）
+        2. 一条 INSERT ... SELECT 反连接插入不存在的节点，RETURNING 得到新节点 ID
+        3. 暂存节点中已存在的部分通过一次连接查询补全 名称 -> ID 映射
+        4. 关系解析为 ID 后写入暂存表，INSERT ... ON CONFLICT DO NOTHING 去重
+        """
+        # (名称, 类型) 去重，保留首次出现的节点
+        unique_nodes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for node in nodes:
+            unique_nodes.setdefault((node["name"], node["entity_type"]), node)
+
+        # 暂存表在同一事务中创建，出错回滚时一并撤销
+        await self._create_staging_tables()
+        await self._stage_records(
+            BULK_NODE_TABLE,
+            ["name", "entity_type", "properties", "uri"],
+            [
+                (name, entity_type, json.dumps(node["props"]), node.get("uri"))
+                for (name, entity_type), node in unique_nodes.items()
+            ],
+        )
+
         result = await self.db.execute(
-            select(GraphEntity.id, GraphEntity._display_name).where(
-                GraphEntity.is_instance == True
+            text(
+                f"""
+            INSERT INTO graph_entities
+                (_display_name, entity_type, is_instance, properties, uri)
+            SELECT s.name, s.entity_type, true, s.properties, s.uri
+            FROM {BULK_NODE_TABLE} s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM graph_entities e
+                WHERE e._display_name = s.name AND e.entity_type = s.entity_type
+            )
+            RETURNING id, _display_name
+            """
             )
         )
-        for row in result.all():
-            self._entity_cache[row[1]] = row[0]
+        inserted = result.all()
+        stats["nodes"] += len(inserted)
+        for entity_id, name in inserted:
+            self._entity_cache[name] = entity_id
+
+        # 已存在的暂存节点
+        if len(inserted) < len(unique_nodes):
+            result = await self.db.execute(
+                text(
+                    f"""
+                SELECT e.id, e._display_name
+                FROM graph_entities e
+                JOIN {BULK_NODE_TABLE} s
+                  ON e._display_name = s.name AND e.entity_type = s.entity_type
+                """
+                )
+            )
+            for entity_id, name in result.all():
+                self._entity_cache.setdefault(name, entity_id)
+
+        edges = await self._resolve_relationships(relationships)
+        if edges:
+            await self._stage_records(
+                BULK_EDGE_TABLE,
+                ["source_id", "target_id", "relationship_type", "properties"],
+                [(s, t, r, "{}") for s, t, r in edges],
+            )
+            result = await self.db.execute(
+                text(
+                    f"""
+                INSERT INTO graph_relationships
+                    (source_id, target_id, relationship_type, properties)
+                SELECT source_id, target_id, relationship_type, properties
+                FROM {BULK_EDGE_TABLE}
+                WHERE true
+                ON CONFLICT (source_id, target_id, relationship_type) DO NOTHING
+                RETURNING id
+                """
+                )
+            )
+            stats["relationships"] += len(result.all())
+
+        await self._drop_staging_tables()
+
+        await self.db.commit()
+
+    async def _resolve_relationships(
+        self, relationships: List[Dict[str, str]]
+    ) -> List[Tuple[int, int, str]]:
+        """将关系端点名称解析为实体 ID（去重）
+
+        端点优先从本次导入的 名称 -> ID 映射中解析，
+        其余（引用图中已有实体）一次性批量查询。
+        """
+        await self._cache_entity_ids(relationships)
+
+        edges: Dict[Tuple[int, int, str], None] = {}
+        for rel in relationships:
+            source_id = self._entity_cache.get(self._local_name(rel["subject"]))
+            target_id = self._entity_cache.get(self._local_name(rel["object"]))
+            if source_id and target_id:
+                edges[(source_id, target_id, self._local_name(rel["predicate"]))] = None
+        return list(edges)
+
+    async def _cache_entity_ids(self, relationships: List[Dict[str, str]]) -> None:
+        """按名称批量查询缓存中缺失的关系端点 ID"""
+        missing = set()
+        for rel in relationships:
+            for uri in (rel["subject"], rel["object"]):
+                name = self._local_name(uri)
+                if name not in self._entity_cache:
+                    missing.add(name)
+
+        missing_names = list(missing)
+        for i in range(0, len(missing_names), BULK_LOOKUP_CHUNK_SIZE):
+            result = await self.db.execute(
+                select(GraphEntity.id, GraphEntity._display_name).where(
+                    GraphEntity.is_instance == True,
+                    GraphEntity._display_name.in_(
+                        missing_names[i : i + BULK_LOOKUP_CHUNK_SIZE]
+                    ),
+                )
+            )
+            for entity_id, name in result.all():
+                self._entity_cache.setdefault(name, entity_id)
+
+    async def _create_staging_tables(self) -> None:
+        await self._drop_staging_tables()
+        json_type = "jsonb" if self._is_postgres else "text"
+        await self.db.execute(
+            text(
+                f"CREATE TEMP TABLE {BULK_NODE_TABLE} "
+                f"(name text, entity_type text, properties {json_type}, uri text)"
+            )
+        )
+        await self.db.execute(
+            text(
+                f"CREATE TEMP TABLE {BULK_EDGE_TABLE} "
+                f"(source_id integer, target_id integer, "
+                f"relationship_type text, properties {json_type})"
+            )
+        )
+
+    async def _drop_staging_tables(self) -> None:
+        await self.db.execute(text(f"DROP TABLE IF EXISTS {BULK_NODE_TABLE}"))
+        await self.db.execute(text(f"DROP TABLE IF EXISTS {BULK_EDGE_TABLE}"))
+
+    async def _stage_records(
+        self, table: str, columns: List[str], records: List[Tuple]
+    ) -> None:
+        """写入暂存表：PostgreSQL 下使用 asyncpg COPY，其他数据库使用 executemany"""
+        if not records:
+            return
+
+        if self._is_postgres:
+            conn = await self.db.connection()
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                table, records=records, columns=columns
+            )
+            return
+
+        placeholders = ", ".join(f":{c}" for c in columns)
+        statement = text(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        )
+        for i in range(0, len(records), BULK_LOOKUP_CHUNK_SIZE):
+            await self.db.execute(
+                statement,
+                [
+                    dict(zip(columns, record))
+                    for record in records[i : i + BULK_LOOKUP_CHUNK_SIZE]
+                ],
+            )
 
     async def import_all(
         self,
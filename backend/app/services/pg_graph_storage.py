@@ -16,12 +16,10 @@ from typing import List, Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import (
     select,
-    update,
     delete,
     func,
     and_,
     or_,
-    text,
     insert,
     literal_column,
     case,
@@ -33,6 +31,23 @@ from app.models.graph import (
     SchemaClass,
     SchemaRelationship,
 )
+from app.services.graph_traversal import (
+    DEFAULT_MAX_NODES,
+    DEFAULT_MAX_PER_LEVEL,
+    DEFAULT_MAX_VISITED,
+    FRONTIER_CHUNK_SIZE,
+    GraphTraversal,
+    TraversalStats,
+)
+from app.rule_engine.persistence import ConcurrentUpdateError, PersistenceService
+from app.services.instance_search import InstanceSearch
+from app.services.property_index import (
+    property_equals,
+    property_text,
+    record_property_filter,
+    schedule_index_sync,
+    try_numeric,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +68,11 @@ def _validate_property_filter_keys(property_filter: Dict[str, Any]) -> None:
 
 
 def _apply_property_filters(query, entity_alias, filters: Dict[str, Any]):
-    """Apply dictionary filters to a SQLAlchemy query using JSONB operations."""
-    from sqlalchemy import cast, Numeric
+    """Apply dictionary filters to a SQLAlchemy query using JSONB operations.
 
+    等值和 $in 过滤使用 property_equals（GIN 包含查询），
+    范围过滤使用 try_numeric 以命中数值属性表达式索引。
+    """
     for k, v in filters.items():
         if k == "_name" or k == "name":
             # Search by display name
@@ -64,27 +81,31 @@ def _apply_property_filters(query, entity_alias, filters: Dict[str, Any]):
             # Handle operator filters like {"OSAT": {"$gt": "8"}}
             if isinstance(v, dict):
                 for op, val in v.items():
-                    # Cast the property to text for comparisons
-                    prop_text = entity_alias.properties[k].astext
-
-                    if op == "$gt":
-                        query = query.where(cast(prop_text, Numeric) > float(val))
-                    elif op == "$gte":
-                        query = query.where(cast(prop_text, Numeric) >= float(val))
-                    elif op == "$lt":
-                        query = query.where(cast(prop_text, Numeric) < float(val))
-                    elif op == "$lte":
-                        query = query.where(cast(prop_text, Numeric) <= float(val))
+                    prop_text = property_text(entity_alias.properties, k)
+
+                    if op in ("$gt", "$gte", "$lt", "$lte"):
+                        record_property_filter(k, "numeric")
+                        prop_num = try_numeric(prop_text)
+                        if op == "$gt":
+                            query = query.where(prop_num > float(val))
+                        elif op == "$gte":
+                            query = query.where(prop_num >= float(val))
+                        elif op == "$lt":
+                            query = query.where(prop_num < float(val))
+                        else:
+                            query = query.where(prop_num <= float(val))
                     elif op == "$ne":
                         query = query.where(prop_text != str(val))
                     elif op == "$like":
                         query = query.where(prop_text.ilike(str(val)))
                     elif op == "$in":
                         if isinstance(val, list):
-                            query = query.where(prop_text.in_([str(i) for i in val]))
+                            query = query.where(
+                                property_equals(entity_alias.properties, k, val)
+                            )
             else:
                 # Exact match by default for JSONB properties
-                query = query.where(entity_alias.properties[k].astext == str(v))
+                query = query.where(property_equals(entity_alias.properties, k, [v]))
     return query
 
 
@@ -98,6 +119,15 @@ class PGGraphStorage:
         self.db = db
         self.event_emitter = event_emitter
 
+    # ==================== Property Indexes ====================
+
+    async def _sync_property_indexes(self) -> None:
+        """本体数据属性变化后在后台同步属性索引，不阻塞请求，失败不影响主流程"""
+        try:
+            schedule_index_sync(self.db)
+        except Exception as e:
+            logger.warning(f"Failed to schedule property index sync: {e}")
+
     # ==================== Event Emission ====================
 
     async def _emit_update_event(
@@ -132,6 +162,8 @@ class PGGraphStorage:
             f"Emitting UpdateEvent: {entity_type}.{property} on {entity_id} ({old_value} -> {new_value}) by {actor_name}({actor_type})"
         )
         self.event_emitter.emit(event)
+        # 规则队列已满时等待，批量更新按规则执行的速度推进
+        await self.event_emitter.wait_for_capacity()
 
     async def _emit_graph_view_event(
         self, nodes: List[Dict], edges: List[Dict]
@@ -199,8 +231,17 @@ class PGGraphStorage:
         updates: Dict[str, Any],
         actor_name: str | None = None,
         actor_type: str | None = None,
+        expected_updated_at: Any = None,
     ) -> Dict[str, Any]:
-        """更新实体属性并触发事件"""
+        """更新实体属性并触发事件
+
+        所有属性变更由一条 ``properties || :patch`` UPDATE 写入，旧值通过 RETURNING 返回，
+        不再读取后整体覆盖 properties，同一实体的并发更新不会互相丢失。
+
+        Args:
+            expected_updated_at: 可选的比较并交换条件，实体 updated_at 不等于该值时
+                不更新并抛出 ConcurrentUpdateError
+        """
         # STRICT ID POLICY: Only allow updates by numeric ID
         # exception: if we really want to update by name... but user said strict ID.
 
@@ -210,59 +251,52 @@ class PGGraphStorage:
             )
             return {}
 
-        query = select(GraphEntity).where(
-            GraphEntity.id == int(entity_id), GraphEntity.entity_type == entity_type
+        # "name" 对应 _display_name 列，避免与实体自身的 name 属性冲突
+        updates = dict(updates)
+        new_display_name = updates.pop("name", None)
+
+        patched = await PersistenceService.patch_properties(
+            self.db,
+            entity_type,
+            entity_id,
+            updates,
+            expected_updated_at=expected_updated_at,
+            display_name=new_display_name,
+            return_properties=True,
         )
-
-        result = await self.db.execute(query)
-        entity = result.scalar_one_or_none()
-
-        if not entity:
-            return {}
-
-        old_values = (entity.properties or {}).copy()
-
-        # Handle special case: if updating "name", actually update _display_name column
-        if "name" in updates:
-            # We don't want "name" in properties if it corresponds to the column
-            # BUT, the user might want to store "name" property as well?
-            # User said: "prevent some class have own name property conflict"
-            # So GraphEntity.name is now _display_name.
-            # If user passes "name" in updates, we should probably update _display_name
-            # AND ALSO store it in properties if they want?
-            # Let's assume "name" in updates means setting the display name.
-            new_display_name = updates.pop("name")
-            # Update the column
-            await self.db.execute(
-                update(GraphEntity)
-                .where(GraphEntity.id == int(entity_id))
-                .values(_display_name=new_display_name)
-            )
-            # Re-fetch or manually update entity object for event emission?
-            # Let's just emit event for "name"
-            if entity._display_name != new_display_name:
-                await self._emit_update_event(
-                    entity_type,
-                    entity_id,
-                    "name",  # still call it name for events? or _display_name? Let's stick to name for compat
-                    entity._display_name,
-                    new_display_name,
-                    actor_name=actor_name,
-                    actor_type=actor_type,
+        if patched is None:
+            if expected_updated_at is not None:
+                exists = await self.db.scalar(
+                    select(GraphEntity.id).where(
+                        GraphEntity.id == int(entity_id),
+                        GraphEntity.entity_type == entity_type,
+                    )
                 )
-
-        # 合并更新
-        new_properties = {**old_values, **updates}
-
-        # Prepare update query for properties
-        update_stmt = update(GraphEntity).where(GraphEntity.id == int(entity_id))
-        await self.db.execute(update_stmt.values(properties=new_properties))
+                if exists is not None:
+                    raise ConcurrentUpdateError(
+                        f"{entity_type} {entity_id} was modified concurrently"
+                    )
+            return {}
 
         await self.db.commit()
 
-        # 触发事件
+        # 触发事件（旧值来自 RETURNING）
+        if (
+            new_display_name is not None
+            and patched.old_display_name != new_display_name
+        ):
+            await self._emit_update_event(
+                entity_type,
+                entity_id,
+                "name",  # still call it name for events? or _display_name? Let's stick to name for compat
+                patched.old_display_name,
+                new_display_name,
+                actor_name=actor_name,
+                actor_type=actor_type,
+            )
+
         for key, new_val in updates.items():
-            old_val = old_values.get(key)
+            old_val = patched.old_values.get(key)
             if old_val != new_val:
                 await self._emit_update_event(
                     entity_type,
@@ -274,7 +308,7 @@ class PGGraphStorage:
                     actor_type=actor_type,
                 )
 
-        return {**new_properties}
+        return {**patched.properties}
 
     # ==================== Schema 查询 ====================
 
@@ -510,6 +544,7 @@ class PGGraphStorage:
         )
         self.db.add(new_class)
         await self.db.commit()
+        await self._sync_property_indexes()
         return {
             "name": name,
             "label": label,
@@ -544,6 +579,8 @@ class PGGraphStorage:
             cls.color = color
 
         await self.db.commit()
+        if data_properties is not None:
+            await self._sync_property_indexes()
         return {
             "name": name,
             "label": cls.label,
@@ -572,6 +609,7 @@ class PGGraphStorage:
 
         await self.db.delete(cls)
         await self.db.commit()
+        await self._sync_property_indexes()
         return {"message": f"Class '{name}' and its relationships deleted"}
 
     async def add_ontology_relationship(
@@ -648,38 +686,17 @@ class PGGraphStorage:
         limit: int = 10,
         accessible_entity_types: Optional[List[str]] = None,
     ) -> List[Dict]:
-        """根据名称，ID或别名搜索实例节点"""
-        from sqlalchemy import cast, String
+        """根据名称，ID或别名搜索实例节点
 
-        # Escape SQL LIKE wildcards in user input
-        escaped_term = (
-            keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        )
-
-        # 搜索名称、ID 或别名
-        query = select(GraphEntity).where(
-            or_(
-                GraphEntity._display_name.ilike(f"%{escaped_term}%"),
-                # Match database id as string
-                cast(GraphEntity.id, String).ilike(f"%{escaped_term}%"),
-                # PostgreSQL JSONB 搜索
-                text(
-                    "id IN (SELECT id FROM graph_entities, jsonb_array_elements_text(properties->'__aliases__') as a WHERE a ILIKE :term)"
-                ),
-            ),
-            GraphEntity.is_instance == True,
+        使用 trigram 索引匹配名称和别名并按相似度排序，纯数字关键字优先按主键查找。
+        """
+        entities = await InstanceSearch(self.db).search(
+            keyword,
+            entity_type=entity_type,
+            limit=limit,
+            accessible_entity_types=accessible_entity_types,
         )
 
-        if entity_type:
-            query = query.where(GraphEntity.entity_type == entity_type)
-
-        if accessible_entity_types is not None and accessible_entity_types:
-            query = query.where(GraphEntity.entity_type.in_(accessible_entity_types))
-
-        query = query.limit(limit)
-        result = await self.db.execute(query, {"term": f"%{keyword}%"})
-        entities = result.scalars().all()
-
         results = [
             {
                 "id": e.id,
@@ -723,32 +740,70 @@ class PGGraphStorage:
         entity_type: Optional[str] = None,
         property_filter: Optional[Dict[str, Any]] = None,
         accessible_entity_types: Optional[List[str]] = None,
+        relationship_types: Optional[List[str]] = None,
+        max_per_level: int = DEFAULT_MAX_PER_LEVEL,
+        max_nodes: int = DEFAULT_MAX_NODES,
     ) -> List[Dict]:
         """查询实例节点的邻居
 
-        使用递归 CTE 实现多跳邻居查询。
+        参数同 get_instance_neighborhood，只返回邻居列表；
+        需要知道结果是否被截断时使用 get_instance_neighborhood。
         """
-        if direction == "outgoing":
-            direction_filter = "direction = 1"  # 仅出边
-        elif direction == "incoming":
-            direction_filter = "direction = -1"  # 仅入边
-        else:
-            direction_filter = "direction IN (1, -1)"  # 双向
+        neighborhood = await self.get_instance_neighborhood(
+            entity_id=entity_id,
+            entity_name=entity_name,
+            hops=hops,
+            direction=direction,
+            entity_type=entity_type,
+            property_filter=property_filter,
+            accessible_entity_types=accessible_entity_types,
+            relationship_types=relationship_types,
+            max_per_level=max_per_level,
+            max_nodes=max_nodes,
+        )
+        return neighborhood["neighbors"]
+
+    async def get_instance_neighborhood(
+        self,
+        entity_id: Optional[int] = None,
+        entity_name: Optional[str] = None,
+        hops: int = 1,
+        direction: str = "both",
+        entity_type: Optional[str] = None,
+        property_filter: Optional[Dict[str, Any]] = None,
+        accessible_entity_types: Optional[List[str]] = None,
+        relationship_types: Optional[List[str]] = None,
+        max_per_level: int = DEFAULT_MAX_PER_LEVEL,
+        max_nodes: int = DEFAULT_MAX_NODES,
+    ) -> Dict[str, Any]:
+        """查询实例节点的邻居及结果是否被截断
 
+        多跳查询按层扩展，方向和关系类型过滤作用于每一跳。
+
+        Args:
+            relationship_types: 可选，仅沿这些关系类型扩展
+            max_per_level: 多跳查询每层最多纳入的新节点数
+            max_nodes: 多跳查询最多访问的节点数
+
+        Returns:
+            {"neighbors": 邻居列表, "truncated": 是否有上限生效}；
+            即使过滤后没有邻居，truncated 也会反映遍历是否被截断
+        """
         if property_filter:
             _validate_property_filter_keys(property_filter)
 
         if hops <= 1:
-            return await self._get_1hop_neighbors(
+            neighbors = await self._get_1hop_neighbors(
                 direction,
                 entity_type,
                 property_filter,
                 entity_id,
                 entity_name,
                 accessible_entity_types,
+                relationship_types,
             )
+            return {"neighbors": neighbors, "truncated": False}
         else:
-            # 对于多跳查询，使用构建的方式
             return await self._get_multi_hop_neighbors(
                 hops,
                 direction,
@@ -757,6 +812,9 @@ class PGGraphStorage:
                 entity_id,
                 entity_name,
                 accessible_entity_types,
+                relationship_types,
+                max_per_level,
+                max_nodes,
             )
 
     async def _get_1hop_neighbors(
@@ -767,6 +825,7 @@ class PGGraphStorage:
         entity_id: Optional[int] = None,
         entity_name: Optional[str] = None,
         accessible_entity_types: Optional[List[str]] = None,
+        relationship_types: Optional[List[str]] = None,
     ) -> List[Dict]:
         """获取 1 跳邻居（简化实现）"""
         # 先获取起始节点
@@ -819,7 +878,7 @@ class PGGraphStorage:
             if property_filter:
                 for key, value in property_filter.items():
                     query = query.where(
-                        GraphEntity.properties[key].astext == str(value)
+                        property_equals(GraphEntity.properties, key, [value])
                     )
 
             if accessible_entity_types is not None and accessible_entity_types:
@@ -840,7 +899,7 @@ class PGGraphStorage:
             if property_filter:
                 for key, value in property_filter.items():
                     query = query.where(
-                        GraphEntity.properties[key].astext == str(value)
+                        property_equals(GraphEntity.properties, key, [value])
                     )
 
             if accessible_entity_types is not None and accessible_entity_types:
@@ -857,6 +916,11 @@ class PGGraphStorage:
                 )
             )
 
+        if relationship_types:
+            query = query.where(
+                GraphRelationship.relationship_type.in_(relationship_types)
+            )
+
         rel_result = await self.db.execute(query)
         neighbors = []
         if direction in ["outgoing", "incoming"]:
@@ -908,7 +972,7 @@ class PGGraphStorage:
             if property_filter:
                 for key, value in property_filter.items():
                     query = query.where(
-                        GraphEntity.properties[key].astext == str(value)
+                        property_equals(GraphEntity.properties, key, [value])
                     )
 
             if accessible_entity_types is not None and accessible_entity_types:
@@ -1004,8 +1068,15 @@ class PGGraphStorage:
         entity_id: Optional[int] = None,
         entity_name: Optional[str] = None,
         accessible_entity_types: Optional[List[str]] = None,
-    ) -> List[Dict]:
-        """获取多跳邻居（使用 SQL 原生查询）"""
+        relationship_types: Optional[List[str]] = None,
+        max_per_level: int = DEFAULT_MAX_PER_LEVEL,
+        max_nodes: int = DEFAULT_MAX_NODES,
+    ) -> Dict[str, Any]:
+        """获取多跳邻居（按层同步扩展）
+
+        每层只发起一次邻接查询，已访问节点不会被重复扩展。
+        每层纳入的新节点数和总节点数有上限，上限生效时返回的 truncated 为 True。
+        """
         if entity_name and entity_name.isdigit():
             # Try by ID first
             result = await self.db.execute(
@@ -1045,157 +1116,96 @@ class PGGraphStorage:
             start_entity = result.scalars().first()
 
         if not start_entity:
-            return []
+            return {"neighbors": [], "truncated": False}
 
         start_id = start_entity.id
 
-        # 构建方向过滤条件
-        if direction == "outgoing":
-            direction_clause = "r.source_id = ns.id"
-        elif direction == "incoming":
-            direction_clause = "r.target_id = ns.id"
-        else:  # both
-            direction_clause = "(r.source_id = ns.id OR r.target_id = ns.id)"
-
-        # 构建过滤器条件
-        filter_conditions = []
-        filter_params = {}
-
-        # 构建过滤器条件 (用于最终结果过滤)
-        filter_conditions = []
-        filter_params = {}
-
-        if entity_type:
-            filter_conditions.append("entity_type = :entity_type")
-            filter_params["entity_type"] = entity_type
-
-        if property_filter:
-            _validate_property_filter_keys(property_filter)
-            for key, value in property_filter.items():
-                param_key = f"prop_{key}"
-                filter_conditions.append(f"properties->>'{key}' = :{param_key}")
-                filter_params[param_key] = str(value)
-
-        filter_clause = " AND ".join(filter_conditions)
-        if filter_clause:
-            filter_clause = f"AND {filter_clause}"
-
-        sql_query = text(
-            f"""
-        WITH RECURSIVE neighbor_search AS (
-            -- 基础：起始节点
-            SELECT
-                e.id,
-                e._display_name as name,
-                e.entity_type,
-                e.properties,
-                1 as depth,
-                ARRAY[e.id] as path_ids,
-                NULL::varchar as rel_type,
-                NULL::bigint as source_id
-            FROM graph_entities e
-            WHERE e.id = :start_id AND e.is_instance = true
-
-            UNION ALL
-
-            -- 递归：查找邻居
-            SELECT
-                CASE WHEN r.source_id = ns.id THEN r.target_id ELSE r.source_id END as id,
-                CASE WHEN r.source_id = ns.id THEN t._display_name ELSE s._display_name END as name,
-                CASE WHEN r.source_id = ns.id THEN t.entity_type ELSE s.entity_type END as entity_type,
-                CASE WHEN r.source_id = ns.id THEN t.properties ELSE s.properties END as properties,
-                ns.depth + 1 as depth,
-                ns.path_ids || CASE WHEN r.source_id = ns.id THEN r.target_id ELSE r.source_id END as path_ids,
-                r.relationship_type as rel_type,
-                ns.id as source_id
-            FROM neighbor_search ns
-            JOIN graph_relationships r ON {direction_clause}
-            JOIN graph_entities s ON r.source_id = s.id
-            JOIN graph_entities t ON r.target_id = t.id
-            WHERE ns.depth <= :hops
-            AND NOT (CASE WHEN r.source_id = ns.id THEN r.target_id ELSE r.source_id END = ANY(ns.path_ids))
-            {f"AND (CASE WHEN r.source_id = ns.id THEN t.entity_type ELSE s.entity_type END) = ANY(:accessible_entity_types)" if accessible_entity_types else ""}
-        )
-        SELECT id, name, entity_type, properties, rel_type, source_id, depth
-        FROM neighbor_search
-        ORDER BY depth ASC
-        LIMIT 500
-        """
+        # 按层同步扩展：每个节点全局只访问一次，方向和关系类型下推到每一跳
+        traversal = GraphTraversal(self.db)
+        neighborhood = await traversal.expand_neighborhood(
+            start_id,
+            hops,
+            direction=direction,
+            relationship_types=relationship_types,
+            accessible_entity_types=accessible_entity_types,
+            max_per_level=max_per_level,
+            max_nodes=max_nodes,
         )
 
-        params = {"start_id": start_id, "hops": hops, **filter_params}
-        if accessible_entity_types:
-            params["accessible_entity_types"] = accessible_entity_types
-
-        result = await self.db.execute(sql_query, params)
-        rows = result.fetchall()
+        # 批量加载访问到的节点
+        entities = {start_id: start_entity}
+        node_ids = [node_id for node_id in neighborhood.nodes if node_id != start_id]
+        for i in range(0, len(node_ids), FRONTIER_CHUNK_SIZE):
+            result = await self.db.execute(
+                select(GraphEntity).where(
+                    GraphEntity.id.in_(node_ids[i : i + FRONTIER_CHUNK_SIZE])
+                )
+            )
+            for entity in result.scalars().all():
+                entities[entity.id] = entity
 
         # 全部节点和边，用于可视化 (去重 ID)
         all_nodes = {}
-        all_edges = []
-
-        # 匹配过滤器的结果
-        filtered_results = []
-        seen_filtered_ids = set()
-
-        for row in rows:
-            node_id, name, etype, props, rel_type, source_id, depth = row
-
-            # 添加到全量节点（用于可视化）
-            if node_id not in all_nodes:
-                all_nodes[node_id] = {
-                    "id": name,
-                    "label": name,
-                    "type": etype,
-                    "properties": {
-                        k: v for k, v in (props or {}).items() if not k.startswith("__")
-                    },
-                }
+        for node_id in neighborhood.nodes:
+            entity = entities.get(node_id)
+            if entity is None:
+                continue
+            all_nodes[node_id] = {
+                "id": entity._display_name,
+                "label": entity._display_name,
+                "type": entity.entity_type,
+                "properties": {
+                    k: v
+                    for k, v in (entity.properties or {}).items()
+                    if not k.startswith("__")
+                },
+            }
 
-            # 添加边（用于可视化）
-            if rel_type and source_id:
-                all_edges.append(
-                    {
-                        "source": str(source_id),
-                        "target": str(node_id),
-                        "label": rel_type,
-                    }
-                )
+        all_edges = [
+            {
+                "source": str(edge.source_id),
+                "target": str(edge.target_id),
+                "label": edge.relationship_type,
+            }
+            for edge in neighborhood.edges
+        ]
 
-            # 检查是否满足过滤器条件并行成结果
-            if depth > 1:
-                match = True
-                if entity_type and etype != entity_type:
-                    match = False
-                if match and property_filter:
-                    for k, v in property_filter.items():
-                        if props.get(k) != str(v):
-                            match = False
-                            break
-
-                if match and node_id not in seen_filtered_ids:
-                    filtered_results.append(
+        # 匹配过滤器的结果（按距离升序）
+        filtered_results = []
+        for node in sorted(neighborhood.nodes.values(), key=lambda n: n.distance):
+            if node.distance == 0 or node.id not in all_nodes:
+                continue
+            entity = entities[node.id]
+            props = entity.properties or {}
+
+            if entity_type and entity.entity_type != entity_type:
+                continue
+            if property_filter and any(
+                k not in props or str(props[k]) != str(v)
+                for k, v in property_filter.items()
+            ):
+                continue
+
+            filtered_results.append(
+                {
+                    "id": node.id,
+                    "name": entity._display_name,
+                    "labels": [entity.entity_type],
+                    "properties": all_nodes[node.id]["properties"],
+                    "aliases": props.get("__aliases__", []),
+                    "distance": node.distance,
+                    "relationships": [
                         {
-                            "id": node_id,
-                            "name": name,
-                            "labels": [etype],
-                            "properties": all_nodes[node_id]["properties"],
-                            "aliases": (props or {}).get("__aliases__", []),
-                            "distance": depth - 1,
-                            "relationships": (
-                                [
-                                    {
-                                        "type": rel_type,
-                                        "source": str(source_id),
-                                        "target": str(node_id),
-                                    }
-                                ]
-                                if rel_type
-                                else []
-                            ),
+                            "type": node.edge.relationship_type,
+                            "source": str(node.parent_id),
+                            "target": str(node.id),
                         }
-                    )
-                    seen_filtered_ids.add(node_id)
+                    ],
+                }
+            )
+
+        truncated = neighborhood.truncated or len(filtered_results) > 100
+        filtered_results = filtered_results[:100]
 
         # 触发可视化事件
         viz_nodes = list(all_nodes.values())
@@ -1204,7 +1214,7 @@ class PGGraphStorage:
         if viz_nodes:
             await self._emit_graph_view_event(nodes=viz_nodes, edges=viz_edges)
 
-        return filtered_results[:100]
+        return {"neighbors": filtered_results, "truncated": truncated}
 
     async def find_path_between_instances(
         self,
@@ -1214,10 +1224,18 @@ class PGGraphStorage:
         end_name: Optional[str] = None,
         max_depth: int = 5,
         accessible_entity_types: Optional[List[str]] = None,
+        k: int = 1,
+        max_visited: int = DEFAULT_MAX_VISITED,
     ) -> Optional[Dict]:
         """查找两个实例之间的最短路径
 
-        使用递归 CTE 实现 BFS 最短路径查找。
+        使用双向 BFS 逐层扩展前沿，每层一次邻接查询，不再枚举全部路径。
+
+        Args:
+            max_depth: 路径最大长度
+            accessible_entity_types: 可选，路径上节点允许的实体类型
+            k: 返回的最短路径条数，大于 1 时结果中额外包含 paths 列表
+            max_visited: 单次查询最多访问的节点数，超出时提前终止
         """
         # 获取起点和终点节点
         if start_id is not None:
@@ -1276,110 +1294,91 @@ class PGGraphStorage:
         if not end:
             return None
 
-        # 使用 BFS 递归 CTE 查找最短路径
-        path_query = text(
-            """
-        WITH RECURSIVE shortest_path AS (
-            -- 起点
-            SELECT
-                s.id as current_id,
-                s._display_name as current_name,
-                s.entity_type as current_type,
-                ARRAY[s.id] as path_ids,
-                ARRAY[s._display_name] as path_names,
-                ARRAY[s.entity_type] as path_labels,
-                ARRAY[]::text[] as rel_types,
-                0 as depth
-            FROM graph_entities s
-            WHERE s.id = :start_id
-
-            UNION ALL
-
-            -- 扩展路径
-            SELECT
-                CASE
-                    WHEN r.source_id = sp.current_id THEN r.target_id
-                    ELSE r.source_id
-                END as current_id,
-                CASE
-                    WHEN r.source_id = sp.current_id THEN t._display_name
-                    ELSE s._display_name
-                END as current_name,
-                CASE
-                    WHEN r.source_id = sp.current_id THEN t.entity_type
-                    ELSE s.entity_type
-                END as current_type,
-                sp.path_ids || CASE
-                    WHEN r.source_id = sp.current_id THEN r.target_id
-                    ELSE r.source_id
-                END as path_ids,
-                sp.path_names || CASE
-                    WHEN r.source_id = sp.current_id THEN t._display_name
-                    ELSE s._display_name
-                END as path_names,
-                sp.path_labels || CASE
-                    WHEN r.source_id = sp.current_id THEN t.entity_type
-                    ELSE s.entity_type
-                END as path_labels,
-                sp.rel_types || r.relationship_type as rel_types,
-                sp.depth + 1 as depth
-            FROM shortest_path sp
-            JOIN graph_relationships r ON (r.source_id = sp.current_id OR r.target_id = sp.current_id)
-            JOIN graph_entities s ON r.source_id = s.id
-            JOIN graph_entities t ON r.target_id = t.id
-            WHERE sp.depth < :max_depth
-            AND NOT (CASE WHEN r.source_id = sp.current_id THEN r.target_id ELSE r.source_id END = ANY(sp.path_ids))
-            {f"AND (CASE WHEN r.source_id = sp.current_id THEN t.entity_type ELSE s.entity_type END) = ANY(:accessible_entity_types)" if accessible_entity_types else ""}
-        )
-        SELECT path_names, path_labels, rel_types, path_ids
-        FROM shortest_path
-        WHERE path_ids[array_length(path_ids, 1)] = :end_id
-        ORDER BY array_length(path_ids, 1) ASC
-        LIMIT 1
-        """
+        # 双向 BFS（k > 1 时使用 Yen 算法）查找最短路径
+        traversal = GraphTraversal(self.db)
+        stats = TraversalStats(max_visited=max_visited)
+        paths = await traversal.k_shortest_paths(
+            start[0],
+            end[0],
+            k=max(1, k),
+            max_depth=max_depth,
+            accessible_entity_types=accessible_entity_types,
+            stats=stats,
         )
 
-        params = {"start_id": start[0], "end_id": end[0], "max_depth": max_depth}
-        if accessible_entity_types:
-            params["accessible_entity_types"] = accessible_entity_types
-
-        result = await self.db.execute(path_query, params)
-        row = result.first()
-
-        if not row:
+        if not paths:
+            if stats.truncated:
+                logger.warning(
+                    f"Path search between {start[1]} and {end[1]} truncated "
+                    f"after visiting {stats.visited} nodes"
+                )
             return None
 
-        path_names, path_labels, rel_types, path_ids = row
+        # 一次性获取路径上所有节点的名称和类型
+        node_ids = {node_id for path in paths for node_id in path.node_ids}
+        result = await self.db.execute(
+            select(
+                GraphEntity.id, GraphEntity._display_name, GraphEntity.entity_type
+            ).where(GraphEntity.id.in_(node_ids))
+        )
+        node_info = {row[0]: (row[1], row[2]) for row in result.all()}
 
-        # 构建节点列表
-        nodes = [
-            {"id": node_id, "name": name, "labels": [label]}
-            for node_id, name, label in zip(path_ids, path_names, path_labels)
-        ]
+        def build_path(path) -> Dict:
+            nodes = [
+                {
+                    "id": node_id,
+                    "name": node_info[node_id][0],
+                    "labels": [node_info[node_id][1]],
+                }
+                for node_id in path.node_ids
+            ]
+            relationships = [
+                {
+                    "type": edge.relationship_type,
+                    "source": nodes[i]["name"],
+                    "target": nodes[i + 1]["name"],
+                }
+                for i, edge in enumerate(path.edges)
+            ]
+            return {"nodes": nodes, "relationships": relationships}
 
-        # 构建关系列表
-        relationships = []
-        for i, rel_type in enumerate(rel_types):
-            relationships.append(
-                {"type": rel_type, "source": path_names[i], "target": path_names[i + 1]}
-            )
+        built = [build_path(path) for path in paths]
+        nodes = built[0]["nodes"]
+        relationships = built[0]["relationships"]
 
-        # 触发可视化事件
+        # 触发可视化事件（包含所有返回路径的节点和边）
         viz_nodes = []
-        for n in nodes:
-            viz_nodes.append(
-                {
-                    "id": n["name"],
-                    "label": n["name"],
-                    "type": n["labels"][0] if n["labels"] else "Entity",
-                    "properties": {},  # 路径查询结果中没有属性，这里简化
-                }
-            )
+        viz_edges = []
+        seen_nodes = set()
+        seen_edges = set()
+        for path in built:
+            for n in path["nodes"]:
+                if n["id"] in seen_nodes:
+                    continue
+                seen_nodes.add(n["id"])
+                viz_nodes.append(
+                    {
+                        "id": n["name"],
+                        "label": n["name"],
+                        "type": n["labels"][0] if n["labels"] else "Entity",
+                        "properties": {},  # 路径查询结果中没有属性，这里简化
+                    }
+                )
+            for rel in path["relationships"]:
+                key = (rel["source"], rel["type"], rel["target"])
+                if key not in seen_edges:
+                    seen_edges.add(key)
+                    viz_edges.append(rel)
 
         if viz_nodes:
-            await self._emit_graph_view_event(nodes=viz_nodes, edges=relationships)
+            await self._emit_graph_view_event(nodes=viz_nodes, edges=viz_edges)
 
-        return {"nodes": nodes, "relationships": relationships}
+        response = {"nodes": nodes, "relationships": relationships}
+        if k > 1:
+            response["paths"] = built
+        if stats.truncated:
+            response["truncated"] = True
+        return response
 
     async def get_instances_by_class(
         self,
@@ -1400,7 +1399,9 @@ class PGGraphStorage:
         if property_filter:
             for key, value in property_filter.items():
                 # 使用 JSONB 操作符查询属性
-                query = query.where(GraphEntity.properties[key].astext == str(value))
+                query = query.where(
+                    property_equals(GraphEntity.properties, key, [value])
+                )
 
         query = query.limit(limit)
         result = await self.db.execute(query)
@@ -1610,10 +1611,12 @@ class PGGraphStorage:
                     "error": f"Aggregation {aggregation} requires aggregate_property to be specified"
                 }
 
-            # Cast JSON string to float/numeric for aggregation
-            from sqlalchemy import cast, Numeric
-
-            val_col = cast(TargetModel.properties[aggregate_property].astext, Numeric)
+            # 转换为数值进行聚合（非数值视为 NULL），可命中数值属性表达式索引
+            _validate_property_filter_keys({aggregate_property: None})
+            record_property_filter(aggregate_property, "numeric")
+            val_col = try_numeric(
+                property_text(TargetModel.properties, aggregate_property)
+            )
 
             if aggregation == "sum":
                 agg_expr = func.sum(val_col)
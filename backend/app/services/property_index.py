@@ -0,0 +1,375 @@
+# backend/app/services/property_index.py
+"""
+JSONB 属性索引管理
+
+graph_entities.properties 上的过滤原本只能按类型扫描全部行。这里提供两部分：
+
+1. 索引管理 (PropertyIndexManager)
+   - properties 上的 jsonb_path_ops GIN 索引，服务于等值 / $in 过滤（@> 包含查询）
+   - 数值属性的表达式索引 (entity_type, graph_try_numeric(properties->>'key'))，
+     服务于 $gt/$gte/$lt/$lte 等范围过滤和聚合
+   数值属性来自 SchemaClass.data_properties 中声明为数值类型的属性，
+   以及运行时被频繁用于范围过滤的热点属性。
+
+2. 可命中索引的过滤表达式
+   - property_text: 以字面量键渲染 properties->>'key'（绑定参数形式的键无法匹配表达式索引）
+   - try_numeric: PostgreSQL 下渲染为 IMMUTABLE 的 graph_try_numeric()，
+     替代 CAST(... AS Numeric)，非数值返回 NULL 而不是报错
+   - property_equals: PostgreSQL 下渲染为 properties @> '{...}'，可使用 GIN 索引
+
+选择表达式索引而不是生成列：表达式索引无需改表结构，也不会在 ALTER TABLE 时重写整张表。
+
+索引以 CREATE/DROP INDEX CONCURRENTLY 在独立的 autocommit 连接上维护，不阻塞写入。
+热点属性的计数只存在于进程内，重启后为空，因此热点索引带有 COMMENT 标记，
+常规同步不会删除它们，只有显式 prune 才会清理。
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+from sqlalchemy import select, text, or_, literal_column, Boolean, Numeric, Text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ColumnElement, FunctionElement
+from app.core.config import settings
+from app.models.graph import SchemaClass
+
+logger = logging.getLogger(__name__)
+
+# 只有满足该格式的属性键才会被写入 DDL
+_SAFE_KEY_RE = re.compile(r"^[a-zA-Z0-9_\-\.]+$")
+
+# data_properties 中视为数值的类型（如 "price:float"）
+NUMERIC_TYPES = {
+    "int",
+    "integer",
+    "long",
+    "short",
+    "float",
+    "double",
+    "decimal",
+    "number",
+    "numeric",
+    "nonnegativeinteger",
+    "positiveinteger",
+}
+
+GIN_INDEX_NAME = "idx_entities_properties_gin"
+PROPERTY_INDEX_PREFIX = "idx_prop_"
+# 热点属性索引的 COMMENT，常规同步不删除带此标记的索引
+HOT_INDEX_COMMENT = "hot"
+
+TRY_NUMERIC_FUNCTION_DDL = r"""
+CREATE OR REPLACE FUNCTION graph_try_numeric(value text) RETURNS numeric
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE
+        WHEN value ~ '^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$'
+        THEN value::numeric
+    END
+$$
+"""
+
+GIN_INDEX_DDL = (
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {GIN_INDEX_NAME} "
+    "ON graph_entities USING gin (properties jsonb_path_ops)"
+)
+
+# 运行时观察到的范围过滤次数：(属性键, 索引类型) -> 次数
+_observed_filters: Counter = Counter()
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def record_property_filter(key: str, kind: str = "numeric") -> None:
+    """记录一次属性过滤，用于识别热点属性"""
+    if _SAFE_KEY_RE.match(key):
+        _observed_filters[(key, kind)] += 1
+
+
+def hot_properties(threshold: int) -> List[Tuple[str, str]]:
+    """返回过滤次数达到阈值的 (属性键, 索引类型)，按次数降序"""
+    return [
+        spec for spec, count in _observed_filters.most_common() if count >= threshold
+    ]
+
+
+def reset_observed_filters() -> None:
+    _observed_filters.clear()
+
+
+# ==================== 过滤表达式 ====================
+
+
+def property_text(column, key: str):
+    """properties->>'key'，键以字面量渲染以匹配表达式索引"""
+    return column.op("->>", return_type=Text)(literal_column(_quote_literal(key)))
+
+
+class try_numeric(FunctionElement):
+    """将文本安全地转换为数值，非数值返回 NULL（PostgreSQL）"""
+
+    type = Numeric()
+    inherit_cache = True
+
+
+@compiles(try_numeric)
+def _compile_try_numeric(element, compiler, **kw):
+    return "CAST(%s AS NUMERIC)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(try_numeric, "postgresql")
+def _compile_try_numeric_pg(element, compiler, **kw):
+    return "graph_try_numeric(%s)" % compiler.process(element.clauses, **kw)
+
+
+def json_equivalents(value: Any) -> List[Any]:
+    """与 properties->>'key' = str(value) 等价的 JSON 值
+
+    例如 "10" 既匹配 JSON 字符串 "10"，也匹配 JSON 数字 10。
+    """
+    value_text = str(value)
+    candidates: List[Any] = [value_text]
+    if value_text in ("true", "false"):
+        candidates.append(value_text == "true")
+        return candidates
+    try:
+        candidates.append(int(value_text))
+    except ValueError:
+        try:
+            number = float(value_text)
+            if math.isfinite(number):
+                candidates.append(number)
+        except ValueError:
+            pass
+    return candidates
+
+
+class property_equals(ColumnElement):
+    """properties->>'key' 等于给定值之一
+
+    PostgreSQL 下渲染为若干 properties @> '{"key": ...}' 的 OR，可使用 GIN 索引；
+    其他数据库渲染为 properties->>'key' IN (...)。
+    """
+
+    type = Boolean()
+    inherit_cache = False
+
+    def __init__(self, column, key: str, values: List[Any]):
+        self.column = column
+        self.key = key
+        self.values = list(values)
+
+    @property
+    def _from_objects(self):
+        return self.column._from_objects
+
+
+@compiles(property_equals)
+def _compile_property_equals(element, compiler, **kw):
+    expr = property_text(element.column, element.key).in_(
+        [str(v) for v in element.values]
+    )
+    return compiler.process(expr, **kw)
+
+
+@compiles(property_equals, "postgresql")
+def _compile_property_equals_pg(element, compiler, **kw):
+    clauses = [
+        element.column.contains({element.key: candidate})
+        for value in element.values
+        for candidate in json_equivalents(value)
+    ]
+    return compiler.process(or_(*clauses), **kw)
+
+
+# ==================== 索引管理 ====================
+
+
+@dataclass(frozen=True)
+class PropertyIndexSpec:
+    """单个属性表达式索引"""
+
+    key: str
+    kind: str = "numeric"
+    # 是否来自运行时热点统计（不参与比较，索引名只由键和类型决定）
+    hot: bool = field(default=False, compare=False)
+
+    @property
+    def index_name(self) -> str:
+        slug = re.sub(r"[^a-z0-9]+", "_", self.key.lower()).strip("_")[:32]
+        digest = hashlib.md5(self.key.encode()).hexdigest()[:8]
+        return f"{PROPERTY_INDEX_PREFIX}{self.kind[:3]}_{slug}_{digest}"
+
+    def create_ddl(self) -> str:
+        expr = f"graph_try_numeric((properties ->> {_quote_literal(self.key)}))"
+        return (
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {self.index_name} "
+            f"ON graph_entities (entity_type, ({expr}))"
+        )
+
+
+def parse_data_property(declaration: str) -> Tuple[str, str]:
+    """解析 data_properties 中的声明，如 "price:float" -> ("price", "float")"""
+    name, _, type_name = str(declaration).partition(":")
+    return name.strip(), (type_name.strip() or "string")
+
+
+class PropertyIndexManager:
+    """根据本体定义和热点属性维护 graph_entities 上的属性索引
+
+    仅在 PostgreSQL 下生效，其他数据库上所有操作均为空操作。
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @property
+    def enabled(self) -> bool:
+        bind = self.db.bind
+        return bind is not None and getattr(bind.dialect, "name", None) == "postgresql"
+
+    async def ensure_base(self) -> None:
+        """创建 graph_try_numeric 函数和 properties GIN 索引"""
+        if not self.enabled:
+            return
+        await self._run_ddl([TRY_NUMERIC_FUNCTION_DDL, GIN_INDEX_DDL])
+
+    async def _run_ddl(self, statements: List[str]) -> None:
+        """在独立的 autocommit 连接上执行 DDL
+
+        CONCURRENTLY 不能在事务块中执行；先结束会话当前事务，
+        否则并发建索引会一直等待本会话持有的事务结束。
+        """
+        if not statements:
+            return
+        await self.db.commit()
+        engine = self.db.bind
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            for statement in statements:
+                await conn.execute(text(statement))
+
+    async def desired_specs(self) -> List[PropertyIndexSpec]:
+        """需要建立索引的属性：声明为数值的属性优先，其次是热点属性"""
+        specs: List[PropertyIndexSpec] = []
+        seen: Set[PropertyIndexSpec] = set()
+
+        def add(spec: PropertyIndexSpec) -> None:
+            if spec not in seen and _SAFE_KEY_RE.match(spec.key):
+                seen.add(spec)
+                specs.append(spec)
+
+        result = await self.db.execute(select(SchemaClass.data_properties))
+        for (data_properties,) in result.all():
+            for declaration in data_properties or []:
+                name, type_name = parse_data_property(declaration)
+                if name and type_name.lower() in NUMERIC_TYPES:
+                    add(PropertyIndexSpec(name, "numeric"))
+
+        for key, kind in hot_properties(settings.PROPERTY_INDEX_HOT_THRESHOLD):
+            add(PropertyIndexSpec(key, kind, hot=True))
+
+        return specs[: settings.PROPERTY_INDEX_MAX_INDEXES]
+
+    async def existing_indexes(self) -> Dict[str, Tuple[Optional[str], bool]]:
+        """现有属性索引：索引名 -> (COMMENT, 是否有效)"""
+        result = await self.db.execute(
+            text(
+                "SELECT c.relname, obj_description(c.oid, 'pg_class'), x.indisvalid "
+                "FROM pg_index x "
+                "JOIN pg_class c ON c.oid = x.indexrelid "
+                "JOIN pg_class t ON t.oid = x.indrelid "
+                "WHERE t.relname = 'graph_entities' AND c.relname LIKE :prefix"
+            ),
+            {"prefix": PROPERTY_INDEX_PREFIX + "%"},
+        )
+        return {row[0]: (row[1], bool(row[2])) for row in result.all()}
+
+    async def existing_index_names(self) -> Set[str]:
+        return set(await self.existing_indexes())
+
+    async def sync(self, prune: bool = False) -> Dict[str, List[str]]:
+        """创建缺失的属性索引并删除不再需要的索引
+
+        Args:
+            prune: 同时删除不再是热点的热点属性索引。热点计数在重启后为空，
+                常规同步保留这些索引，只删除不再声明为数值的本体属性索引。
+        """
+        stats: Dict[str, List[str]] = {"created": [], "dropped": []}
+        if not self.enabled:
+            return stats
+
+        await self.ensure_base()
+        desired = {spec.index_name: spec for spec in await self.desired_specs()}
+        existing = await self.existing_indexes()
+
+        statements: List[str] = []
+        for name, spec in desired.items():
+            if name in existing and existing[name][1]:
+                continue
+            if name in existing:
+                # 上次并发建索引失败留下的无效索引，重建
+                statements.append(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+            statements.append(spec.create_ddl())
+            if spec.hot:
+                statements.append(
+                    f"COMMENT ON INDEX {name} IS {_quote_literal(HOT_INDEX_COMMENT)}"
+                )
+            stats["created"].append(name)
+
+        for name, (comment, _) in existing.items():
+            if name in desired:
+                continue
+            if comment == HOT_INDEX_COMMENT and not prune:
+                continue
+            statements.append(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+            stats["dropped"].append(name)
+
+        await self._run_ddl(statements)
+        if stats["created"] or stats["dropped"]:
+            logger.info(
+                f"Property indexes synced: created={stats['created']}, "
+                f"dropped={stats['dropped']}"
+            )
+        return stats
+
+    async def drop_all(self) -> List[str]:
+        """删除全部属性表达式索引"""
+        if not self.enabled:
+            return []
+        names = sorted(await self.existing_index_names())
+        await self._run_ddl([f"DROP INDEX CONCURRENTLY IF EXISTS {n}" for n in names])
+        return names
+
+
+# 后台索引同步任务（保留引用，避免任务被回收）
+_background_syncs: Set[asyncio.Task] = set()
+
+
+def schedule_index_sync(db: AsyncSession) -> Optional[asyncio.Task]:
+    """在后台同步属性索引，不阻塞当前请求
+
+    使用与 db 相同的 engine 打开独立会话；非 PostgreSQL 时不做任何事。
+    """
+    if not PropertyIndexManager(db).enabled:
+        return None
+    engine = db.bind
+
+    async def run() -> None:
+        try:
+            async with AsyncSession(engine) as session:
+                await PropertyIndexManager(session).sync()
+        except Exception as e:
+            logger.warning(f"Failed to sync property indexes: {e}")
+
+    task = asyncio.get_running_loop().create_task(run(), name="property-index-sync")
+    _background_syncs.add(task)
+    task.add_done_callback(_background_syncs.discard)
+    return task
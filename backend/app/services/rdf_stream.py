@@ -0,0 +1,223 @@
+# backend/app/services/rdf_stream.py
+"""
+RDF 流式解析
+
+在不构建完整 rdflib Graph 的情况下，逐块解析 N-Triples / Turtle 文件：
+
+1. N-Triples: 每行一条三元组，按固定行数分块交给 rdflib 的 N-Triples 解析器
+2. Turtle: 按顶层语句（以 '.' 结尾）切分文本，前缀声明附加到每个块之前，
+   每块单独解析为一个小 Graph 后即丢弃
+3. TripleClassifier: 单遍完成 Schema / Instance 三元组分类
+
+内存占用只与块大小相关，与文件大小无关。
+
+限制：跨块的空白节点 (_:b) 标签不保证指向同一节点。
+"""
+
+import io
+import logging
+from typing import IO, Iterable, Iterator, List, Optional, Set, Tuple
+from rdflib import Graph, RDF
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser
+from rdflib.term import Node
+from app.services.owl_parser import OWLParser
+
+logger = logging.getLogger(__name__)
+
+# 可以流式解析的格式（按扩展名）
+STREAMING_FORMATS = {".ttl": "turtle", ".nt": "nt"}
+
+# 每个解析块包含的 Turtle 语句数 / N-Triples 行数
+DEFAULT_STATEMENTS_PER_CHUNK = 2000
+
+RDFTriple = Tuple[Node, Node, Node]
+
+
+class _ListSink:
+    """收集 N-Triples 解析结果的 sink"""
+
+    def __init__(self):
+        self.triples: List[RDFTriple] = []
+
+    def triple(self, s, p, o):
+        self.triples.append((s, p, o))
+
+
+def iter_ntriples(
+    lines: Iterable[str], lines_per_chunk: int = DEFAULT_STATEMENTS_PER_CHUNK
+) -> Iterator[RDFTriple]:
+    """逐块解析 N-Triples"""
+    bnode_context: dict = {}
+    chunk: List[str] = []
+
+    def parse(chunk_lines: List[str]) -> List[RDFTriple]:
+        sink = _ListSink()
+        W3CNTriplesParser(sink).parse(
+            io.StringIO("".join(chunk_lines)), bnode_context=bnode_context
+        )
+        return sink.triples
+
+    for line in lines:
+        chunk.append(line if line.endswith("\n") else line + "\n")
+        if len(chunk) >= lines_per_chunk:
+            yield from parse(chunk)
+            chunk = []
+    if chunk:
+        yield from parse(chunk)
+
+
+class TurtleStatementSplitter:
+    """将 Turtle 文本切分为顶层语句
+
+    跟踪 IRI、字符串（含三引号长字符串）、注释和括号嵌套，
+    仅在顶层的 '.' 处切分。前缀 / base 声明单独收集。
+    """
+
+    def __init__(self):
+        self.directives: List[str] = []
+        self._statement: List[str] = []
+        self._state: Optional[str] = None  # None / "iri" / 字符串定界符
+        self._depth = 0
+
+    def feed(self, line: str) -> List[str]:
+        """输入一行文本，返回该行中完成的语句"""
+        completed: List[str] = []
+
+        # SPARQL 风格的 PREFIX / BASE 声明不以 '.' 结尾
+        if self._state is None and not "".join(self._statement).strip():
+            head = line.lstrip()[:6].upper()
+            if head.startswith("PREFIX") or head.startswith("BASE"):
+                self.directives.append(line.strip())
+                return completed
+
+        start = 0
+        i = 0
+        length = len(line)
+        end = length
+        while i < length:
+            ch = line[i]
+            state = self._state
+
+            if state == "iri":
+                if ch == ">":
+                    self._state = None
+            elif state is not None:
+                if ch == "\\":
+                    i += 1
+                elif line.startswith(state, i):
+                    self._state = None
+                    i += len(state) - 1
+            elif ch == "#":
+                # 丢弃注释，保留换行
+                end = i
+                break
+            elif ch == "<":
+                self._state = "iri"
+            elif ch in "\"'":
+                delim = ch * 3 if line.startswith(ch * 3, i) else ch
+                self._state = delim
+                i += len(delim) - 1
+            elif ch in "[(":
+                self._depth += 1
+            elif ch in "])":
+                self._depth -= 1
+            elif ch == "." and self._depth == 0:
+                following = line[i + 1 : i + 2]
+                if not following or following.isspace() or following == "#":
+                    self._statement.append(line[start : i + 1])
+                    self._finish(completed)
+                    start = i + 1
+            i += 1
+
+        rest = line[start:end] if end == length else line[start:end] + "\n"
+        if rest.strip() or self._statement:
+            self._statement.append(rest)
+        return completed
+
+    def _finish(self, completed: List[str]) -> None:
+        statement = "".join(self._statement).strip()
+        self._statement = []
+        if not statement:
+            return
+        if statement.lower().startswith(("@prefix", "@base")):
+            self.directives.append(statement)
+        else:
+            completed.append(statement)
+
+    def close(self) -> List[str]:
+        """返回末尾未以 '.' 结束的内容（交给解析器报错）"""
+        statement = "".join(self._statement).strip()
+        self._statement = []
+        return [statement] if statement else []
+
+
+def iter_turtle(
+    lines: Iterable[str], statements_per_chunk: int = DEFAULT_STATEMENTS_PER_CHUNK
+) -> Iterator[RDFTriple]:
+    """逐块解析 Turtle"""
+    splitter = TurtleStatementSplitter()
+    chunk: List[str] = []
+
+    def parse(statements: List[str]) -> Iterator[RDFTriple]:
+        data = "\n".join(splitter.directives + statements)
+        graph = Graph()
+        graph.parse(data=data, format="turtle")
+        # Graph 内三元组顺序不固定，先输出 Schema 类型声明，
+        # 保证同一块中 Schema 实体的其余三元组能被单遍分类器识别
+        for s, p, o in graph.triples((None, RDF.type, None)):
+            if o in OWLParser.SCHEMA_TYPES:
+                yield s, p, o
+        for s, p, o in graph:
+            if not (p == RDF.type and o in OWLParser.SCHEMA_TYPES):
+                yield s, p, o
+
+    for line in lines:
+        chunk.extend(splitter.feed(line))
+        if len(chunk) >= statements_per_chunk:
+            yield from parse(chunk)
+            chunk = []
+    chunk.extend(splitter.close())
+    if chunk:
+        yield from parse(chunk)
+
+
+def iter_rdf_file(
+    stream: IO[bytes],
+    rdf_format: str,
+    statements_per_chunk: int = DEFAULT_STATEMENTS_PER_CHUNK,
+) -> Iterator[RDFTriple]:
+    """按格式流式读取二进制文件流中的三元组"""
+    lines = io.TextIOWrapper(stream, encoding="utf-8")
+    try:
+        if rdf_format == "nt":
+            yield from iter_ntriples(lines, statements_per_chunk)
+        elif rdf_format == "turtle":
+            yield from iter_turtle(lines, statements_per_chunk)
+        else:
+            raise ValueError(f"Unsupported streaming format: {rdf_format}")
+    finally:
+        # 不关闭底层流，由调用方负责
+        lines.detach()
+
+
+class TripleClassifier:
+    """单遍 Schema / Instance 三元组分类
+
+    规则与 OWLParser.classify_triples 一致，但 Schema 实体集合是边读边建立的：
+    Schema 实体在首次出现在 Schema 三元组中之后，其后续三元组才会被识别为 Schema。
+    本体文件通常先声明 Schema，实例导入也只依赖实例的 rdf:type，因此影响有限。
+    """
+
+    def __init__(self):
+        self.schema_entities: Set[Node] = set()
+
+    def is_schema(self, s: Node, p: Node, o: Node) -> bool:
+        if p == RDF.type:
+            schema = o in OWLParser.SCHEMA_TYPES
+        else:
+            schema = p in OWLParser.SCHEMA_PREDICATES or s in self.schema_entities
+
+        if schema:
+            self.schema_entities.add(s)
+            self.schema_entities.add(o)
+        return schema
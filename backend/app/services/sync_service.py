@@ -9,11 +9,17 @@ import ast
 import logging
 import asyncio
 import operator
-from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Dict, Any, Optional, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, delete, and_, or_, func, literal, literal_column
+from sqlalchemy import String, all_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.sql.expression import FunctionElement
 import re
 
 from app.models.data_product import (
@@ -21,10 +27,18 @@ from app.models.data_product import (
     EntityMapping,
     PropertyMapping,
     RelationshipMapping,
+    SyncForeignKey,
     SyncLog,
 )
 from app.models.graph import GraphEntity, GraphRelationship
-from app.services.grpc_client import DynamicGrpcClient
+from app.services.grpc_client import DynamicGrpcClient, borrow_client
+from app.services.page_fetcher import (
+    FetchProgress,
+    PageFetchError,
+    iter_pages,
+    iter_stream_batches,
+    resolve_paging,
+)
 
 
 def parse_num(value):
@@ -157,22 +171,90 @@ def _eval_node(node: ast.AST, variables: Dict[str, Any]) -> Any:
     raise ValueError(f"Unsupported expression node: {type(node).__name__}")
 
 
+class merge_properties(FunctionElement):
+    """UPSERT 时合并已有属性和新属性
+
+    新属性覆盖旧属性；旧属性中的 "id" 仅在新属性也包含 "id" 时保留。
+    """
+
+    type = JSONB()
+    inherit_cache = True
+
+
+@compiles(merge_properties)
+def _compile_merge_properties(element, compiler, **kw):
+    existing, incoming = [compiler.process(c, **kw) for c in element.clauses]
+    # SQLite: json_patch 对 null 值的处理是删除键，与 jsonb || 略有不同
+    return f"json_patch(json_remove(coalesce({existing}, '{{}}'), '$.id'), {incoming})"
+
+
+@compiles(merge_properties, "postgresql")
+def _compile_merge_properties_pg(element, compiler, **kw):
+    existing, incoming = [compiler.process(c, **kw) for c in element.clauses]
+    return f"((coalesce({existing}, '{{}}'::jsonb) - 'id') || {incoming})"
+
+
 logger = logging.getLogger(__name__)
 
+# 单条 UPSERT 语句的最大行数（受数据库绑定参数数量限制）
+UPSERT_CHUNK_SIZE = 1000
+
+# 增量同步时两次全量对账（含删除检测）之间的默认间隔
+DEFAULT_FULL_SYNC_INTERVAL_HOURS = 24
+
+
+def _watermark_key(value: Any) -> Tuple[int, Any]:
+    """高水位比较键：数值（含数字字符串，如 int64 时间戳）按数值比较，其他按字符串比较"""
+    num = parse_num(value) if not isinstance(value, bool) else None
+    if num is not None:
+        return (0, num)
+    return (1, str(value))
+
+
+def advance_watermark(
+    current: Optional[str], items: List[Dict[str, Any]], field: str
+) -> Optional[str]:
+    """返回当前高水位与一页记录中高水位字段的最大值（以字符串保存）"""
+    best = current
+    best_key = _watermark_key(current) if current is not None else None
+    for item in items:
+        value = item.get(field)
+        if value is None or value == "":
+            continue
+        key = _watermark_key(value)
+        if best_key is None or key > best_key:
+            best, best_key = str(value), key
+    return best
+
+
+def watermark_param(watermark: str) -> Any:
+    """将保存的高水位还原为列表请求的过滤参数值"""
+    num = parse_num(watermark)
+    return watermark if num is None else num
+
 
 class SyncService:
     """数据同步服务"""
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        # 本实例中已拉取过（并暂存了外键）的实体映射 ID
+        self._captured_mapping_ids: Set[int] = set()
 
     async def sync_data_product(
         self,
         product_id: int,
         sync_relationships: bool = True,
         sync_log_id: Optional[int] = None,
+        incremental: bool = False,
+        reconcile: bool = False,
     ) -> Dict[str, Any]:
-        """同步单个数据产品"""
+        """同步单个数据产品
+
+        Args:
+            incremental: 对配置了高水位字段的实体映射只拉取变更记录
+            reconcile: 全量对账，删除源端已不存在的实体
+        """
         # 1. 加载数据产品和所有映射
         result = await self.db.execute(
             select(DataProduct)
@@ -198,7 +280,7 @@ class SyncService:
         else:
             sync_log = SyncLog(
                 data_product_id=product.id,
-                sync_type="manual",
+                sync_type="incremental" if incremental else "manual",
                 direction="pull",
                 status="started",
                 started_at=datetime.now(timezone.utc).replace(tzinfo=None),
@@ -214,9 +296,7 @@ class SyncService:
         error_msgs = []
 
         try:
-            async with DynamicGrpcClient(
-                product.grpc_host, product.grpc_port
-            ) as client:
+            async with borrow_client(product.grpc_host, product.grpc_port) as client:
                 # 3. 遍历每个实体映射进行拉取同步
                 # Eager load necessary relationships
                 stmt = (
@@ -232,7 +312,12 @@ class SyncService:
 
                 for mapping in mappings:
                     await self._sync_mapping_internal(
-                        mapping, client, product, sync_log
+                        mapping,
+                        client,
+                        product,
+                        sync_log,
+                        incremental=incremental,
+                        reconcile=reconcile,
                     )
 
                 # 4. 同步关系 (可选)
@@ -270,7 +355,11 @@ class SyncService:
             }
 
     async def sync_entity_mapping(
-        self, mapping_id: int, sync_log_id: Optional[int] = None
+        self,
+        mapping_id: int,
+        sync_log_id: Optional[int] = None,
+        incremental: bool = False,
+        reconcile: bool = False,
     ) -> Dict[str, Any]:
         """同步单个实体映射"""
         # 1. 加载实体映射和关联的数据产品
@@ -301,7 +390,7 @@ class SyncService:
             sync_log = SyncLog(
                 data_product_id=product.id,
                 entity_mapping_id=mapping.id,
-                sync_type="manual",
+                sync_type="incremental" if incremental else "manual",
                 direction="pull",
                 status="started",
                 started_at=datetime.now(timezone.utc).replace(tzinfo=None),
@@ -311,10 +400,15 @@ class SyncService:
             await self.db.refresh(sync_log)
 
         try:
-            async with DynamicGrpcClient(
-                product.grpc_host, product.grpc_port
-            ) as client:
-                await self._sync_mapping_internal(mapping, client, product, sync_log)
+            async with borrow_client(product.grpc_host, product.grpc_port) as client:
+                await self._sync_mapping_internal(
+                    mapping,
+                    client,
+                    product,
+                    sync_log,
+                    incremental=incremental,
+                    reconcile=reconcile,
+                )
 
             sync_log.status = "completed"
             sync_log.completed_at = datetime.now(timezone.utc).replace(tzinfo=None)
@@ -334,6 +428,7 @@ class SyncService:
             "created": sync_log.records_created,
             "updated": sync_log.records_updated,
             "failed": sync_log.records_failed,
+            "deleted": sync_log.records_deleted,
         }
 
     async def _sync_mapping_internal(
@@ -342,191 +437,661 @@ class SyncService:
         client: DynamicGrpcClient,
         product: DataProduct,
         sync_log: SyncLog,
+        incremental: bool = False,
+        reconcile: bool = False,
     ) -> None:
-        """内部通用同步逻辑：同步单个 Mapping 的数据"""
+        """内部通用同步逻辑：同步单个 Mapping 的数据
+
+        增量模式只拉取高水位之后变更的记录；全量模式拉取全部记录。
+        只有对账模式（定时的全量对账或显式指定 reconcile）在确认拉取了源端
+        全部记录后才删除源端已不存在的实体。
+        """
         if not mapping.sync_enabled or mapping.sync_direction.value != "pull":
             return
 
-        if not mapping.list_method:
+        if not mapping.list_method and not mapping.export_method:
             logger.warning(f"No list_method defined for mapping {mapping.id}")
             return
 
+        mode = self._resolve_sync_mode(mapping, incremental, reconcile)
+        request = None
+        if mode == "incremental":
+            filter_field = (
+                mapping.watermark_filter_field or f"{mapping.watermark_field}_from"
+            )
+            if await self._request_has_field(client, product, mapping, filter_field):
+                request = {filter_field: watermark_param(mapping.sync_watermark)}
+                logger.info(
+                    f"Incremental sync for mapping {mapping.id}: "
+                    f"{filter_field} >= {mapping.sync_watermark}"
+                )
+            else:
+                # 请求消息不支持该过滤字段时无法增量拉取，退回全量拉取（不删除）
+                message = (
+                    f"Mapping {mapping.id}: request of "
+                    f"{mapping.export_method or mapping.list_method} has no field "
+                    f"'{filter_field}', falling back to a full pull"
+                )
+                logger.warning(message)
+                self._append_sync_error(sync_log, message)
+                mode = "full"
+        full = mode != "incremental"
+        fk_mappings = await self._begin_foreign_key_capture(mapping, replace=full)
+
+        high_watermark = mapping.sync_watermark if mode == "incremental" else None
+        seen_ids: Set[str] = set()
+        complete = True
+        progress = FetchProgress()
         try:
-            total_pages = 1
-            current_page = 1
-            page_size = 100
-
-            while current_page <= total_pages:
-                # a. 调用 gRPC 列表方法 (带分页)
-                request_payload = {
-                    "pagination": {
-                        "page": current_page,
-                        "page_size": page_size,
+            # a. 调用 gRPC 流式导出方法或列表方法 (带分页，后续页面并发预取)
+            pages = self._iter_source_batches(
+                client,
+                product,
+                mapping,
+                request=request,
+                item_fields=self._item_fields(mapping, fk_mappings),
+                progress=progress,
+            )
+            async with aclosing(pages):
+                try:
+                    async for current_page, items in pages:
+                        await self._stage_foreign_keys(
+                            mapping, fk_mappings, items, replace=full
+                        )
+                        await self._process_entity_page(
+                            mapping, items, current_page, sync_log
+                        )
+                        if mapping.watermark_field:
+                            high_watermark = advance_watermark(
+                                high_watermark, items, mapping.watermark_field
+                            )
+                        if mode == "reconcile":
+                            seen_ids.update(
+                                str(item[mapping.id_field_mapping])
+                                for item in items
+                                if item.get(mapping.id_field_mapping) is not None
+                            )
+                except PageFetchError as e:
+                    # 一页都没有拉到时同步失败，而不是以"已完成"结束
+                    if progress.received_pages == 0:
+                        raise
+                    complete = False
+                    message = (
+                        f"Failed to fetch page {e.page} for mapping {mapping.id}: {e.error}"
+                    )
+                    logger.error(message)
+                    self._append_sync_error(sync_log, message)
+
+        except Exception as e:
+            logger.error(f"Error syncing mapping {mapping.id}: {e}")
+            raise
+
+        # b. 拉取不完整时保留原高水位，下次从同一位置重新拉取
+        if not complete:
+            return
+        if mode == "reconcile":
+            if progress.complete and seen_ids:
+                sync_log.records_deleted = (
+                    sync_log.records_deleted or 0
+                ) + await self._delete_missing_entities(mapping, seen_ids)
+            else:
+                # 源端未声明总页数、页面未收齐或本次没有任何记录时无法确认缺失
+                logger.warning(
+                    f"Skipping deletion detection for mapping {mapping.id}: "
+                    f"received {progress.received_pages} of "
+                    f"{progress.total_pages or 'unknown'} pages, "
+                    f"{len(seen_ids)} records"
+                )
+        if full:
+            mapping.last_full_sync_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        if high_watermark is not None:
+            mapping.sync_watermark = high_watermark
+        await self.db.commit()
+
+    @staticmethod
+    def _iter_source_batches(
+        client: DynamicGrpcClient,
+        product: DataProduct,
+        mapping: EntityMapping,
+        request: Optional[Dict[str, Any]] = None,
+        item_fields: Optional[Set[str]] = None,
+        progress: Optional[FetchProgress] = None,
+    ) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """拉取映射的源记录：配置了流式导出方法时优先使用，否则分页调用列表方法"""
+        page_size, concurrency = resolve_paging(product, mapping)
+        if mapping.export_method:
+            return iter_stream_batches(
+                client,
+                product.service_name,
+                mapping.export_method,
+                batch_size=page_size,
+                buffer_batches=concurrency,
+                request=request,
+                item_fields=item_fields,
+                progress=progress,
+            )
+        return iter_pages(
+            client,
+            product.service_name,
+            mapping.list_method,
+            page_size=page_size,
+            concurrency=concurrency,
+            request=request,
+            item_fields=item_fields,
+            progress=progress,
+        )
+
+    @staticmethod
+    async def _request_has_field(
+        client: DynamicGrpcClient,
+        product: DataProduct,
+        mapping: EntityMapping,
+        field_name: str,
+    ) -> bool:
+        """拉取方法的请求消息是否包含该字段（字段名或 JSON 名）"""
+        method = mapping.export_method or mapping.list_method
+        codec = await client.get_codec(product.service_name, method)
+        descriptor = codec.input_class.DESCRIPTOR
+        return field_name in descriptor.fields_by_name or any(
+            f.json_name == field_name for f in descriptor.fields
+        )
+
+    @staticmethod
+    def _append_sync_error(sync_log: SyncLog, message: str) -> None:
+        """在同步日志中追加一条错误信息"""
+        if sync_log.error_message:
+            sync_log.error_message = f"{sync_log.error_message}\n{message}"
+        else:
+            sync_log.error_message = message
+
+    @staticmethod
+    def _item_fields(
+        mapping: EntityMapping, fk_mappings: List[RelationshipMapping]
+    ) -> Optional[Set[str]]:
+        """同步一个实体映射需要的源字段，用于只转换响应中用到的字段
+
+        转换表达式引用了整条记录（item）时返回 None，转换全部字段。
+        """
+        fields = {mapping.id_field_mapping, mapping.name_field_mapping}
+        for p_map in mapping.property_mappings:
+            if p_map.transform_expression and re.search(
+                r"\bitem\b", p_map.transform_expression
+            ):
+                return None
+            fields.add(p_map.grpc_field)
+        fields.update(
+            rel.target_id_field for rel in mapping.target_relationship_mappings
+        )
+        fields.update(rm.source_fk_field for rm in fk_mappings)
+        if mapping.watermark_field:
+            fields.add(mapping.watermark_field)
+        fields.discard(None)
+        return fields
+
+    @staticmethod
+    def _resolve_sync_mode(
+        mapping: EntityMapping, incremental: bool, reconcile: bool = False
+    ) -> str:
+        """确定本次同步模式："incremental"、"full" 或 "reconcile"
+
+        - reconcile: 显式指定对账，或增量同步距上次全量拉取超过对账间隔；
+          拉取全部记录并删除源端已不存在的实体
+        - full: 手动同步、未配置高水位字段或尚无高水位；拉取全部记录，不删除
+        - incremental: 只拉取高水位之后变更的记录
+        """
+        if reconcile:
+            return "reconcile"
+        if not incremental or not mapping.watermark_field:
+            return "full"
+        if mapping.sync_watermark is None or mapping.last_full_sync_at is None:
+            return "full"
+        interval = mapping.full_sync_interval_hours
+        if interval is None:
+            interval = DEFAULT_FULL_SYNC_INTERVAL_HOURS
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if interval > 0 and now - mapping.last_full_sync_at >= timedelta(
+            hours=interval
+        ):
+            return "reconcile"
+        return "incremental"
+
+    async def _delete_missing_entities(
+        self, mapping: EntityMapping, seen_ids: Set[str]
+    ) -> int:
+        """全量对账：删除源端已不存在的实体（关系随外键级联删除）
+
+        仅当该 Ontology 类只由这一个实体映射同步时执行，
+        避免误删其他数据产品同步来的同类实体。
+        """
+        shared = await self.db.execute(
+            select(func.count(EntityMapping.id)).where(
+                EntityMapping.ontology_class_name == mapping.ontology_class_name,
+                EntityMapping.sync_enabled == True,
+                EntityMapping.id != mapping.id,
+            )
+        )
+        if shared.scalar_one():
+            logger.info(
+                f"Skipping deletion detection for mapping {mapping.id}: "
+                f"class {mapping.ontology_class_name} is synced by other mappings"
+            )
+            return 0
+
+        query = select(GraphEntity.id).where(
+            GraphEntity.entity_type == mapping.ontology_class_name,
+            GraphEntity.source_id.is_not(None),
+        )
+        if self._is_postgres:
+            # 在数据库中筛选缺失的实体，已见 ID 作为一个数组参数传入
+            seen = bindparam("seen", sorted(seen_ids), type_=ARRAY(String))
+            result = await self.db.execute(
+                query.where(GraphEntity.source_id != all_(seen))
+            )
+            stale = list(result.scalars().all())
+        else:
+            # SQLite 没有数组参数，NOT IN 又受绑定参数个数限制，在内存中比较
+            result = await self.db.execute(query.add_columns(GraphEntity.source_id))
+            stale = [
+                entity_id
+                for entity_id, source_id in result.all()
+                if source_id not in seen_ids
+            ]
+        for i in range(0, len(stale), UPSERT_CHUNK_SIZE):
+            chunk = stale[i : i + UPSERT_CHUNK_SIZE]
+            # SQLite 不强制外键级联，显式删除关联关系
+            await self.db.execute(
+                delete(GraphRelationship).where(
+                    or_(
+                        GraphRelationship.source_id.in_(chunk),
+                        GraphRelationship.target_id.in_(chunk),
+                    )
+                )
+            )
+            await self.db.execute(delete(GraphEntity).where(GraphEntity.id.in_(chunk)))
+
+        if stale:
+            logger.info(
+                f"Deleted {len(stale)} {mapping.ontology_class_name} entities "
+                f"no longer present in the source"
+            )
+        return len(stale)
+
+    async def _process_entity_page(
+        self,
+        mapping: EntityMapping,
+        items: List[Dict[str, Any]],
+        current_page: int,
+        sync_log: SyncLog,
+    ) -> None:
+        """转换并写入一页实体数据：按 (entity_type, source_id) 批量 UPSERT"""
+        rows: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            sync_log.records_processed += 1
+            try:
+                raw_id, node_name, properties = self._transform_item(mapping, item)
+                if raw_id is None:
+                    # 没有外部 ID 的条目只能按名称匹配，逐条处理
+                    await self._upsert_entity_by_name(
+                        mapping, node_name, properties, sync_log
+                    )
+                    continue
+
+                source_id = str(raw_id)
+                if source_id in rows:
+                    # 同一页内重复的记录合并为一行，视为更新
+                    rows[source_id]["properties"].update(properties)
+                    rows[source_id]["_display_name"] = node_name
+                    sync_log.records_updated += 1
+                else:
+                    rows[source_id] = {
+                        "_display_name": node_name,
+                        "entity_type": mapping.ontology_class_name,
+                        "source_id": source_id,
+                        "is_instance": True,
+                        "properties": properties,
                     }
-                }
+            except Exception as e:
+                logger.error(f"Error processing item: {e}")
+                sync_log.records_failed += 1
 
+        if rows:
+            try:
+                created = await self._upsert_entities(list(rows.values()))
+                sync_log.records_created += created
+                sync_log.records_updated += len(rows) - created
+            except Exception as e:
+                logger.error(
+                    f"Batch upsert failed for page {current_page} "
+                    f"of mapping {mapping.id}: {e}"
+                )
+                sync_log.records_failed += len(rows)
+
+        await self.db.commit()
+
+    @property
+    def _is_postgres(self) -> bool:
+        bind = self.db.bind
+        return bind is not None and getattr(bind.dialect, "name", None) == "postgresql"
+
+    def _transform_item(
+        self, mapping: EntityMapping, item: Dict[str, Any]
+    ) -> Tuple[Any, str, Dict[str, Any]]:
+        """按映射规则转换单个条目
+
+        Returns:
+            (raw_id, node_name, properties)
+        """
+        raw_id = item.get(mapping.id_field_mapping)
+        node_name = item.get(mapping.name_field_mapping)
+        if not node_name:
+            node_name = f"{mapping.ontology_class_name}_{raw_id}"
+
+        properties = {}
+        raw_name = item.get(mapping.name_field_mapping)
+        if raw_name is not None:
+            properties[mapping.name_field_mapping] = raw_name
+
+        for rel in mapping.target_relationship_mappings:
+            if (
+                rel.target_id_field not in properties
+                and rel.target_id_field != mapping.id_field_mapping
+                and rel.target_id_field != "id"
+            ):
+                val = item.get(rel.target_id_field)
+                if val is not None:
+                    properties[rel.target_id_field] = val
+
+        for p_map in mapping.property_mappings:
+            val = item.get(p_map.grpc_field)
+            if p_map.transform_expression:
                 try:
-                    logger.info(
-                        f"Calling gRPC method {mapping.list_method} for page {current_page}..."
-                    )
-                    response = await client.call_method(
-                        product.service_name,
-                        mapping.list_method,
-                        request_payload,
+                    safe_dict = {
+                        "value": val,
+                        "item": item,
+                        "parseNum": parse_num,
+                        "toString": to_string,
+                        "toDate": to_date,
+                        "str": str,
+                        "float": float,
+                        "int": int,
+                        "bool": bool,
+                        "datetime": datetime,
+                        "None": None,
+                        "True": True,
+                        "False": False,
+                    }
+                    val = safe_eval(
+                        p_map.transform_expression,
+                        safe_dict,
                     )
-                    logger.info(f"Received response for page {current_page}")
                 except Exception as e:
-                    logger.error(
-                        f"Failed to fetch page {current_page} for mapping {mapping.id}: {e}"
+                    logger.error(f"Transform error for {p_map.ontology_property}: {e}")
+            properties[p_map.ontology_property] = val
+
+        return raw_id, str(node_name), properties
+
+    async def _upsert_entities(self, rows: List[Dict[str, Any]]) -> int:
+        """批量写入实体：INSERT ... ON CONFLICT (entity_type, source_id) DO UPDATE
+
+        每 UPSERT_CHUNK_SIZE 行一条语句。已存在的实体合并属性（新值覆盖旧值），
+        并更新显示名称。
+
+        Returns:
+            新创建的实体数量
+        """
+        created = 0
+        for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            created += await self._upsert_entity_chunk(rows[i : i + UPSERT_CHUNK_SIZE])
+        return created
+
+    async def _upsert_entity_chunk(self, rows: List[Dict[str, Any]]) -> int:
+        insert = pg_insert if self._is_postgres else sqlite_insert
+        stmt = insert(GraphEntity).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GraphEntity.entity_type, GraphEntity.source_id],
+            set_={
+                "properties": merge_properties(
+                    GraphEntity.properties, stmt.excluded.properties
+                ),
+                "_display_name": stmt.excluded._display_name,
+                "updated_at": func.now(),
+            },
+        )
+
+        # 使用 SAVEPOINT，失败时只回滚本页，不影响同步日志等已有修改
+        async with self.db.begin_nested():
+            if self._is_postgres:
+                # xmax = 0 表示本次 INSERT 新建的行，否则为 UPDATE
+                result = await self.db.execute(
+                    stmt.returning(literal_column("xmax = 0"))
+                )
+                return sum(1 for (created,) in result.all() if created)
+
+            entity_type = rows[0]["entity_type"]
+            existing = await self.db.execute(
+                select(func.count(GraphEntity.id)).where(
+                    GraphEntity.entity_type == entity_type,
+                    GraphEntity.source_id.in_([row["source_id"] for row in rows]),
+                )
+            )
+            created = len(rows) - existing.scalar_one()
+            await self.db.execute(stmt)
+            return created
+
+    async def _upsert_entity_by_name(
+        self,
+        mapping: EntityMapping,
+        node_name: str,
+        properties: Dict[str, Any],
+        sync_log: SyncLog,
+    ) -> None:
+        """按显示名称匹配并写入单个实体（条目没有外部 ID 时使用）"""
+        ent_result = await self.db.execute(
+            select(GraphEntity).where(
+                and_(
+                    GraphEntity.entity_type == mapping.ontology_class_name,
+                    GraphEntity._display_name == node_name,
+                )
+            )
+        )
+        entity = ent_result.scalars().first()
+
+        if entity:
+            existing_props = dict(entity.properties) if entity.properties else {}
+            existing_props.update(properties)
+            if "id" in existing_props and "id" not in properties:
+                del existing_props["id"]
+            entity.properties = existing_props
+            entity._display_name = node_name
+            sync_log.records_updated += 1
+        else:
+            new_entity = GraphEntity(
+                _display_name=node_name,
+                entity_type=mapping.ontology_class_name,
+                source_id=None,
+                is_instance=True,
+                properties=properties,
+            )
+            self.db.add(new_entity)
+            sync_log.records_created += 1
+
+    # ==================== 外键暂存 ====================
+
+    async def _begin_foreign_key_capture(
+        self, mapping: EntityMapping, replace: bool = True
+    ) -> List[RelationshipMapping]:
+        """开始拉取源实体映射，返回需要记录外键的关系映射
+
+        全量拉取（replace=True）时先清空这些关系映射的外键暂存；
+        增量拉取只替换变更记录对应的暂存行，见 _stage_foreign_keys。
+        """
+        result = await self.db.execute(
+            select(RelationshipMapping).where(
+                RelationshipMapping.source_entity_mapping_id == mapping.id,
+                RelationshipMapping.sync_enabled == True,
+            )
+        )
+        fk_mappings = list(result.scalars().all())
+        if fk_mappings and replace:
+            await self.db.execute(
+                delete(SyncForeignKey).where(
+                    SyncForeignKey.relationship_mapping_id.in_(
+                        [rm.id for rm in fk_mappings]
                     )
-                    break
-
-                items = []
-                if isinstance(response, dict):
-                    if "items" in response and isinstance(response["items"], list):
-                        items = response["items"]
-                    else:
-                        for val in response.values():
-                            if isinstance(val, list):
-                                items = val
-                                break
-
-                    if "pagination" in response and isinstance(
-                        response["pagination"], dict
-                    ):
-                        total_pages = response["pagination"].get(
-                            "total_pages", total_pages
-                        )
+                )
+            )
+        self._captured_mapping_ids.add(mapping.id)
+        return fk_mappings
 
-                elif isinstance(response, list):
-                    items = response
-                    total_pages = 0
-
-                if not items:
-                    break
-
-                # b. 处理每个条目
-                for item in items:
-                    sync_log.records_processed += 1
-                    try:
-                        raw_id = item.get(mapping.id_field_mapping)
-                        node_name = item.get(mapping.name_field_mapping)
-                        if not node_name:
-                            node_name = f"{mapping.ontology_class_name}_{raw_id}"
-
-                        properties = {}
-                        raw_name = item.get(mapping.name_field_mapping)
-                        if raw_name is not None:
-                            properties[mapping.name_field_mapping] = raw_name
-
-                        for rel in mapping.target_relationship_mappings:
-                            if (
-                                rel.target_id_field not in properties
-                                and rel.target_id_field != mapping.id_field_mapping
-                                and rel.target_id_field != "id"
-                            ):
-                                val = item.get(rel.target_id_field)
-                                if val is not None:
-                                    properties[rel.target_id_field] = val
-
-                        for p_map in mapping.property_mappings:
-                            val = item.get(p_map.grpc_field)
-                            if p_map.transform_expression:
-                                try:
-                                    safe_dict = {
-                                        "value": val,
-                                        "item": item,
-                                        "parseNum": parse_num,
-                                        "toString": to_string,
-                                        "toDate": to_date,
-                                        "str": str,
-                                        "float": float,
-                                        "int": int,
-                                        "bool": bool,
-                                        "datetime": datetime,
-                                        "None": None,
-                                        "True": True,
-                                        "False": False,
-                                    }
-                                    val = safe_eval(
-                                        p_map.transform_expression,
-                                        safe_dict,
-                                    )
-                                except Exception as e:
-                                    logger.error(
-                                        f"Transform error for {p_map.ontology_property}: {e}"
-                                    )
-                            properties[p_map.ontology_property] = val
-
-                        # c. UPSERT GraphEntity
-                        lookup_cond = []
-                        if raw_id is not None:
-                            lookup_cond.append(GraphEntity.source_id == str(raw_id))
-                        else:
-                            lookup_cond.append(
-                                GraphEntity._display_name == str(node_name)
-                            )
+    async def _stage_foreign_keys(
+        self,
+        mapping: EntityMapping,
+        fk_mappings: List[RelationshipMapping],
+        items: List[Dict[str, Any]],
+        replace: bool = True,
+    ) -> None:
+        """记录一页源数据中关系映射所需的外键值"""
+        if not fk_mappings:
+            return
 
-                        ent_result = await self.db.execute(
-                            select(GraphEntity).where(
-                                and_(
-                                    GraphEntity.entity_type
-                                    == mapping.ontology_class_name,
-                                    *lookup_cond,
-                                )
-                            )
-                        )
-                        entity = ent_result.scalars().first()
+        rows = {}
+        source_keys = set()
+        for item in items:
+            source_raw_id = item.get(mapping.id_field_mapping)
+            if source_raw_id is None:
+                continue
+            source_keys.add(str(source_raw_id))
+            for rm in fk_mappings:
+                fk_val = item.get(rm.source_fk_field)
+                if fk_val is not None:
+                    key = (rm.id, str(source_raw_id), str(fk_val))
+                    rows[key] = {
+                        "relationship_mapping_id": rm.id,
+                        "source_key": key[1],
+                        "target_key": key[2],
+                    }
 
-                        if entity:
-                            existing_props = (
-                                dict(entity.properties) if entity.properties else {}
-                            )
-                            existing_props.update(properties)
-                            if "id" in existing_props and "id" not in properties:
-                                del existing_props["id"]
-                            entity.properties = existing_props
-                            entity._display_name = str(node_name)
-                            sync_log.records_updated += 1
-                        else:
-                            new_entity = GraphEntity(
-                                _display_name=str(node_name),
-                                entity_type=mapping.ontology_class_name,
-                                source_id=str(raw_id) if raw_id is not None else None,
-                                is_instance=True,
-                                properties=properties,
-                            )
-                            self.db.add(new_entity)
-                            sync_log.records_created += 1
+        if not replace and source_keys:
+            # 增量拉取：变更记录的外键可能已修改，先删除其旧暂存行
+            await self.db.execute(
+                delete(SyncForeignKey).where(
+                    SyncForeignKey.relationship_mapping_id.in_(
+                        [rm.id for rm in fk_mappings]
+                    ),
+                    SyncForeignKey.source_key.in_(source_keys),
+                )
+            )
+        if rows:
+            await self.db.execute(
+                SyncForeignKey.__table__.insert(), list(rows.values())
+            )
 
-                    except Exception as e:
-                        logger.error(f"Error processing item: {e}")
-                        sync_log.records_failed += 1
+    async def _capture_foreign_keys(
+        self,
+        client: DynamicGrpcClient,
+        product: DataProduct,
+        mapping: EntityMapping,
+    ) -> None:
+        """仅拉取外键：源实体映射在本次同步中未被拉取时使用"""
+        fk_mappings = await self._begin_foreign_key_capture(mapping)
+        pages = self._iter_source_batches(
+            client,
+            product,
+            mapping,
+            item_fields={mapping.id_field_mapping}
+            | {rm.source_fk_field for rm in fk_mappings},
+        )
+        async with aclosing(pages):
+            async for _, items in pages:
+                await self._stage_foreign_keys(mapping, fk_mappings, items)
+        await self.db.commit()
 
-                await self.db.commit()
-                current_page += 1
+    async def _resolve_relationship_mapping(
+        self, rm: RelationshipMapping
+    ) -> Dict[str, int]:
+        """基于外键暂存表集合式创建一个关系映射的所有关系"""
+        source_type = rm.source_entity_mapping.ontology_class_name
+        target_type = rm.target_entity_mapping.ontology_class_name
+        src = aliased(GraphEntity)
+        tgt = aliased(GraphEntity)
+        staged = SyncForeignKey.relationship_mapping_id == rm.id
+        src_match = and_(
+            src.entity_type == source_type, src.source_id == SyncForeignKey.source_key
+        )
+        tgt_match = and_(
+            tgt.entity_type == target_type, tgt.source_id == SyncForeignKey.target_key
+        )
+        empty_properties = literal_column(
+            "'{}'::jsonb" if self._is_postgres else "'{}'"
+        )
 
-        except Exception as e:
-            logger.error(f"Error syncing mapping {mapping.id}: {e}")
-            raise
+        edges = (
+            select(src.id, tgt.id, literal(rm.ontology_relationship), empty_properties)
+            .select_from(SyncForeignKey)
+            .join(src, src_match)
+            .join(tgt, tgt_match)
+            .where(staged)
+            .distinct()
+        )
+        insert = pg_insert if self._is_postgres else sqlite_insert
+        stmt = (
+            insert(GraphRelationship)
+            .from_select(
+                ["source_id", "target_id", "relationship_type", "properties"], edges
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    GraphRelationship.source_id,
+                    GraphRelationship.target_id,
+                    GraphRelationship.relationship_type,
+                ]
+            )
+            .returning(GraphRelationship.id)
+        )
+        missing = (
+            select(
+                func.count().filter(src.id.is_(None)),
+                func.count().filter(tgt.id.is_(None)),
+            )
+            .select_from(SyncForeignKey)
+            .outerjoin(src, src_match)
+            .outerjoin(tgt, tgt_match)
+            .where(staged)
+        )
+
+        # 使用 SAVEPOINT，失败时只回滚当前关系映射
+        async with self.db.begin_nested():
+            created = len((await self.db.execute(stmt)).all())
+            source_missing, target_missing = (await self.db.execute(missing)).one()
+        await self.db.commit()
+
+        if source_missing or target_missing:
+            logger.warning(
+                f"[{rm.ontology_relationship}] Unresolved foreign keys: "
+                f"missing source ({source_type}): {source_missing}, "
+                f"missing target ({target_type}): {target_missing}"
+            )
+        return {
+            "created": created,
+            "source_missing": source_missing,
+            "target_missing": target_missing,
+        }
 
     async def _sync_relationships(
         self, client: DynamicGrpcClient, product: DataProduct
     ) -> Dict[str, int]:
-        """根据外键同步实体间的关系"""
+        """根据外键同步实体间的关系
+
+        外键值来自实体同步时的暂存表；源实体映射在本次同步中未被拉取时
+        （例如跨数据产品的关系），每个源实体映射只补拉一次外键。
+        """
         stats = {"created": 0, "failed": 0, "source_missing": 0, "target_missing": 0}
-        id_cache: Dict[Tuple[str, str], int] = (
-            {}
-        )  # (entity_type, source_id) -> graph_id
 
         # 加载所有涉及到该数据产品的关系映射 (无论该产品是源还是目标)
         mappings_ids = [m.id for m in product.entity_mappings]
         if not mappings_ids:
             return stats
 
-        from sqlalchemy import or_
-        from app.models.data_product import EntityMapping
-
         result = await self.db.execute(
             select(RelationshipMapping)
             .options(
@@ -534,203 +1099,56 @@ class SyncService:
                     EntityMapping.data_product
                 )
             )
-            .options(
-                selectinload(RelationshipMapping.target_entity_mapping).selectinload(
-                    EntityMapping.data_product
-                )
-            )
+            .options(selectinload(RelationshipMapping.target_entity_mapping))
             .where(
                 or_(
                     RelationshipMapping.source_entity_mapping_id.in_(mappings_ids),
                     RelationshipMapping.target_entity_mapping_id.in_(mappings_ids),
                 )
             )
+            .where(RelationshipMapping.sync_enabled == True)
         )
         rel_mappings = result.scalars().all()
 
+        # 补拉未暂存外键的源实体映射
         for rm in rel_mappings:
-            if not rm.sync_enabled:
+            source_mapping = rm.source_entity_mapping
+            if source_mapping.id in self._captured_mapping_ids or not (
+                source_mapping.list_method or source_mapping.export_method
+            ):
                 continue
 
-            # 为了获取外键信息，我们需要再次拉取源数据
             # 如果当前产品跨越了不同的数据产品，必须使用源产品的 host/port
-            source_mapping = rm.source_entity_mapping
-            target_mapping = rm.target_entity_mapping
             source_product = source_mapping.data_product
-
-            total_pages = 1
-            current_page = 1
-            page_size = 100
-
-            # 决定使用哪个客户端：如果源产品就是当前产品，可以直接用 client；否则需要新建 client
-            if source_product.id == product.id:
-                src_client = client
-                is_own_client = True
-            else:
-                src_client = DynamicGrpcClient(
-                    source_product.grpc_host, source_product.grpc_port
-                )
-                await src_client.connect()
-                is_own_client = False
-
             try:
-                while current_page <= total_pages:
-                    try:
-                        request_payload = {
-                            "pagination": {
-                                "page": current_page,
-                                "page_size": page_size,
-                            }
-                        }
-                        response = await src_client.call_method(
-                            source_product.service_name,
-                            source_mapping.list_method,
-                            request_payload,
-                        )
-
-                        items = []
-                        if isinstance(response, dict):
-                            if "items" in response and isinstance(
-                                response["items"], list
-                            ):
-                                items = response["items"]
-                            else:
-                                for val in response.values():
-                                    if isinstance(val, list):
-                                        items = val
-                                        break
-
-                            if "pagination" in response and isinstance(
-                                response["pagination"], dict
-                            ):
-                                total_pages = response["pagination"].get(
-                                    "total_pages", total_pages
-                                )
-
-                        elif isinstance(response, list):
-                            items = response
-                            total_pages = 0
-
-                        if not items:
-                            break
-
-                        for item in items:
-                            fk_val = item.get(rm.source_fk_field)
-                            source_raw_id = item.get(source_mapping.id_field_mapping)
-
-                            if fk_val is None or source_raw_id is None:
-                                continue
-
-                            # 查找源节点 ID (优先从缓存读取)
-                            source_cache_key = (
-                                source_mapping.ontology_class_name,
-                                str(source_raw_id),
-                            )
-                            if source_cache_key in id_cache:
-                                source_id = id_cache[source_cache_key]
-                            else:
-                                source_ent_res = await self.db.execute(
-                                    select(GraphEntity.id)
-                                    .where(
-                                        and_(
-                                            GraphEntity.entity_type
-                                            == source_mapping.ontology_class_name,
-                                            GraphEntity.source_id == str(source_raw_id),
-                                        )
-                                    )
-                                    .limit(1)
-                                )
-                                source_id = source_ent_res.scalars().first()
-                                if source_id:
-                                    id_cache[source_cache_key] = source_id
-
-                            # 查找目标节点 ID (优先从缓存读取)
-                            target_cache_key = (
-                                target_mapping.ontology_class_name,
-                                str(fk_val),
-                            )
-                            if target_cache_key in id_cache:
-                                target_id = id_cache[target_cache_key]
-                            else:
-                                target_ent_res = await self.db.execute(
-                                    select(GraphEntity.id)
-                                    .where(
-                                        and_(
-                                            GraphEntity.entity_type
-                                            == target_mapping.ontology_class_name,
-                                            GraphEntity.source_id == str(fk_val),
-                                        )
-                                    )
-                                    .limit(1)
-                                )
-                                target_id = target_ent_res.scalars().first()
-                                if target_id:
-                                    id_cache[target_cache_key] = target_id
-
-                            if source_id and target_id:
-                                # 插入或更新关系
-                                rel_check = await self.db.execute(
-                                    select(GraphRelationship).where(
-                                        and_(
-                                            GraphRelationship.source_id == source_id,
-                                            GraphRelationship.target_id == target_id,
-                                            GraphRelationship.relationship_type
-                                            == rm.ontology_relationship,
-                                        )
-                                    )
-                                )
-                                if not rel_check.scalars().first():
-                                    new_rel = GraphRelationship(
-                                        source_id=source_id,
-                                        target_id=target_id,
-                                        relationship_type=rm.ontology_relationship,
-                                    )
-                                    self.db.add(new_rel)
-                                    stats["created"] += 1
-                            else:
-                                # Optimized logging: only log the first 5 missing entities per relationship type
-                                if not source_id:
-                                    stats["source_missing"] += 1
-                                    if stats["source_missing"] <= 5:
-                                        logger.warning(
-                                            f"[{rm.ontology_relationship}] Source entity not found: "
-                                            f"class={source_mapping.ontology_class_name}, raw_id={source_raw_id}"
-                                        )
-                                    elif stats["source_missing"] == 6:
-                                        logger.warning(
-                                            f"[{rm.ontology_relationship}] Further source missing warnings suppressed..."
-                                        )
-
-                                if not target_id:
-                                    stats["target_missing"] += 1
-                                    if stats["target_missing"] <= 5:
-                                        logger.warning(
-                                            f"[{rm.ontology_relationship}] Target entity not found: "
-                                            f"class={target_mapping.ontology_class_name}, fk_val={fk_val}"
-                                        )
-                                    elif stats["target_missing"] == 6:
-                                        logger.warning(
-                                            f"[{rm.ontology_relationship}] Further target missing warnings suppressed..."
-                                        )
-
-                        await self.db.commit()
-                        current_page += 1
-
-                    except Exception as e:
-                        logger.error(
-                            f"Error syncing relationship {rm.ontology_relationship} page {current_page}: {e}"
+                if source_product.id == product.id:
+                    await self._capture_foreign_keys(
+                        client, source_product, source_mapping
+                    )
+                else:
+                    async with borrow_client(
+                        source_product.grpc_host, source_product.grpc_port
+                    ) as src_client:
+                        await self._capture_foreign_keys(
+                            src_client, source_product, source_mapping
                         )
-                        stats["failed"] += 1
-                        break  # Break on error to avoid infinite loops
+            except Exception as e:
+                logger.error(
+                    f"Error fetching foreign keys for mapping {source_mapping.id}: {e}"
+                )
+                stats["failed"] += 1
 
-                if stats["source_missing"] > 5 or stats["target_missing"] > 5:
-                    logger.info(
-                        f"Relationship {rm.ontology_relationship} sync summary: "
-                        f"Created: {stats['created']}, Missing Source: {stats['source_missing']}, Missing Target: {stats['target_missing']}"
-                    )
-            finally:
-                if not is_own_client:
-                    await src_client.close()
+        for rm in rel_mappings:
+            try:
+                rm_stats = await self._resolve_relationship_mapping(rm)
+            except Exception as e:
+                logger.error(
+                    f"Error syncing relationship {rm.ontology_relationship}: {e}"
+                )
+                stats["failed"] += 1
+                continue
+            for key, value in rm_stats.items():
+                stats[key] += value
 
         return stats
 
@@ -847,7 +1265,7 @@ class SyncService:
                 full_product = prod_result.scalar_one_or_none()
 
                 if full_product:
-                    async with DynamicGrpcClient(
+                    async with borrow_client(
                         full_product.grpc_host, full_product.grpc_port
                     ) as client:
                         rel_stats = await self._sync_relationships(client, full_product)
@@ -313,9 +313,12 @@ class TaskExecutor:
         """
         async with session_factory() as session:
             sync_service = SyncService(session)
+            # Scheduled syncs pull only changed rows; each mapping still gets a
+            # periodic full reconcile (see EntityMapping.full_sync_interval_hours)
             result = await sync_service.sync_data_product(
                 product_id=task.target_id,
                 sync_relationships=True,
+                incremental=True,
             )
 
             logger.info(
@@ -346,6 +349,7 @@ class TaskExecutor:
             sync_service = SyncService(session)
             result = await sync_service.sync_entity_mapping(
                 mapping_id=task.target_id,
+                incremental=True,
             )
 
             logger.info(
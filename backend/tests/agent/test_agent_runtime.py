@@ -0,0 +1,152 @@
+"""Tests for the app-scoped agent runtime."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.rule_engine.models import GraphViewEvent
+from app.services.agent import EnhancedAgentService
+from app.services.agent.runtime import AgentRuntime
+
+
+@pytest.fixture
+def llm_config():
+    return {
+        "api_key": "test-key",
+        "base_url": "https://api.test.com",
+        "model": "gpt-4",
+    }
+
+
+class FakeMCPRegistry:
+    """MCPToolRegistry stand-in serving a configurable tool list."""
+
+    tool_names: list[str] = []
+    server_url = "http://mcp.test/sse"
+    initialized = 0
+
+    def __init__(self, session_provider):
+        self._tools = []
+        self.servers = []
+
+    async def initialize(self):
+        FakeMCPRegistry.initialized += 1
+        self.servers = [(1, "weather", FakeMCPRegistry.server_url)]
+        self._tools = []
+        for name in FakeMCPRegistry.tool_names:
+            tool = MagicMock(description=name, args_schema=None)
+            tool.name = name
+            self._tools.append(tool)
+
+    @property
+    def tools(self):
+        return self._tools
+
+
+@pytest.fixture
+def graph_factory():
+    FakeMCPRegistry.tool_names = ["mcp_weather_forecast"]
+    FakeMCPRegistry.server_url = "http://mcp.test/sse"
+    FakeMCPRegistry.initialized = 0
+    with (
+        patch("app.services.agent.runtime.MCPToolRegistry", FakeMCPRegistry),
+        patch("app.services.agent.agent_service.QueryToolRegistry"),
+        patch("app.services.agent.agent_service.create_agent_graph") as create,
+    ):
+        create.side_effect = lambda **kwargs: MagicMock()
+        yield create
+
+
+@pytest.mark.asyncio
+async def test_agent_graph_is_compiled_once(graph_factory, llm_config):
+    runtime = AgentRuntime(session_factory=MagicMock())
+
+    agents = await asyncio.gather(*(runtime.get_agent(llm_config) for _ in range(5)))
+
+    assert all(agent is agents[0] for agent in agents)
+    assert graph_factory.call_count == 1
+    assert FakeMCPRegistry.initialized == 1
+    tools = graph_factory.call_args.kwargs["action_tools"]
+    assert [tool.name for tool in tools] == ["mcp_weather_forecast"]
+
+    # A new LLM configuration builds a new agent
+    other = await runtime.get_agent({**llm_config, "model": "gpt-4o"})
+    assert other is not agents[0]
+    assert graph_factory.call_count == 2
+    assert runtime.metrics()["agents_built"] == 2
+
+
+@pytest.mark.asyncio
+async def test_mcp_refresh_rebuilds_only_on_tool_changes(graph_factory, llm_config):
+    runtime = AgentRuntime(session_factory=MagicMock())
+    agent = await runtime.get_agent(llm_config)
+
+    assert await runtime.refresh_mcp_tools() is False
+    assert await runtime.get_agent(llm_config) is agent
+
+    FakeMCPRegistry.tool_names = ["mcp_weather_forecast", "mcp_weather_alerts"]
+    runtime.invalidate_mcp()
+    await asyncio.gather(*runtime._pending_refreshes)
+
+    rebuilt = await runtime.get_agent(llm_config)
+    assert rebuilt is not agent
+    assert len(graph_factory.call_args.kwargs["action_tools"]) == 2
+    # Chats still running on the old agent keep their tool set
+    assert len(agent.mcp_registry.tools) == 1
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_url_change_rebuilds_with_same_tools(graph_factory, llm_config):
+    runtime = AgentRuntime(session_factory=MagicMock())
+    agent = await runtime.get_agent(llm_config)
+    old_registry = runtime.mcp_registry
+
+    # Same tools, but their coroutines must call the new URL
+    FakeMCPRegistry.server_url = "http://mcp-new.test/sse"
+    assert await runtime.refresh_mcp_tools() is True
+
+    assert runtime.mcp_registry is not old_registry
+    assert await runtime.get_agent(llm_config) is not agent
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_loads_tools_before_first_chat(
+    graph_factory, llm_config
+):
+    runtime = AgentRuntime(session_factory=MagicMock(), mcp_refresh_interval=0)
+    await runtime.start()
+    await asyncio.sleep(0)
+    await runtime.get_agent(llm_config)
+    await runtime.close()
+
+    assert FakeMCPRegistry.initialized == 1
+    assert runtime.metrics()["mcp_tools"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_chats_receive_only_their_graph_events(llm_config):
+    with (
+        patch("app.services.agent.agent_service.QueryToolRegistry"),
+        patch("app.services.agent.agent_service.create_agent_graph") as create,
+    ):
+        graph = MagicMock()
+        create.return_value = graph
+        agent = EnhancedAgentService(llm_config=llm_config, mcp_registry=MagicMock())
+
+        async def astream_events(state, version):
+            query = state["messages"][-1].content
+            agent.event_emitter.emit(GraphViewEvent(nodes=[{"id": query}]))
+            await asyncio.sleep(0.01)
+            yield {"event": "on_chain_stream", "data": {}}
+
+        graph.astream_events = astream_events
+
+        async def chat(query):
+            events = [event async for event in agent.astream_chat(query)]
+            return [e["nodes"] for e in events if e["type"] == "graph_data"]
+
+        first, second = await asyncio.gather(chat("PO_1"), chat("PO_2"))
+
+    assert first == [[{"id": "PO_1"}]]
+    assert second == [[{"id": "PO_2"}]]
@@ -2,6 +2,8 @@
 
 import pytest
 import asyncio
+import json
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.batch_executor import (
@@ -10,6 +12,7 @@ from app.services.batch_executor import (
     BatchExecutionConfig,
     BatchExecutionResult,
 )
+from app.rule_engine.action_executor import ExecutionResult
 
 
 @pytest.fixture
@@ -272,3 +275,362 @@ class TestBatchActionExecutor:
         )
 
         assert isinstance(executor, StreamingBatchExecutor)
+
+
+class FakeRows:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return MagicMock(all=lambda: self.rows)
+
+
+class FakeSession:
+    """Serves entity rows and records statements, logs and commits."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+        self.added = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        self.executed.append((str(statement), params))
+        if str(statement).lstrip().startswith("SELECT"):
+            ids = set(params["ids"])
+            return FakeRows([row for row in self.rows if row["id"] in ids])
+        return FakeRows([])
+
+    def add_all(self, objects):
+        self.added.extend(objects)
+
+    async def commit(self):
+        self.commits += 1
+
+
+class TestBatchNativeExecution:
+    """Test chunked batch-native execution."""
+
+    ACTION = """
+    ACTION PurchaseOrder.submit(note: string) {
+        PRECONDITION draft: this.status == "Draft" ON_FAILURE: "Only draft orders"
+        PRECONDITION: this.amount > note ON_FAILURE: "Amount too small"
+        EFFECT {
+            SET this.status = "Submitted";
+            SET this.note = note;
+        }
+    }
+    """
+
+    def _executor(self, rows, action_dsl=ACTION):
+        from app.rule_engine.action_executor import ActionExecutor
+        from app.rule_engine.action_registry import ActionRegistry
+        from app.rule_engine.parser import RuleParser
+
+        registry = ActionRegistry()
+        for action in RuleParser().parse(action_dsl):
+            registry.register(action)
+        sessions = []
+
+        @asynccontextmanager
+        async def get_session():
+            session = FakeSession(rows)
+            sessions.append(session)
+            yield session
+
+        executor = StreamingBatchExecutor(
+            action_executor=ActionExecutor(registry),
+            get_session_func=get_session,
+        )
+        return executor, sessions
+
+    @staticmethod
+    def _rows(count, failing=()):
+        # check0 is the SQL outcome of the translatable "draft" precondition
+        return [
+            {
+                "id": i,
+                "name": f"PO-{i}",
+                "properties": {"status": "Draft", "amount": 100 + i},
+                "check0": i not in failing,
+            }
+            for i in range(1, count + 1)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chunks_share_one_query_update_and_commit(self):
+        executor, sessions = self._executor(self._rows(5, failing={2}))
+        executions = [
+            {
+                "entity_type": "PurchaseOrder",
+                "action_name": "submit",
+                "entity_id": str(i),
+                "params": {"note": 102},
+            }
+            for i in range(1, 7)
+        ]
+
+        result = await executor.execute_batch(
+            executions, config=BatchExecutionConfig(batch_native=True, chunk_size=3)
+        )
+
+        assert result.total == 6
+        assert sorted(s["entity_id"] for s in result.successes) == ["3", "4", "5"]
+        failures = {f["entity_id"]: f["error"] for f in result.failures}
+        assert failures == {
+            "1": "Amount too small",
+            "2": "Only draft orders",
+            "6": "Entity '6' not found (type: PurchaseOrder)",
+        }
+
+        # Two chunks: one SELECT, one batched UPDATE and one commit each
+        assert len(sessions) == 2
+        for session in sessions:
+            select_sql, select_params = session.executed[0]
+            assert "this.id = ANY(:ids)" in select_sql
+            assert "FOR UPDATE OF this" in select_sql
+            assert " AS check0" in select_sql and " AS check1" not in select_sql
+            assert len(session.executed) == 2
+            assert session.commits == 1
+        assert sessions[0].executed[0][1]["ids"] == [1, 2, 3]
+        patches = [p["patch"] for p in sessions[1].executed[1][1]]
+        assert len(patches) == 2
+        assert sum(len(s.added) for s in sessions) == 5
+
+    @pytest.mark.asyncio
+    async def test_events_and_logs_are_published_after_commit(self):
+        from app.rule_engine.event_emitter import GraphEventEmitter
+
+        executor, sessions = self._executor(self._rows(3))
+        emitter = GraphEventEmitter()
+        commits_at_emit = []
+        emitter.subscribe(lambda event: commits_at_emit.append(sessions[-1].commits))
+        recorded = []
+        executor.action_executor.event_emitter = emitter
+        executor.action_executor.log_writer = MagicMock(
+            record=lambda **fields: recorded.append(sessions[-1].commits)
+        )
+        executions = [
+            {
+                "entity_type": "PurchaseOrder",
+                "action_name": "submit",
+                "entity_id": str(i),
+                "params": {"note": 0},
+            }
+            for i in (1, 2)
+        ]
+
+        await executor.execute_batch(
+            executions, config=BatchExecutionConfig(batch_native=True)
+        )
+
+        # Two properties changed on each entity
+        assert commits_at_emit == [1, 1, 1, 1]
+        assert recorded == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_evaluation_errors_are_logged(self):
+        executor, sessions = self._executor(self._rows(2))
+        recorded = []
+        executor.action_executor.log_writer = MagicMock(
+            record=lambda **fields: recorded.append(fields)
+        )
+        evaluate = executor.action_executor.evaluate_action
+
+        async def evaluate_action(action, context, checks=None):
+            if context.entity["id"] == "2":
+                raise ValueError("bad expression")
+            return await evaluate(action, context, checks)
+
+        executor.action_executor.evaluate_action = evaluate_action
+        executions = [
+            {
+                "entity_type": "PurchaseOrder",
+                "action_name": "submit",
+                "entity_id": str(i),
+                "params": {"note": 0},
+            }
+            for i in (1, 2)
+        ]
+
+        result = await executor.execute_batch(
+            executions, config=BatchExecutionConfig(batch_native=True)
+        )
+
+        assert result.failed == 1
+        assert [(log["entity_id"], log["success"]) for log in recorded] == [
+            ("1", True),
+            ("2", False),
+        ]
+        assert recorded[1]["detail"] == {"error": "bad expression"}
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_publishes_nothing(self):
+        from app.rule_engine.event_emitter import GraphEventEmitter
+
+        executor, sessions = self._executor(self._rows(2))
+        emitted = []
+        emitter = GraphEventEmitter()
+        emitter.subscribe(emitted.append)
+        executor.action_executor.event_emitter = emitter
+        executor.action_executor.log_writer = MagicMock()
+
+        async def failing_commit():
+            raise RuntimeError("commit failed")
+
+        original = executor.get_session_func
+
+        @asynccontextmanager
+        async def get_session():
+            async with original() as session:
+                session.commit = failing_commit
+                yield session
+
+        executor.get_session_func = get_session
+        executions = [
+            {
+                "entity_type": "PurchaseOrder",
+                "action_name": "submit",
+                "entity_id": "1",
+                "params": {"note": 0},
+            }
+        ]
+
+        result = await executor.execute_batch(
+            executions, config=BatchExecutionConfig(batch_native=True)
+        )
+
+        assert result.failed == 1
+        assert emitted == []
+        executor.action_executor.log_writer.record.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_call_statements_use_per_entity_path(self):
+        dsl = """
+        ACTION PurchaseOrder.sync {
+            PRECONDITION: true ON_FAILURE: "Error"
+            EFFECT {
+                CALL OrderService.Sync({id: this.id});
+            }
+        }
+        """
+        executor, sessions = self._executor(self._rows(2), action_dsl=dsl)
+        executor._execute_single_action = AsyncMock(
+            return_value=ExecutionResult(success=True, changes={})
+        )
+
+        executions = [
+            {"entity_type": "PurchaseOrder", "action_name": "sync", "entity_id": "1"},
+            {"entity_type": "PurchaseOrder", "action_name": "sync", "entity_id": "2"},
+        ]
+        result = await executor.execute_batch(
+            executions, config=BatchExecutionConfig(batch_native=True)
+        )
+
+        assert result.succeeded == 2
+        assert executor._execute_single_action.await_count == 2
+        assert sessions == []
+
+
+class TestWindowedScheduling:
+    """Test lazy scheduling, progress coalescing and result spilling."""
+
+    @staticmethod
+    def _executor(mock_action_executor):
+        executor = StreamingBatchExecutor(
+            action_executor=mock_action_executor,
+            get_session_func=None,
+        )
+        # Entity loading and sessions are covered elsewhere
+        async def execute_single(execution, **kwargs):
+            return await mock_action_executor.execute(
+                execution["entity_type"],
+                execution["action_name"],
+                MagicMock(entity={"id": execution["entity_id"]}),
+            )
+
+        executor._execute_single_action = AsyncMock(side_effect=execute_single)
+        return executor
+
+    @staticmethod
+    def _execution(entity_id):
+        return {
+            "entity_type": "PurchaseOrder",
+            "action_name": "submit",
+            "entity_id": entity_id,
+        }
+
+    @pytest.mark.asyncio
+    async def test_executions_are_pulled_lazily(self, mock_action_executor):
+        executor = self._executor(mock_action_executor)
+        pulled = 0
+        max_ahead = 0
+
+        async def executions():
+            nonlocal pulled, max_ahead
+            for i in range(50):
+                pulled += 1
+                completed = executor._execute_single_action.await_count
+                max_ahead = max(max_ahead, pulled - completed)
+                yield self._execution(f"PO_{i:03d}")
+
+        result = await executor.execute_batch(
+            executions(), config=BatchExecutionConfig(max_concurrent=4)
+        )
+
+        assert result.total == 50
+        assert result.succeeded == 50
+        assert max_ahead <= 4 + 1
+
+    @pytest.mark.asyncio
+    async def test_progress_updates_are_coalesced(self, mock_action_executor):
+        executor = self._executor(mock_action_executor)
+        updates = []
+
+        async def progress_callback(update):
+            updates.append(update)
+
+        executions = [self._execution(f"PO_{i:03d}") for i in range(11)]
+        executions.append(self._execution("PO_fail_001"))
+        await executor.execute_batch(
+            executions,
+            config=BatchExecutionConfig(max_concurrent=1, progress_every=5),
+            progress_callback=progress_callback,
+        )
+
+        assert [u["completed"] for u in updates] == [5, 10, 12]
+        assert updates[-1] == {
+            "type": "batch_progress",
+            "completed": 12,
+            "total": 12,
+            "succeeded": 11,
+            "failed": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_results_are_bounded_and_spilled(
+        self, mock_action_executor, tmp_path
+    ):
+        executor = self._executor(mock_action_executor)
+        path = tmp_path / "results.ndjson"
+
+        executions = [self._execution(f"PO_{i:03d}") for i in range(5)]
+        executions += [self._execution(f"PO_fail_{i}") for i in range(3)]
+        result = await executor.execute_batch(
+            executions,
+            config=BatchExecutionConfig(
+                max_results_in_memory=2, results_path=str(path)
+            ),
+        )
+
+        assert (result.succeeded, result.failed) == (5, 3)
+        assert len(result.successes) == 2
+        assert len(result.failures) == 2
+        assert result.results_path == str(path)
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(lines) == 8
+        assert sum(line["success"] for line in lines) == 5
+        assert {"entity_id": "PO_fail_0", "error": "Simulated failure"}.items() <= {
+            line["entity_id"]: line for line in lines
+        }["PO_fail_0"].items()
@@ -42,14 +42,17 @@ def mock_graph_tools():
     tools.get_instances_by_class = AsyncMock(
         return_value=[{"name": "PO_001", "properties": {"status": "pending"}}]
     )
-    tools.get_instance_neighbors = AsyncMock(
-        return_value=[
-            {
-                "name": "Supplier_001",
-                "labels": ["Supplier"],
-                "properties": {"name": "Acme"},
-            }
-        ]
+    tools.get_instance_neighborhood = AsyncMock(
+        return_value={
+            "neighbors": [
+                {
+                    "name": "Supplier_001",
+                    "labels": ["Supplier"],
+                    "properties": {"name": "Acme"},
+                }
+            ],
+            "truncated": False,
+        }
     )
     tools.find_path_between_instances = AsyncMock(
         return_value={
@@ -173,7 +176,7 @@ class TestCreateQueryTools:
             result = await tool.coroutine(instance_name="PO_001")
 
             assert "Supplier_001" in result
-            mock_graph_tools.get_instance_neighbors.assert_called_once_with(
+            mock_graph_tools.get_instance_neighborhood.assert_called_once_with(
                 hops=1,
                 direction="both",
                 entity_type=None,
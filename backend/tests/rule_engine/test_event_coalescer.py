@@ -0,0 +1,141 @@
+"""Tests for coalescing of update event bursts."""
+
+import asyncio
+
+import pytest
+
+from app.rule_engine.event_coalescer import EventCoalescer
+from app.rule_engine.models import (
+    ForClause,
+    RuleDef,
+    Trigger,
+    TriggerType,
+    UpdateEvent,
+)
+from app.rule_engine.rule_engine import RuleEngine
+from app.rule_engine.rule_registry import RuleRegistry
+
+
+def _event(entity_id, prop, old, new, actor="sync"):
+    return UpdateEvent(
+        entity_type="Supplier",
+        entity_id=entity_id,
+        property=prop,
+        old_value=old,
+        new_value=new,
+        actor_name=actor,
+    )
+
+
+def _rule(name, priority, property=None):
+    return RuleDef(
+        name=name,
+        priority=priority,
+        trigger=Trigger(
+            type=TriggerType.UPDATE, entity_type="Supplier", property=property
+        ),
+        body=ForClause(
+            variable="s", entity_type="Supplier", condition=None, statements=[]
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_burst_is_merged_per_entity():
+    dispatched = []
+    coalescer = EventCoalescer(dispatched.append, window=0.01)
+
+    coalescer.submit(_event("1", "status", "Active", "Review"))
+    coalescer.submit(_event("1", "rating", 3, 4))
+    coalescer.submit(_event(2, "status", "Active", "Expired"))
+    coalescer.submit(_event(1, "status", "Review", "Expired", actor="admin"))
+    assert dispatched == []
+    assert coalescer.pending == 2
+
+    await asyncio.sleep(0.03)
+
+    assert len(dispatched) == 2
+    merged = dispatched[0]
+    assert merged.entity_id == "1"
+    assert merged.changes == {"status": ("Active", "Expired"), "rating": (3, 4)}
+    assert (merged.property, merged.old_value, merged.new_value) == (
+        "status",
+        "Active",
+        "Expired",
+    )
+    assert merged.actor_name == "admin"
+    assert dispatched[1].changes == {"status": ("Active", "Expired")}
+
+    metrics = coalescer.metrics()
+    assert metrics["events_received"] == 4
+    assert metrics["events_dispatched"] == 2
+    assert metrics["rule_executions_saved"] == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_dispatches_open_windows():
+    dispatched = []
+    coalescer = EventCoalescer(dispatched.append, window=60)
+
+    coalescer.submit(_event("1", "status", "Active", "Review"))
+    coalescer.submit(_event("1", "status", "Review", "Expired"))
+    coalescer.flush()
+
+    assert [e.changes for e in dispatched] == [{"status": ("Active", "Expired")}]
+    assert coalescer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_open_windows_are_bounded():
+    dispatched = []
+    coalescer = EventCoalescer(dispatched.append, window=60, max_pending=2)
+
+    for entity_id in ("1", "2", "3"):
+        coalescer.submit(_event(entity_id, "status", "Active", "Review"))
+    # Events of entities that still have an open window keep merging
+    coalescer.submit(_event("3", "status", "Review", "Expired"))
+
+    # The oldest window was dispatched early to make room for entity 3
+    assert [e.entity_id for e in dispatched] == ["1"]
+    assert coalescer.pending == 2
+    coalescer.flush()
+    assert [e.entity_id for e in dispatched] == ["1", "2", "3"]
+    assert dispatched[2].changes == {"status": ("Active", "Expired")}
+
+
+def test_zero_window_passes_events_through():
+    dispatched = []
+    coalescer = EventCoalescer(dispatched.append, window=0)
+    event = _event("1", "status", "Active", "Review")
+
+    coalescer.submit(event)
+
+    assert dispatched == [event]
+    assert coalescer.metrics()["rule_executions_saved"] == 0
+
+
+@pytest.mark.asyncio
+async def test_merged_event_runs_each_rule_once():
+    registry = RuleRegistry()
+    registry.register(_rule("any", 10))
+    registry.register(_rule("status", 50, property="status"))
+    registry.register(_rule("rating", 70, property="rating"))
+    engine = RuleEngine(action_registry=None, registry=registry, coalesce_window=60)
+    handled = []
+
+    async def handle(event):
+        handled.append([rule.name for rule in engine._match_rules(event)])
+
+    engine.worker_pool.handler = handle
+
+    engine.on_event(_event("1", "status", "Active", "Review"))
+    engine.on_event(_event("1", "rating", 3, 4))
+    engine.on_event(_event("1", "status", "Review", "Expired"))
+    await engine.flush()
+
+    assert handled == [["rating", "status", "any"]]
+    metrics = engine.metrics()
+    # 2 + 2 + 2 executions requested, 3 dispatched
+    assert metrics["rule_executions_saved"] == 3
+    assert metrics["processed"] == 1
+    await engine.shutdown()
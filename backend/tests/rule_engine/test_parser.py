@@ -1,7 +1,7 @@
 """Tests for DSL parser."""
 
 import pytest
-from app.rule_engine.parser import RuleParser
+from app.rule_engine.parser import RuleParser, clear_ast_cache
 from app.rule_engine.models import ForClause
 
 
@@ -154,3 +154,30 @@ def test_parse_action_with_return():
     ret_stmt = statements[1]
     assert ret_stmt.__class__.__name__ == "ReturnStatement"
     assert ret_stmt.value == ("id", "my_data")
+
+
+def test_parsers_share_grammar_and_cache_asts():
+    """Test that the grammar is compiled once and unchanged DSL is not re-parsed."""
+    dsl_text = """
+    RULE CachedRule PRIORITY 5 {
+        ON UPDATE(Supplier.status)
+        FOR (s: Supplier) {
+            SET s.checked = true;
+        }
+    }
+    """
+    clear_ast_cache()
+    first = RuleParser()
+    second = RuleParser()
+    assert first.lark is second.lark
+
+    rules = first.parse(dsl_text)
+    cached = second.parse(dsl_text)
+    assert cached[0] is rules[0]
+    # Callers get their own list
+    cached.append("extra")
+    assert len(first.parse(dsl_text)) == 1
+
+    changed = first.parse(dsl_text.replace("PRIORITY 5", "PRIORITY 6"))
+    assert changed[0] is not rules[0]
+    assert changed[0].priority == 6
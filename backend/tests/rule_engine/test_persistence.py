@@ -0,0 +1,173 @@
+"""Tests for single-statement property persistence."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.rule_engine.action_executor import ActionExecutor
+from app.rule_engine.action_registry import ActionRegistry
+from app.rule_engine.context import EvaluationContext
+from app.rule_engine.event_emitter import GraphEventEmitter
+from app.rule_engine.parser import RuleParser
+from app.rule_engine.persistence import ConcurrentUpdateError, PersistenceService
+from app.services.pg_graph_storage import PGGraphStorage
+
+
+class FakeResult:
+    def __init__(self, row=None):
+        self.row = row
+
+    def mappings(self):
+        return SimpleNamespace(first=lambda: self.row)
+
+
+class FakeSession:
+    """Answers the patch UPDATE with a RETURNING row."""
+
+    def __init__(self, row=None, exists=True):
+        self.row = row
+        self.exists = exists
+        self.executed = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        self.executed.append((str(statement), params))
+        return FakeResult(self.row)
+
+    async def scalar(self, statement):
+        return 1 if self.exists else None
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _row(old_values, properties=None):
+    return {
+        "old_values": old_values,
+        "old_display_name": "PO-1",
+        "updated_at": "2026-01-01 00:00:01",
+        "properties": properties,
+    }
+
+
+@pytest.mark.asyncio
+async def test_patch_is_one_statement_returning_old_values():
+    session = FakeSession(_row({"status": "Draft", "note": None}))
+
+    result = await PersistenceService.patch_properties(
+        session, "PurchaseOrder", "7", {"status": "Submitted", "note": "x"}
+    )
+
+    assert len(session.executed) == 1
+    sql, params = session.executed[0]
+    assert "|| CAST(:patch AS jsonb)" in sql
+    assert "FOR UPDATE" in sql
+    assert "RETURNING" in sql
+    assert "updated_at = :expected_updated_at" not in sql
+    assert params["numeric_id"] == 7
+    assert json.loads(params["patch"]) == {"status": "Submitted", "note": "x"}
+    assert result.old_values == {"status": "Draft", "note": None}
+    assert result.updated_at == "2026-01-01 00:00:01"
+
+
+@pytest.mark.asyncio
+async def test_compare_and_set_guard():
+    session = FakeSession(row=None)
+
+    result = await PersistenceService.patch_properties(
+        session,
+        "PurchaseOrder",
+        7,
+        {"status": "Submitted"},
+        expected_updated_at="2026-01-01 00:00:00",
+    )
+
+    sql, params = session.executed[0]
+    assert "AND updated_at = :expected_updated_at" in sql
+    assert params["expected_updated_at"] == "2026-01-01 00:00:00"
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_storage_update_uses_returned_old_values():
+    session = FakeSession(_row({"status": "Draft"}, {"status": "Submitted", "a": 1}))
+    storage = PGGraphStorage(session)
+    events = []
+
+    async def emit(entity_type, entity_id, prop, old, new, **kwargs):
+        events.append((prop, old, new))
+
+    storage._emit_update_event = emit
+    updates = {"status": "Submitted", "name": "PO-2"}
+
+    result = await storage.update_entity("PurchaseOrder", "7", updates)
+
+    assert result == {"status": "Submitted", "a": 1}
+    assert updates == {"status": "Submitted", "name": "PO-2"}
+    assert len(session.executed) == 1
+    assert session.executed[0][1]["display_name"] == "PO-2"
+    assert session.commits == 1
+    assert events == [("name", "PO-1", "PO-2"), ("status", "Draft", "Submitted")]
+
+
+@pytest.mark.asyncio
+async def test_storage_update_raises_on_concurrent_modification():
+    storage = PGGraphStorage(FakeSession(row=None, exists=True))
+
+    with pytest.raises(ConcurrentUpdateError):
+        await storage.update_entity(
+            "PurchaseOrder", "7", {"status": "X"}, expected_updated_at="stale"
+        )
+
+    missing = PGGraphStorage(FakeSession(row=None, exists=False))
+    assert (
+        await missing.update_entity(
+            "PurchaseOrder", "7", {"status": "X"}, expected_updated_at="stale"
+        )
+        == {}
+    )
+
+
+@pytest.mark.asyncio
+async def test_action_events_use_returned_old_values():
+    registry = ActionRegistry()
+    for action in RuleParser().parse(
+        """
+        ACTION PurchaseOrder.submit {
+            PRECONDITION: this.status == "Draft" ON_FAILURE: "Only draft"
+            EFFECT {
+                SET this.status = "Submitted";
+                SET this.stage = 2;
+            }
+        }
+        """
+    ):
+        registry.register(action)
+    emitted = []
+    emitter = GraphEventEmitter()
+    emitter.subscribe(emitted.append)
+    # A concurrent update already moved the entity to stage 2
+    session = FakeSession(_row({"status": "Draft", "stage": 2}))
+    commits_at_emit = []
+    emitter.subscribe(lambda event: commits_at_emit.append(session.commits))
+    executor = ActionExecutor(
+        registry,
+        event_emitter=emitter,
+        log_writer=SimpleNamespace(record=lambda **fields: None),
+    )
+    context = EvaluationContext(
+        entity={"id": "7", "status": "Draft", "stage": 1},
+        old_values={},
+        session=session,
+    )
+
+    result = await executor.execute("PurchaseOrder", "submit", context)
+
+    assert result.success
+    assert len(session.executed) == 1
+    assert [(e.property, e.old_value, e.new_value) for e in emitted] == [
+        ("status", "Draft", "Submitted")
+    ]
+    # Events are emitted only once the changes are committed
+    assert commits_at_emit == [1]
@@ -0,0 +1,84 @@
+"""Tests for rule registry trigger dispatch."""
+
+from app.rule_engine.models import ForClause, RuleDef, Trigger, TriggerType
+from app.rule_engine.rule_registry import RuleRegistry
+
+
+def _rule(name, priority, entity_type="Supplier", property=None):
+    return RuleDef(
+        name=name,
+        priority=priority,
+        trigger=Trigger(
+            type=TriggerType.UPDATE, entity_type=entity_type, property=property
+        ),
+        body=ForClause(
+            variable="s", entity_type=entity_type, condition=None, statements=[]
+        ),
+    )
+
+
+def _names(rules):
+    return [rule.name for rule in rules]
+
+
+class TestRuleDispatch:
+    """Test precompiled trigger dispatch in RuleRegistry."""
+
+    def test_property_rules_include_wildcard_rules_by_priority(self):
+        registry = RuleRegistry()
+        registry.register(_rule("any_low", 10))
+        registry.register(_rule("status_mid", 50, property="status"))
+        registry.register(_rule("any_high", 100))
+        registry.register(_rule("status_tie", 50, property="status"))
+        registry.register(_rule("rating", 70, property="rating"))
+        registry.register(_rule("other_entity", 90, entity_type="Order"))
+
+        assert _names(registry.match(TriggerType.UPDATE, "Supplier", "status")) == [
+            "any_high",
+            "status_mid",
+            "status_tie",
+            "any_low",
+        ]
+        # Properties without dedicated rules still get the wildcard rules
+        assert _names(registry.match(TriggerType.UPDATE, "Supplier", "email")) == [
+            "any_high",
+            "any_low",
+        ]
+        assert _names(registry.match(TriggerType.UPDATE, "Supplier", None)) == [
+            "any_high",
+            "any_low",
+        ]
+        assert registry.match(TriggerType.CREATE, "Supplier", "status") == ()
+        assert registry.match(TriggerType.UPDATE, "Material", "status") == ()
+
+    def test_lookup_returns_shared_precompiled_tuple(self):
+        registry = RuleRegistry()
+        registry.register(_rule("status", 1, property="status"))
+
+        first = registry.match(TriggerType.UPDATE, "Supplier", "status")
+        assert isinstance(first, tuple)
+        assert registry.match(TriggerType.UPDATE, "Supplier", "status") is first
+
+        trigger = Trigger(type=TriggerType.UPDATE, entity_type="Supplier")
+        assert registry.get_by_trigger(trigger) == []
+
+    def test_table_is_swapped_on_register_and_unregister(self):
+        registry = RuleRegistry()
+        registry.register(_rule("status", 1, property="status"))
+        before = registry.match(TriggerType.UPDATE, "Supplier", "status")
+
+        registry.register(_rule("any", 5))
+        after = registry.match(TriggerType.UPDATE, "Supplier", "status")
+
+        # Tuples handed out earlier are never mutated
+        assert _names(before) == ["status"]
+        assert _names(after) == ["any", "status"]
+
+        assert registry.unregister("any") is True
+        assert _names(registry.match(TriggerType.UPDATE, "Supplier", "status")) == [
+            "status"
+        ]
+        assert registry.match(TriggerType.UPDATE, "Supplier", "email") == ()
+
+        registry.clear()
+        assert registry.match(TriggerType.UPDATE, "Supplier", "status") == ()
@@ -0,0 +1,177 @@
+"""Tests for set-based execution of SET statements."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.rule_engine.models import UpdateEvent
+from app.rule_engine.parser import RuleParser
+from app.rule_engine.rule_engine import RuleEngine
+from app.rule_engine.rule_registry import RuleRegistry
+
+
+class FakeResult:
+    def __init__(self, rows=(), rowcount=0):
+        self.rows = list(rows)
+        self.rowcount = rowcount
+
+    def mappings(self):
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+class FakeSession:
+    """Records executed statements and serves FOR clause rows."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.executed = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.executed.append((sql, params))
+        if sql.lstrip().startswith("SELECT"):
+            return FakeResult(rows=self.rows)
+        return FakeResult(rowcount=len(self.rows))
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+class FailingSession(FakeSession):
+    """Fails every UPDATE like an aborted PostgreSQL transaction."""
+
+    async def execute(self, statement, params=None):
+        if str(statement).lstrip().startswith("UPDATE"):
+            raise RuntimeError("current transaction is aborted")
+        return await super().execute(statement, params)
+
+
+def _for_clause(body):
+    rule = RuleParser().parse(
+        f"""
+        RULE Stamp PRIORITY 1 {{
+            ON UPDATE(Supplier.status)
+            FOR (o: PurchaseOrder WHERE o.amount > 100) {{
+                {body}
+            }}
+        }}
+        """
+    )[0]
+    return rule.body
+
+
+def _event():
+    return UpdateEvent(
+        entity_type="Supplier",
+        entity_id="1",
+        property="status",
+        old_value="Active",
+        new_value="Expired",
+    )
+
+
+def _rows(count):
+    return [
+        {"id": i, "name": f"PO-{i}", "properties": {"amount": 200 + i, "code": i}}
+        for i in range(1, count + 1)
+    ]
+
+
+def _rule():
+    return RuleParser().parse(
+        """
+        RULE Stamp PRIORITY 1 {
+            ON UPDATE(Supplier.status)
+            FOR (o: PurchaseOrder WHERE o.amount > 100) {
+                SET o.status = "RiskLocked";
+            }
+        }
+        """
+    )[0]
+
+
+async def _run(for_clause, session, scope=None):
+    engine = RuleEngine(action_registry=None, registry=RuleRegistry())
+    return await engine._execute_for_clause_async(
+        for_clause, _event(), session, {"this": ("internal", "1")}, scope
+    )
+
+
+@pytest.mark.asyncio
+async def test_constant_and_property_sets_run_as_one_update():
+    for_clause = _for_clause(
+        'SET o.status = "RiskLocked"; SET o.supplier = s.name; SET o.copy = o.code;'
+    )
+    session = FakeSession(_rows(2000))
+
+    result = await _run(for_clause, session, scope={"s": {"name": "ACME"}})
+
+    assert len(session.executed) == 1
+    sql, params = session.executed[0]
+    assert sql.startswith("UPDATE graph_entities AS _target")
+    assert "FROM (\nSELECT o.*" in sql
+    assert json.loads(params["set0_value"]) == "RiskLocked"
+    assert json.loads(params["set1_value"]) == "ACME"
+    assert params["set2_key"] == "copy"
+    assert params["set2_path0"] == "code"
+    assert result == {"entities_affected": 2000, "statements_executed": 1}
+    # Committing is left to the rule firing
+    assert session.commits == 0
+
+
+@pytest.mark.asyncio
+async def test_row_dependent_values_are_written_in_one_batch():
+    for_clause = _for_clause(
+        'SET o.label = "${o.name}/${o.code}"; SET o.status = "Checked";'
+    )
+    session = FakeSession(_rows(3))
+
+    result = await _run(for_clause, session)
+
+    assert len(session.executed) == 2
+    select_sql, _ = session.executed[0]
+    update_sql, params = session.executed[1]
+    assert select_sql.lstrip().startswith("SELECT o.*")
+    assert "|| CAST(:patch AS jsonb)" in update_sql
+    assert [p["numeric_id"] for p in params] == [1, 2, 3]
+    assert json.loads(params[1]["patch"]) == {"label": "PO-2/2", "status": "Checked"}
+    assert result == {"entities_affected": 3, "statements_executed": 6}
+    assert session.commits == 0
+
+
+@pytest.mark.asyncio
+async def test_update_plan_is_cached_on_for_clause():
+    for_clause = _for_clause('SET o.status = "RiskLocked";')
+    session = FakeSession(_rows(1))
+
+    await _run(for_clause, session)
+    plan = for_clause.set_plans[frozenset({"this"})]
+    await _run(for_clause, session)
+
+    assert for_clause.set_plans[frozenset({"this"})] is plan
+    assert session.executed[0][0] == session.executed[1][0]
+
+
+@pytest.mark.asyncio
+async def test_failed_set_update_rolls_back_and_marks_rule_failed():
+    logs = []
+    engine = RuleEngine(
+        action_registry=None,
+        registry=RuleRegistry(),
+        log_writer=SimpleNamespace(record=lambda **fields: logs.append(fields)),
+    )
+    session = FailingSession(_rows(2))
+
+    result = await engine._execute_rule_async(_rule(), _event(), session)
+
+    assert result["success"] is False
+    assert session.rollbacks == 1
+    assert session.commits == 0
+    assert logs[0]["success"] is False
+    assert "aborted" in logs[0]["detail"]["error"]
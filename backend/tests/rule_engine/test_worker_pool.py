@@ -0,0 +1,160 @@
+"""Tests for the bounded rule execution worker pool."""
+
+import asyncio
+
+import pytest
+
+from app.rule_engine.models import UpdateEvent
+from app.rule_engine.rule_engine import RuleEngine
+from app.rule_engine.rule_registry import RuleRegistry
+from app.rule_engine.worker_pool import RuleWorkerPool
+
+
+def _event(entity_id, value=None):
+    return UpdateEvent(
+        entity_type="PurchaseOrder",
+        entity_id=str(entity_id),
+        property="status",
+        old_value=None,
+        new_value=value,
+    )
+
+
+class RecordingHandler:
+    """Records handled events and tracks concurrency."""
+
+    def __init__(self, delay=0.001, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.handled = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, event):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if event.new_value == self.fail_on:
+                raise RuntimeError("rule failed")
+            self.handled.append((event.entity_id, event.new_value))
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_and_entity_order_kept():
+    handler = RecordingHandler()
+    pool = RuleWorkerPool(handler, workers=3, max_queue_size=1000)
+
+    for value in range(20):
+        for entity_id in range(10):
+            assert pool.submit(_event(entity_id, value))
+    await pool.flush()
+
+    assert handler.max_active <= 3
+    assert len(handler.handled) == 200
+    for entity_id in range(10):
+        values = [v for e, v in handler.handled if e == str(entity_id)]
+        assert values == list(range(20))
+
+    metrics = pool.metrics()
+    assert metrics["processed"] == 200
+    assert metrics["queue_depth"] == 0
+    assert metrics["in_flight"] == 0
+    assert metrics["max_lag_seconds"] > 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_and_counts_events():
+    handler = RecordingHandler()
+    pool = RuleWorkerPool(handler, workers=1, max_queue_size=5, overflow="drop")
+
+    accepted = [pool.submit(_event(1, value)) for value in range(8)]
+    assert pool.metrics()["queue_depth"] == 5
+    await pool.flush()
+
+    assert accepted == [True] * 5 + [False] * 3
+    assert pool.metrics()["dropped"] == 3
+    assert [value for _, value in handler.handled] == list(range(5))
+
+    # Awaiting producers wait for space instead of dropping
+    for value in range(8):
+        await pool.submit_wait(_event(1, value))
+    await pool.close()
+    assert pool.metrics()["dropped"] == 3
+    assert len(handler.handled) == 13
+
+
+@pytest.mark.asyncio
+async def test_full_queue_holds_back_producers_by_default():
+    handler = RecordingHandler(delay=0.005)
+    pool = RuleWorkerPool(handler, workers=1, max_queue_size=5)
+
+    # Events are never dropped; producers wait for the workers to catch up
+    max_depth = 0
+    for value in range(30):
+        assert pool.submit(_event(1, value))
+        max_depth = max(max_depth, pool.queue_depth)
+        await pool.wait_for_capacity()
+        assert pool.queue_depth < 5
+    await pool.flush()
+
+    assert max_depth == 5
+    assert [value for _, value in handler.handled] == list(range(30))
+    assert pool.metrics()["dropped"] == 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_events_emitted_by_rules_do_not_wait_for_capacity():
+    pool = None
+    handled = []
+
+    async def cascading_handler(event):
+        handled.append(event.new_value)
+        if 0 <= event.new_value < 20:
+            # A rule updating entities emits new events from inside a worker
+            pool.submit(_event(event.new_value + 1, event.new_value + 1))
+            pool.submit(_event(event.new_value + 100, -1))
+            await pool.wait_for_capacity()
+
+    pool = RuleWorkerPool(cascading_handler, workers=1, max_queue_size=2)
+    pool.submit(_event(0, 0))
+    await asyncio.wait_for(pool.flush(), 5)
+
+    assert [value for value in handled if value >= 0] == list(range(21))
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_failures_are_counted_and_workers_keep_running():
+    handler = RecordingHandler(fail_on="bad")
+    pool = RuleWorkerPool(handler, workers=2)
+
+    pool.submit(_event(1, "bad"))
+    pool.submit(_event(1, "good"))
+    await pool.flush()
+
+    assert handler.handled == [("1", "good")]
+    assert pool.metrics()["failed"] == 1
+    assert pool.metrics()["processed"] == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_rule_engine_queues_events_on_worker_pool():
+    engine = RuleEngine(
+        action_registry=None, registry=RuleRegistry(), max_workers=2, max_queue_size=10
+    )
+    handler = RecordingHandler()
+    engine.worker_pool.handler = handler
+
+    for entity_id in range(4):
+        assert engine.on_event(_event(entity_id, "x")) == []
+    await engine.flush()
+
+    assert sorted(handler.handled) == [(str(i), "x") for i in range(4)]
+    assert engine.metrics()["processed"] == 4
+    await engine.shutdown()
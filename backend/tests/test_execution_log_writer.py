@@ -0,0 +1,143 @@
+"""Tests for the batched execution log writer."""
+
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.models.rule import ExecutionLog
+from app.services.execution_log_writer import ExecutionLogWriter
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(ExecutionLog.__table__.create)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+class CountingFactory:
+    """Wraps a session factory and counts opened sessions."""
+
+    def __init__(self, factory, fail=False):
+        self.factory = factory
+        self.fail = fail
+        self.sessions = 0
+
+    def __call__(self):
+        self.sessions += 1
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        return self.factory()
+
+
+async def _logs(factory):
+    async with factory() as session:
+        result = await session.execute(select(ExecutionLog).order_by(ExecutionLog.id))
+        return list(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_records_are_written_in_batches(session_factory):
+    factory = CountingFactory(session_factory)
+    writer = ExecutionLogWriter(factory, batch_size=50, flush_interval=60)
+
+    for i in range(120):
+        writer.record(
+            type="RULE",
+            name="Stamp",
+            entity_id=i,
+            actor_name="sync",
+            success=True,
+            detail={"entities_affected": i},
+        )
+    assert factory.sessions == 0
+
+    await writer.flush_all()
+
+    logs = await _logs(session_factory)
+    assert len(logs) == 120
+    assert factory.sessions == 3
+    assert logs[7].entity_id == "7"
+    assert json.loads(logs[7].detail) == {"entities_affected": 7}
+    assert writer.metrics()["written"] == 120
+
+
+@pytest.mark.asyncio
+async def test_successes_are_sampled_and_failures_kept(session_factory):
+    writer = ExecutionLogWriter(session_factory, success_sample_rate=0.25)
+
+    for _ in range(8):
+        writer.record(type="ACTION", name="PO.submit", success=True)
+    writer.record(type="ACTION", name="PO.submit", success=False, detail={"e": 1})
+    await writer.flush_all()
+
+    logs = await _logs(session_factory)
+    assert [log.success for log in logs] == [True, True, False]
+    assert writer.metrics()["sampled_out"] == 6
+
+
+@pytest.mark.asyncio
+async def test_background_task_flushes_when_batch_is_full(session_factory):
+    writer = ExecutionLogWriter(session_factory, batch_size=10, flush_interval=60)
+    await writer.start()
+    try:
+        for i in range(10):
+            writer.record(type="RULE", name="Stamp", entity_id=i)
+        # Reaching batch_size wakes the writer without waiting for the interval
+        for _ in range(50):
+            if writer.metrics()["written"] == 10:
+                break
+            await asyncio.sleep(0.01)
+        assert writer.metrics()["written"] == 10
+    finally:
+        await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_unwritten_records_are_spooled_and_replayed(session_factory, tmp_path):
+    spool = tmp_path / "logs.jsonl"
+    failing = CountingFactory(session_factory, fail=True)
+    writer = ExecutionLogWriter(failing, flush_interval=60, spool_path=str(spool))
+    await writer.start()
+    writer.record(type="RULE", name="Stamp", entity_id=1, success=False)
+    writer.record(type="RULE", name="Stamp", entity_id=2)
+    await writer.close()
+
+    assert len(spool.read_text().splitlines()) == 2
+    assert writer.metrics()["failed_flushes"] == 1
+
+    # The next process picks the spooled records up on start
+    writer = ExecutionLogWriter(
+        session_factory, flush_interval=60, spool_path=str(spool)
+    )
+    await writer.start()
+    await writer.close()
+
+    assert not spool.exists()
+    logs = await _logs(session_factory)
+    assert [(log.entity_id, log.success) for log in logs] == [
+        ("1", False),
+        ("2", True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_buffer_limit_drops_oldest_records(session_factory):
+    writer = ExecutionLogWriter(session_factory, max_buffer_size=3)
+
+    for i in range(5):
+        writer.record(type="RULE", name="Stamp", entity_id=i)
+    await writer.flush_all()
+
+    assert [log.entity_id for log in await _logs(session_factory)] == ["2", "3", "4"]
+    assert writer.metrics()["dropped"] == 2
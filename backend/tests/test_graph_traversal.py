@@ -0,0 +1,253 @@
+"""Tests for the frontier-based graph traversal engine.
+
+Runs against an in-memory SQLite database so the adjacency queries are real.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.graph import GraphEntity, GraphRelationship
+from app.services.graph_traversal import GraphTraversal, TraversalStats
+from app.services.pg_graph_storage import PGGraphStorage
+
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest.fixture
+async def test_session():
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+async def _build_graph(session, edges, types=None):
+    """Create entities named after their ids and the given (source, target) edges."""
+    types = types or {}
+    node_ids = sorted({n for edge in edges for n in edge[:2]})
+    for node_id in node_ids:
+        session.add(
+            GraphEntity(
+                id=node_id,
+                _display_name=f"N{node_id}",
+                entity_type=types.get(node_id, "Node"),
+                is_instance=True,
+                properties={},
+            )
+        )
+    await session.flush()
+    for source_id, target_id, *rest in edges:
+        session.add(
+            GraphRelationship(
+                source_id=source_id,
+                target_id=target_id,
+                relationship_type=rest[0] if rest else "LINK",
+                properties={},
+            )
+        )
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_shortest_path_prefers_fewest_hops(test_session):
+    # 1-2-3-4-5 chain plus a shortcut 1-6-5
+    await _build_graph(
+        test_session, [(1, 2), (2, 3), (3, 4), (4, 5), (1, 6), (6, 5)]
+    )
+    path = await GraphTraversal(test_session).shortest_path(1, 5, max_depth=5)
+
+    assert path.node_ids == [1, 6, 5]
+    assert len(path) == 2
+
+
+@pytest.mark.asyncio
+async def test_shortest_path_ignores_edge_direction_by_default(test_session):
+    await _build_graph(test_session, [(1, 2), (3, 2)])
+    traversal = GraphTraversal(test_session)
+
+    assert (await traversal.shortest_path(1, 3)).node_ids == [1, 2, 3]
+    assert await traversal.shortest_path(1, 3, direction="outgoing") is None
+
+
+@pytest.mark.asyncio
+async def test_shortest_path_respects_max_depth(test_session):
+    await _build_graph(test_session, [(1, 2), (2, 3), (3, 4)])
+    traversal = GraphTraversal(test_session)
+
+    assert await traversal.shortest_path(1, 4, max_depth=2) is None
+    assert (await traversal.shortest_path(1, 4, max_depth=3)).node_ids == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_shortest_path_filters_accessible_types(test_session):
+    await _build_graph(
+        test_session,
+        [(1, 2), (2, 4), (1, 3), (3, 5), (5, 4)],
+        types={2: "Secret"},
+    )
+    path = await GraphTraversal(test_session).shortest_path(
+        1, 4, accessible_entity_types=["Node"]
+    )
+
+    assert path.node_ids == [1, 3, 5, 4]
+
+
+@pytest.mark.asyncio
+async def test_visited_limit_truncates_search(test_session):
+    # Hub 1 fans out to 2..40, target 100 hangs off 40 via 41
+    edges = [(1, n) for n in range(2, 41)] + [(40, 41), (41, 100)]
+    await _build_graph(test_session, edges)
+    stats = TraversalStats(max_visited=10)
+
+    path = await GraphTraversal(test_session).shortest_path(1, 100, stats=stats)
+
+    assert path is None
+    assert stats.truncated
+
+
+@pytest.mark.asyncio
+async def test_k_shortest_paths(test_session):
+    # Three disjoint routes from 1 to 9 of length 2, 3 and 4
+    await _build_graph(
+        test_session,
+        [(1, 2), (2, 9), (1, 3), (3, 4), (4, 9), (1, 5), (5, 6), (6, 7), (7, 9)],
+    )
+    paths = await GraphTraversal(test_session).k_shortest_paths(
+        1, 9, k=3, max_depth=5
+    )
+
+    assert [p.node_ids for p in paths] == [
+        [1, 2, 9],
+        [1, 3, 4, 9],
+        [1, 5, 6, 7, 9],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_k_shortest_paths_over_parallel_edges(test_session):
+    # Two relationships between 1 and 2 give two distinct paths 1-2-3
+    await _build_graph(test_session, [(1, 2, "HAS"), (1, 2, "OWNS"), (2, 3, "LINK")])
+    paths = await GraphTraversal(test_session).k_shortest_paths(
+        1, 3, k=3, max_depth=5
+    )
+
+    assert [p.node_ids for p in paths] == [[1, 2, 3], [1, 2, 3]]
+    assert sorted(p.edges[0].relationship_type for p in paths) == ["HAS", "OWNS"]
+
+
+@pytest.mark.asyncio
+async def test_storage_find_path_returns_named_path(test_session):
+    await _build_graph(test_session, [(1, 2, "HAS"), (3, 2, "OWNS")])
+    storage = PGGraphStorage(test_session)
+
+    result = await storage.find_path_between_instances(start_name="N1", end_name="N3")
+
+    assert [n["name"] for n in result["nodes"]] == ["N1", "N2", "N3"]
+    assert result["relationships"] == [
+        {"type": "HAS", "source": "N1", "target": "N2"},
+        {"type": "OWNS", "source": "N2", "target": "N3"},
+    ]
+    assert "paths" not in result
+
+
+@pytest.mark.asyncio
+async def test_storage_find_path_with_k(test_session):
+    await _build_graph(test_session, [(1, 2), (2, 4), (1, 3), (3, 4)])
+    storage = PGGraphStorage(test_session)
+
+    result = await storage.find_path_between_instances(start_id=1, end_id=4, k=2)
+
+    assert len(result["paths"]) == 2
+    assert result["nodes"] == result["paths"][0]["nodes"]
+
+
+@pytest.mark.asyncio
+async def test_neighborhood_visits_each_node_once(test_session):
+    # Diamond 1-2-4, 1-3-4: node 4 is reachable through two paths
+    await _build_graph(test_session, [(1, 2), (1, 3), (2, 4), (3, 4), (4, 5)])
+    neighborhood = await GraphTraversal(test_session).expand_neighborhood(1, hops=3)
+
+    assert {n.id: n.distance for n in neighborhood.nodes.values()} == {
+        1: 0,
+        2: 1,
+        3: 1,
+        4: 2,
+        5: 3,
+    }
+    assert neighborhood.nodes[4].parent_id == 2
+    assert len(neighborhood.edges) == 5
+    assert not neighborhood.truncated
+
+
+@pytest.mark.asyncio
+async def test_neighborhood_pushes_down_direction_and_types(test_session):
+    await _build_graph(
+        test_session, [(1, 2, "HAS"), (2, 3, "HAS"), (4, 1, "HAS"), (2, 5, "OWNS")]
+    )
+    traversal = GraphTraversal(test_session)
+
+    outgoing = await traversal.expand_neighborhood(1, hops=2, direction="outgoing")
+    assert set(outgoing.nodes) == {1, 2, 3, 5}
+
+    typed = await traversal.expand_neighborhood(1, hops=2, relationship_types=["HAS"])
+    assert set(typed.nodes) == {1, 2, 3, 4}
+
+
+@pytest.mark.asyncio
+async def test_neighborhood_fanout_cap_sets_truncated(test_session):
+    await _build_graph(test_session, [(1, n) for n in range(2, 12)])
+    neighborhood = await GraphTraversal(test_session).expand_neighborhood(
+        1, hops=2, max_per_level=4
+    )
+
+    assert len(neighborhood.nodes) == 5
+    assert neighborhood.truncated
+
+
+@pytest.mark.asyncio
+async def test_storage_multi_hop_neighbors_contract(test_session):
+    await _build_graph(test_session, [(1, 2, "HAS"), (1, 3, "HAS"), (2, 4), (3, 4)])
+    storage = PGGraphStorage(test_session)
+
+    results = await storage.get_instance_neighbors(entity_name="N1", hops=2)
+
+    assert [(r["name"], r["distance"]) for r in results] == [
+        ("N2", 1),
+        ("N3", 1),
+        ("N4", 2),
+    ]
+    assert results[0]["relationships"] == [
+        {"type": "HAS", "source": "1", "target": "2"}
+    ]
+    neighborhood = await storage.get_instance_neighborhood(entity_name="N1", hops=2)
+    assert neighborhood["neighbors"] == results
+    assert neighborhood["truncated"] is False
+
+    filtered = await storage.get_instance_neighbors(
+        entity_id=1, hops=2, relationship_types=["HAS"]
+    )
+    assert [r["name"] for r in filtered] == ["N2", "N3"]
+
+
+@pytest.mark.asyncio
+async def test_storage_reports_truncation_without_matching_neighbors(test_session):
+    await _build_graph(test_session, [(1, n) for n in range(2, 12)])
+    storage = PGGraphStorage(test_session)
+
+    neighborhood = await storage.get_instance_neighborhood(
+        entity_id=1, hops=2, entity_type="Missing", max_per_level=4
+    )
+
+    assert neighborhood == {"neighbors": [], "truncated": True}
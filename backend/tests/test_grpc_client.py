@@ -0,0 +1,91 @@
+"""Tests for the shared gRPC client registry."""
+
+import grpc
+import pytest
+from grpc_reflection.v1alpha import reflection
+
+from app.services.grpc_client import GrpcClientRegistry
+
+REFLECTION_SERVICE = "grpc.reflection.v1alpha.ServerReflection"
+
+
+@pytest.fixture
+async def grpc_server():
+    server = grpc.aio.server()
+    reflection.enable_server_reflection([REFLECTION_SERVICE], server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    yield port
+    await server.stop(None)
+
+
+@pytest.mark.asyncio
+async def test_borrowed_clients_share_channel_and_descriptors(grpc_server):
+    registry = GrpcClientRegistry()
+
+    async with registry.borrow("127.0.0.1", grpc_server) as client:
+        service_desc = await client._get_service(REFLECTION_SERVICE)
+        channel = client.channel
+
+    async with registry.borrow("127.0.0.1", grpc_server) as again:
+        assert again is client
+        assert again.channel is channel
+        # Descriptors come from the cache, no second reflection round trip
+        assert await again._get_service(REFLECTION_SERVICE) is service_desc
+
+    assert service_desc.methods[0].name == "ServerReflectionInfo"
+    await registry.close_all()
+
+
+@pytest.mark.asyncio
+async def test_descriptor_ttl_and_invalidate(grpc_server):
+    registry = GrpcClientRegistry(descriptor_ttl=0, health_check_interval=0)
+
+    client = await registry.get("127.0.0.1", grpc_server)
+    await client._get_service(REFLECTION_SERVICE)
+    assert client.descriptors_loaded_at is not None
+    client._unary_calls["/pkg.Svc/Get"] = object()
+    client._stream_calls["/pkg.Svc/List"] = object()
+
+    # Expired descriptors and the calls built from them are dropped
+    assert await registry.get("127.0.0.1", grpc_server) is client
+    assert client._services == {}
+    assert client._unary_calls == {}
+    assert client._stream_calls == {}
+
+    await registry.invalidate("127.0.0.1", grpc_server)
+    assert client.channel is None
+    fresh = await registry.get("127.0.0.1", grpc_server)
+    assert fresh is not client
+    await registry.close_all()
+
+
+@pytest.mark.asyncio
+async def test_closed_channel_is_reconnected(grpc_server):
+    registry = GrpcClientRegistry(health_check_interval=0)
+
+    client = await registry.get("127.0.0.1", grpc_server)
+    await client.close()
+
+    assert await registry.get("127.0.0.1", grpc_server) is client
+    assert client.channel is not None
+    await registry.close_all()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_waits_for_outstanding_borrows(grpc_server):
+    registry = GrpcClientRegistry()
+
+    async with registry.borrow("127.0.0.1", grpc_server) as client:
+        await registry.invalidate("127.0.0.1", grpc_server)
+        # The in-flight borrower keeps a usable channel
+        assert client.channel is not None
+        await client._get_service(REFLECTION_SERVICE)
+
+        async with registry.borrow("127.0.0.1", grpc_server) as fresh:
+            assert fresh is not client
+
+    assert client.channel is None
+    assert fresh.channel is not None
+    await registry.close_all()
+    assert fresh.channel is None
@@ -0,0 +1,276 @@
+"""Tests for compiled gRPC response codecs."""
+
+import grpc
+import pytest
+from google.protobuf import (
+    descriptor_pb2,
+    descriptor_pool,
+    message_factory,
+    text_format,
+)
+from google.protobuf.json_format import MessageToDict
+from grpc_reflection.v1alpha import reflection
+
+from app.services.grpc_client import DynamicGrpcClient
+from app.services.grpc_codec import (
+    compile_message_converter,
+    compile_response_converter,
+)
+
+FILE_DESCRIPTOR = """
+name: "codec_test.proto"
+package: "codectest"
+syntax: "proto3"
+enum_type {
+  name: "Status"
+  value { name: "UNKNOWN" number: 0 }
+  value { name: "ACTIVE" number: 1 }
+}
+message_type {
+  name: "Nested"
+  field { name: "label" number: 1 type: TYPE_STRING label: LABEL_OPTIONAL }
+  field { name: "level" number: 2 type: TYPE_INT32 label: LABEL_OPTIONAL }
+}
+message_type {
+  name: "Item"
+  field { name: "id" number: 1 type: TYPE_INT64 label: LABEL_OPTIONAL }
+  field { name: "name" number: 2 type: TYPE_STRING label: LABEL_OPTIONAL }
+  field { name: "amount" number: 3 type: TYPE_DOUBLE label: LABEL_OPTIONAL }
+  field { name: "ratio" number: 4 type: TYPE_FLOAT label: LABEL_OPTIONAL }
+  field {
+    name: "status" number: 5 type: TYPE_ENUM type_name: ".codectest.Status"
+    label: LABEL_OPTIONAL
+  }
+  field {
+    name: "nested" number: 6 type: TYPE_MESSAGE type_name: ".codectest.Nested"
+    label: LABEL_OPTIONAL
+  }
+  field { name: "tags" number: 7 type: TYPE_STRING label: LABEL_REPEATED }
+  field {
+    name: "attrs" number: 8 type: TYPE_MESSAGE
+    type_name: ".codectest.Item.AttrsEntry" label: LABEL_REPEATED
+  }
+  field { name: "blob" number: 9 type: TYPE_BYTES label: LABEL_OPTIONAL }
+  field { name: "flag" number: 10 type: TYPE_BOOL label: LABEL_OPTIONAL }
+  nested_type {
+    name: "AttrsEntry"
+    field { name: "key" number: 1 type: TYPE_STRING label: LABEL_OPTIONAL }
+    field { name: "value" number: 2 type: TYPE_INT32 label: LABEL_OPTIONAL }
+    options { map_entry: true }
+  }
+}
+message_type {
+  name: "Tree"
+  field { name: "name" number: 1 type: TYPE_STRING label: LABEL_OPTIONAL }
+  field {
+    name: "children" number: 2 type: TYPE_MESSAGE type_name: ".codectest.Tree"
+    label: LABEL_REPEATED
+  }
+  field {
+    name: "by_name" number: 3 type: TYPE_MESSAGE
+    type_name: ".codectest.Tree.ByNameEntry" label: LABEL_REPEATED
+  }
+  nested_type {
+    name: "ByNameEntry"
+    field { name: "key" number: 1 type: TYPE_STRING label: LABEL_OPTIONAL }
+    field {
+      name: "value" number: 2 type: TYPE_MESSAGE type_name: ".codectest.Tree"
+      label: LABEL_OPTIONAL
+    }
+    options { map_entry: true }
+  }
+}
+message_type {
+  name: "ListItemsRequest"
+  field { name: "page" number: 1 type: TYPE_INT32 label: LABEL_OPTIONAL }
+}
+message_type {
+  name: "ListItemsResponse"
+  field {
+    name: "items" number: 1 type: TYPE_MESSAGE type_name: ".codectest.Item"
+    label: LABEL_REPEATED
+  }
+  field {
+    name: "pagination" number: 2 type: TYPE_MESSAGE type_name: ".codectest.Nested"
+    label: LABEL_OPTIONAL
+  }
+}
+service {
+  name: "ItemService"
+  method {
+    name: "ListItems"
+    input_type: ".codectest.ListItemsRequest"
+    output_type: ".codectest.ListItemsResponse"
+  }
+  method {
+    name: "ExportItems"
+    input_type: ".codectest.ListItemsRequest"
+    output_type: ".codectest.Item"
+    server_streaming: true
+  }
+}
+"""
+
+
+def _load_messages():
+    file_proto = text_format.Parse(
+        FILE_DESCRIPTOR, descriptor_pb2.FileDescriptorProto()
+    )
+    pool = descriptor_pool.Default()
+    try:
+        pool.FindFileByName(file_proto.name)
+    except KeyError:
+        pool.Add(file_proto)
+    return {
+        name: message_factory.GetMessageClass(
+            pool.FindMessageTypeByName(f"codectest.{name}")
+        )
+        for name in ("Item", "Tree", "ListItemsRequest", "ListItemsResponse")
+    }
+
+
+MESSAGES = _load_messages()
+
+
+def _response():
+    response = MESSAGES["ListItemsResponse"]()
+    item = response.items.add(
+        id=9007199254740993,
+        name="PO-1",
+        amount=10.5,
+        ratio=0.1,
+        status=1,
+        tags=["a", "b"],
+        blob=b"\x00\x01",
+        flag=True,
+    )
+    item.nested.label = "deep"
+    item.attrs["x"] = 3
+    response.items.add(id=2, amount=float("nan"))
+    response.items.add()
+    response.pagination.level = 4
+    return response
+
+
+def test_full_conversion_matches_message_to_dict():
+    response = _response()
+    convert = compile_message_converter(response.DESCRIPTOR)
+
+    assert convert(response) == MessageToDict(
+        response, preserving_proto_field_name=True
+    )
+
+
+def test_recursive_messages_use_compiled_converters(monkeypatch):
+    tree = MESSAGES["Tree"](name="root")
+    child = tree.children.add(name="a")
+    child.children.add(name="a1")
+    tree.by_name["b"].name = "b"
+    tree.by_name["b"].children.add(name="b1")
+    expected = MessageToDict(tree, preserving_proto_field_name=True)
+
+    # Nested messages no longer fall back to MessageToDict
+    monkeypatch.setattr(
+        "app.services.grpc_codec.MessageToDict",
+        lambda *args, **kwargs: pytest.fail("MessageToDict called"),
+    )
+    assert compile_message_converter(tree.DESCRIPTOR)(tree) == expected
+
+
+def test_projection_only_converts_requested_fields():
+    response = _response()
+    convert = compile_response_converter(response.DESCRIPTOR, {"id", "ratio"})
+
+    assert convert(response) == {
+        "items": [{"id": "9007199254740993", "ratio": 0.1}, {"id": "2"}, {}],
+        "pagination": {"level": 4},
+    }
+
+
+@pytest.fixture
+async def item_server():
+    async def list_items(request, context):
+        response = _response()
+        response.pagination.label = f"page {request.page}"
+        return response
+
+    async def export_items(request, context):
+        for item in _response().items:
+            yield item
+
+    server = grpc.aio.server()
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                "codectest.ItemService",
+                {
+                    "ListItems": grpc.unary_unary_rpc_method_handler(
+                        list_items,
+                        request_deserializer=MESSAGES["ListItemsRequest"].FromString,
+                        response_serializer=MESSAGES[
+                            "ListItemsResponse"
+                        ].SerializeToString,
+                    ),
+                    "ExportItems": grpc.unary_stream_rpc_method_handler(
+                        export_items,
+                        request_deserializer=MESSAGES["ListItemsRequest"].FromString,
+                        response_serializer=MESSAGES["Item"].SerializeToString,
+                    ),
+                },
+            ),
+        )
+    )
+    reflection.enable_server_reflection(
+        ["codectest.ItemService", reflection.SERVICE_NAME], server
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    yield port
+    await server.stop(None)
+
+
+@pytest.mark.asyncio
+async def test_call_method_uses_cached_codec(item_server):
+    async with DynamicGrpcClient("127.0.0.1", item_server) as client:
+        response = await client.call_method(
+            "codectest.ItemService", "ListItems", {"page": 2}, item_fields={"name"}
+        )
+        codec = await client.get_codec("codectest.ItemService", "ListItems")
+        full = await client.call_method(
+            "codectest.ItemService", "ListItems", {"page": 3}
+        )
+
+        assert await client.get_codec("codectest.ItemService", "ListItems") is codec
+
+    assert response["items"] == [{"name": "PO-1"}, {}, {}]
+    assert response["pagination"] == {"label": "page 2", "level": 4}
+    assert full["items"][0]["attrs"] == {"x": 3}
+    assert full["items"][0]["status"] == "ACTIVE"
+
+
+@pytest.mark.asyncio
+async def test_stream_method_yields_converted_items(item_server):
+    async with DynamicGrpcClient("127.0.0.1", item_server) as client:
+        items = [
+            item
+            async for item in client.stream_method(
+                "codectest.ItemService", "ExportItems", {}, item_fields={"id", "name"}
+            )
+        ]
+        full = [
+            item
+            async for item in client.stream_method(
+                "codectest.ItemService", "ExportItems", {}
+            )
+        ]
+
+        with pytest.raises(NotImplementedError):
+            await client.call_method("codectest.ItemService", "ExportItems", {})
+        with pytest.raises(ValueError):
+            await anext(client.stream_method("codectest.ItemService", "ListItems", {}))
+
+    assert items == [{"id": "9007199254740993", "name": "PO-1"}, {"id": "2"}, {}]
+    assert full == [
+        MessageToDict(item, preserving_proto_field_name=True)
+        for item in _response().items
+    ]
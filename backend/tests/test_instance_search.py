@@ -0,0 +1,129 @@
+"""Tests for instance search (SQLite fallback path)."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.graph import GraphEntity
+from app.services.instance_search import InstanceSearch, escape_like
+from app.services.pg_graph_storage import PGGraphStorage
+
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest.fixture
+async def test_session():
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_factory() as session:
+        session.add_all(
+            [
+                GraphEntity(
+                    id=1,
+                    _display_name="Acme Supplies Ltd",
+                    entity_type="Supplier",
+                    properties={"__aliases__": ["ACME"]},
+                ),
+                GraphEntity(
+                    id=2,
+                    _display_name="Acme",
+                    entity_type="Supplier",
+                    properties={},
+                ),
+                GraphEntity(
+                    id=12,
+                    _display_name="PO_2024_001",
+                    entity_type="PurchaseOrder",
+                    properties={"__aliases__": ["order-one"]},
+                ),
+                GraphEntity(
+                    id=13,
+                    _display_name="PO-2024-002",
+                    entity_type="PurchaseOrder",
+                    properties={},
+                ),
+            ]
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+def test_escape_like():
+    assert escape_like("50%_a\\b") == "50\\%\\_a\\\\b"
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_exact_name_first(test_session):
+    entities = await InstanceSearch(test_session).search("acme")
+
+    assert [e.id for e in entities] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_search_matches_aliases(test_session):
+    entities = await InstanceSearch(test_session).search("order-one")
+
+    assert [e.id for e in entities] == [12]
+
+
+@pytest.mark.asyncio
+async def test_search_escapes_wildcards(test_session):
+    entities = await InstanceSearch(test_session).search("PO_2024")
+
+    assert [e.id for e in entities] == [12]
+
+
+@pytest.mark.asyncio
+async def test_search_numeric_keyword_uses_exact_id(test_session):
+    entities = await InstanceSearch(test_session).search("12")
+
+    # Ids are matched exactly on the primary key, not as substrings
+    assert [e.id for e in entities] == [12]
+
+
+@pytest.mark.asyncio
+async def test_search_numeric_keyword_beyond_id_range(test_session):
+    test_session.add(
+        GraphEntity(
+            id=14,
+            _display_name="Contact 13800138000",
+            entity_type="Supplier",
+            properties={},
+        )
+    )
+    await test_session.commit()
+
+    # Longer than int32: matched as text instead of on the primary key
+    entities = await InstanceSearch(test_session).search("13800138000")
+
+    assert [e.id for e in entities] == [14]
+
+
+@pytest.mark.asyncio
+async def test_search_respects_type_filters(test_session):
+    search = InstanceSearch(test_session)
+
+    assert await search.search("acme", entity_type="PurchaseOrder") == []
+    assert (
+        await search.search("12", accessible_entity_types=["Supplier"]) == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_storage_search_instances(test_session):
+    results = await PGGraphStorage(test_session).search_instances("acme", limit=1)
+
+    assert len(results) == 1
+    assert results[0]["name"] == "Acme"
+    assert results[0]["labels"] == ["Supplier"]
@@ -0,0 +1,155 @@
+"""Tests for pipelined gRPC list-method page fetching."""
+
+import asyncio
+from contextlib import aclosing
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.page_fetcher import (
+    DEFAULT_CONCURRENCY,
+    FetchProgress,
+    PageFetchError,
+    extract_page,
+    iter_pages,
+    iter_stream_batches,
+    resolve_paging,
+)
+
+
+class SlowClient:
+    """Returns numbered pages after a short, page-dependent delay."""
+
+    def __init__(self, total_pages, fail_page=None):
+        self.total_pages = total_pages
+        self.fail_page = fail_page
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requested = []
+
+    async def call_method(self, service_name, method_name, request):
+        page = request["pagination"]["page"]
+        self.requested.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later pages finish first to check that delivery stays ordered
+            await asyncio.sleep(0.001 * (self.total_pages - page))
+            if page == self.fail_page:
+                raise RuntimeError("boom")
+            return {
+                "items": [{"id": page}],
+                "pagination": {"total_pages": self.total_pages},
+            }
+        finally:
+            self.in_flight -= 1
+
+
+class StreamClient:
+    """Streams numbered items and records how far the stream was read."""
+
+    def __init__(self, total, fail_at=None):
+        self.total = total
+        self.fail_at = fail_at
+        self.produced = 0
+        self.closed = False
+
+    async def stream_method(self, service_name, method_name, request):
+        try:
+            for i in range(self.total):
+                if i == self.fail_at:
+                    raise RuntimeError("stream reset")
+                self.produced += 1
+                yield {"id": i}
+                await asyncio.sleep(0)
+        finally:
+            self.closed = True
+
+
+def test_resolve_paging_prefers_mapping():
+    product = SimpleNamespace(sync_page_size=500, sync_concurrency=8)
+
+    assert resolve_paging(product) == (500, 8)
+    assert resolve_paging(product, SimpleNamespace(sync_page_size=50)) == (50, 8)
+    assert resolve_paging(SimpleNamespace()) == (100, DEFAULT_CONCURRENCY)
+
+
+def test_extract_page():
+    assert extract_page({"orders": [1, 2]}, 1) == ([1, 2], 1)
+    assert extract_page([1], 5) == ([1], 0)
+    assert extract_page({"items": [], "pagination": {"total_pages": 3}}, 1) == ([], 3)
+
+
+@pytest.mark.asyncio
+async def test_pages_are_prefetched_with_bounded_concurrency():
+    client = SlowClient(total_pages=10)
+    pages = []
+
+    async with aclosing(iter_pages(client, "S", "List", concurrency=3)) as it:
+        async for page, items in it:
+            pages.append(page)
+            await asyncio.sleep(0.002)
+
+    assert pages == list(range(1, 11))
+    assert client.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_progress_is_complete_only_after_all_declared_pages():
+    progress = FetchProgress()
+    client = SlowClient(total_pages=4)
+    async with aclosing(iter_pages(client, "S", "List", progress=progress)) as it:
+        async for page, items in it:
+            assert not progress.complete or page == 4
+
+    assert (progress.total_pages, progress.received_pages) == (4, 4)
+    assert progress.complete
+
+
+@pytest.mark.asyncio
+async def test_fetch_error_stops_iteration_and_cancels_prefetch():
+    client = SlowClient(total_pages=10, fail_page=3)
+    pages = []
+
+    with pytest.raises(PageFetchError) as exc_info:
+        async with aclosing(iter_pages(client, "S", "List", concurrency=4)) as it:
+            async for page, items in it:
+                pages.append(page)
+
+    assert exc_info.value.page == 3
+    assert pages == [1, 2]
+    assert client.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_is_batched_with_bounded_buffer():
+    client = StreamClient(total=25)
+    batches = []
+
+    stream = iter_stream_batches(client, "S", "Export", batch_size=10, buffer_batches=1)
+    async with aclosing(stream) as it:
+        async for batch, items in it:
+            # While the consumer is busy the reader stops once the buffer is full
+            await asyncio.sleep(0.005)
+            assert client.produced <= (batch + 2) * 10
+            batches.append((batch, [item["id"] for item in items]))
+
+    assert [batch for batch, _ in batches] == [1, 2, 3]
+    assert [len(ids) for _, ids in batches] == [10, 10, 5]
+    assert batches[-1][1][-1] == 24
+    assert client.closed
+
+
+@pytest.mark.asyncio
+async def test_stream_error_reports_incomplete_batch():
+    client = StreamClient(total=25, fail_at=15)
+    batches = []
+
+    with pytest.raises(PageFetchError) as exc_info:
+        stream = iter_stream_batches(client, "S", "Export", batch_size=10)
+        async with aclosing(stream) as it:
+            async for batch, items in it:
+                batches.append(batch)
+
+    assert exc_info.value.page == 2
+    assert batches == [1]
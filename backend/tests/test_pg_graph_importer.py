@@ -0,0 +1,92 @@
+"""Tests for PGGraphImporter instance import (ORM and bulk modes)."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.graph import GraphEntity, GraphRelationship
+from app.services.owl_parser import Triple
+from app.services.pg_graph_importer import PGGraphImporter
+
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+NS = "http://example.org/ontology#"
+RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+RDFS_LABEL = "http://www.w3.org/2000/01/rdf-schema#label"
+
+
+@pytest.fixture
+async def test_session():
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+def _triples():
+    return [
+        Triple(f"{NS}po1", RDF_TYPE, f"{NS}PurchaseOrder"),
+        Triple(f"{NS}po1", f"{NS}amount", "120"),
+        Triple(f"{NS}po1", RDFS_LABEL, "First order"),
+        Triple(f"{NS}s1", RDF_TYPE, f"{NS}Supplier"),
+        Triple(f"{NS}po1", f"{NS}orderedFrom", f"{NS}s1"),
+        Triple(f"{NS}po1", f"{NS}orderedFrom", f"{NS}s1"),
+        # Edge to an entity that already exists in the graph
+        Triple(f"{NS}po1", f"{NS}approvedBy", f"{NS}u1"),
+    ]
+
+
+async def _import(session, bulk):
+    session.add(GraphEntity(_display_name="u1", entity_type="User", properties={}))
+    await session.commit()
+    importer = PGGraphImporter(session)
+    return await importer.import_instances([], _triples(), bulk=bulk)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bulk", [False, True])
+async def test_import_instances(test_session, bulk):
+    stats = await _import(test_session, bulk)
+
+    assert stats["nodes"] == 2
+    assert stats["relationships"] == 2
+    assert stats["mode"] == ("bulk" if bulk else "orm")
+    assert stats["rows_per_second"] >= 0
+
+    result = await test_session.execute(
+        select(GraphEntity).where(GraphEntity._display_name == "po1")
+    )
+    po = result.scalar_one()
+    assert po.properties == {"amount": "120", "__aliases__": ["First order"]}
+    assert po.is_instance is True
+
+    result = await test_session.execute(
+        select(GraphRelationship.relationship_type).order_by(
+            GraphRelationship.relationship_type
+        )
+    )
+    assert result.scalars().all() == ["approvedBy", "orderedFrom"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_is_idempotent(test_session):
+    await _import(test_session, True)
+    stats = await PGGraphImporter(test_session).import_instances(
+        [], _triples(), bulk=True
+    )
+
+    assert stats["nodes"] == 0
+    assert stats["relationships"] == 0
+    result = await test_session.execute(select(GraphEntity.id))
+    assert len(result.all()) == 3
@@ -57,16 +57,16 @@ async def test_find_path_emits_event(storage, mock_db, mock_event_emitter):
         MagicMock(one_or_none=MagicMock(return_value=(1, "Start", "Type1"))),
         # End node
         MagicMock(one_or_none=MagicMock(return_value=(2, "End", "Type2"))),
-        # Path
+        # Frontier expansion from the start node
+        MagicMock(all=MagicMock(return_value=[(10, 1, 2, "REL")])),
+        # Names and labels of the path nodes
         MagicMock(
-            first=MagicMock(
-                return_value=(["Start", "End"], ["Type1", "Type2"], ["REL"])
-            )
+            all=MagicMock(return_value=[(1, "Start", "Type1"), (2, "End", "Type2")])
         ),
     ]
 
     # Call method
-    await storage.find_path_between_instances("Start", "End")
+    await storage.find_path_between_instances(start_id=1, end_id=2)
 
     # Verify event emission
     mock_event_emitter.emit.assert_called()
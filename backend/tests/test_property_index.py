@@ -0,0 +1,216 @@
+"""Tests for JSONB property index management and index-friendly filters."""
+
+import pytest
+from unittest.mock import patch
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.graph import GraphEntity, SchemaClass
+from app.rule_engine.pgq_translator import PGQTranslator
+from app.services.pg_graph_storage import PGGraphStorage, _apply_property_filters
+from app.services.property_index import (
+    HOT_INDEX_COMMENT,
+    PropertyIndexManager,
+    PropertyIndexSpec,
+    json_equivalents,
+    parse_data_property,
+    record_property_filter,
+    reset_observed_filters,
+)
+
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest.fixture
+async def test_session():
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+    reset_observed_filters()
+
+
+def _pg_sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_parse_data_property():
+    assert parse_data_property("price:float") == ("price", "float")
+    assert parse_data_property("status") == ("status", "string")
+
+
+def test_json_equivalents():
+    assert json_equivalents("Open") == ["Open"]
+    assert json_equivalents("10") == ["10", 10]
+    assert json_equivalents(2.5) == ["2.5", 2.5]
+    assert json_equivalents("true") == ["true", True]
+
+
+def test_index_spec_ddl():
+    spec = PropertyIndexSpec("unit-price", "numeric")
+
+    assert len(spec.index_name) <= 63
+    assert spec.index_name.startswith("idx_prop_num_unit_price_")
+    assert spec.create_ddl().endswith(
+        "ON graph_entities (entity_type, "
+        "(graph_try_numeric((properties ->> 'unit-price'))))"
+    )
+
+
+def test_filters_render_index_friendly_postgres_sql():
+    query = _apply_property_filters(
+        select(GraphEntity.id),
+        GraphEntity,
+        {"OSAT": {"$gt": "8"}, "status": "Open", "grade": {"$in": ["A", 1]}},
+    )
+    sql = _pg_sql(query)
+
+    assert "graph_try_numeric(graph_entities.properties ->> 'OSAT') >" in sql
+    assert "CAST" not in sql
+    assert "graph_entities.properties @>" in sql
+
+
+def test_translator_rewrites_property_comparisons():
+    translator = PGQTranslator()
+
+    assert (
+        translator.translate_condition(("op", ">", ("id", "po.amount"), 100))
+        == "graph_try_numeric(po.properties->>'amount') > 100"
+    )
+    assert (
+        translator.translate_condition(("op", "==", ("id", "po.status"), "Open"))
+        == "(po.properties @> '{\"status\": \"Open\"}'::jsonb)"
+    )
+    # Comparisons between two paths are left untouched
+    assert (
+        translator.translate_condition(("op", "==", ("id", "a.x"), "b.y"))
+        == "a.properties->>'x' = b.properties->>'y'"
+    )
+
+
+@pytest.mark.asyncio
+async def test_desired_specs_from_schema_and_hot_filters(test_session):
+    test_session.add(
+        SchemaClass(
+            name="PurchaseOrder",
+            label=["PurchaseOrder"],
+            data_properties=["amount:decimal", "status:string", "qty:integer"],
+        )
+    )
+    await test_session.commit()
+    for _ in range(3):
+        record_property_filter("OSAT", "numeric")
+
+    manager = PropertyIndexManager(test_session)
+    with patch("app.services.property_index.settings.PROPERTY_INDEX_HOT_THRESHOLD", 3):
+        specs = await manager.desired_specs()
+
+    assert [s.key for s in specs] == ["amount", "qty", "OSAT"]
+    # Index DDL is only issued on PostgreSQL
+    assert not manager.enabled
+    assert await manager.sync() == {"created": [], "dropped": []}
+
+
+@pytest.mark.asyncio
+async def test_filters_and_aggregation_on_sqlite(test_session):
+    test_session.add_all(
+        [
+            GraphEntity(
+                _display_name=f"SR{i}",
+                entity_type="ServiceResponse",
+                properties={"OSAT": str(i), "status": "Open" if i % 2 else "Closed"},
+            )
+            for i in range(1, 7)
+        ]
+    )
+    await test_session.commit()
+    storage = PGGraphStorage(test_session)
+
+    count = await storage.execute_complex_aggregation(
+        target_class="ServiceResponse",
+        target_filters={"OSAT": {"$gte": "3"}, "status": "Open"},
+    )
+    total = await storage.execute_complex_aggregation(
+        target_class="ServiceResponse",
+        aggregation="sum",
+        aggregate_property="OSAT",
+        target_filters={"status": {"$in": ["Closed"]}},
+    )
+
+    assert count["value"] == 2.0
+    assert total["value"] == 12.0
+
+
+class RecordingIndexManager(PropertyIndexManager):
+    """Index manager with a fixed PostgreSQL catalog that records its DDL."""
+
+    def __init__(self, desired, existing):
+        super().__init__(db=None)
+        self._desired = desired
+        self._existing = existing
+        self.ddl = []
+
+    @property
+    def enabled(self):
+        return True
+
+    async def desired_specs(self):
+        return self._desired
+
+    async def existing_indexes(self):
+        return self._existing
+
+    async def _run_ddl(self, statements):
+        self.ddl.extend(statements)
+
+
+@pytest.mark.asyncio
+async def test_sync_keeps_hot_indexes_unless_pruned():
+    amount = PropertyIndexSpec("amount")
+    osat = PropertyIndexSpec("OSAT", hot=True)
+    removed = PropertyIndexSpec("qty")
+    # After a restart no hot filters have been observed yet
+    existing = {
+        amount.index_name: (None, True),
+        osat.index_name: (HOT_INDEX_COMMENT, True),
+        removed.index_name: (None, True),
+    }
+
+    manager = RecordingIndexManager([amount], existing)
+    stats = await manager.sync()
+    assert stats == {"created": [], "dropped": [removed.index_name]}
+    assert f"DROP INDEX CONCURRENTLY IF EXISTS {removed.index_name}" in manager.ddl
+
+    manager = RecordingIndexManager([amount], existing)
+    stats = await manager.sync(prune=True)
+    assert sorted(stats["dropped"]) == sorted([osat.index_name, removed.index_name])
+
+
+@pytest.mark.asyncio
+async def test_sync_creates_concurrently_and_rebuilds_invalid_indexes():
+    amount = PropertyIndexSpec("amount")
+    osat = PropertyIndexSpec("OSAT", hot=True)
+    manager = RecordingIndexManager([amount, osat], {amount.index_name: (None, False)})
+
+    stats = await manager.sync()
+
+    assert stats["created"] == [amount.index_name, osat.index_name]
+    index_ddl = [s for s in manager.ddl if s.startswith(("CREATE INDEX", "DROP"))]
+    assert all("CONCURRENTLY" in s for s in index_ddl)
+    assert manager.ddl.index(
+        f"DROP INDEX CONCURRENTLY IF EXISTS {amount.index_name}"
+    ) < manager.ddl.index(amount.create_ddl())
+    assert f"COMMENT ON INDEX {osat.index_name} IS 'hot'" in manager.ddl
@@ -0,0 +1,212 @@
+"""Tests for streaming RDF parsing and streaming graph import."""
+
+import io
+
+import pytest
+from rdflib import Graph, URIRef
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.graph import GraphEntity, GraphRelationship, SchemaClass
+from app.services.owl_parser import OWLParser
+from app.services.pg_graph_importer import PGGraphImporter
+from app.services.rdf_stream import (
+    TripleClassifier,
+    TurtleStatementSplitter,
+    iter_ntriples,
+    iter_rdf_file,
+)
+
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+NS = "http://example.org/ontology#"
+
+TURTLE = """@prefix : <http://example.org/ontology#> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+:PurchaseOrder a owl:Class ; rdfs:label "Purchase Order" .
+:Supplier a owl:Class .
+:orderedFrom a owl:ObjectProperty ;
+    rdfs:domain :PurchaseOrder ;
+    rdfs:range :Supplier .
+:amount a owl:DatatypeProperty ;
+    rdfs:domain :PurchaseOrder ;
+    rdfs:range xsd:decimal .
+
+# Instances; the note contains a period and a hash. Not a statement end.
+:po1 a :PurchaseOrder ;
+    :amount "120.5" ;
+    rdfs:label "First order. # not a comment" ;
+    :orderedFrom :s1 .
+:po2 a :PurchaseOrder ; :amount \"\"\"7.
+\"\"\" ; :orderedFrom :s1 .
+:s1 a :Supplier .
+"""
+
+
+@pytest.fixture
+async def test_session():
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+def _split(data: str):
+    splitter = TurtleStatementSplitter()
+    statements = []
+    for line in io.StringIO(data):
+        statements.extend(splitter.feed(line))
+    statements.extend(splitter.close())
+    return splitter.directives, statements
+
+
+def test_turtle_splitter_respects_strings_and_comments():
+    directives, statements = _split(TURTLE)
+
+    assert len(directives) == 4
+    assert len(statements) == 7
+    assert statements[4].startswith(":po1")
+    assert statements[4].endswith(":orderedFrom :s1 .")
+
+
+def test_turtle_splitter_sparql_prefix_and_nested_blank_nodes():
+    directives, statements = _split(
+        "PREFIX : <http://example.org/ontology#>\n"
+        ":a :p [ :q 1.5 ; :r ( :x :y ) ] .\n"
+        ":b :p 2 .\n"
+    )
+
+    assert directives == ["PREFIX : <http://example.org/ontology#>"]
+    assert statements == [":a :p [ :q 1.5 ; :r ( :x :y ) ] .", ":b :p 2 ."]
+
+
+def test_chunked_turtle_matches_full_parse():
+    full = Graph().parse(data=TURTLE, format="turtle")
+    streamed = list(
+        iter_rdf_file(io.BytesIO(TURTLE.encode()), "turtle", statements_per_chunk=2)
+    )
+
+    assert len(streamed) == len(full)
+    assert set(streamed) == set(full)
+
+
+def test_ntriples_chunks():
+    lines = [
+        f"<{NS}e{i}> <{NS}p> \"v{i}\" .\n" for i in range(5)
+    ] + ["# comment\n", "\n"]
+
+    triples = list(iter_ntriples(lines, lines_per_chunk=2))
+
+    assert len(triples) == 5
+    assert triples[0][0] == URIRef(f"{NS}e0")
+
+
+def test_single_pass_classifier_matches_owl_parser():
+    graph = Graph().parse(data=TURTLE, format="turtle")
+    schema, instances = OWLParser(graph).classify_triples()
+
+    classifier = TripleClassifier()
+    streamed = [t for t in iter_rdf_file(io.BytesIO(TURTLE.encode()), "turtle")]
+    streamed_schema = [t for t in streamed if classifier.is_schema(*t)]
+
+    assert len(streamed_schema) == len(schema)
+    assert len(streamed) - len(streamed_schema) == len(instances)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bulk", [False, True])
+async def test_import_stream(test_session, bulk):
+    triples = iter_rdf_file(io.BytesIO(TURTLE.encode()), "turtle")
+    result = await PGGraphImporter(test_session).import_stream(
+        triples, batch_size=2, bulk=bulk
+    )
+    stats = result["instances"]
+
+    assert result["schema"]["classes"] == 2
+    assert stats["nodes"] == 3
+    assert stats["relationships"] == 2
+    assert stats["batches"] > 1
+    assert stats["mode"] == "stream"
+
+    result = await test_session.execute(select(SchemaClass.name))
+    assert sorted(result.scalars().all()) == ["PurchaseOrder", "Supplier"]
+
+    result = await test_session.execute(
+        select(GraphEntity).where(GraphEntity._display_name == "po1")
+    )
+    po = result.scalar_one()
+    assert po.properties == {
+        "amount": "120.5",
+        "__aliases__": ["First order. # not a comment"],
+    }
+
+    result = await test_session.execute(select(GraphRelationship))
+    assert len(result.scalars().all()) == 2
+
+
+@pytest.mark.asyncio
+async def test_import_stream_merges_fragments_and_defers_edges(test_session):
+    # Unsorted N-Triples: property before the type, edge before its target
+    data = "\n".join(
+        [
+            f"<{NS}po1> <{NS}orderedFrom> <{NS}s1> .",
+            f"<{NS}po1> <{NS}status> \"Open\" .",
+            f"<{NS}x> <{NS}filler> \"1\" .",
+            f"<{NS}po1> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <{NS}PurchaseOrder> .",
+            f"<{NS}s1> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <{NS}Supplier> .",
+            f"<{NS}po1> <{NS}note> \"late\" .",
+        ]
+    )
+    triples = iter_rdf_file(io.BytesIO(data.encode()), "nt")
+    result = await PGGraphImporter(test_session).import_stream(
+        triples, batch_size=1, bulk=True
+    )
+
+    assert result["instances"]["nodes"] == 2
+    assert result["instances"]["relationships"] == 1
+
+    result = await test_session.execute(
+        select(GraphEntity).where(GraphEntity._display_name == "po1")
+    )
+    assert result.scalar_one().properties == {"status": "Open", "note": "late"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bulk", [False, True])
+async def test_import_stream_spills_pending_state(test_session, monkeypatch, bulk):
+    monkeypatch.setattr("app.services.pg_graph_importer.STREAM_PENDING_LIMIT", 1)
+    type_uri = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+    # Every order references a supplier and carries a fragment typed only later
+    lines = []
+    for i in range(4):
+        lines.append(f"<{NS}po{i}> <{NS}orderedFrom> <{NS}s{i}> .")
+        lines.append(f"<{NS}po{i}> <{NS}status> \"Open\" .")
+    for i in range(4):
+        lines.append(f"<{NS}po{i}> <{type_uri}> <{NS}PurchaseOrder> .")
+        lines.append(f"<{NS}s{i}> <{type_uri}> <{NS}Supplier> .")
+    triples = iter_rdf_file(io.BytesIO("\n".join(lines).encode()), "nt")
+    importer = PGGraphImporter(test_session)
+
+    result = await importer.import_stream(triples, batch_size=1, bulk=bulk)
+
+    assert result["instances"]["nodes"] == 8
+    assert result["instances"]["relationships"] == 4
+    assert importer._entity_cache == {}
+    result = await test_session.execute(
+        select(GraphEntity.properties).where(GraphEntity.entity_type == "PurchaseOrder")
+    )
+    assert result.scalars().all() == [{"status": "Open"}] * 4
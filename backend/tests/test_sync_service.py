@@ -0,0 +1,455 @@
+"""Tests for SyncService entity synchronization."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.data_product import (
+    DataProduct,
+    EntityMapping,
+    PropertyMapping,
+    RelationshipMapping,
+    SyncLog,
+)
+from app.models.graph import GraphEntity, GraphRelationship
+from app.services.page_fetcher import PageFetchError
+from app.services.sync_service import SyncService, advance_watermark
+
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest.fixture
+async def test_session():
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+class FakeClient:
+    """Serves list-method pages from in-memory lists keyed by method name."""
+
+    def __init__(self, pages, request_fields=("pagination", "updated_at_from")):
+        self.pages = pages if isinstance(pages, dict) else {"ListOrders": pages}
+        self.request_fields = request_fields
+        self.calls = []
+        self.requests = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get_codec(self, service_name, method_name):
+        fields = [SimpleNamespace(name=name, json_name=name) for name in self.request_fields]
+        descriptor = SimpleNamespace(
+            fields=fields, fields_by_name={f.name: f for f in fields}
+        )
+        return SimpleNamespace(input_class=SimpleNamespace(DESCRIPTOR=descriptor))
+
+    async def call_method(self, service_name, method_name, request, item_fields=None):
+        page = request["pagination"]["page"]
+        self.calls.append((method_name, page))
+        self.requests.append(request)
+        self.item_fields = item_fields
+        pages = self.pages[method_name]
+        return {
+            "items": pages[page - 1],
+            "pagination": {"total_pages": len(pages)},
+        }
+
+    async def stream_method(self, service_name, method_name, request, item_fields=None):
+        self.calls.append((method_name, "stream"))
+        self.requests.append(request)
+        self.item_fields = item_fields
+        for page in self.pages[method_name]:
+            for item in page:
+                yield item
+
+
+async def _setup(session):
+    product = DataProduct(
+        name="erp", grpc_host="localhost", grpc_port=50051, service_name="ERP"
+    )
+    session.add(product)
+    await session.flush()
+    mapping = EntityMapping(
+        data_product_id=product.id,
+        ontology_class_name="PurchaseOrder",
+        grpc_message_type="Order",
+        list_method="ListOrders",
+        id_field_mapping="id",
+        name_field_mapping="code",
+    )
+    session.add(mapping)
+    await session.flush()
+    session.add(
+        PropertyMapping(
+            entity_mapping_id=mapping.id,
+            ontology_property="amount",
+            grpc_field="amount",
+            transform_expression="parseNum(value)",
+        )
+    )
+    sync_log = SyncLog(data_product_id=product.id, status="started")
+    session.add(sync_log)
+    await session.commit()
+
+    result = await session.execute(
+        select(EntityMapping)
+        .where(EntityMapping.id == mapping.id)
+        .options(
+            selectinload(EntityMapping.property_mappings),
+            selectinload(EntityMapping.target_relationship_mappings),
+        )
+    )
+    return product, result.scalar_one(), sync_log
+
+
+@pytest.mark.asyncio
+async def test_sync_mapping_upserts_pages(test_session):
+    product, mapping, sync_log = await _setup(test_session)
+    test_session.add(
+        GraphEntity(
+            _display_name="old",
+            entity_type="PurchaseOrder",
+            source_id="1",
+            properties={"id": 1, "status": "Open", "amount": 1},
+        )
+    )
+    await test_session.commit()
+
+    client = FakeClient(
+        [
+            [
+                {"id": 1, "code": "PO-1", "amount": "10.5"},
+                {"id": 2, "code": "PO-2", "amount": "20"},
+                {"id": 2, "code": "PO-2b", "amount": "21"},
+            ],
+            [{"id": 3, "code": None, "amount": "30"}],
+        ]
+    )
+    await SyncService(test_session)._sync_mapping_internal(
+        mapping, client, product, sync_log
+    )
+
+    assert client.calls == [("ListOrders", 1), ("ListOrders", 2)]
+    # Only the mapped source fields are converted from the gRPC response
+    assert client.item_fields == {"id", "code", "amount"}
+    assert sync_log.records_processed == 4
+    assert sync_log.records_created == 2
+    assert sync_log.records_updated == 2
+    assert sync_log.records_failed == 0
+
+    result = await test_session.execute(
+        select(GraphEntity)
+        .where(GraphEntity.entity_type == "PurchaseOrder")
+        .order_by(GraphEntity.source_id)
+        .execution_options(populate_existing=True)
+    )
+    entities = result.scalars().all()
+    assert [e._display_name for e in entities] == ["PO-1", "PO-2b", "PurchaseOrder_3"]
+    # Existing properties are merged; a stale "id" key is dropped
+    assert entities[0].properties == {"status": "Open", "amount": 10.5, "code": "PO-1"}
+    assert entities[1].properties == {"code": "PO-2b", "amount": 21}
+    assert entities[2].properties == {"amount": 30}
+
+
+@pytest.mark.asyncio
+async def test_sync_mapping_is_idempotent(test_session):
+    product, mapping, sync_log = await _setup(test_session)
+    pages = [[{"id": i, "code": f"PO-{i}", "amount": str(i)} for i in range(5)]]
+
+    service = SyncService(test_session)
+    await service._sync_mapping_internal(mapping, FakeClient(pages), product, sync_log)
+    await service._sync_mapping_internal(mapping, FakeClient(pages), product, sync_log)
+
+    assert sync_log.records_created == 5
+    assert sync_log.records_updated == 5
+    result = await test_session.execute(select(GraphEntity.id))
+    assert len(result.all()) == 5
+
+
+@pytest.mark.asyncio
+async def test_relationships_resolved_from_entity_pass(test_session):
+    product, orders, sync_log = await _setup(test_session)
+    suppliers = EntityMapping(
+        data_product_id=product.id,
+        ontology_class_name="Supplier",
+        grpc_message_type="Supplier",
+        list_method="ListSuppliers",
+        id_field_mapping="id",
+        name_field_mapping="name",
+    )
+    test_session.add(suppliers)
+    await test_session.flush()
+    test_session.add(
+        RelationshipMapping(
+            source_entity_mapping_id=orders.id,
+            target_entity_mapping_id=suppliers.id,
+            ontology_relationship="orderedFrom",
+            source_fk_field="supplier_id",
+        )
+    )
+    await test_session.commit()
+
+    client = FakeClient(
+        {
+            "ListOrders": [
+                [
+                    {"id": 1, "code": "PO-1", "supplier_id": 10},
+                    {"id": 2, "code": "PO-2", "supplier_id": 10},
+                ],
+                [
+                    {"id": 3, "code": "PO-3", "supplier_id": 99},
+                    {"id": 4, "code": "PO-4"},
+                ],
+            ],
+            "ListSuppliers": [[{"id": 10, "name": "Acme"}]],
+        }
+    )
+    with patch("app.services.sync_service.borrow_client", return_value=client):
+        service = SyncService(test_session)
+        await service.sync_data_product(product.id)
+        # A second run must not duplicate edges
+        await service.sync_data_product(product.id)
+
+    # Orders are downloaded once per run; relationships reuse the staged FKs
+    assert client.calls.count(("ListOrders", 1)) == 2
+
+    result = await test_session.execute(
+        select(GraphRelationship.relationship_type, GraphEntity.source_id).join(
+            GraphEntity, GraphEntity.id == GraphRelationship.source_id
+        )
+    )
+    assert sorted(result.all()) == [("orderedFrom", "1"), ("orderedFrom", "2")]
+
+    stats = await service._sync_relationships(client, product)
+    assert stats == {
+        "created": 0,
+        "failed": 0,
+        "source_missing": 0,
+        "target_missing": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_uses_watermark(test_session):
+    product, mapping, sync_log = await _setup(test_session)
+    mapping.watermark_field = "updated_at"
+    await test_session.commit()
+    service = SyncService(test_session)
+
+    # No watermark yet: the first incremental run falls back to a full pull
+    client = FakeClient(
+        [
+            [
+                {"id": 1, "code": "PO-1", "updated_at": "100"},
+                {"id": 2, "code": "PO-2", "updated_at": "250"},
+                {"id": 3, "code": "PO-3", "updated_at": "90"},
+            ]
+        ]
+    )
+    await service._sync_mapping_internal(
+        mapping, client, product, sync_log, incremental=True
+    )
+    assert "updated_at_from" not in client.requests[0]
+    assert mapping.sync_watermark == "250"
+    assert mapping.last_full_sync_at is not None
+
+    client = FakeClient([[{"id": 2, "code": "PO-2b", "updated_at": "300"}]])
+    await service._sync_mapping_internal(
+        mapping, client, product, sync_log, incremental=True
+    )
+    assert client.requests[0]["updated_at_from"] == 250
+    assert mapping.sync_watermark == "300"
+
+    # A plain full sync never deletes entities
+    client = FakeClient([[{"id": 1, "code": "PO-1", "updated_at": "100"}]])
+    await service._sync_mapping_internal(mapping, client, product, sync_log)
+    assert not sync_log.records_deleted
+
+    # A reconcile removes entities that disappeared from the source
+    client = FakeClient([[{"id": 1, "code": "PO-1", "updated_at": "100"}]])
+    await service._sync_mapping_internal(
+        mapping, client, product, sync_log, reconcile=True
+    )
+    assert sync_log.records_deleted == 2
+    assert mapping.sync_watermark == "100"
+
+    result = await test_session.execute(select(GraphEntity.source_id))
+    assert result.scalars().all() == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_falls_back_when_request_lacks_filter(test_session):
+    product, mapping, sync_log = await _setup(test_session)
+    mapping.watermark_field = "updated_at"
+    mapping.sync_watermark = "100"
+    mapping.last_full_sync_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    await test_session.commit()
+
+    client = FakeClient(
+        [[{"id": 1, "code": "PO-1", "updated_at": "150"}]],
+        request_fields=("pagination",),
+    )
+    await SyncService(test_session)._sync_mapping_internal(
+        mapping, client, product, sync_log, incremental=True
+    )
+
+    # The request is sent without the unknown filter and the full pull is noted
+    assert "updated_at_from" not in client.requests[0]
+    assert "falling back to a full pull" in sync_log.error_message
+    assert mapping.sync_watermark == "150"
+
+
+class FailingClient(FakeClient):
+    """Fails every request for pages at or after fail_from."""
+
+    def __init__(self, pages, fail_from):
+        super().__init__(pages)
+        self.fail_from = fail_from
+
+    async def call_method(self, service_name, method_name, request, item_fields=None):
+        if request["pagination"]["page"] >= self.fail_from:
+            raise RuntimeError("unavailable")
+        return await super().call_method(service_name, method_name, request)
+
+
+@pytest.mark.asyncio
+async def test_sync_fails_when_first_page_cannot_be_fetched(test_session):
+    product, mapping, sync_log = await _setup(test_session)
+    client = FailingClient([[{"id": 1, "code": "PO-1"}]], fail_from=1)
+
+    with pytest.raises(PageFetchError):
+        await SyncService(test_session)._sync_mapping_internal(
+            mapping, client, product, sync_log
+        )
+
+
+@pytest.mark.asyncio
+async def test_partial_pull_is_recorded_on_the_sync_log(test_session):
+    product, mapping, sync_log = await _setup(test_session)
+    client = FailingClient(
+        [[{"id": 1, "code": "PO-1"}], [{"id": 2, "code": "PO-2"}]], fail_from=2
+    )
+
+    await SyncService(test_session)._sync_mapping_internal(
+        mapping, client, product, sync_log
+    )
+
+    assert "Failed to fetch page 2" in sync_log.error_message
+    assert mapping.last_full_sync_at is None
+
+
+class UnpaginatedClient(FakeClient):
+    """Returns pages without declaring how many there are."""
+
+    async def call_method(self, service_name, method_name, request, item_fields=None):
+        response = await super().call_method(service_name, method_name, request)
+        del response["pagination"]
+        return response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "client",
+    [
+        # Transient empty first page
+        FakeClient([[]]),
+        # Second of three declared pages comes back empty
+        FakeClient([[{"id": 1, "code": "PO-1"}], [], [{"id": 3, "code": "PO-3"}]]),
+        # No pagination: completeness cannot be verified
+        UnpaginatedClient([[{"id": 1, "code": "PO-1"}]]),
+    ],
+)
+async def test_reconcile_skips_deletion_without_a_complete_pull(test_session, client):
+    product, mapping, sync_log = await _setup(test_session)
+    service = SyncService(test_session)
+    seed = FakeClient([[{"id": i, "code": f"PO-{i}"} for i in range(1, 4)]])
+    await service._sync_mapping_internal(mapping, seed, product, sync_log)
+
+    await service._sync_mapping_internal(
+        mapping, client, product, sync_log, reconcile=True
+    )
+
+    assert not sync_log.records_deleted
+    result = await test_session.execute(select(func.count(GraphEntity.id)))
+    assert result.scalar_one() == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_mapping_prefers_export_stream(test_session):
+    product, mapping, sync_log = await _setup(test_session)
+    mapping.export_method = "ExportOrders"
+    mapping.sync_page_size = 2
+    await test_session.commit()
+
+    client = FakeClient(
+        {
+            "ExportOrders": [
+                [{"id": i, "code": f"PO-{i}", "amount": str(i)} for i in range(5)]
+            ]
+        }
+    )
+    await SyncService(test_session)._sync_mapping_internal(
+        mapping, client, product, sync_log
+    )
+
+    assert client.calls == [("ExportOrders", "stream")]
+    assert client.item_fields == {"id", "code", "amount"}
+    assert sync_log.records_created == 5
+    assert mapping.last_full_sync_at is not None
+
+    result = await test_session.execute(
+        select(GraphEntity._display_name).order_by(GraphEntity.source_id)
+    )
+    assert result.scalars().all() == [f"PO-{i}" for i in range(5)]
+
+
+def test_resolve_sync_mode():
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    mapping = EntityMapping(
+        watermark_field="updated_at",
+        sync_watermark="10",
+        last_full_sync_at=now - timedelta(hours=1),
+    )
+
+    assert SyncService._resolve_sync_mode(mapping, incremental=False) == "full"
+    assert SyncService._resolve_sync_mode(mapping, incremental=True) == "incremental"
+    mapping.full_sync_interval_hours = 1
+    assert SyncService._resolve_sync_mode(mapping, incremental=True) == "reconcile"
+    mapping.full_sync_interval_hours = 0
+    assert SyncService._resolve_sync_mode(mapping, incremental=True) == "incremental"
+    mapping.watermark_field = None
+    assert SyncService._resolve_sync_mode(mapping, incremental=True) == "full"
+    assert SyncService._resolve_sync_mode(mapping, False, reconcile=True) == (
+        "reconcile"
+    )
+
+
+def test_advance_watermark():
+    items = [{"ts": "9"}, {"ts": "10"}, {"ts": None}, {}]
+    assert advance_watermark(None, items, "ts") == "10"
+    assert advance_watermark("11", items, "ts") == "11"
+    assert advance_watermark(
+        None, [{"ts": "2024-02-01"}, {"ts": "2024-10-01"}], "ts"
+    ) == ("2024-10-01")
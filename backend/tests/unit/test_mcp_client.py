@@ -1,6 +1,16 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import AsyncMock, patch
-from app.services.mcp_client import MCPClient
+from app.services.mcp_client import MCPClient, MCPClientPool, mcp_pool
+
+
+@pytest.fixture(autouse=True)
+async def close_pooled_sessions():
+    yield
+    await mcp_pool.close_all()
 
 
 @pytest.mark.asyncio
@@ -54,3 +64,157 @@ async def test_mcp_client_call_tool():
 
             assert result[0].text == "result_text"
             mock_session.call_tool.assert_called_once_with("tool1", {"arg": "val"})
+
+
+class FakeSession:
+    """ClientSession stand-in answering tool calls after a short delay."""
+
+    created = 0
+
+    def __init__(self, read, write):
+        FakeSession.created += 1
+        self.initialized = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def initialize(self):
+        self.initialized += 1
+
+    async def call_tool(self, name, arguments):
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(content=[SimpleNamespace(text=f"{name}:{arguments}")])
+
+
+class FakeTransport:
+    """sse_client stand-in whose first ``failures`` connects fail."""
+
+    def __init__(self, failures=0, delay=0.0):
+        self.failures = failures
+        self.delay = delay
+        self.connects = 0
+
+    @asynccontextmanager
+    async def __call__(self, url):
+        self.connects += 1
+        if self.connects <= self.failures:
+            raise ConnectionError("connection refused")
+        if self.connects > 1:
+            await asyncio.sleep(self.delay)
+        yield (object(), object())
+
+
+@pytest.fixture
+async def pool():
+    FakeSession.created = 0
+    pool = MCPClientPool(backoff_base=0.05)
+    yield pool
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_session(pool):
+    url = "http://localhost:8000/sse"
+    transport = FakeTransport()
+    with (
+        patch("app.services.mcp_client.sse_client", transport),
+        patch("app.services.mcp_client.ClientSession", FakeSession),
+    ):
+        client = MCPClient(url, pool=pool)
+        results = await asyncio.gather(
+            *(client.call_tool("echo", {"i": i}) for i in range(10))
+        )
+        await client.call_tool("echo", {"i": 10})
+
+    assert [r[0].text for r in results] == [f"echo:{{'i': {i}}}" for i in range(10)]
+    assert transport.connects == 1
+    assert FakeSession.created == 1
+    metrics = pool.metrics()[url]
+    assert metrics["calls"] == 11
+    assert metrics["errors"] == 0
+    assert metrics["sessions"] == 1
+    assert metrics["latency_ms_p95"] >= 10
+
+
+@pytest.mark.asyncio
+async def test_failed_connects_back_off_before_reconnecting(pool):
+    url = "http://localhost:8000/sse"
+    transport = FakeTransport(failures=1)
+    with (
+        patch("app.services.mcp_client.sse_client", transport),
+        patch("app.services.mcp_client.ClientSession", FakeSession),
+    ):
+        client = MCPClient(url, pool=pool)
+        with pytest.raises(ConnectionError, match="connection refused"):
+            await client.call_tool("echo", {})
+        # Within the backoff window calls fail without a new connect
+        with pytest.raises(ConnectionError, match="reconnecting in"):
+            await client.call_tool("echo", {})
+        assert transport.connects == 1
+
+        await asyncio.sleep(0.06)
+        result = await client.call_tool("echo", {})
+
+    assert result[0].text == "echo:{}"
+    assert transport.connects == 2
+    metrics = pool.metrics()[url]
+    assert metrics["errors"] == 2
+    assert metrics["connect_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_dropped_session_is_replaced(pool):
+    url = "http://localhost:8000/sse"
+    transport = FakeTransport()
+    with (
+        patch("app.services.mcp_client.sse_client", transport),
+        patch("app.services.mcp_client.ClientSession", FakeSession),
+    ):
+        client = MCPClient(url, pool=pool)
+        await client.call_tool("echo", {})
+
+        # The connection task ends as it does when the SSE stream drops
+        dropped = pool.get(url)._sessions[0]
+        dropped._task.cancel()
+        await asyncio.gather(dropped._task, return_exceptions=True)
+
+        await client.call_tool("echo", {})
+
+    assert transport.connects == 2
+    assert pool.metrics()[url]["connects"] == 2
+    assert pool.metrics()[url]["sessions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_connect_does_not_block_open_sessions():
+    url = "http://localhost:8000/sse"
+    pool = MCPClientPool(size=2)
+    transport = FakeTransport(delay=0.3)
+    with (
+        patch("app.services.mcp_client.sse_client", transport),
+        patch("app.services.mcp_client.ClientSession", FakeSession),
+    ):
+        client = MCPClient(url, pool=pool)
+        await client.call_tool("echo", {})
+
+        # The open session is busy, so this call starts a second, slow connect
+        opened = pool.get(url)._sessions[0]
+        opened.in_flight += 1
+        slow = asyncio.create_task(client.call_tool("echo", {"i": 2}))
+        await asyncio.sleep(0.05)
+        opened.in_flight -= 1
+        assert transport.connects == 2
+
+        # Meanwhile calls are served by the open session
+        start = asyncio.get_running_loop().time()
+        await client.call_tool("echo", {"i": 3})
+        assert asyncio.get_running_loop().time() - start < 0.2
+        assert not slow.done()
+
+        await slow
+
+    assert pool.metrics()[url]["sessions"] == 2
+    await pool.close_all()
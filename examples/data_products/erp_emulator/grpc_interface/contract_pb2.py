@@ -22,7 +22,7 @@ from grpc_interface import common_pb2 as common__pb2
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x0e\x63ontract.proto\x12\x03\x65rp\x1a\x0c\x63ommon.proto"\x9d\x02\n\x08\x43ontract\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x17\n\x0f\x63ontract_number\x18\x02 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x03 \x01(\x05\x12\x13\n\x0bmaterial_id\x18\x04 \x01(\x05\x12\x12\n\nstart_date\x18\x05 \x01(\x03\x12\x10\n\x08\x65nd_date\x18\x06 \x01(\x03\x12\x14\n\x0c\x61greed_price\x18\x07 \x01(\x01\x12\x14\n\x0cmin_quantity\x18\x08 \x01(\x01\x12\x14\n\x0cmax_quantity\x18\t \x01(\x01\x12#\n\x06status\x18\n \x01(\x0e\x32\x13.erp.ContractStatus\x12\r\n\x05terms\x18\x0b \x01(\t\x12\x12\n\ncreated_at\x18\x0c \x01(\x03\x12\x12\n\nupdated_at\x18\r \x01(\x03"\xdd\x01\n\x15\x43reateContractRequest\x12\x13\n\x0bsupplier_id\x18\x01 \x01(\x05\x12\x13\n\x0bmaterial_id\x18\x02 \x01(\x05\x12\x12\n\nstart_date\x18\x03 \x01(\x03\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\x03\x12\x14\n\x0c\x61greed_price\x18\x05 \x01(\x01\x12\x14\n\x0cmin_quantity\x18\x06 \x01(\x01\x12\x14\n\x0cmax_quantity\x18\x07 \x01(\x01\x12#\n\x06status\x18\x08 \x01(\x0e\x32\x13.erp.ContractStatus\x12\r\n\x05terms\x18\t \x01(\t"\x9e\x02\n\x15UpdateContractRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x15\n\x08\x65nd_date\x18\x02 \x01(\x03H\x00\x88\x01\x01\x12\x19\n\x0c\x61greed_price\x18\x03 \x01(\x01H\x01\x88\x01\x01\x12\x19\n\x0cmin_quantity\x18\x04 \x01(\x01H\x02\x88\x01\x01\x12\x19\n\x0cmax_quantity\x18\x05 \x01(\x01H\x03\x88\x01\x01\x12(\n\x06status\x18\x06 \x01(\x0e\x32\x13.erp.ContractStatusH\x04\x88\x01\x01\x12\x12\n\x05terms\x18\x07 \x01(\tH\x05\x88\x01\x01\x42\x0b\n\t_end_dateB\x0f\n\r_agreed_priceB\x0f\n\r_min_quantityB\x0f\n\r_max_quantityB\t\n\x07_statusB\x08\n\x06_terms"K\n\x12GetContractRequest\x12\x0c\n\x02id\x18\x01 \x01(\x05H\x00\x12\x19\n\x0f\x63ontract_number\x18\x02 \x01(\tH\x00\x42\x0c\n\nidentifier"\xcb\x01\n\x14ListContractsRequest\x12*\n\npagination\x18\x01 \x01(\x0b\x32\x16.erp.PaginationRequest\x12\x18\n\x0bsupplier_id\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\x18\n\x0bmaterial_id\x18\x03 \x01(\x05H\x01\x88\x01\x01\x12(\n\x06status\x18\x04 \x01(\x0e\x32\x13.erp.ContractStatusH\x02\x88\x01\x01\x42\x0e\n\x0c_supplier_idB\x0e\n\x0c_material_idB\t\n\x07_status"b\n\x15ListContractsResponse\x12\x1c\n\x05items\x18\x01 \x03(\x0b\x32\r.erp.Contract\x12+\n\npagination\x18\x02 \x01(\x0b\x32\x17.erp.PaginationResponse2\xc1\x02\n\x0f\x43ontractService\x12\x35\n\x0bGetContract\x12\x17.erp.GetContractRequest\x1a\r.erp.Contract\x12;\n\x0e\x43reateContract\x12\x1a.erp.CreateContractRequest\x1a\r.erp.Contract\x12;\n\x0eUpdateContract\x12\x1a.erp.UpdateContractRequest\x1a\r.erp.Contract\x12\x35\n\x0e\x44\x65leteContract\x12\x17.erp.GetContractRequest\x1a\n.erp.Empty\x12\x46\n\rListContracts\x12\x19.erp.ListContractsRequest\x1a\x1a.erp.ListContractsResponseb\x06proto3'
+    b'\n\x0e\x63ontract.proto\x12\x03\x65rp\x1a\x0c\x63ommon.proto"\x9d\x02\n\x08\x43ontract\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x17\n\x0f\x63ontract_number\x18\x02 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x03 \x01(\x05\x12\x13\n\x0bmaterial_id\x18\x04 \x01(\x05\x12\x12\n\nstart_date\x18\x05 \x01(\x03\x12\x10\n\x08\x65nd_date\x18\x06 \x01(\x03\x12\x14\n\x0c\x61greed_price\x18\x07 \x01(\x01\x12\x14\n\x0cmin_quantity\x18\x08 \x01(\x01\x12\x14\n\x0cmax_quantity\x18\t \x01(\x01\x12#\n\x06status\x18\n \x01(\x0e\x32\x13.erp.ContractStatus\x12\r\n\x05terms\x18\x0b \x01(\t\x12\x12\n\ncreated_at\x18\x0c \x01(\x03\x12\x12\n\nupdated_at\x18\r \x01(\x03"\xdd\x01\n\x15\x43reateContractRequest\x12\x13\n\x0bsupplier_id\x18\x01 \x01(\x05\x12\x13\n\x0bmaterial_id\x18\x02 \x01(\x05\x12\x12\n\nstart_date\x18\x03 \x01(\x03\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\x03\x12\x14\n\x0c\x61greed_price\x18\x05 \x01(\x01\x12\x14\n\x0cmin_quantity\x18\x06 \x01(\x01\x12\x14\n\x0cmax_quantity\x18\x07 \x01(\x01\x12#\n\x06status\x18\x08 \x01(\x0e\x32\x13.erp.ContractStatus\x12\r\n\x05terms\x18\t \x01(\t"\x9e\x02\n\x15UpdateContractRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x15\n\x08\x65nd_date\x18\x02 \x01(\x03H\x00\x88\x01\x01\x12\x19\n\x0c\x61greed_price\x18\x03 \x01(\x01H\x01\x88\x01\x01\x12\x19\n\x0cmin_quantity\x18\x04 \x01(\x01H\x02\x88\x01\x01\x12\x19\n\x0cmax_quantity\x18\x05 \x01(\x01H\x03\x88\x01\x01\x12(\n\x06status\x18\x06 \x01(\x0e\x32\x13.erp.ContractStatusH\x04\x88\x01\x01\x12\x12\n\x05terms\x18\x07 \x01(\tH\x05\x88\x01\x01\x42\x0b\n\t_end_dateB\x0f\n\r_agreed_priceB\x0f\n\r_min_quantityB\x0f\n\r_max_quantityB\t\n\x07_statusB\x08\n\x06_terms"K\n\x12GetContractRequest\x12\x0c\n\x02id\x18\x01 \x01(\x05H\x00\x12\x19\n\x0f\x63ontract_number\x18\x02 \x01(\tH\x00\x42\x0c\n\nidentifier"\xcb\x01\n\x14ListContractsRequest\x12*\n\npagination\x18\x01 \x01(\x0b\x32\x16.erp.PaginationRequest\x12\x18\n\x0bsupplier_id\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\x18\n\x0bmaterial_id\x18\x03 \x01(\x05H\x01\x88\x01\x01\x12(\n\x06status\x18\x04 \x01(\x0e\x32\x13.erp.ContractStatusH\x02\x88\x01\x01\x42\x0e\n\x0c_supplier_idB\x0e\n\x0c_material_idB\t\n\x07_status"b\n\x15ListContractsResponse\x12\x1c\n\x05items\x18\x01 \x03(\x0b\x32\r.erp.Contract\x12+\n\npagination\x18\x02 \x01(\x0b\x32\x17.erp.PaginationResponse"^\n\x16\x45xportContractsRequest\x12\x1c\n\x0fupdated_at_from\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x12\n\nbatch_size\x18\x02 \x01(\x05\x42\x12\n\x10_updated_at_from2\x82\x03\n\x0f\x43ontractService\x12\x35\n\x0bGetContract\x12\x17.erp.GetContractRequest\x1a\r.erp.Contract\x12;\n\x0e\x43reateContract\x12\x1a.erp.CreateContractRequest\x1a\r.erp.Contract\x12;\n\x0eUpdateContract\x12\x1a.erp.UpdateContractRequest\x1a\r.erp.Contract\x12\x35\n\x0e\x44\x65leteContract\x12\x17.erp.GetContractRequest\x1a\n.erp.Empty\x12\x46\n\rListContracts\x12\x19.erp.ListContractsRequest\x1a\x1a.erp.ListContractsResponse\x12?\n\x0f\x45xportContracts\x12\x1b.erp.ExportContractsRequest\x1a\r.erp.Contract0\x01\x62\x06proto3'
 )
 
 _globals = globals()
@@ -42,6 +42,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_LISTCONTRACTSREQUEST"]._serialized_end = 1119
     _globals["_LISTCONTRACTSRESPONSE"]._serialized_start = 1121
     _globals["_LISTCONTRACTSRESPONSE"]._serialized_end = 1219
-    _globals["_CONTRACTSERVICE"]._serialized_start = 1222
-    _globals["_CONTRACTSERVICE"]._serialized_end = 1543
+    _globals["_EXPORTCONTRACTSREQUEST"]._serialized_start = 1221
+    _globals["_EXPORTCONTRACTSREQUEST"]._serialized_end = 1315
+    _globals["_CONTRACTSERVICE"]._serialized_start = 1318
+    _globals["_CONTRACTSERVICE"]._serialized_end = 1704
 # @@protoc_insertion_point(module_scope)
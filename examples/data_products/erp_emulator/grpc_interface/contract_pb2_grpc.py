@@ -68,6 +68,12 @@ class ContractServiceStub(object):
             response_deserializer=contract__pb2.ListContractsResponse.FromString,
             _registered_method=True,
         )
+        self.ExportContracts = channel.unary_stream(
+            "/erp.ContractService/ExportContracts",
+            request_serializer=contract__pb2.ExportContractsRequest.SerializeToString,
+            response_deserializer=contract__pb2.Contract.FromString,
+            _registered_method=True,
+        )
 
 
 class ContractServiceServicer(object):
@@ -103,6 +109,12 @@ class ContractServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ExportContracts(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_ContractServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -131,6 +143,11 @@ def add_ContractServiceServicer_to_server(servicer, server):
             request_deserializer=contract__pb2.ListContractsRequest.FromString,
             response_serializer=contract__pb2.ListContractsResponse.SerializeToString,
         ),
+        "ExportContracts": grpc.unary_stream_rpc_method_handler(
+            servicer.ExportContracts,
+            request_deserializer=contract__pb2.ExportContractsRequest.FromString,
+            response_serializer=contract__pb2.Contract.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "erp.ContractService", rpc_method_handlers
@@ -292,3 +309,33 @@ class ContractService(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def ExportContracts(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/erp.ContractService/ExportContracts",
+            contract__pb2.ExportContractsRequest.SerializeToString,
+            contract__pb2.Contract.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
@@ -22,7 +22,7 @@ from grpc_interface import common_pb2 as common__pb2
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x0ematerial.proto\x12\x03\x65rp\x1a\x0c\x63ommon.proto"\xdb\x01\n\x08Material\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x04 \x01(\t\x12\x0c\n\x04unit\x18\x05 \x01(\t\x12\x16\n\x0estandard_price\x18\x06 \x01(\x01\x12\x16\n\x0elead_time_days\x18\x07 \x01(\x05\x12\x1a\n\x12min_order_quantity\x18\x08 \x01(\x05\x12\x13\n\x0b\x64\x65scription\x18\t \x01(\t\x12\x12\n\ncreated_at\x18\n \x01(\x03\x12\x12\n\nupdated_at\x18\x0b \x01(\x03"\xb4\x01\n\x15\x43reateMaterialRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x03 \x01(\t\x12\x0c\n\x04unit\x18\x04 \x01(\t\x12\x16\n\x0estandard_price\x18\x05 \x01(\x01\x12\x16\n\x0elead_time_days\x18\x06 \x01(\x05\x12\x1a\n\x12min_order_quantity\x18\x07 \x01(\x05\x12\x13\n\x0b\x64\x65scription\x18\x08 \x01(\t"\xc1\x02\n\x15UpdateMaterialRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08\x63\x61tegory\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\x04unit\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x1b\n\x0estandard_price\x18\x05 \x01(\x01H\x03\x88\x01\x01\x12\x1b\n\x0elead_time_days\x18\x06 \x01(\x05H\x04\x88\x01\x01\x12\x1f\n\x12min_order_quantity\x18\x07 \x01(\x05H\x05\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x08 \x01(\tH\x06\x88\x01\x01\x42\x07\n\x05_nameB\x0b\n\t_categoryB\x07\n\x05_unitB\x11\n\x0f_standard_priceB\x11\n\x0f_lead_time_daysB\x15\n\x13_min_order_quantityB\x0e\n\x0c_description"@\n\x12GetMaterialRequest\x12\x0c\n\x02id\x18\x01 \x01(\x05H\x00\x12\x0e\n\x04\x63ode\x18\x02 \x01(\tH\x00\x42\x0c\n\nidentifier"\x86\x01\n\x14ListMaterialsRequest\x12*\n\npagination\x18\x01 \x01(\x0b\x32\x16.erp.PaginationRequest\x12\x15\n\x08\x63\x61tegory\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x13\n\x06search\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x0b\n\t_categoryB\t\n\x07_search"b\n\x15ListMaterialsResponse\x12\x1c\n\x05items\x18\x01 \x03(\x0b\x32\r.erp.Material\x12+\n\npagination\x18\x02 \x01(\x0b\x32\x17.erp.PaginationResponse2\xc1\x02\n\x0fMaterialService\x12\x35\n\x0bGetMaterial\x12\x17.erp.GetMaterialRequest\x1a\r.erp.Material\x12;\n\x0e\x43reateMaterial\x12\x1a.erp.CreateMaterialRequest\x1a\r.erp.Material\x12;\n\x0eUpdateMaterial\x12\x1a.erp.UpdateMaterialRequest\x1a\r.erp.Material\x12\x35\n\x0e\x44\x65leteMaterial\x12\x17.erp.GetMaterialRequest\x1a\n.erp.Empty\x12\x46\n\rListMaterials\x12\x19.erp.ListMaterialsRequest\x1a\x1a.erp.ListMaterialsResponseb\x06proto3'
+    b'\n\x0ematerial.proto\x12\x03\x65rp\x1a\x0c\x63ommon.proto"\xdb\x01\n\x08Material\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x04 \x01(\t\x12\x0c\n\x04unit\x18\x05 \x01(\t\x12\x16\n\x0estandard_price\x18\x06 \x01(\x01\x12\x16\n\x0elead_time_days\x18\x07 \x01(\x05\x12\x1a\n\x12min_order_quantity\x18\x08 \x01(\x05\x12\x13\n\x0b\x64\x65scription\x18\t \x01(\t\x12\x12\n\ncreated_at\x18\n \x01(\x03\x12\x12\n\nupdated_at\x18\x0b \x01(\x03"\xb4\x01\n\x15\x43reateMaterialRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x03 \x01(\t\x12\x0c\n\x04unit\x18\x04 \x01(\t\x12\x16\n\x0estandard_price\x18\x05 \x01(\x01\x12\x16\n\x0elead_time_days\x18\x06 \x01(\x05\x12\x1a\n\x12min_order_quantity\x18\x07 \x01(\x05\x12\x13\n\x0b\x64\x65scription\x18\x08 \x01(\t"\xc1\x02\n\x15UpdateMaterialRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08\x63\x61tegory\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\x04unit\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x1b\n\x0estandard_price\x18\x05 \x01(\x01H\x03\x88\x01\x01\x12\x1b\n\x0elead_time_days\x18\x06 \x01(\x05H\x04\x88\x01\x01\x12\x1f\n\x12min_order_quantity\x18\x07 \x01(\x05H\x05\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x08 \x01(\tH\x06\x88\x01\x01\x42\x07\n\x05_nameB\x0b\n\t_categoryB\x07\n\x05_unitB\x11\n\x0f_standard_priceB\x11\n\x0f_lead_time_daysB\x15\n\x13_min_order_quantityB\x0e\n\x0c_description"@\n\x12GetMaterialRequest\x12\x0c\n\x02id\x18\x01 \x01(\x05H\x00\x12\x0e\n\x04\x63ode\x18\x02 \x01(\tH\x00\x42\x0c\n\nidentifier"\x86\x01\n\x14ListMaterialsRequest\x12*\n\npagination\x18\x01 \x01(\x0b\x32\x16.erp.PaginationRequest\x12\x15\n\x08\x63\x61tegory\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x13\n\x06search\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x0b\n\t_categoryB\t\n\x07_search"b\n\x15ListMaterialsResponse\x12\x1c\n\x05items\x18\x01 \x03(\x0b\x32\r.erp.Material\x12+\n\npagination\x18\x02 \x01(\x0b\x32\x17.erp.PaginationResponse"^\n\x16\x45xportMaterialsRequest\x12\x1c\n\x0fupdated_at_from\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x12\n\nbatch_size\x18\x02 \x01(\x05\x42\x12\n\x10_updated_at_from2\x82\x03\n\x0fMaterialService\x12\x35\n\x0bGetMaterial\x12\x17.erp.GetMaterialRequest\x1a\r.erp.Material\x12;\n\x0e\x43reateMaterial\x12\x1a.erp.CreateMaterialRequest\x1a\r.erp.Material\x12;\n\x0eUpdateMaterial\x12\x1a.erp.UpdateMaterialRequest\x1a\r.erp.Material\x12\x35\n\x0e\x44\x65leteMaterial\x12\x17.erp.GetMaterialRequest\x1a\n.erp.Empty\x12\x46\n\rListMaterials\x12\x19.erp.ListMaterialsRequest\x1a\x1a.erp.ListMaterialsResponse\x12?\n\x0f\x45xportMaterials\x12\x1b.erp.ExportMaterialsRequest\x1a\r.erp.Material0\x01\x62\x06proto3'
 )
 
 _globals = globals()
@@ -42,6 +42,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_LISTMATERIALSREQUEST"]._serialized_end = 967
     _globals["_LISTMATERIALSRESPONSE"]._serialized_start = 969
     _globals["_LISTMATERIALSRESPONSE"]._serialized_end = 1067
-    _globals["_MATERIALSERVICE"]._serialized_start = 1070
-    _globals["_MATERIALSERVICE"]._serialized_end = 1391
+    _globals["_EXPORTMATERIALSREQUEST"]._serialized_start = 1069
+    _globals["_EXPORTMATERIALSREQUEST"]._serialized_end = 1163
+    _globals["_MATERIALSERVICE"]._serialized_start = 1166
+    _globals["_MATERIALSERVICE"]._serialized_end = 1552
 # @@protoc_insertion_point(module_scope)
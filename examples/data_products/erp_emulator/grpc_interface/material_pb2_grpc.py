@@ -68,6 +68,12 @@ class MaterialServiceStub(object):
             response_deserializer=material__pb2.ListMaterialsResponse.FromString,
             _registered_method=True,
         )
+        self.ExportMaterials = channel.unary_stream(
+            "/erp.MaterialService/ExportMaterials",
+            request_serializer=material__pb2.ExportMaterialsRequest.SerializeToString,
+            response_deserializer=material__pb2.Material.FromString,
+            _registered_method=True,
+        )
 
 
 class MaterialServiceServicer(object):
@@ -103,6 +109,12 @@ class MaterialServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ExportMaterials(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_MaterialServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -131,6 +143,11 @@ def add_MaterialServiceServicer_to_server(servicer, server):
             request_deserializer=material__pb2.ListMaterialsRequest.FromString,
             response_serializer=material__pb2.ListMaterialsResponse.SerializeToString,
         ),
+        "ExportMaterials": grpc.unary_stream_rpc_method_handler(
+            servicer.ExportMaterials,
+            request_deserializer=material__pb2.ExportMaterialsRequest.FromString,
+            response_serializer=material__pb2.Material.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "erp.MaterialService", rpc_method_handlers
@@ -292,3 +309,33 @@ class MaterialService(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def ExportMaterials(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/erp.MaterialService/ExportMaterials",
+            material__pb2.ExportMaterialsRequest.SerializeToString,
+            material__pb2.Material.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
@@ -23,7 +23,7 @@ from grpc_interface import payment_pb2 as payment__pb2
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x0border.proto\x12\x03\x65rp\x1a\x0c\x63ommon.proto\x1a\rpayment.proto"\xbe\x01\n\tOrderItem\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08order_id\x18\x02 \x01(\x05\x12\x13\n\x0bmaterial_id\x18\x03 \x01(\x05\x12\x10\n\x08quantity\x18\x04 \x01(\x01\x12\x12\n\nunit_price\x18\x05 \x01(\x01\x12\x10\n\x08subtotal\x18\x06 \x01(\x01\x12\x18\n\x10\x64iscount_percent\x18\x07 \x01(\x01\x12,\n\x0f\x64\x65livery_status\x18\x08 \x01(\x0e\x32\x13.erp.DeliveryStatus"\x84\x03\n\rPurchaseOrder\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x14\n\x0corder_number\x18\x02 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x03 \x01(\x05\x12 \n\x06status\x18\x04 \x01(\x0e\x32\x10.erp.OrderStatus\x12\x12\n\norder_date\x18\x05 \x01(\x03\x12\x15\n\rdelivery_date\x18\x06 \x01(\x03\x12\x14\n\x0ctotal_amount\x18\x07 \x01(\x01\x12\x15\n\rpayment_terms\x18\x08 \x01(\t\x12\x18\n\x10shipping_address\x18\t \x01(\t\x12\r\n\x05notes\x18\n \x01(\t\x12\x12\n\ncreated_at\x18\x0b \x01(\x03\x12\x12\n\nupdated_at\x18\x0c \x01(\x03\x12\x1d\n\x05items\x18\r \x03(\x0b\x32\x0e.erp.OrderItem\x12\x18\n\x0b\x63ontract_id\x18\x0e \x01(\x05H\x00\x88\x01\x01\x12\x18\n\x0bmaterial_id\x18\x0f \x01(\x05H\x01\x88\x01\x01\x42\x0e\n\x0c_contract_idB\x0e\n\x0c_material_id"m\n\x16\x43reateOrderItemRequest\x12\x13\n\x0bmaterial_id\x18\x01 \x01(\x05\x12\x10\n\x08quantity\x18\x02 \x01(\x01\x12\x12\n\nunit_price\x18\x03 \x01(\x01\x12\x18\n\x10\x64iscount_percent\x18\x04 \x01(\x01"\xa2\x02\n\x12\x43reateOrderRequest\x12\x13\n\x0bsupplier_id\x18\x01 \x01(\x05\x12 \n\x06status\x18\x02 \x01(\x0e\x32\x10.erp.OrderStatus\x12\x15\n\rdelivery_date\x18\x03 \x01(\x03\x12\x15\n\rpayment_terms\x18\x04 \x01(\t\x12\x18\n\x10shipping_address\x18\x05 \x01(\t\x12\r\n\x05notes\x18\x06 \x01(\t\x12*\n\x05items\x18\x07 \x03(\x0b\x32\x1b.erp.CreateOrderItemRequest\x12\x18\n\x0b\x63ontract_id\x18\x08 \x01(\x05H\x00\x88\x01\x01\x12\x18\n\x0bmaterial_id\x18\t \x01(\x05H\x01\x88\x01\x01\x42\x0e\n\x0c_contract_idB\x0e\n\x0c_material_id"\x80\x02\n\x12UpdateOrderRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12%\n\x06status\x18\x02 \x01(\x0e\x32\x10.erp.OrderStatusH\x00\x88\x01\x01\x12\x1a\n\rdelivery_date\x18\x03 \x01(\x03H\x01\x88\x01\x01\x12\x1a\n\rpayment_terms\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x1d\n\x10shipping_address\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x12\n\x05notes\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\t\n\x07_statusB\x10\n\x0e_delivery_dateB\x10\n\x0e_payment_termsB\x13\n\x11_shipping_addressB\x08\n\x06_notes"E\n\x0fGetOrderRequest\x12\x0c\n\x02id\x18\x01 \x01(\x05H\x00\x12\x16\n\x0corder_number\x18\x02 \x01(\tH\x00\x42\x0c\n\nidentifier"\x92\x02\n\x11ListOrdersRequest\x12*\n\npagination\x18\x01 \x01(\x0b\x32\x16.erp.PaginationRequest\x12\x18\n\x0bsupplier_id\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12%\n\x06status\x18\x03 \x01(\x0e\x32\x10.erp.OrderStatusH\x01\x88\x01\x01\x12\x1c\n\x0forder_date_from\x18\x04 \x01(\x03H\x02\x88\x01\x01\x12\x1a\n\rorder_date_to\x18\x05 \x01(\x03H\x03\x88\x01\x01\x12\x15\n\rinclude_items\x18\x06 \x01(\x08\x42\x0e\n\x0c_supplier_idB\t\n\x07_statusB\x12\n\x10_order_date_fromB\x10\n\x0e_order_date_to"d\n\x12ListOrdersResponse\x12!\n\x05items\x18\x01 \x03(\x0b\x32\x12.erp.PurchaseOrder\x12+\n\npagination\x18\x02 \x01(\x0b\x32\x17.erp.PaginationResponse"+\n\x17GetOrderPaymentsRequest\x12\x10\n\x08order_id\x18\x01 \x01(\x05\x32\xee\x02\n\x0cOrderService\x12\x34\n\x08GetOrder\x12\x14.erp.GetOrderRequest\x1a\x12.erp.PurchaseOrder\x12:\n\x0b\x43reateOrder\x12\x17.erp.CreateOrderRequest\x1a\x12.erp.PurchaseOrder\x12:\n\x0bUpdateOrder\x12\x17.erp.UpdateOrderRequest\x1a\x12.erp.PurchaseOrder\x12/\n\x0b\x44\x65leteOrder\x12\x14.erp.GetOrderRequest\x1a\n.erp.Empty\x12=\n\nListOrders\x12\x16.erp.ListOrdersRequest\x1a\x17.erp.ListOrdersResponse\x12@\n\x10GetOrderPayments\x12\x1c.erp.GetOrderPaymentsRequest\x1a\x0c.erp.Payment0\x01\x62\x06proto3'
+    b'\n\x0border.proto\x12\x03\x65rp\x1a\x0c\x63ommon.proto\x1a\rpayment.proto"\xbe\x01\n\tOrderItem\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08order_id\x18\x02 \x01(\x05\x12\x13\n\x0bmaterial_id\x18\x03 \x01(\x05\x12\x10\n\x08quantity\x18\x04 \x01(\x01\x12\x12\n\nunit_price\x18\x05 \x01(\x01\x12\x10\n\x08subtotal\x18\x06 \x01(\x01\x12\x18\n\x10\x64iscount_percent\x18\x07 \x01(\x01\x12,\n\x0f\x64\x65livery_status\x18\x08 \x01(\x0e\x32\x13.erp.DeliveryStatus"\x84\x03\n\rPurchaseOrder\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x14\n\x0corder_number\x18\x02 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x03 \x01(\x05\x12 \n\x06status\x18\x04 \x01(\x0e\x32\x10.erp.OrderStatus\x12\x12\n\norder_date\x18\x05 \x01(\x03\x12\x15\n\rdelivery_date\x18\x06 \x01(\x03\x12\x14\n\x0ctotal_amount\x18\x07 \x01(\x01\x12\x15\n\rpayment_terms\x18\x08 \x01(\t\x12\x18\n\x10shipping_address\x18\t \x01(\t\x12\r\n\x05notes\x18\n \x01(\t\x12\x12\n\ncreated_at\x18\x0b \x01(\x03\x12\x12\n\nupdated_at\x18\x0c \x01(\x03\x12\x1d\n\x05items\x18\r \x03(\x0b\x32\x0e.erp.OrderItem\x12\x18\n\x0b\x63ontract_id\x18\x0e \x01(\x05H\x00\x88\x01\x01\x12\x18\n\x0bmaterial_id\x18\x0f \x01(\x05H\x01\x88\x01\x01\x42\x0e\n\x0c_contract_idB\x0e\n\x0c_material_id"m\n\x16\x43reateOrderItemRequest\x12\x13\n\x0bmaterial_id\x18\x01 \x01(\x05\x12\x10\n\x08quantity\x18\x02 \x01(\x01\x12\x12\n\nunit_price\x18\x03 \x01(\x01\x12\x18\n\x10\x64iscount_percent\x18\x04 \x01(\x01"\xa2\x02\n\x12\x43reateOrderRequest\x12\x13\n\x0bsupplier_id\x18\x01 \x01(\x05\x12 \n\x06status\x18\x02 \x01(\x0e\x32\x10.erp.OrderStatus\x12\x15\n\rdelivery_date\x18\x03 \x01(\x03\x12\x15\n\rpayment_terms\x18\x04 \x01(\t\x12\x18\n\x10shipping_address\x18\x05 \x01(\t\x12\r\n\x05notes\x18\x06 \x01(\t\x12*\n\x05items\x18\x07 \x03(\x0b\x32\x1b.erp.CreateOrderItemRequest\x12\x18\n\x0b\x63ontract_id\x18\x08 \x01(\x05H\x00\x88\x01\x01\x12\x18\n\x0bmaterial_id\x18\t \x01(\x05H\x01\x88\x01\x01\x42\x0e\n\x0c_contract_idB\x0e\n\x0c_material_id"\x80\x02\n\x12UpdateOrderRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12%\n\x06status\x18\x02 \x01(\x0e\x32\x10.erp.OrderStatusH\x00\x88\x01\x01\x12\x1a\n\rdelivery_date\x18\x03 \x01(\x03H\x01\x88\x01\x01\x12\x1a\n\rpayment_terms\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x1d\n\x10shipping_address\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x12\n\x05notes\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\t\n\x07_statusB\x10\n\x0e_delivery_dateB\x10\n\x0e_payment_termsB\x13\n\x11_shipping_addressB\x08\n\x06_notes"E\n\x0fGetOrderRequest\x12\x0c\n\x02id\x18\x01 \x01(\x05H\x00\x12\x16\n\x0corder_number\x18\x02 \x01(\tH\x00\x42\x0c\n\nidentifier"\x92\x02\n\x11ListOrdersRequest\x12*\n\npagination\x18\x01 \x01(\x0b\x32\x16.erp.PaginationRequest\x12\x18\n\x0bsupplier_id\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12%\n\x06status\x18\x03 \x01(\x0e\x32\x10.erp.OrderStatusH\x01\x88\x01\x01\x12\x1c\n\x0forder_date_from\x18\x04 \x01(\x03H\x02\x88\x01\x01\x12\x1a\n\rorder_date_to\x18\x05 \x01(\x03H\x03\x88\x01\x01\x12\x15\n\rinclude_items\x18\x06 \x01(\x08\x42\x0e\n\x0c_supplier_idB\t\n\x07_statusB\x12\n\x10_order_date_fromB\x10\n\x0e_order_date_to"d\n\x12ListOrdersResponse\x12!\n\x05items\x18\x01 \x03(\x0b\x32\x12.erp.PurchaseOrder\x12+\n\npagination\x18\x02 \x01(\x0b\x32\x17.erp.PaginationResponse"+\n\x17GetOrderPaymentsRequest\x12\x10\n\x08order_id\x18\x01 \x01(\x05"[\n\x13\x45xportOrdersRequest\x12\x1c\n\x0fupdated_at_from\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x12\n\nbatch_size\x18\x02 \x01(\x05\x42\x12\n\x10_updated_at_from2\xae\x03\n\x0cOrderService\x12\x34\n\x08GetOrder\x12\x14.erp.GetOrderRequest\x1a\x12.erp.PurchaseOrder\x12:\n\x0b\x43reateOrder\x12\x17.erp.CreateOrderRequest\x1a\x12.erp.PurchaseOrder\x12:\n\x0bUpdateOrder\x12\x17.erp.UpdateOrderRequest\x1a\x12.erp.PurchaseOrder\x12/\n\x0b\x44\x65leteOrder\x12\x14.erp.GetOrderRequest\x1a\n.erp.Empty\x12=\n\nListOrders\x12\x16.erp.ListOrdersRequest\x1a\x17.erp.ListOrdersResponse\x12>\n\x0c\x45xportOrders\x12\x18.erp.ExportOrdersRequest\x1a\x12.erp.PurchaseOrder0\x01\x12@\n\x10GetOrderPayments\x12\x1c.erp.GetOrderPaymentsRequest\x1a\x0c.erp.Payment0\x01\x62\x06proto3'
 )
 
 _globals = globals()
@@ -49,6 +49,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_LISTORDERSRESPONSE"]._serialized_end = 1744
     _globals["_GETORDERPAYMENTSREQUEST"]._serialized_start = 1746
     _globals["_GETORDERPAYMENTSREQUEST"]._serialized_end = 1789
-    _globals["_ORDERSERVICE"]._serialized_start = 1792
-    _globals["_ORDERSERVICE"]._serialized_end = 2158
+    _globals["_EXPORTORDERSREQUEST"]._serialized_start = 1791
+    _globals["_EXPORTORDERSREQUEST"]._serialized_end = 1882
+    _globals["_ORDERSERVICE"]._serialized_start = 1885
+    _globals["_ORDERSERVICE"]._serialized_end = 2315
 # @@protoc_insertion_point(module_scope)
@@ -69,6 +69,12 @@ class OrderServiceStub(object):
             response_deserializer=order__pb2.ListOrdersResponse.FromString,
             _registered_method=True,
         )
+        self.ExportOrders = channel.unary_stream(
+            "/erp.OrderService/ExportOrders",
+            request_serializer=order__pb2.ExportOrdersRequest.SerializeToString,
+            response_deserializer=order__pb2.PurchaseOrder.FromString,
+            _registered_method=True,
+        )
         self.GetOrderPayments = channel.unary_stream(
             "/erp.OrderService/GetOrderPayments",
             request_serializer=order__pb2.GetOrderPaymentsRequest.SerializeToString,
@@ -110,6 +116,12 @@ class OrderServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ExportOrders(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def GetOrderPayments(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -144,6 +156,11 @@ def add_OrderServiceServicer_to_server(servicer, server):
             request_deserializer=order__pb2.ListOrdersRequest.FromString,
             response_serializer=order__pb2.ListOrdersResponse.SerializeToString,
         ),
+        "ExportOrders": grpc.unary_stream_rpc_method_handler(
+            servicer.ExportOrders,
+            request_deserializer=order__pb2.ExportOrdersRequest.FromString,
+            response_serializer=order__pb2.PurchaseOrder.SerializeToString,
+        ),
         "GetOrderPayments": grpc.unary_stream_rpc_method_handler(
             servicer.GetOrderPayments,
             request_deserializer=order__pb2.GetOrderPaymentsRequest.FromString,
@@ -311,6 +328,36 @@ class OrderService(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def ExportOrders(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/erp.OrderService/ExportOrders",
+            order__pb2.ExportOrdersRequest.SerializeToString,
+            order__pb2.PurchaseOrder.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def GetOrderPayments(
         request,
@@ -22,7 +22,7 @@ from grpc_interface import common_pb2 as common__pb2
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\rpayment.proto\x12\x03\x65rp\x1a\x0c\x63ommon.proto"\xcb\x01\n\x07Payment\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08order_id\x18\x02 \x01(\x05\x12\x14\n\x0cpayment_date\x18\x03 \x01(\x03\x12\x0e\n\x06\x61mount\x18\x04 \x01(\x01\x12"\n\x06method\x18\x05 \x01(\x0e\x32\x12.erp.PaymentMethod\x12"\n\x06status\x18\x06 \x01(\x0e\x32\x12.erp.PaymentStatus\x12\x11\n\treference\x18\x07 \x01(\t\x12\r\n\x05notes\x18\x08 \x01(\t\x12\x12\n\ncreated_at\x18\t \x01(\x03"\xb8\x01\n\x14\x43reatePaymentRequest\x12\x10\n\x08order_id\x18\x01 \x01(\x05\x12\x14\n\x0cpayment_date\x18\x02 \x01(\x03\x12\x0e\n\x06\x61mount\x18\x03 \x01(\x01\x12"\n\x06method\x18\x04 \x01(\x0e\x32\x12.erp.PaymentMethod\x12"\n\x06status\x18\x05 \x01(\x0e\x32\x12.erp.PaymentStatus\x12\x11\n\treference\x18\x06 \x01(\t\x12\r\n\x05notes\x18\x07 \x01(\t"\xee\x01\n\x14UpdatePaymentRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x13\n\x06\x61mount\x18\x02 \x01(\x01H\x00\x88\x01\x01\x12\'\n\x06method\x18\x03 \x01(\x0e\x32\x12.erp.PaymentMethodH\x01\x88\x01\x01\x12\'\n\x06status\x18\x04 \x01(\x0e\x32\x12.erp.PaymentStatusH\x02\x88\x01\x01\x12\x16\n\treference\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x12\n\x05notes\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\t\n\x07_amountB\t\n\x07_methodB\t\n\x07_statusB\x0c\n\n_referenceB\x08\n\x06_notes"\x1f\n\x11GetPaymentRequest\x12\n\n\x02id\x18\x01 \x01(\x05"\xcd\x01\n\x13ListPaymentsRequest\x12*\n\npagination\x18\x01 \x01(\x0b\x32\x16.erp.PaginationRequest\x12\x15\n\x08order_id\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\'\n\x06status\x18\x03 \x01(\x0e\x32\x12.erp.PaymentStatusH\x01\x88\x01\x01\x12\'\n\x06method\x18\x04 \x01(\x0e\x32\x12.erp.PaymentMethodH\x02\x88\x01\x01\x42\x0b\n\t_order_idB\t\n\x07_statusB\t\n\x07_method"`\n\x14ListPaymentsResponse\x12\x1b\n\x05items\x18\x01 \x03(\x0b\x32\x0c.erp.Payment\x12+\n\npagination\x18\x02 \x01(\x0b\x32\x17.erp.PaginationResponse2\xb2\x02\n\x0ePaymentService\x12\x32\n\nGetPayment\x12\x16.erp.GetPaymentRequest\x1a\x0c.erp.Payment\x12\x38\n\rCreatePayment\x12\x19.erp.CreatePaymentRequest\x1a\x0c.erp.Payment\x12\x38\n\rUpdatePayment\x12\x19.erp.UpdatePaymentRequest\x1a\x0c.erp.Payment\x12\x33\n\rDeletePayment\x12\x16.erp.GetPaymentRequest\x1a\n.erp.Empty\x12\x43\n\x0cListPayments\x12\x18.erp.ListPaymentsRequest\x1a\x19.erp.ListPaymentsResponseb\x06proto3'
+    b'\n\rpayment.proto\x12\x03\x65rp\x1a\x0c\x63ommon.proto"\xcb\x01\n\x07Payment\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08order_id\x18\x02 \x01(\x05\x12\x14\n\x0cpayment_date\x18\x03 \x01(\x03\x12\x0e\n\x06\x61mount\x18\x04 \x01(\x01\x12"\n\x06method\x18\x05 \x01(\x0e\x32\x12.erp.PaymentMethod\x12"\n\x06status\x18\x06 \x01(\x0e\x32\x12.erp.PaymentStatus\x12\x11\n\treference\x18\x07 \x01(\t\x12\r\n\x05notes\x18\x08 \x01(\t\x12\x12\n\ncreated_at\x18\t \x01(\x03"\xb8\x01\n\x14\x43reatePaymentRequest\x12\x10\n\x08order_id\x18\x01 \x01(\x05\x12\x14\n\x0cpayment_date\x18\x02 \x01(\x03\x12\x0e\n\x06\x61mount\x18\x03 \x01(\x01\x12"\n\x06method\x18\x04 \x01(\x0e\x32\x12.erp.PaymentMethod\x12"\n\x06status\x18\x05 \x01(\x0e\x32\x12.erp.PaymentStatus\x12\x11\n\treference\x18\x06 \x01(\t\x12\r\n\x05notes\x18\x07 \x01(\t"\xee\x01\n\x14UpdatePaymentRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x13\n\x06\x61mount\x18\x02 \x01(\x01H\x00\x88\x01\x01\x12\'\n\x06method\x18\x03 \x01(\x0e\x32\x12.erp.PaymentMethodH\x01\x88\x01\x01\x12\'\n\x06status\x18\x04 \x01(\x0e\x32\x12.erp.PaymentStatusH\x02\x88\x01\x01\x12\x16\n\treference\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x12\n\x05notes\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\t\n\x07_amountB\t\n\x07_methodB\t\n\x07_statusB\x0c\n\n_referenceB\x08\n\x06_notes"\x1f\n\x11GetPaymentRequest\x12\n\n\x02id\x18\x01 \x01(\x05"\xcd\x01\n\x13ListPaymentsRequest\x12*\n\npagination\x18\x01 \x01(\x0b\x32\x16.erp.PaginationRequest\x12\x15\n\x08order_id\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\'\n\x06status\x18\x03 \x01(\x0e\x32\x12.erp.PaymentStatusH\x01\x88\x01\x01\x12\'\n\x06method\x18\x04 \x01(\x0e\x32\x12.erp.PaymentMethodH\x02\x88\x01\x01\x42\x0b\n\t_order_idB\t\n\x07_statusB\t\n\x07_method"`\n\x14ListPaymentsResponse\x12\x1b\n\x05items\x18\x01 \x03(\x0b\x32\x0c.erp.Payment\x12+\n\npagination\x18\x02 \x01(\x0b\x32\x17.erp.PaginationResponse"+\n\x15\x45xportPaymentsRequest\x12\x12\n\nbatch_size\x18\x01 \x01(\x05\x32\xf0\x02\n\x0ePaymentService\x12\x32\n\nGetPayment\x12\x16.erp.GetPaymentRequest\x1a\x0c.erp.Payment\x12\x38\n\rCreatePayment\x12\x19.erp.CreatePaymentRequest\x1a\x0c.erp.Payment\x12\x38\n\rUpdatePayment\x12\x19.erp.UpdatePaymentRequest\x1a\x0c.erp.Payment\x12\x33\n\rDeletePayment\x12\x16.erp.GetPaymentRequest\x1a\n.erp.Empty\x12\x43\n\x0cListPayments\x12\x18.erp.ListPaymentsRequest\x1a\x19.erp.ListPaymentsResponse\x12<\n\x0e\x45xportPayments\x12\x1a.erp.ExportPaymentsRequest\x1a\x0c.erp.Payment0\x01\x62\x06proto3'
 )
 
 _globals = globals()
@@ -42,6 +42,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_LISTPAYMENTSREQUEST"]._serialized_end = 909
     _globals["_LISTPAYMENTSRESPONSE"]._serialized_start = 911
     _globals["_LISTPAYMENTSRESPONSE"]._serialized_end = 1007
-    _globals["_PAYMENTSERVICE"]._serialized_start = 1010
-    _globals["_PAYMENTSERVICE"]._serialized_end = 1316
+    _globals["_EXPORTPAYMENTSREQUEST"]._serialized_start = 1009
+    _globals["_EXPORTPAYMENTSREQUEST"]._serialized_end = 1052
+    _globals["_PAYMENTSERVICE"]._serialized_start = 1055
+    _globals["_PAYMENTSERVICE"]._serialized_end = 1423
 # @@protoc_insertion_point(module_scope)
@@ -68,6 +68,12 @@ class PaymentServiceStub(object):
             response_deserializer=payment__pb2.ListPaymentsResponse.FromString,
             _registered_method=True,
         )
+        self.ExportPayments = channel.unary_stream(
+            "/erp.PaymentService/ExportPayments",
+            request_serializer=payment__pb2.ExportPaymentsRequest.SerializeToString,
+            response_deserializer=payment__pb2.Payment.FromString,
+            _registered_method=True,
+        )
 
 
 class PaymentServiceServicer(object):
@@ -103,6 +109,12 @@ class PaymentServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ExportPayments(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_PaymentServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -131,6 +143,11 @@ def add_PaymentServiceServicer_to_server(servicer, server):
             request_deserializer=payment__pb2.ListPaymentsRequest.FromString,
             response_serializer=payment__pb2.ListPaymentsResponse.SerializeToString,
         ),
+        "ExportPayments": grpc.unary_stream_rpc_method_handler(
+            servicer.ExportPayments,
+            request_deserializer=payment__pb2.ExportPaymentsRequest.FromString,
+            response_serializer=payment__pb2.Payment.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "erp.PaymentService", rpc_method_handlers
@@ -292,3 +309,33 @@ class PaymentService(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def ExportPayments(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/erp.PaymentService/ExportPayments",
+            payment__pb2.ExportPaymentsRequest.SerializeToString,
+            payment__pb2.Payment.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
@@ -175,6 +175,34 @@ def str_to_delivery_status(status: int) -> str:
     return mapping.get(status, "")
 
 
+DEFAULT_EXPORT_BATCH_SIZE = 500
+
+
+async def iter_keyset(query, id_column, batch_size: int = 0):
+    """Yield query rows in id order, fetching one keyset page per round trip.
+
+    Each page resumes from the last id seen (id > last_id) instead of using
+    OFFSET, so no page scans the rows before it and no COUNT query is needed.
+    A short-lived session is used per page, so a slow stream consumer does not
+    hold a database connection open.
+    """
+    batch_size = batch_size if batch_size > 0 else DEFAULT_EXPORT_BATCH_SIZE
+    last_id = None
+    while True:
+        page_query = query
+        if last_id is not None:
+            page_query = page_query.where(id_column > last_id)
+        async with async_session_maker() as db:
+            result = await db.execute(page_query.order_by(id_column).limit(batch_size))
+            rows = result.scalars().all()
+
+        for row in rows:
+            yield row
+        if len(rows) < batch_size:
+            return
+        last_id = getattr(rows[-1], id_column.key)
+
+
 # ============================================================================
 # Supplier Service
 # ============================================================================
@@ -378,6 +406,29 @@ class SupplierServicer(supplier_pb2_grpc.SupplierServiceServicer):
                 ),
             )
 
+    async def ExportSuppliers(self, request, context: ServicerContext):
+        """Stream all suppliers for bulk extraction"""
+        query = select(Supplier)
+        if request.HasField("updated_at_from"):
+            query = query.where(
+                Supplier.updated_at >= datetime.fromtimestamp(request.updated_at_from)
+            )
+
+        async for supplier in iter_keyset(query, Supplier.id, request.batch_size):
+            yield supplier_pb2.Supplier(
+                id=supplier.id,
+                name=supplier.name,
+                code=supplier.code,
+                contact_person=supplier.contact_person or "",
+                email=supplier.email or "",
+                phone=supplier.phone or "",
+                address=supplier.address or "",
+                credit_rating=map_credit_rating(supplier.credit_rating),
+                status=map_status(supplier.status),
+                created_at=datetime_to_timestamp(supplier.created_at),
+                updated_at=datetime_to_timestamp(supplier.updated_at),
+            )
+
 
 # ============================================================================
 # Material Service
@@ -582,6 +633,29 @@ class MaterialServicer(material_pb2_grpc.MaterialServiceServicer):
                 ),
             )
 
+    async def ExportMaterials(self, request, context: ServicerContext):
+        """Stream all materials for bulk extraction"""
+        query = select(Material)
+        if request.HasField("updated_at_from"):
+            query = query.where(
+                Material.updated_at >= datetime.fromtimestamp(request.updated_at_from)
+            )
+
+        async for material in iter_keyset(query, Material.id, request.batch_size):
+            yield material_pb2.Material(
+                id=material.id,
+                name=material.name,
+                code=material.code,
+                category=material.category or "",
+                unit=material.unit,
+                standard_price=material.standard_price,
+                lead_time_days=material.lead_time_days,
+                min_order_quantity=material.min_order_quantity,
+                description=material.description or "",
+                created_at=datetime_to_timestamp(material.created_at),
+                updated_at=datetime_to_timestamp(material.updated_at),
+            )
+
 
 # ============================================================================
 # Payment Service (needed by OrderService for streaming)
@@ -764,6 +838,23 @@ class PaymentServicer(payment_pb2_grpc.PaymentServiceServicer):
                 ),
             )
 
+    async def ExportPayments(self, request, context: ServicerContext):
+        """Stream all payments for bulk extraction"""
+        async for payment in iter_keyset(
+            select(Payment), Payment.id, request.batch_size
+        ):
+            yield payment_pb2.Payment(
+                id=payment.id,
+                order_id=payment.order_id,
+                payment_date=datetime_to_timestamp(payment.payment_date),
+                amount=payment.amount,
+                method=map_payment_method(payment.payment_method),
+                status=map_payment_status(payment.status),
+                reference=payment.reference or "",
+                notes=payment.notes or "",
+                created_at=datetime_to_timestamp(payment.created_at),
+            )
+
 
 # ============================================================================
 # Order Service
@@ -1142,6 +1233,33 @@ class OrderServicer(order_pb2_grpc.OrderServiceServicer):
                     created_at=datetime_to_timestamp(payment.created_at),
                 )
 
+    async def ExportOrders(self, request, context: ServicerContext):
+        """Stream all orders (without line items) for bulk extraction"""
+        query = select(PurchaseOrder)
+        if request.HasField("updated_at_from"):
+            query = query.where(
+                PurchaseOrder.updated_at
+                >= datetime.fromtimestamp(request.updated_at_from)
+            )
+
+        async for order in iter_keyset(query, PurchaseOrder.id, request.batch_size):
+            yield order_pb2.PurchaseOrder(
+                id=order.id,
+                order_number=order.order_number,
+                supplier_id=order.supplier_id,
+                status=map_order_status(order.status),
+                order_date=datetime_to_timestamp(order.order_date),
+                delivery_date=datetime_to_timestamp(order.delivery_date),
+                total_amount=order.total_amount,
+                payment_terms=order.payment_terms,
+                shipping_address=order.shipping_address or "",
+                notes=order.notes or "",
+                created_at=datetime_to_timestamp(order.created_at),
+                updated_at=datetime_to_timestamp(order.updated_at),
+                contract_id=order.contract_id,
+                material_id=order.material_id,
+            )
+
 
 # ============================================================================
 # Contract Service
@@ -1388,6 +1506,31 @@ class ContractServicer(contract_pb2_grpc.ContractServiceServicer):
                 ),
             )
 
+    async def ExportContracts(self, request, context: ServicerContext):
+        """Stream all contracts for bulk extraction"""
+        query = select(Contract)
+        if request.HasField("updated_at_from"):
+            query = query.where(
+                Contract.updated_at >= datetime.fromtimestamp(request.updated_at_from)
+            )
+
+        async for contract in iter_keyset(query, Contract.id, request.batch_size):
+            yield contract_pb2.Contract(
+                id=contract.id,
+                contract_number=contract.contract_number,
+                supplier_id=contract.supplier_id,
+                material_id=contract.material_id,
+                start_date=datetime_to_timestamp(contract.start_date),
+                end_date=datetime_to_timestamp(contract.end_date),
+                agreed_price=contract.agreed_price,
+                min_quantity=contract.min_quantity,
+                max_quantity=contract.max_quantity or 0.0,
+                status=map_contract_status(contract.status),
+                terms=contract.terms or "",
+                created_at=datetime_to_timestamp(contract.created_at),
+                updated_at=datetime_to_timestamp(contract.updated_at),
+            )
+
 
 # ============================================================================
 # Admin Service
@@ -22,7 +22,7 @@ from grpc_interface import common_pb2 as common__pb2
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x0esupplier.proto\x12\x03\x65rp\x1a\x0c\x63ommon.proto"\xee\x01\n\x08Supplier\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x16\n\x0e\x63ontact_person\x18\x04 \x01(\t\x12\r\n\x05\x65mail\x18\x05 \x01(\t\x12\r\n\x05phone\x18\x06 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x07 \x01(\t\x12(\n\rcredit_rating\x18\x08 \x01(\x0e\x32\x11.erp.CreditRating\x12!\n\x06status\x18\t \x01(\x0e\x32\x11.erp.EntityStatus\x12\x12\n\ncreated_at\x18\n \x01(\x03\x12\x12\n\nupdated_at\x18\x0b \x01(\x03"\xc7\x01\n\x15\x43reateSupplierRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x16\n\x0e\x63ontact_person\x18\x03 \x01(\t\x12\r\n\x05\x65mail\x18\x04 \x01(\t\x12\r\n\x05phone\x18\x05 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x06 \x01(\t\x12(\n\rcredit_rating\x18\x07 \x01(\x0e\x32\x11.erp.CreditRating\x12!\n\x06status\x18\x08 \x01(\x0e\x32\x11.erp.EntityStatus"\xc1\x02\n\x15UpdateSupplierRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x1b\n\x0e\x63ontact_person\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x12\n\x05\x65mail\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x12\n\x05phone\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x14\n\x07\x61\x64\x64ress\x18\x06 \x01(\tH\x04\x88\x01\x01\x12-\n\rcredit_rating\x18\x07 \x01(\x0e\x32\x11.erp.CreditRatingH\x05\x88\x01\x01\x12&\n\x06status\x18\x08 \x01(\x0e\x32\x11.erp.EntityStatusH\x06\x88\x01\x01\x42\x07\n\x05_nameB\x11\n\x0f_contact_personB\x08\n\x06_emailB\x08\n\x06_phoneB\n\n\x08_addressB\x10\n\x0e_credit_ratingB\t\n\x07_status"@\n\x12GetSupplierRequest\x12\x0c\n\x02id\x18\x01 \x01(\x05H\x00\x12\x0e\n\x04\x63ode\x18\x02 \x01(\tH\x00\x42\x0c\n\nidentifier"\x95\x01\n\x14ListSuppliersRequest\x12*\n\npagination\x18\x01 \x01(\x0b\x32\x16.erp.PaginationRequest\x12&\n\x06status\x18\x02 \x01(\x0e\x32\x11.erp.EntityStatusH\x00\x88\x01\x01\x12\x13\n\x06search\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\t\n\x07_statusB\t\n\x07_search"b\n\x15ListSuppliersResponse\x12\x1c\n\x05items\x18\x01 \x03(\x0b\x32\r.erp.Supplier\x12+\n\npagination\x18\x02 \x01(\x0b\x32\x17.erp.PaginationResponse2\xc1\x02\n\x0fSupplierService\x12\x35\n\x0bGetSupplier\x12\x17.erp.GetSupplierRequest\x1a\r.erp.Supplier\x12;\n\x0e\x43reateSupplier\x12\x1a.erp.CreateSupplierRequest\x1a\r.erp.Supplier\x12;\n\x0eUpdateSupplier\x12\x1a.erp.UpdateSupplierRequest\x1a\r.erp.Supplier\x12\x35\n\x0e\x44\x65leteSupplier\x12\x17.erp.GetSupplierRequest\x1a\n.erp.Empty\x12\x46\n\rListSuppliers\x12\x19.erp.ListSuppliersRequest\x1a\x1a.erp.ListSuppliersResponseb\x06proto3'
+    b'\n\x0esupplier.proto\x12\x03\x65rp\x1a\x0c\x63ommon.proto"\xee\x01\n\x08Supplier\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x16\n\x0e\x63ontact_person\x18\x04 \x01(\t\x12\r\n\x05\x65mail\x18\x05 \x01(\t\x12\r\n\x05phone\x18\x06 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x07 \x01(\t\x12(\n\rcredit_rating\x18\x08 \x01(\x0e\x32\x11.erp.CreditRating\x12!\n\x06status\x18\t \x01(\x0e\x32\x11.erp.EntityStatus\x12\x12\n\ncreated_at\x18\n \x01(\x03\x12\x12\n\nupdated_at\x18\x0b \x01(\x03"\xc7\x01\n\x15\x43reateSupplierRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x16\n\x0e\x63ontact_person\x18\x03 \x01(\t\x12\r\n\x05\x65mail\x18\x04 \x01(\t\x12\r\n\x05phone\x18\x05 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x06 \x01(\t\x12(\n\rcredit_rating\x18\x07 \x01(\x0e\x32\x11.erp.CreditRating\x12!\n\x06status\x18\x08 \x01(\x0e\x32\x11.erp.EntityStatus"\xc1\x02\n\x15UpdateSupplierRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x1b\n\x0e\x63ontact_person\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x12\n\x05\x65mail\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x12\n\x05phone\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x14\n\x07\x61\x64\x64ress\x18\x06 \x01(\tH\x04\x88\x01\x01\x12-\n\rcredit_rating\x18\x07 \x01(\x0e\x32\x11.erp.CreditRatingH\x05\x88\x01\x01\x12&\n\x06status\x18\x08 \x01(\x0e\x32\x11.erp.EntityStatusH\x06\x88\x01\x01\x42\x07\n\x05_nameB\x11\n\x0f_contact_personB\x08\n\x06_emailB\x08\n\x06_phoneB\n\n\x08_addressB\x10\n\x0e_credit_ratingB\t\n\x07_status"@\n\x12GetSupplierRequest\x12\x0c\n\x02id\x18\x01 \x01(\x05H\x00\x12\x0e\n\x04\x63ode\x18\x02 \x01(\tH\x00\x42\x0c\n\nidentifier"\x95\x01\n\x14ListSuppliersRequest\x12*\n\npagination\x18\x01 \x01(\x0b\x32\x16.erp.PaginationRequest\x12&\n\x06status\x18\x02 \x01(\x0e\x32\x11.erp.EntityStatusH\x00\x88\x01\x01\x12\x13\n\x06search\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\t\n\x07_statusB\t\n\x07_search"b\n\x15ListSuppliersResponse\x12\x1c\n\x05items\x18\x01 \x03(\x0b\x32\r.erp.Supplier\x12+\n\npagination\x18\x02 \x01(\x0b\x32\x17.erp.PaginationResponse"^\n\x16\x45xportSuppliersRequest\x12\x1c\n\x0fupdated_at_from\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x12\n\nbatch_size\x18\x02 \x01(\x05\x42\x12\n\x10_updated_at_from2\x82\x03\n\x0fSupplierService\x12\x35\n\x0bGetSupplier\x12\x17.erp.GetSupplierRequest\x1a\r.erp.Supplier\x12;\n\x0e\x43reateSupplier\x12\x1a.erp.CreateSupplierRequest\x1a\r.erp.Supplier\x12;\n\x0eUpdateSupplier\x12\x1a.erp.UpdateSupplierRequest\x1a\r.erp.Supplier\x12\x35\n\x0e\x44\x65leteSupplier\x12\x17.erp.GetSupplierRequest\x1a\n.erp.Empty\x12\x46\n\rListSuppliers\x12\x19.erp.ListSuppliersRequest\x1a\x1a.erp.ListSuppliersResponse\x12?\n\x0f\x45xportSuppliers\x12\x1b.erp.ExportSuppliersRequest\x1a\r.erp.Supplier0\x01\x62\x06proto3'
 )
 
 _globals = globals()
@@ -42,6 +42,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_LISTSUPPLIERSREQUEST"]._serialized_end = 1020
     _globals["_LISTSUPPLIERSRESPONSE"]._serialized_start = 1022
     _globals["_LISTSUPPLIERSRESPONSE"]._serialized_end = 1120
-    _globals["_SUPPLIERSERVICE"]._serialized_start = 1123
-    _globals["_SUPPLIERSERVICE"]._serialized_end = 1444
+    _globals["_EXPORTSUPPLIERSREQUEST"]._serialized_start = 1122
+    _globals["_EXPORTSUPPLIERSREQUEST"]._serialized_end = 1216
+    _globals["_SUPPLIERSERVICE"]._serialized_start = 1219
+    _globals["_SUPPLIERSERVICE"]._serialized_end = 1605
 # @@protoc_insertion_point(module_scope)
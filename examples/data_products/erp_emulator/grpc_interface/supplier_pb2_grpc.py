@@ -68,6 +68,12 @@ class SupplierServiceStub(object):
             response_deserializer=supplier__pb2.ListSuppliersResponse.FromString,
             _registered_method=True,
         )
+        self.ExportSuppliers = channel.unary_stream(
+            "/erp.SupplierService/ExportSuppliers",
+            request_serializer=supplier__pb2.ExportSuppliersRequest.SerializeToString,
+            response_deserializer=supplier__pb2.Supplier.FromString,
+            _registered_method=True,
+        )
 
 
 class SupplierServiceServicer(object):
@@ -103,6 +109,12 @@ class SupplierServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ExportSuppliers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_SupplierServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -131,6 +143,11 @@ def add_SupplierServiceServicer_to_server(servicer, server):
             request_deserializer=supplier__pb2.ListSuppliersRequest.FromString,
             response_serializer=supplier__pb2.ListSuppliersResponse.SerializeToString,
         ),
+        "ExportSuppliers": grpc.unary_stream_rpc_method_handler(
+            servicer.ExportSuppliers,
+            request_deserializer=supplier__pb2.ExportSuppliersRequest.FromString,
+            response_serializer=supplier__pb2.Supplier.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "erp.SupplierService", rpc_method_handlers
@@ -292,3 +309,33 @@ class SupplierService(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def ExportSuppliers(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/erp.SupplierService/ExportSuppliers",
+            supplier__pb2.ExportSuppliersRequest.SerializeToString,
+            supplier__pb2.Supplier.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
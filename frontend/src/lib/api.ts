@@ -342,6 +342,8 @@ export interface DataProduct {
   last_health_check: string | null
   last_error: string | null
   is_active: boolean
+  sync_page_size: number
+  sync_concurrency: number
   created_at: string
   updated_at: string
 }
@@ -356,10 +358,18 @@ export interface EntityMapping {
   create_method: string | null
   update_method: string | null
   delete_method: string | null
+  export_method: string | null
   sync_enabled: boolean
   sync_direction: SyncDirection
   id_field_mapping: string
   name_field_mapping: string
+  sync_page_size: number | null
+  sync_concurrency: number | null
+  watermark_field: string | null
+  watermark_filter_field: string | null
+  full_sync_interval_hours: number | null
+  sync_watermark: string | null
+  last_full_sync_at: string | null
   created_at: string
   updated_at: string
   property_mapping_count: number
@@ -440,6 +450,8 @@ export const dataProductsApi = {
     service_name: string
     proto_content?: string
     is_active?: boolean
+    sync_page_size?: number
+    sync_concurrency?: number
   }) => api.post<DataProduct>('/data-products', data),
 
   update: (id: number, data: {
@@ -450,6 +462,8 @@ export const dataProductsApi = {
     service_name?: string
     proto_content?: string
     is_active?: boolean
+    sync_page_size?: number
+    sync_concurrency?: number
   }) => api.put<DataProduct>(`/data-products/${id}`, data),
 
   delete: (id: number) =>
@@ -470,8 +484,8 @@ export const dataProductsApi = {
     api.get<{ items: EntityMapping[]; total: number }>(`/data-products/${id}/entity-mappings`),
 
   // Synchronization
-  triggerSync: (id: number) =>
-    api.post<SyncLogResponse>(`/data-products/${id}/sync`),
+  triggerSync: (id: number, syncType: 'full' | 'incremental' = 'full') =>
+    api.post<SyncLogResponse>(`/data-products/${id}/sync`, { sync_type: syncType }),
 
   triggerSyncAll: () =>
     api.post<{ status: string }>('/data-products/sync-all'),
@@ -491,6 +505,7 @@ export interface SyncLogResponse {
   records_created: number
   records_updated: number
   records_failed: number
+  records_deleted: number | null
   error_message: string | null
   started_at: string
   completed_at: string | null
@@ -512,10 +527,16 @@ export const dataMappingsApi = {
     create_method?: string
     update_method?: string
     delete_method?: string
+    export_method?: string | null
     sync_enabled?: boolean
     sync_direction?: SyncDirection
     id_field_mapping?: string
     name_field_mapping?: string
+    sync_page_size?: number | null
+    sync_concurrency?: number | null
+    watermark_field?: string | null
+    watermark_filter_field?: string | null
+    full_sync_interval_hours?: number | null
   }) => api.post<EntityMapping>('/data-mappings/entity-mappings', data),
 
   listEntityMappings: (dataProductId?: number, ontologyClassName?: string) =>
@@ -533,10 +554,16 @@ export const dataMappingsApi = {
     create_method?: string
     update_method?: string
     delete_method?: string
+    export_method?: string | null
     sync_enabled?: boolean
     sync_direction?: SyncDirection
     id_field_mapping?: string
     name_field_mapping?: string
+    sync_page_size?: number | null
+    sync_concurrency?: number | null
+    watermark_field?: string | null
+    watermark_filter_field?: string | null
+    full_sync_interval_hours?: number | null
   }) => api.put<EntityMapping>(`/data-mappings/entity-mappings/${id}`, data),
 
   deleteEntityMapping: (id: number) =>